@@ -0,0 +1,109 @@
+"""Benchmark per-call overhead of a fresh vs. the shared pooled managed RAG client.
+
+A local HTTP server stands in for the chat completions endpoint so the benchmark
+runs without a Databricks workspace:
+
+    uv run python -m scripts.benchmark_rag_client --calls 200 --latency 0.0
+"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import click
+
+
+def _start_server(latency: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        disable_nagle_algorithm = True
+        connections = set()
+
+        def do_POST(self):
+            Handler.connections.add(self.client_address)
+            self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            if latency:
+                time.sleep(latency)
+            body = json.dumps({'output': '{"result": "Pass"}'}).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.handler = Handler
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _fresh_client_call():
+    """The previous per-call path: new eval context, client and HTTP session."""
+    from databricks.rag_eval import context
+
+    @context.eval_context
+    def call():
+        client = context.get_context().build_managed_rag_client()
+        return client.get_chat_completions_result(
+            user_prompt='Judge this', system_prompt='Be strict'
+        )
+
+    return call()
+
+
+def _pooled_client_call():
+    from server.utils import rag_client
+
+    return rag_client.get_chat_completions_result('Judge this', 'Be strict')
+
+
+def _time_calls(call, calls: int, concurrency: int) -> float:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(lambda _: call(), range(calls)))
+    elapsed = time.perf_counter() - start
+    assert all(result.output for result in results)
+    return elapsed
+
+
+@click.command()
+@click.option('--calls', default=200, help='Number of chat completion calls per client')
+@click.option('--concurrency', default=1, help='Concurrent callers')
+@click.option('--latency', default=0.0, help='Simulated server latency in seconds')
+def main(calls: int, concurrency: int, latency: float):
+    """Compare wall time and connections opened per call for both client paths."""
+    server = _start_server(latency)
+    os.environ['DATABRICKS_HOST'] = f'http://127.0.0.1:{server.server_port}'
+    os.environ['DATABRICKS_TOKEN'] = 'benchmark-token'
+    os.environ.pop('DATABRICKS_CONFIG_PROFILE', None)
+
+    # Warm up imports and the shared client outside the timed runs
+    _fresh_client_call()
+    _pooled_client_call()
+
+    results = {}
+    for name, call in (('fresh', _fresh_client_call), ('pooled', _pooled_client_call)):
+        server.handler.connections.clear()
+        elapsed = _time_calls(call, calls, concurrency)
+        results[name] = (elapsed, len(server.handler.connections))
+
+    print(
+        f'Calls:   {calls} (concurrency {concurrency}, simulated latency {latency * 1000:.0f} ms)'
+    )
+    for name, (elapsed, connections) in results.items():
+        print(
+            f'{name.capitalize():8} {elapsed / calls * 1000:.2f} ms/call, '
+            f'{connections} connections opened'
+        )
+    print(f'Speedup: {results["fresh"][0] / results["pooled"][0]:.1f}x')
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
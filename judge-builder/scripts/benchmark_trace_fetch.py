@@ -0,0 +1,57 @@
+"""Benchmark serial vs batched trace fetching in CacheService.
+
+MLflow round-trips are simulated with a fixed per-call latency so the benchmark
+runs without a Databricks workspace:
+
+    uv run python -m scripts.benchmark_trace_fetch --traces 500 --latency 0.05
+"""
+
+import time
+from unittest.mock import Mock, patch
+
+import click
+
+from server.services.cache_service import CacheService
+
+
+def _fake_get_trace(latency: float):
+    def get_trace(trace_id: str):
+        time.sleep(latency)
+        trace = Mock()
+        trace.info.trace_id = trace_id
+        return trace
+
+    return get_trace
+
+
+def _time_fetch(trace_ids, latency: float, batched: bool) -> float:
+    cache = CacheService()
+    with patch('server.services.cache_service.mlflow.get_trace', _fake_get_trace(latency)):
+        start = time.perf_counter()
+        if batched:
+            traces = cache.get_traces(trace_ids)
+        else:
+            traces = [cache.get_trace(trace_id) for trace_id in trace_ids]
+        elapsed = time.perf_counter() - start
+    assert len(traces) == len(trace_ids)
+    return elapsed
+
+
+@click.command()
+@click.option('--traces', default=500, help='Number of traces to fetch')
+@click.option('--latency', default=0.05, help='Simulated MLflow get_trace latency in seconds')
+def main(traces: int, latency: float):
+    """Compare cold-cache wall time of serial get_trace calls vs get_traces."""
+    trace_ids = [f'tr-{i:05d}' for i in range(traces)]
+
+    serial = _time_fetch(trace_ids, latency, batched=False)
+    batched = _time_fetch(trace_ids, latency, batched=True)
+
+    print(f'Traces:  {traces} (simulated latency {latency * 1000:.0f} ms/call)')
+    print(f'Serial:  {serial:.2f}s')
+    print(f'Batched: {batched:.2f}s')
+    print(f'Speedup: {serial / batched:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
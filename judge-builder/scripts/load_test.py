@@ -0,0 +1,93 @@
+"""Load test: GET /judges latency while an evaluation runs.
+
+Measures ``GET /api/judges/`` latency for a baseline window, then again while
+``POST /api/alignment/{judge_id}/evaluate`` runs against the judge's examples. With
+blocking MLflow work offloaded from the event loop, p99 should stay flat. Use a judge
+version that hasn't been evaluated on its current examples, otherwise the evaluation
+is served from the cached run and finishes immediately:
+
+    uv run python -m scripts.load_test --judge-id <judge_id> --duration 30
+"""
+
+import asyncio
+import statistics
+import time
+from typing import List, Optional
+
+import click
+import httpx
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _report(label: str, samples: List[float]) -> None:
+    if not samples:
+        print(f'{label}: no samples')
+        return
+    ms = [s * 1000 for s in samples]
+    print(
+        f'{label}: n={len(ms)} p50={statistics.median(ms):.1f}ms '
+        f'p95={_percentile(ms, 95):.1f}ms p99={_percentile(ms, 99):.1f}ms max={max(ms):.1f}ms'
+    )
+
+
+async def _poll_judges(client: httpx.AsyncClient, stop: asyncio.Event, samples: List[float]):
+    while not stop.is_set():
+        start = time.perf_counter()
+        response = await client.get('/api/judges/')
+        response.raise_for_status()
+        samples.append(time.perf_counter() - start)
+
+
+async def _measure(client: httpx.AsyncClient, duration: float, concurrency: int) -> List[float]:
+    samples: List[float] = []
+    stop = asyncio.Event()
+    workers = [asyncio.create_task(_poll_judges(client, stop, samples)) for _ in range(concurrency)]
+    await asyncio.sleep(duration)
+    stop.set()
+    await asyncio.gather(*workers)
+    return samples
+
+
+async def _run(base_url: str, judge_id: Optional[str], duration: float, concurrency: int):
+    async with httpx.AsyncClient(base_url=base_url, timeout=None) as client:
+        baseline = await _measure(client, duration, concurrency)
+        _report('GET /judges (idle)', baseline)
+
+        if not judge_id:
+            return
+
+        examples = await client.get(f'/api/labeling/{judge_id}/examples')
+        examples.raise_for_status()
+        trace_ids = [trace['trace_id'] for trace in examples.json()['traces']]
+        if not trace_ids:
+            print(f'Judge {judge_id} has no examples to evaluate')
+            return
+
+        evaluation = asyncio.create_task(
+            client.post(f'/api/alignment/{judge_id}/evaluate', json={'trace_ids': trace_ids})
+        )
+        loaded = await _measure(client, duration, concurrency)
+        _report(f'GET /judges (evaluating {len(trace_ids)} traces)', loaded)
+
+        start = time.perf_counter()
+        (await evaluation).raise_for_status()
+        print(f'Evaluation finished {time.perf_counter() - start:.1f}s after measurement window')
+
+
+@click.command()
+@click.option('--base-url', default='http://localhost:8001', help='Judge Builder server URL')
+@click.option('--judge-id', default=None, help='Judge to evaluate during the loaded window')
+@click.option('--duration', default=20.0, help='Seconds per measurement window')
+@click.option('--concurrency', default=8, help='Concurrent GET /judges pollers')
+def main(base_url: str, judge_id: Optional[str], duration: float, concurrency: int):
+    """Report GET /judges latency percentiles idle and under evaluation load."""
+    asyncio.run(_run(base_url, judge_id, duration, concurrency))
+
+
+if __name__ == '__main__':
+    main()
@@ -2,15 +2,17 @@
 
 import logging
 import os
+import time
 from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from fastapi.staticfiles import StaticFiles
 
 from server.routers import router
+from server.utils.metrics import HTTP_REQUEST_SECONDS, PROMETHEUS_CONTENT_TYPE, registry
 
 
 def load_env_file(filepath: str) -> None:
@@ -64,26 +66,12 @@ def _patch_mlflow_call_chat_completions():
         from server.utils.constants import VERSION
 
         def patched_call_chat_completions(user_prompt: str, system_prompt: str, model: str | None = None, temperature: float | None = None):
-            """Patched version that uses judge-builder client name."""
-            from databricks.rag_eval import context, env_vars
-
-            # Set our custom client name
-            env_vars.RAG_EVAL_EVAL_SESSION_CLIENT_NAME.set(f"judge-builder-v{VERSION}")
-
-            @context.eval_context
-            def _call_chat_completions(user_prompt: str, system_prompt: str):
-                managed_rag_client = context.get_context().build_managed_rag_client()
-                kwargs = {
-                    'user_prompt': user_prompt,
-                    'system_prompt': system_prompt,
-                }
-                if model:
-                    kwargs['model'] = model
-                if temperature:
-                    kwargs['temperature'] = temperature
-                return managed_rag_client.get_chat_completions_result(**kwargs)
-
-            return _call_chat_completions(user_prompt, system_prompt)
+            """Patched version that uses judge-builder client name and the shared pooled client."""
+            from server.utils import rag_client
+
+            return rag_client.get_chat_completions_result(
+                user_prompt, system_prompt, model=model, temperature=temperature or None
+            )
 
         # Apply the patch
         mlflow_utils.call_chat_completions = patched_call_chat_completions
@@ -103,10 +91,31 @@ async def lifespan(app: FastAPI):
     from server.services.judge_service import judge_service
     await judge_service.load_all_judges_on_startup()
 
+    # Resume alignment jobs interrupted by the previous shutdown
+    from server.services.alignment_job_service import alignment_job_service
+    alignment_job_service.resume_interrupted_jobs()
+
+    # Prefetch traces as SMEs label them so alignment starts with a warm cache
+    from server.services.trace_warmer import TRACE_WARMER_ENABLED, trace_warmer
+    if TRACE_WARMER_ENABLED:
+        trace_warmer.start()
+
+    # Refresh labeling progress for judges with open progress streams
+    from server.services.labeling_progress_monitor import (
+        LABELING_PROGRESS_MONITOR_ENABLED,
+        labeling_progress_monitor,
+    )
+    if LABELING_PROGRESS_MONITOR_ENABLED:
+        labeling_progress_monitor.start()
+
     yield
 
-    # Shutdown (if needed in the future)
-    pass
+    trace_warmer.stop()
+    labeling_progress_monitor.stop()
+
+    # Shutdown: write judge metadata updates still waiting in the write-behind queue
+    from server.services.judge_metadata_store import judge_metadata_store
+    judge_metadata_store.flush()
 
 
 app = FastAPI(
@@ -127,6 +136,26 @@ if os.getenv('DEPLOYMENT_MODE', 'prod') == 'dev':
         allow_headers=['*'],
     )
 
+
+@app.middleware('http')
+async def record_request_latency(request: Request, call_next):
+    """Record API latency by route template (not raw path, to keep label counts bounded)."""
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get('route')
+        HTTP_REQUEST_SECONDS.observe(
+            time.perf_counter() - start,
+            method=request.method,
+            route=getattr(route, 'path', '<unmatched>'),
+            status=status,
+        )
+
+
 app.include_router(router, prefix='/api', tags=['api'])
 
 
@@ -136,6 +165,12 @@ async def health():
     return {'status': 'healthy'}
 
 
+@app.get('/metrics', include_in_schema=False)
+async def metrics():
+    """Performance metrics in the Prometheus text format."""
+    return Response(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
 # Serve static files from client build directory
 if os.path.exists('client/build'):
     # First, mount static assets (CSS, JS, images, etc.)
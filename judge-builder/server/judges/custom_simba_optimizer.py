@@ -1,6 +1,9 @@
 """Custom SIMBA optimizer that uses our AgentEvalLM instead of MLflow's construct_dspy_lm."""
 
 import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import dspy
 from mlflow.entities.trace import Trace
@@ -16,14 +19,34 @@ from mlflow.genai.judges.optimizers.simba import SIMBAAlignmentOptimizer
 from mlflow.genai.judges.utils import _suppress_litellm_nonfatal_errors
 from mlflow.protos.databricks_pb2 import INTERNAL_ERROR, INVALID_PARAMETER_VALUE
 
-from server.utils.dspy_utils import AgentEvalLM, DEFAULT_ALIGNMENT_MODEL
+from server.utils.dspy_utils import AgentEvalLM, DEFAULT_ALIGNMENT_MODEL, LMCallStats
 
 logger = logging.getLogger(__name__)
 
+# Threads used to convert traces into DSPy examples
+EXAMPLE_CONVERSION_MAX_WORKERS = int(os.getenv('ALIGNMENT_EXAMPLE_MAX_WORKERS', '8'))
+
 
 class CustomSIMBAAlignmentOptimizer(SIMBAAlignmentOptimizer):
     """Custom SIMBA optimizer that uses our AgentEvalLM."""
 
+    # Counters for the most recent align() call (LM calls, cache hits, wall time)
+    last_run_stats: dict = {}
+
+    def _traces_to_examples(self, judge: Judge, traces: list[Trace]) -> list:
+        """Convert traces to DSPy examples in parallel, preserving trace order."""
+        if len(traces) <= 1:
+            examples = [trace_to_dspy_example(trace, judge) for trace in traces]
+        else:
+            max_workers = min(EXAMPLE_CONVERSION_MAX_WORKERS, len(traces))
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix='dspy-examples'
+            ) as executor:
+                examples = list(
+                    executor.map(lambda trace: trace_to_dspy_example(trace, judge), traces)
+                )
+        return [example for example in examples if example is not None]
+
     @_suppress_litellm_nonfatal_errors
     def align(self, judge: Judge, traces: list[Trace]) -> Judge:
         """
@@ -36,6 +59,9 @@ class CustomSIMBAAlignmentOptimizer(SIMBAAlignmentOptimizer):
         Returns:
             A new optimized Judge instance
         """
+        start = time.perf_counter()
+        lm_stats = LMCallStats()
+        self.last_run_stats = {}
         try:
             if not traces:
                 raise MlflowException(
@@ -55,7 +81,7 @@ class CustomSIMBAAlignmentOptimizer(SIMBAAlignmentOptimizer):
                 # Otherwise use our AgentEvalLM with the model name
                 resolved_model = self._model if self._model else DEFAULT_ALIGNMENT_MODEL
                 logger.info(f'Using AgentEvalLM with model: {resolved_model}')
-                optimizer_lm = AgentEvalLM(model=resolved_model)
+                optimizer_lm = AgentEvalLM(model=resolved_model, stats=lm_stats)
 
             with dspy.context(lm=optimizer_lm):
                 # Create DSPy program that will simulate the judge
@@ -63,11 +89,7 @@ class CustomSIMBAAlignmentOptimizer(SIMBAAlignmentOptimizer):
                 self._logger.debug("Created DSPy program with signature using judge's model")
 
                 # Convert traces to DSPy format
-                dspy_examples = []
-                for trace in traces:
-                    example = trace_to_dspy_example(trace, judge)
-                    if example is not None:
-                        dspy_examples.append(example)
+                dspy_examples = self._traces_to_examples(judge, traces)
 
                 self._logger.info(
                     f'Preparing optimization with {len(dspy_examples)} examples '
@@ -109,3 +131,10 @@ class CustomSIMBAAlignmentOptimizer(SIMBAAlignmentOptimizer):
             raise MlflowException(
                 f'Alignment optimization failed: {e!s}', error_code=INTERNAL_ERROR
             ) from e
+        finally:
+            self.last_run_stats = {
+                **lm_stats.as_dict(),
+                'traces': len(traces),
+                'duration_seconds': round(time.perf_counter() - start, 3),
+            }
+            logger.info(f'Alignment optimization stats: {self.last_run_stats}')
@@ -28,6 +28,8 @@ class InstructionJudge(BaseJudge):
         super().__init__(name, user_instructions, experiment_id)
 
         self.system_instructions = system_instructions if system_instructions else user_instructions
+        # Counters from the most recent optimize() call
+        self.alignment_stats: Dict[str, Any] = {}
 
         # Create MLflow judge using make_judge API - this becomes our scorer_func
         logger.info(f"Creating MLflow judge with:")
@@ -141,7 +143,10 @@ class InstructionJudge(BaseJudge):
 
             model = alignment_model if alignment_model else DEFAULT_ALIGNMENT_MODEL
             optimizer = CustomSIMBAAlignmentOptimizer(model=model)
-            self.scorer_func = self.scorer_func.align(traces=traces, optimizer=optimizer)
+            try:
+                self.scorer_func = self.scorer_func.align(traces=traces, optimizer=optimizer)
+            finally:
+                self.alignment_stats = optimizer.last_run_stats
 
             logger.debug(f'Successfully aligned judge {self.name}')
             return True
@@ -115,6 +115,20 @@ class TraceExamplesResponse(BaseModel):
     total_count: int = Field(..., description='Total number of examples')
 
 
+class AddExamplesProgress(BaseModel):
+    """Progress of a bulk import of examples into a labeling session."""
+
+    stage: str = Field(..., description='fetching, inserting, completed or failed')
+    requested: int = Field(0, description='Number of trace IDs requested')
+    skipped: int = Field(0, description='Traces already in the labeling session')
+    fetched: int = Field(0, description='Traces fetched from MLflow')
+    fetch_failed: int = Field(0, description='Traces that could not be fetched')
+    added: int = Field(0, description='Traces added to the labeling session')
+    insert_failed: int = Field(0, description='Traces that could not be added after retries')
+    traces: Optional[List[TraceExample]] = Field(None, description='Added examples, once completed')
+    error: Optional[str] = Field(None, description='Error message if the import failed')
+
+
 class LabelingProgress(BaseModel):
     """Model for labeling progress."""
 
@@ -125,6 +139,12 @@ class LabelingProgress(BaseModel):
     assigned_smes: Optional[List[str]] = Field(
         None, description='SME email addresses assigned to labeling session'
     )
+    version: int = Field(
+        0,
+        description=(
+            'Increases whenever the counts change (0 if not tracked by the progress monitor)'
+        ),
+    )
 
 
 class AlignmentResponse(BaseModel):
@@ -145,29 +165,37 @@ class AlignmentStartResponse(BaseModel):
     message: str = Field(..., description='Status message')
 
 
-class AlignmentTaskStatus(BaseModel):
-    """Status of a background alignment task."""
+class AlignmentPhaseTiming(BaseModel):
+    """Timing for one phase of an alignment job."""
+
+    phase: str = Field(..., description='Phase name')
+    started_at: Optional[float] = Field(None, description='Unix timestamp when the phase started')
+    completed_at: Optional[float] = Field(
+        None, description='Unix timestamp when the phase completed'
+    )
+    duration_seconds: Optional[float] = Field(None, description='Phase wall time in seconds')
+
+
+class AlignmentJob(BaseModel):
+    """Persisted state of a background alignment job."""
 
-    status: str = Field(..., description='Task status: running, completed, or failed')
+    job_id: str = Field(..., description='Unique job identifier')
+    judge_id: str = Field(..., description='Judge being aligned')
+    status: str = Field(..., description='Job status: queued, running, completed, or failed')
+    phase: Optional[str] = Field(None, description='Phase currently executing')
+    phases: List[AlignmentPhaseTiming] = Field(
+        default_factory=list, description='Per-phase timings in execution order'
+    )
+    checkpoint: dict = Field(
+        default_factory=dict, description='Outputs of completed phases, used to resume the job'
+    )
+    attempts: int = Field(default=0, description='Number of times the job has been started')
     result: Optional[AlignmentResponse] = Field(None, description='Alignment result if completed')
     error_type: Optional[str] = Field(None, description='Error type if failed: not_found, optimization_failure, or unknown')
     error_message: Optional[str] = Field(None, description='Error message if failed')
     error_traceback: Optional[str] = Field(None, description='Error traceback if failed')
-
-    @classmethod
-    def running(cls) -> 'AlignmentTaskStatus':
-        """Create a running status."""
-        return cls(status='running', result=None, error_type=None, error_message=None, error_traceback=None)
-
-    @classmethod
-    def completed(cls, result: AlignmentResponse) -> 'AlignmentTaskStatus':
-        """Create a completed status with result."""
-        return cls(status='completed', result=result, error_type=None, error_message=None, error_traceback=None)
-
-    @classmethod
-    def failed(cls, error_type: str, error_message: str, error_traceback: Optional[str] = None) -> 'AlignmentTaskStatus':
-        """Create a failed status with error details."""
-        return cls(status='failed', result=None, error_type=error_type, error_message=error_message, error_traceback=error_traceback)
+    created_at: float = Field(..., description='Unix timestamp when the job was submitted')
+    updated_at: float = Field(..., description='Unix timestamp of the last state change')
 
 
 class UserInfo(BaseModel):
@@ -238,6 +266,31 @@ class ConfusionMatrix(BaseModel):
         return self.true_positive / denominator
 
 
+class ClassMetrics(BaseModel):
+    """Precision and recall of the judge for one label."""
+
+    label: str = Field(..., description='Label value')
+    precision: float = Field(
+        ..., description='Share of judge predictions of this label that humans agree with'
+    )
+    recall: float = Field(..., description='Share of human labels of this value the judge matched')
+    support: int = Field(..., description='Number of human labels with this value')
+
+
+class CategoricalMetrics(BaseModel):
+    """Multi-class agreement metrics for judge vs human comparison."""
+
+    labels: List[str] = Field(
+        ..., description='Labels in confusion matrix order (schema options first)'
+    )
+    confusion_matrix: List[List[int]] = Field(
+        ..., description='Counts indexed [human label][judge label] in labels order'
+    )
+    agreement_count: int = Field(..., description='Number of samples where judge and human agree')
+    cohens_kappa: float = Field(..., description="Cohen's kappa (agreement corrected for chance)")
+    per_class: List[ClassMetrics] = Field(..., description='Per-label precision and recall')
+
+
 class AlignmentMetrics(BaseModel):
     """Metrics showing judge performance improvement."""
 
@@ -251,6 +304,12 @@ class AlignmentMetrics(BaseModel):
     confusion_matrix_new: Optional[ConfusionMatrix] = Field(
         None, description='New version confusion matrix (only for binary outcomes)'
     )
+    categorical_metrics_previous: Optional[CategoricalMetrics] = Field(
+        None, description='Previous version multi-class metrics'
+    )
+    categorical_metrics_new: Optional[CategoricalMetrics] = Field(
+        None, description='New version multi-class metrics'
+    )
 
     @property
     def previous_agreement_rate(self) -> float:
@@ -267,6 +326,19 @@ class AlignmentMetrics(BaseModel):
         return self.new_agreement_count / self.total_samples
 
 
+class ScoringStats(BaseModel):
+    """Throughput and token usage for one scoring run."""
+
+    traces_scored: int = Field(..., description='Traces that produced an assessment')
+    traces_failed: int = Field(default=0, description='Traces whose scoring errored')
+    traces_reused: int = Field(default=0, description='Traces whose earlier result was reused')
+    duration_seconds: float = Field(..., description='Wall time spent scoring')
+    traces_per_second: float = Field(..., description='Scoring throughput')
+    rate_limit_retries: int = Field(default=0, description='Judge calls retried after a 429')
+    input_tokens: int = Field(default=0, description='Judge prompt tokens, where reported')
+    output_tokens: int = Field(default=0, description='Judge completion tokens, where reported')
+
+
 class EvaluationResult(BaseModel):
     """Result from running judge evaluation on traces."""
 
@@ -277,6 +349,9 @@ class EvaluationResult(BaseModel):
         ..., description='Individual trace evaluation results'
     )
     total_traces: int = Field(..., description='Total number of traces evaluated')
+    scoring_stats: Optional[ScoringStats] = Field(
+        None, description='Throughput and token usage, if traces were scored in this request'
+    )
 
 
 class SingleJudgeTestRequest(BaseModel):
@@ -14,8 +14,7 @@ router = APIRouter()
 async def clear_caches():
     """Clear all caches."""
     try:
-        cache_service.trace_cache.clear()
-        cache_service.evaluation_cache.clear()
+        cache_service.clear()
         return {'message': 'All caches cleared successfully'}
     except Exception as e:
         logger.error(f'Failed to clear caches: {e}')
@@ -7,6 +7,7 @@ from fastapi import APIRouter, HTTPException
 
 # from server.models import ExperimentInfo  # Using MLflow entities directly
 from server.services.experiment_service import experiment_service
+from server.utils.concurrency import run_blocking
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +18,7 @@ router = APIRouter()
 async def list_experiments():
     """List available MLflow experiments."""
     try:
-        return experiment_service.list_experiments()
+        return await run_blocking(experiment_service.list_experiments)
     except Exception as e:
         logger.error(f'Failed to list experiments: {e}\n{traceback.format_exc()}')
         raise HTTPException(status_code=500, detail=str(e))
@@ -27,7 +28,7 @@ async def list_experiments():
 async def get_experiment(experiment_id: str):
     """Get experiment by ID."""
     try:
-        return experiment_service.get_experiment(experiment_id)
+        return await run_blocking(experiment_service.get_experiment, experiment_id)
     except ValueError as e:
         logger.error(f'Experiment not found {experiment_id}: {e}\n{traceback.format_exc()}')
         raise HTTPException(status_code=404, detail=str(e))
@@ -40,7 +41,7 @@ async def get_experiment(experiment_id: str):
 async def get_experiment_traces(experiment_id: str, run_id: str = None):
     """Get traces from experiment."""
     try:
-        traces = experiment_service.get_experiment_traces(experiment_id, run_id)
+        traces = await run_blocking(experiment_service.get_experiment_traces, experiment_id, run_id)
         return {'traces': traces, 'count': len(traces)}
     except ValueError as e:
         logger.error(
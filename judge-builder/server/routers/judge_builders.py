@@ -11,16 +11,19 @@ from server.models import (
     JudgeResponse,
 )
 from server.services.judge_builder_service import judge_builder_service
+from server.utils.concurrency import route_limiter, run_blocking
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+_create_limiter = route_limiter('create-judge', 4)
+
 
 @router.get('/', response_model=List[JudgeResponse])
 async def list_judge_builders():
     """List all judge builders."""
     try:
-        return judge_builder_service.list_judge_builders()
+        return await run_blocking(judge_builder_service.list_judge_builders)
     except Exception as e:
         logger.error(f'Failed to list judge builders: {e}\n{traceback.format_exc()}')
         raise HTTPException(status_code=500, detail=str(e))
@@ -31,7 +34,7 @@ async def create_judge_builder(request: JudgeCreateRequest):
     """Create a new judge builder."""
     try:
         logger.info(f'Creating judge builder: {request.name}')
-        return judge_builder_service.create_judge_builder(request)
+        return await _create_limiter.run(judge_builder_service.create_judge_builder, request)
     except Exception as e:
         logger.error(f'Failed to create judge builder: {e}\n{traceback.format_exc()}')
         raise HTTPException(status_code=500, detail=str(e))
@@ -40,7 +43,7 @@ async def create_judge_builder(request: JudgeCreateRequest):
 @router.get('/{judge_id}', response_model=JudgeResponse)
 async def get_judge_builder(judge_id: str):
     """Get a judge builder by ID."""
-    judge = judge_builder_service.get_judge_builder(judge_id)
+    judge = await run_blocking(judge_builder_service.get_judge_builder, judge_id)
     if not judge:
         raise HTTPException(status_code=404, detail='Judge builder not found')
     return judge
@@ -50,7 +53,9 @@ async def get_judge_builder(judge_id: str):
 async def delete_judge_builder(judge_id: str):
     """Delete a judge builder."""
     try:
-        deletion_success, warnings = judge_builder_service.delete_judge_builder(judge_id)
+        deletion_success, warnings = await run_blocking(
+            judge_builder_service.delete_judge_builder, judge_id
+        )
 
         # Always return success so frontend refreshes the judge list
         # Surface warnings as different message types
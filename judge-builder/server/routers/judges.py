@@ -12,17 +12,20 @@ from server.models import (
     JudgeResponse,
 )
 from server.services.judge_service import judge_service
+from server.utils.concurrency import route_limiter, run_blocking
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+_create_limiter = route_limiter('create-judge', 4)
+
 
 @router.post('/', response_model=JudgeResponse)
 async def create_judge(request: JudgeCreateRequest):
     """Create a new judge (direct judge creation, not full orchestration)."""
     try:
         logger.info(f'Creating judge: {request.name}')
-        return judge_service.create_judge(request)
+        return await _create_limiter.run(judge_service.create_judge, request)
     except Exception as e:
         logger.error(f'Failed to create judge: {e}\n{traceback.format_exc()}')
         raise HTTPException(status_code=500, detail=str(e))
@@ -32,7 +35,7 @@ async def create_judge(request: JudgeCreateRequest):
 async def list_judges():
     """List all judges."""
     try:
-        return judge_service.list_judges()
+        return await run_blocking(judge_service.list_judges)
     except Exception as e:
         logger.error(f'Failed to list judges: {e}\n{traceback.format_exc()}')
         raise HTTPException(status_code=500, detail=str(e))
@@ -42,7 +45,7 @@ async def list_judges():
 async def get_judge(judge_id: str):
     """Get a judge by ID."""
     try:
-        judge = judge_service.get_judge(judge_id)
+        judge = await run_blocking(judge_service.get_judge, judge_id)
         if not judge:
             raise HTTPException(status_code=404, detail='Judge not found')
         return judge
@@ -57,7 +60,7 @@ async def get_judge(judge_id: str):
 async def delete_judge(judge_id: str):
     """Delete a judge."""
     try:
-        success = judge_service.delete_judge(judge_id)
+        success = await run_blocking(judge_service.delete_judge, judge_id)
         if not success:
             raise HTTPException(status_code=404, detail='Judge not found')
         return {'message': 'Judge deleted successfully'}
@@ -71,7 +74,7 @@ async def update_alignment_model(judge_id: str, config: AlignmentModelConfig | N
     """Update the alignment model configuration for a judge."""
     try:
         logger.info(f'Updating alignment model for judge {judge_id}: {config}')
-        judge = judge_service.update_alignment_model_config(judge_id, config)
+        judge = await run_blocking(judge_service.update_alignment_model_config, judge_id, config)
         if not judge:
             raise HTTPException(status_code=404, detail='Judge not found')
         return judge
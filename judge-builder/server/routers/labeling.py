@@ -1,27 +1,43 @@
 """Labeling API router."""
 
+import asyncio
+import json
 import logging
 import traceback
+from typing import Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 
 from server.models import (
+    AddExamplesProgress,
     CreateLabelingSessionRequest,
     CreateLabelingSessionResponse,
     LabelingProgress,
     TraceRequest,
 )
+from server.services.labeling_progress_monitor import labeling_progress_monitor
 from server.services.labeling_service import labeling_service
+from server.utils.concurrency import route_limiter, run_blocking
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+_add_examples_limiter = route_limiter('add-examples', 4)
+# Largest page the examples endpoint will fetch in one MLflow search
+MAX_EXAMPLES_PAGE_SIZE = 500
+# Streaming imports in flight (referenced so they finish even if the client disconnects)
+_import_tasks: set = set()
+# Seconds between keep-alive comments on idle progress streams
+PROGRESS_STREAM_HEARTBEAT_SECONDS = 15.0
+
 
 @router.post('/{judge_id}/examples')
 async def add_examples(judge_id: str, request: TraceRequest):
     """Add examples to a judge."""
     try:
-        traces = labeling_service.add_examples(judge_id, request)
+        traces = await _add_examples_limiter.run(labeling_service.add_examples, judge_id, request)
         return {'traces': traces, 'count': len(traces)}
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -30,11 +46,80 @@ async def add_examples(judge_id: str, request: TraceRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post('/{judge_id}/examples/stream')
+async def add_examples_stream(judge_id: str, request: TraceRequest):
+    """Add examples to a judge, streaming import progress as newline-delimited JSON.
+
+    Each line is an AddExamplesProgress; the last has stage 'completed' (with the
+    added traces) or 'failed' (with the error).
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+
+    def on_progress(progress: AddExamplesProgress):
+        loop.call_soon_threadsafe(queue.put_nowait, progress)
+
+    async def run_import():
+        try:
+            await _add_examples_limiter.run(
+                labeling_service.add_examples, judge_id, request, on_progress=on_progress
+            )
+        except Exception as e:
+            logger.error(f'Streaming example import failed: {e}\n{traceback.format_exc()}')
+            queue.put_nowait(
+                AddExamplesProgress(stage='failed', requested=len(request.trace_ids), error=str(e))
+            )
+        finally:
+            queue.put_nowait(None)
+
+    async def stream():
+        task = asyncio.create_task(run_import())
+        _import_tasks.add(task)
+        task.add_done_callback(_import_tasks.discard)
+        while True:
+            progress = await queue.get()
+            if progress is None:
+                break
+            yield progress.model_dump_json() + '\n'
+
+    return StreamingResponse(stream(), media_type='application/x-ndjson')
+
+
 @router.get('/{judge_id}/examples')
-async def get_examples(judge_id: str, include_judge_results: bool = False):
-    """Get examples for a judge."""
+async def get_examples(
+    judge_id: str,
+    include_judge_results: bool = False,
+    page_size: Optional[int] = Query(None, ge=1, le=MAX_EXAMPLES_PAGE_SIZE),
+    page_token: Optional[str] = None,
+    stream: bool = False,
+):
+    """Get examples for a judge.
+
+    Without paging parameters all examples are returned at once. With page_size or
+    page_token a single page is returned along with next_page_token. With stream=true
+    the response is newline-delimited JSON, one line per page, so the first page can
+    be rendered while later pages are still being fetched.
+    """
+    if stream:
+        return StreamingResponse(
+            _stream_examples(judge_id, include_judge_results, page_size, page_token),
+            media_type='application/x-ndjson',
+        )
+
     try:
-        traces = labeling_service.get_examples(judge_id, include_judge_results=include_judge_results)
+        if page_size or page_token:
+            traces, next_page_token = await run_blocking(
+                labeling_service.get_examples_page,
+                judge_id,
+                include_judge_results=include_judge_results,
+                page_size=page_size,
+                page_token=page_token,
+            )
+            return {'traces': traces, 'count': len(traces), 'next_page_token': next_page_token}
+
+        traces = await run_blocking(
+            labeling_service.get_examples, judge_id, include_judge_results=include_judge_results
+        )
         return {'traces': traces, 'count': len(traces)}
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -43,11 +128,35 @@ async def get_examples(judge_id: str, include_judge_results: bool = False):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _stream_examples(
+    judge_id: str, include_judge_results: bool, page_size: Optional[int], page_token: Optional[str]
+):
+    """Yield pages of examples as NDJSON lines, ending with an error line if a page fails."""
+    while True:
+        try:
+            traces, page_token = await run_blocking(
+                labeling_service.get_examples_page,
+                judge_id,
+                include_judge_results=include_judge_results,
+                page_size=page_size,
+                page_token=page_token,
+            )
+        except Exception as e:
+            logger.error(f'Streaming examples failed: {e}\n{traceback.format_exc()}')
+            yield json.dumps({'error': str(e)}) + '\n'
+            return
+
+        page = {'traces': traces, 'count': len(traces), 'next_page_token': page_token}
+        yield json.dumps(jsonable_encoder(page)) + '\n'
+        if not page_token:
+            return
+
+
 @router.get('/{judge_id}/labeling-progress', response_model=LabelingProgress)
 async def get_labeling_progress(judge_id: str):
-    """Get labeling progress for a judge."""
+    """Get labeling progress for a judge (shared by all readers, refreshed at most per interval)."""
     try:
-        return labeling_service.get_labeling_progress(judge_id)
+        return await run_blocking(labeling_progress_monitor.get, judge_id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -55,11 +164,50 @@ async def get_labeling_progress(judge_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get('/{judge_id}/labeling-progress/stream')
+async def stream_labeling_progress(judge_id: str, last_event_id: Optional[str] = Header(None)):
+    """Stream labeling progress for a judge as server-sent events.
+
+    The current progress is sent first, then a new 'progress' event only when the
+    counts change. Each event's id is the progress version; a reconnecting client
+    that sends it back as Last-Event-ID is not sent the unchanged progress again.
+    """
+    return StreamingResponse(
+        _stream_progress(judge_id, last_event_id),
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
+
+
+def _progress_event(progress: LabelingProgress) -> str:
+    return f'id: {progress.version}\nevent: progress\ndata: {progress.model_dump_json()}\n\n'
+
+
+async def _stream_progress(judge_id: str, last_event_id: Optional[str]):
+    """Yield SSE progress events for a judge until the client disconnects."""
+    subscription = labeling_progress_monitor.subscribe(judge_id)
+    try:
+        progress = await run_blocking(labeling_progress_monitor.get, judge_id)
+        if str(progress.version) != last_event_id:
+            yield _progress_event(progress)
+        version = progress.version
+
+        while True:
+            update = await subscription.next(timeout=PROGRESS_STREAM_HEARTBEAT_SECONDS)
+            if update is None:
+                yield ': keep-alive\n\n'
+            elif update.version > version:
+                version = update.version
+                yield _progress_event(update)
+    finally:
+        labeling_progress_monitor.unsubscribe(subscription)
+
+
 @router.post('/{judge_id}/labeling', response_model=CreateLabelingSessionResponse)
 async def create_labeling_session(judge_id: str, request: CreateLabelingSessionRequest):
     """Create a new labeling session for a judge."""
     try:
-        return labeling_service.create_labeling_session(judge_id, request)
+        return await run_blocking(labeling_service.create_labeling_session, judge_id, request)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except NotImplementedError as e:
@@ -73,7 +221,7 @@ async def create_labeling_session(judge_id: str, request: CreateLabelingSessionR
 async def get_labeling_session(judge_id: str):
     """Get the labeling session for a judge."""
     try:
-        session = labeling_service.get_labeling_session(judge_id)
+        session = await run_blocking(labeling_service.get_labeling_session, judge_id)
         if not session:
             raise HTTPException(status_code=404, detail='No labeling session found for this judge')
         return {
@@ -93,7 +241,7 @@ async def get_labeling_session(judge_id: str):
 async def delete_labeling_session(judge_id: str):
     """Delete the labeling session for a judge."""
     try:
-        success = labeling_service.delete_labeling_session(judge_id)
+        success = await run_blocking(labeling_service.delete_labeling_session, judge_id)
         if not success:
             raise HTTPException(status_code=404, detail='Labeling session not found')
         return {'message': 'Labeling session deleted successfully'}
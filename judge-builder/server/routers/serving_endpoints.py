@@ -5,6 +5,7 @@ import logging
 from fastapi import APIRouter, HTTPException
 
 from server.services.serving_endpoint_service import serving_endpoint_service
+from server.utils.concurrency import run_blocking
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -14,7 +15,9 @@ router = APIRouter()
 async def list_serving_endpoints(force_refresh: bool = False):
     """List all serving endpoints in the workspace."""
     try:
-        endpoints = serving_endpoint_service.list_serving_endpoints(force_refresh=force_refresh)
+        endpoints = await run_blocking(
+            serving_endpoint_service.list_serving_endpoints, force_refresh=force_refresh
+        )
         return [
             {
                 "name": e.name,
@@ -32,7 +35,7 @@ async def list_serving_endpoints(force_refresh: bool = False):
 async def get_serving_endpoint(endpoint_name: str):
     """Get details for a specific serving endpoint."""
     try:
-        endpoint = serving_endpoint_service.get_endpoint(endpoint_name)
+        endpoint = await run_blocking(serving_endpoint_service.get_endpoint, endpoint_name)
         return {
             "name": endpoint.name,
             "state": endpoint.state,
@@ -48,7 +51,9 @@ async def get_serving_endpoint(endpoint_name: str):
 async def validate_endpoint(endpoint_name: str):
     """Validate that an endpoint exists."""
     try:
-        is_valid = serving_endpoint_service.validate_endpoint_name(endpoint_name)
+        is_valid = await run_blocking(
+            serving_endpoint_service.validate_endpoint_name, endpoint_name
+        )
         return {"valid": is_valid, "endpoint_name": endpoint_name}
     except Exception as e:
         logger.error(f"Failed to validate endpoint {endpoint_name}: {e}")
@@ -4,6 +4,7 @@ from fastapi import APIRouter
 
 from server.models import UserInfo
 from server.services.user_service import user_service
+from server.utils.concurrency import run_blocking
 
 router = APIRouter()
 
@@ -11,4 +12,4 @@ router = APIRouter()
 @router.get('/me', response_model=UserInfo)
 async def get_current_user():
     """Get current user information."""
-    return user_service.get_current_user()
+    return await run_blocking(user_service.get_current_user)
@@ -0,0 +1,290 @@
+"""Durable queue for background alignment jobs."""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from server.models import AlignmentJob, AlignmentPhaseTiming
+
+from .alignment_service import AlignmentCheckpoint
+
+logger = logging.getLogger(__name__)
+
+# Job statuses
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_COMPLETED = 'completed'
+JOB_FAILED = 'failed'
+ACTIVE_STATUSES = (JOB_QUEUED, JOB_RUNNING)
+
+# Relative to the app's working directory, which persists across restarts (unlike the
+# temp directory); point ALIGNMENT_JOBS_DB_PATH at other persistent storage if needed
+DEFAULT_JOBS_DB_PATH = os.path.join('data', 'alignment_jobs.db')
+# Alignment is LLM-heavy; run only a few at once and queue the rest
+DEFAULT_MAX_CONCURRENT_ALIGNMENTS = 2
+# Jobs interrupted this many times are failed instead of resumed again
+MAX_JOB_ATTEMPTS = 3
+
+
+class _JobCheckpoint(AlignmentCheckpoint):
+    """Alignment checkpoint that persists phase progress and timings to the job store."""
+
+    def __init__(self, service: 'AlignmentJobService', job: AlignmentJob):
+        super().__init__(job.checkpoint)
+        self._service = service
+        self._job = job
+
+    def _timing(self, phase: str) -> AlignmentPhaseTiming:
+        for timing in self._job.phases:
+            if timing.phase == phase:
+                return timing
+        timing = AlignmentPhaseTiming(phase=phase)
+        self._job.phases.append(timing)
+        return timing
+
+    def start_phase(self, phase: str) -> None:
+        """Mark a phase as running and record its start time in the job store."""
+        super().start_phase(phase)
+        timing = self._timing(phase)
+        timing.started_at = time.time()
+        timing.completed_at = None
+        timing.duration_seconds = None
+        self._job.phase = phase
+        self._service._save(self._job)
+
+    def complete_phase(self, phase: str, **outputs) -> None:
+        """Persist a phase's outputs and duration so a resumed job can skip it."""
+        super().complete_phase(phase, **outputs)
+        timing = self._timing(phase)
+        timing.completed_at = time.time()
+        if timing.started_at is not None:
+            timing.duration_seconds = timing.completed_at - timing.started_at
+        self._job.checkpoint = dict(self.completed)
+        self._service._save(self._job)
+        logger.info(
+            f'Alignment job {self._job.job_id} completed phase {phase}'
+            + (f' in {timing.duration_seconds:.1f}s' if timing.duration_seconds is not None else '')
+        )
+
+
+class AlignmentJobService:
+    """Runs alignment jobs on a bounded worker pool and persists their state.
+
+    Job state (status, current phase, per-phase timings and checkpoint outputs) is
+    stored in SQLite after every phase, so the status endpoint survives restarts and
+    jobs interrupted by a restart are resumed from their last completed phase. At most
+    one job per judge is tracked at a time.
+    """
+
+    def __init__(self, db_path: str, max_concurrent: int = DEFAULT_MAX_CONCURRENT_ALIGNMENTS):
+        """Open (or create) the job store.
+
+        Args:
+            db_path: SQLite database file path
+            max_concurrent: Maximum number of alignments running at once
+        """
+        self.db_path = db_path
+        self.max_concurrent = max_concurrent
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrent, thread_name_prefix='alignment-job'
+        )
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        with self._lock:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS alignment_jobs (
+                    judge_id TEXT PRIMARY KEY,
+                    job_id TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+                """
+            )
+
+    # Persistence
+    def _save(self, job: AlignmentJob) -> None:
+        job.updated_at = time.time()
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO alignment_jobs '
+                '(judge_id, job_id, status, payload, updated_at) VALUES (?, ?, ?, ?, ?)',
+                (job.judge_id, job.job_id, job.status, job.model_dump_json(), job.updated_at),
+            )
+
+    def _load(self, judge_id: str) -> Optional[AlignmentJob]:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT payload FROM alignment_jobs WHERE judge_id = ?', (judge_id,)
+            ).fetchone()
+        return AlignmentJob.model_validate_json(row[0]) if row else None
+
+    def _load_active(self) -> List[AlignmentJob]:
+        placeholders = ','.join('?' * len(ACTIVE_STATUSES))
+        with self._lock:
+            rows = self._conn.execute(
+                f'SELECT payload FROM alignment_jobs WHERE status IN ({placeholders}) '
+                'ORDER BY updated_at ASC',
+                ACTIVE_STATUSES,
+            ).fetchall()
+        return [AlignmentJob.model_validate_json(row[0]) for row in rows]
+
+    # Public API
+    def submit(self, judge_id: str) -> Tuple[AlignmentJob, bool]:
+        """Queue an alignment job for a judge.
+
+        Args:
+            judge_id: Judge to align
+
+        Returns:
+            Tuple of (job, created). created is False if a job for the judge is already
+            queued or running, in which case that job is returned.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT payload FROM alignment_jobs WHERE judge_id = ?', (judge_id,)
+            ).fetchone()
+            if row:
+                existing = AlignmentJob.model_validate_json(row[0])
+                if existing.status in ACTIVE_STATUSES:
+                    return existing, False
+
+            now = time.time()
+            job = AlignmentJob(
+                job_id=str(uuid.uuid4()),
+                judge_id=judge_id,
+                status=JOB_QUEUED,
+                phase=JOB_QUEUED,
+                created_at=now,
+                updated_at=now,
+            )
+            self._conn.execute(
+                'INSERT OR REPLACE INTO alignment_jobs '
+                '(judge_id, job_id, status, payload, updated_at) VALUES (?, ?, ?, ?, ?)',
+                (job.judge_id, job.job_id, job.status, job.model_dump_json(), job.updated_at),
+            )
+
+        logger.info(f'Alignment job {job.job_id} queued for judge {judge_id}')
+        self._executor.submit(self._run, job.judge_id, job.job_id)
+        return job, True
+
+    def get_job(self, judge_id: str) -> Optional[AlignmentJob]:
+        """Get the tracked alignment job for a judge, if any."""
+        return self._load(judge_id)
+
+    def clear_job(self, judge_id: str) -> None:
+        """Forget a finished job once its outcome has been reported."""
+        with self._lock:
+            self._conn.execute(
+                'DELETE FROM alignment_jobs WHERE judge_id = ? AND status IN (?, ?)',
+                (judge_id, JOB_COMPLETED, JOB_FAILED),
+            )
+
+    def resume_interrupted_jobs(self) -> int:
+        """Re-queue jobs left queued or running by a previous process.
+
+        Returns:
+            Number of jobs resumed
+        """
+        resumed = 0
+        for job in self._load_active():
+            if job.attempts >= MAX_JOB_ATTEMPTS:
+                logger.error(
+                    f'Alignment job {job.job_id} interrupted {job.attempts} times, giving up'
+                )
+                self._fail(
+                    job, 'unknown', 'Alignment was interrupted repeatedly and was abandoned', None
+                )
+                continue
+
+            logger.info(
+                f'Resuming alignment job {job.job_id} for judge {job.judge_id} '
+                f'after phases {list(job.checkpoint)}'
+            )
+            job.status = JOB_QUEUED
+            self._save(job)
+            self._executor.submit(self._run, job.judge_id, job.job_id)
+            resumed += 1
+        return resumed
+
+    def get_stats(self) -> Dict[str, int]:
+        """Count tracked jobs by status."""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT status, COUNT(*) FROM alignment_jobs GROUP BY status'
+            ).fetchall()
+        return {status: count for status, count in rows}
+
+    # Execution
+    def _fail(
+        self, job: AlignmentJob, error_type: str, error_message: str, error_traceback: Optional[str]
+    ) -> None:
+        job.status = JOB_FAILED
+        job.error_type = error_type
+        job.error_message = error_message
+        job.error_traceback = error_traceback
+        self._save(job)
+
+    def _run(self, judge_id: str, job_id: str) -> None:
+        """Run (or resume) one alignment job on a worker thread."""
+        from server.services.alignment_service import alignment_service
+
+        job = self._load(judge_id)
+        if not job or job.job_id != job_id or job.status not in ACTIVE_STATUSES:
+            return
+
+        job.status = JOB_RUNNING
+        job.attempts += 1
+        self._save(job)
+
+        try:
+            logger.info(f'Background alignment started for judge {judge_id} (job {job_id})')
+            result = alignment_service.run_alignment(judge_id, checkpoint=_JobCheckpoint(self, job))
+            job.status = JOB_COMPLETED
+            job.result = result
+            self._save(job)
+            logger.info(f'Background alignment completed for judge {judge_id} (job {job_id})')
+        except ValueError as e:
+            tb = traceback.format_exc()
+            logger.error(f'Alignment validation failed for judge {judge_id}: {e}\n{tb}')
+            self._fail(job, 'not_found', str(e), tb)
+        except RuntimeError as e:
+            tb = traceback.format_exc()
+            logger.error(f'Alignment optimization failed for judge {judge_id}: {e}\n{tb}')
+            self._fail(job, 'optimization_failure', str(e), tb)
+        except Exception as e:
+            tb = traceback.format_exc()
+            logger.error(f'Alignment failed for judge {judge_id}: {e}\n{tb}')
+            self._fail(job, 'unknown', str(e), tb)
+
+
+def create_alignment_job_service() -> AlignmentJobService:
+    """Create the process-wide job service from environment configuration.
+
+    ``ALIGNMENT_JOBS_DB_PATH`` sets the job store location (default
+    ``data/alignment_jobs.db`` under the app's working directory) and
+    ``MAX_CONCURRENT_ALIGNMENTS`` the number of alignments that may run at once.
+    """
+    return AlignmentJobService(
+        os.getenv('ALIGNMENT_JOBS_DB_PATH', DEFAULT_JOBS_DB_PATH),
+        max_concurrent=int(
+            os.getenv('MAX_CONCURRENT_ALIGNMENTS', DEFAULT_MAX_CONCURRENT_ALIGNMENTS)
+        ),
+    )
+
+
+# Global service instance
+alignment_job_service = create_alignment_job_service()
@@ -1,11 +1,14 @@
 """Alignment service for judge evaluation and alignment using DSPy."""
 
+import hashlib
+import json
 import logging
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 import dspy
 import mlflow
-from mlflow.genai import evaluate, scorers
+from mlflow.entities import Feedback, Trace
+from mlflow.genai import scorers
 from mlflow.tracking import MlflowClient
 
 from server.models import (
@@ -21,24 +24,78 @@ from server.models import (
     TraceRequest,
 )
 from server.utils import dspy_utils
+from server.utils.alignment_metrics import (
+    binary_confusion_matrix,
+    categorical_metrics,
+    confusion_matrix,
+    encode_labels,
+    positive_label_code,
+)
 from server.utils.constants import ALIGNED_SAMPLES_COUNT
+from server.utils.metrics import track_call
 from server.utils.naming_utils import create_scorer_name, sanitize_judge_name
 from server.utils.parsing_utils import (
+    HUMAN_SOURCE,
     assessment_has_error,
     get_human_feedback_from_trace,
     get_scorer_feedback_from_trace,
 )
 from server.utils.schema_analysis import (
+    DEFAULT_CATEGORICAL_OPTIONS,
     extract_categorical_options_from_instruction,
     is_binary_categorical_options,
 )
 
 from .base_service import BaseService
 from .cache_service import cache_service
+from .labeling_progress_monitor import labeling_progress_monitor
+from .scoring_service import scoring_service
 
 logger = logging.getLogger(__name__)
 
 
+# Alignment phases, in execution order
+PHASE_EVALUATE_CURRENT = 'evaluate_current'
+PHASE_OPTIMIZE = 'optimize'
+PHASE_CREATE_VERSION = 'create_version'
+PHASE_EVALUATE_NEW = 'evaluate_new'
+PHASE_FINALIZE = 'finalize'
+ALIGNMENT_PHASES = [
+    PHASE_EVALUATE_CURRENT,
+    PHASE_OPTIMIZE,
+    PHASE_CREATE_VERSION,
+    PHASE_EVALUATE_NEW,
+    PHASE_FINALIZE,
+]
+
+
+class AlignmentCheckpoint:
+    """Records which alignment phases have completed and what they produced.
+
+    This in-memory implementation is used for one-off runs; the alignment job service
+    subclasses it to persist progress between phases.
+    """
+
+    def __init__(self, completed: Optional[Dict[str, dict]] = None):
+        self.completed: Dict[str, dict] = dict(completed or {})
+
+    def is_completed(self, phase: str) -> bool:
+        """Whether a phase finished in an earlier attempt."""
+        return phase in self.completed
+
+    def outputs(self, phase: str) -> dict:
+        """Outputs a completed phase recorded."""
+        return self.completed[phase]
+
+    def start_phase(self, phase: str) -> None:
+        """Called before a phase runs."""
+        logger.debug(f'Starting alignment phase {phase}')
+
+    def complete_phase(self, phase: str, **outputs) -> None:
+        """Record a finished phase and the outputs later phases need."""
+        self.completed[phase] = outputs
+
+
 class AlignmentService(BaseService):
     """Handles judge evaluation and alignment using DSPy."""
 
@@ -50,13 +107,24 @@ class AlignmentService(BaseService):
         dspy.configure(lm=lm)
 
     def _get_judge_scorer(self, judge: JudgeResponse) -> Optional[scorers.Scorer]:
-        """Get the scorer for a judge."""
-        scorers_list = scorers.list_scorers()
+        """Get the scorer for a judge.
+
+        Registered scorers are cached per experiment, so the scorer listing is only
+        fetched when the scorer was not registered (or listed) by this process.
+        """
+        scorer_name = create_scorer_name(judge.name, judge.version)
+        scorer = cache_service.get_scorer(judge.experiment_id, scorer_name)
+        if scorer is not None:
+            return scorer
+
+        with track_call('scorers.list_scorers'):
+            scorers_list = scorers.list_scorers(experiment_id=judge.experiment_id)
         if not scorers_list:
             logger.warning('No scorers found in list_scorers()')
             return None
 
-        scorer_name = create_scorer_name(judge.name, judge.version)
+        # Cache the whole listing; other judges in the experiment are likely next
+        cache_service.cache_scorers(judge.experiment_id, scorers_list)
 
         for scorer in scorers_list:
             if scorer.name == scorer_name:
@@ -65,6 +133,29 @@ class AlignmentService(BaseService):
         logger.warning(f'Scorer "{scorer_name}" not found among available scorers')
         return None
 
+    def _get_previous_results(
+        self, judge: JudgeResponse, traces: List[Trace]
+    ) -> Dict[str, Feedback]:
+        """Find traces that already have a successful result from this judge version.
+
+        Checks the per-trace result cache first, then the judge assessments already
+        logged on the traces themselves (which survive restarts).
+        """
+        trace_ids = [trace.info.trace_id for trace in traces]
+        results = cache_service.get_trace_assessments(judge.id, judge.version, trace_ids)
+
+        recovered = {}
+        for trace in traces:
+            if trace.info.trace_id in results:
+                continue
+            feedback = get_scorer_feedback_from_trace(judge.name, judge.version, trace)
+            if feedback and not assessment_has_error(feedback):
+                recovered[trace.info.trace_id] = feedback
+
+        if recovered:
+            cache_service.cache_trace_assessments(judge.id, judge.version, recovered)
+        return {**results, **recovered}
+
     # Judge evaluation and testing
     def evaluate_judge(self, judge_id: str, request: TraceRequest) -> EvaluationResult:
         """Run judge evaluation on traces and log to MLflow."""
@@ -91,9 +182,6 @@ class AlignmentService(BaseService):
                     total_traces=len(request.trace_ids),
                 )
 
-            # Set experiment context
-            mlflow.set_experiment(experiment_id=judge.experiment_id)
-
             # Find judge scorer
             judge_scorer = self._get_judge_scorer(judge)
             if not judge_scorer:
@@ -101,37 +189,50 @@ class AlignmentService(BaseService):
 
             logger.debug(f'Found scorer: {judge_scorer.name} for judge {judge.name} v{judge.version}')
 
-            # Get traces using cache
-            traces = []
-            for trace_id in request.trace_ids:
-                trace = cache_service.get_trace(trace_id)
-                if trace:
-                    traces.append(trace)
-                else:
-                    logger.warning(f'Could not fetch trace {trace_id}')
+            # Get traces using cache (misses are fetched concurrently)
+            traces = cache_service.get_traces(request.trace_ids)
 
             if not traces:
                 raise ValueError('No valid traces found')
 
-            eval_data = [{'trace': trace} for trace in traces]
+            # Only score traces this judge version hasn't scored before; earlier results are
+            # reused so adding examples costs O(new traces), not O(dataset)
+            previous_results = self._get_previous_results(judge, traces)
+            traces_to_score = [t for t in traces if t.info.trace_id not in previous_results]
 
             # Run evaluation
             sanitized_name = sanitize_judge_name(judge.name)
             dataset_version = cache_service.compute_dataset_version(request.trace_ids)
             run_name = f'evaluation_{sanitized_name}_v{judge.version}_{dataset_version}'
 
-            logger.info(f'Running evaluation for judge {judge_id} v{judge.version} with dataset {dataset_version} ({len(request.trace_ids)} traces)')
+            logger.info(
+                f'Running evaluation for judge {judge_id} v{judge.version} with dataset '
+                f'{dataset_version} ({len(request.trace_ids)} traces, '
+                f'{len(traces_to_score)} to score)'
+            )
 
-            with mlflow.start_run(run_name=run_name) as run:
+            with mlflow.start_run(experiment_id=judge.experiment_id, run_name=run_name) as run:
                 mlflow.set_tag('judge_id', judge_id)
                 mlflow.set_tag('judge_version', judge.version)
                 mlflow.set_tag('dataset_version', dataset_version)
 
-                evaluate(data=eval_data, scorers=[judge_scorer])
+                # Judge calls fan out across a bounded pool; assessments are logged to this run
+                feedback_by_trace, scoring_stats = scoring_service.score_traces(
+                    judge_scorer, traces_to_score, run.info.run_id, reused_results=previous_results
+                )
+                cache_service.cache_trace_assessments(
+                    judge_id,
+                    judge.version,
+                    {
+                        trace_id: feedbacks[0]
+                        for trace_id, feedbacks in feedback_by_trace.items()
+                        if feedbacks
+                    },
+                )
 
                 # Cache the evaluation result
                 cache_service.cache_evaluation_run_id(
-                    judge_id, judge.version, request.trace_ids, run.info.run_id
+                    judge_id, judge.version, request.trace_ids, run.info.run_id, judge.experiment_id
                 )
 
                 return EvaluationResult(
@@ -139,7 +240,8 @@ class AlignmentService(BaseService):
                     judge_version=judge.version,
                     mlflow_run_id=run.info.run_id,
                     evaluation_results=[],  # TODO: Implement individual trace results
-                    total_traces=len(eval_data),
+                    total_traces=len(traces),
+                    scoring_stats=scoring_stats,
                 )
 
         except Exception as e:
@@ -205,11 +307,29 @@ class AlignmentService(BaseService):
         if not trace_ids:
             raise ValueError('No traces found for alignment comparison')
 
+        # Reuse the comparison while the versions, dataset and human labels are unchanged
+        comparison_key = cache_service.alignment_comparison_key(
+            judge_id,
+            judge.version - 1,
+            judge.version,
+            cache_service.compute_dataset_version(trace_ids),
+            self._labels_version(judge.name, examples),
+        )
+        cached = cache_service.get_alignment_comparison(comparison_key)
+        if cached:
+            logger.debug(f'Using cached alignment comparison for judge {judge_id} v{judge.version}')
+            return cached
+
+        # Comparisons only read previews and assessments, so span-free summaries suffice
+        traces_by_id = {
+            trace.info.trace_id: trace for trace in cache_service.get_trace_summaries(trace_ids)
+        }
+
         # Count examples with human feedback from assessments
         examples_with_feedback = []
         for ex in examples:
-            # Get the actual trace object from cache to access assessments
-            trace = cache_service.get_trace(ex.trace_id)
+            # Get the actual trace object to access assessments
+            trace = traces_by_id.get(ex.trace_id)
             if not trace:
                 logger.warning(f'Trace {ex.trace_id} not found in cache for judge {judge_id}')
                 continue
@@ -230,7 +350,7 @@ class AlignmentService(BaseService):
         missing_curr_count = 0
 
         for example, human_feedback in examples_with_feedback:
-            trace = cache_service.get_trace(example.trace_id)
+            trace = traces_by_id.get(example.trace_id)
             if not trace:
                 continue
 
@@ -254,12 +374,17 @@ class AlignmentService(BaseService):
             self.evaluate_judge(judge_id, TraceRequest(trace_ids=trace_ids))
             cache_service.invalidate_traces(trace_ids)
 
+        # Re-read traces in one batch (refetches any invalidated above)
+        traces_by_id = {
+            trace.info.trace_id: trace for trace in cache_service.get_trace_summaries(trace_ids)
+        }
+
         # Build per-row comparisons using trace_id matching
         comparisons = []
         human_labels = []
 
         for example, human_feedback in examples_with_feedback:
-            trace = cache_service.get_trace(example.trace_id)
+            trace = traces_by_id.get(example.trace_id)
             if not trace:
                 logger.warning(f'Skipping trace {example.trace_id}: trace not found in cache')
                 continue
@@ -298,10 +423,6 @@ class AlignmentService(BaseService):
         if not human_labels:
             raise ValueError('No valid examples with both human and judge feedback found')
 
-        # Calculate metrics using only valid examples
-        prev_judge_labels = [comp.previous_judge_feedback.feedback.value for comp in comparisons]
-        curr_judge_labels = [comp.new_judge_feedback.feedback.value for comp in comparisons]
-
         # Use cached schema information from judge
         if judge.schema_info:
             schema_info = judge.schema_info
@@ -320,127 +441,233 @@ class AlignmentService(BaseService):
                 # Default to binary categorical for backward compatibility
                 schema_info = SchemaInfo(
                     is_binary=True,
-                    options=['Pass', 'Fail']
+                    options=list(DEFAULT_CATEGORICAL_OPTIONS)
                 )
 
-        # Only calculate confusion matrices for binary categorical outcomes
+        # Encode all label lists once into shared category codes, then compute metrics
+        labels, (human_codes, prev_codes, curr_codes) = encode_labels(
+            [
+                human_labels,
+                [comp.previous_judge_feedback.feedback.value for comp in comparisons],
+                [comp.new_judge_feedback.feedback.value for comp in comparisons],
+            ],
+            schema_info.options,
+        )
+        matrix_prev = confusion_matrix(human_codes, prev_codes, len(labels))
+        matrix_new = confusion_matrix(human_codes, curr_codes, len(labels))
+        categorical_prev = categorical_metrics(matrix_prev, labels)
+        categorical_new = categorical_metrics(matrix_new, labels)
+
+        # Pass/fail confusion matrices are only shown for binary categorical outcomes
         confusion_matrix_prev = None
         confusion_matrix_new = None
         if schema_info.is_binary:
-            try:
-                confusion_matrix_prev = self.calculate_confusion_matrix(human_labels, prev_judge_labels)
-                confusion_matrix_new = self.calculate_confusion_matrix(human_labels, curr_judge_labels)
-            except Exception as e:
-                logger.warning(f'Confusion matrix calculation failed: {e}')
+            positive_code = positive_label_code(labels)
+            confusion_matrix_prev = binary_confusion_matrix(matrix_prev, positive_code)
+            confusion_matrix_new = binary_confusion_matrix(matrix_new, positive_code)
 
         metrics = AlignmentMetrics(
             total_samples=len(human_labels),
-            previous_agreement_count=sum(1 for h, p in zip(human_labels, prev_judge_labels) if h.lower() == p.lower()),
-            new_agreement_count=sum(1 for h, c in zip(human_labels, curr_judge_labels) if h.lower() == c.lower()),
+            previous_agreement_count=categorical_prev.agreement_count,
+            new_agreement_count=categorical_new.agreement_count,
             schema_info=schema_info,
             confusion_matrix_previous=confusion_matrix_prev,
-            confusion_matrix_new=confusion_matrix_new
+            confusion_matrix_new=confusion_matrix_new,
+            categorical_metrics_previous=categorical_prev,
+            categorical_metrics_new=categorical_new,
         )
 
-        return {'metrics': metrics, 'comparisons': comparisons}
+        result = {'metrics': metrics, 'comparisons': comparisons}
+        cache_service.cache_alignment_comparison(comparison_key, result)
+        return result
+
+    def _labels_version(self, judge_name: str, examples: List) -> str:
+        """Fingerprint the examples' human labels, so relabeling changes the comparison key."""
+        assessment_name = sanitize_judge_name(judge_name)
+        labels = []
+        for example in examples:
+            assessments = getattr(example, 'assessments', None)
+            if not isinstance(assessments, list):
+                continue
+            for assessment in assessments:
+                if (
+                    isinstance(assessment, dict)
+                    and assessment.get('assessment_name') == assessment_name
+                    and (assessment.get('source') or {}).get('source_type') == HUMAN_SOURCE
+                ):
+                    labels.append(
+                        f'{example.trace_id}:{assessment.get("last_update_time")}:'
+                        f'{json.dumps(assessment.get("feedback"), sort_keys=True, default=str)}'
+                    )
+        return hashlib.sha256('|'.join(sorted(labels)).encode()).hexdigest()[:8]
+
+    def run_alignment(
+        self, judge_id: str, checkpoint: Optional['AlignmentCheckpoint'] = None
+    ) -> AlignmentResponse:
+        """Run DSPy-powered judge alignment and create new version.
+
+        Alignment runs as a sequence of phases. Each phase records its outputs on the
+        checkpoint when it completes, and phases already recorded there are skipped, so
+        an interrupted run can resume from the last completed phase.
+
+        Args:
+            judge_id: Judge to align
+            checkpoint: Phase checkpoint to resume from and record into (defaults to a
+                fresh in-memory checkpoint)
 
-    def run_alignment(self, judge_id: str) -> AlignmentResponse:
-        """Run DSPy-powered judge alignment and create new version."""
+        Returns:
+            AlignmentResponse describing the new judge version
+        """
         from server.services.judge_service import judge_service
 
+        checkpoint = checkpoint or AlignmentCheckpoint()
+
         # Get current judge
         current_judge = judge_service.get_judge(judge_id)
         if not current_judge:
             raise ValueError(f'Judge {judge_id} not found')
 
-        # Get traces from the labeling service examples
-        from server.services.labeling_service import labeling_service
-        logger.debug(f'Getting examples from judge {judge_id}')
-        examples = labeling_service.get_examples(judge_id)
+        # Step 1: Run evaluation on current judge version (v_i)
+        if not checkpoint.is_completed(PHASE_EVALUATE_CURRENT):
+            checkpoint.start_phase(PHASE_EVALUATE_CURRENT)
 
-        # Get actual traces using trace_ids from examples
-        traces = []
-        for example in examples:
-            trace = cache_service.get_trace(example.trace_id)
-            if trace:
-                traces.append(trace)
-            else:
-                logger.warning(f'Could not fetch trace {example.trace_id} from cache')
+            # Get traces from the labeling service examples
+            from server.services.labeling_service import labeling_service
+            logger.debug(f'Getting examples from judge {judge_id}')
+            examples = labeling_service.get_examples(judge_id)
 
-        if not traces:
-            raise ValueError('No traces found in labeling session')
+            # Get actual traces using trace_ids from examples
+            traces = cache_service.get_traces([example.trace_id for example in examples])
 
-        # MLflow's alignment will handle minimum example requirements internally
-        labeling_progress = labeling_service.get_labeling_progress(judge_id)
+            if not traces:
+                raise ValueError('No traces found in labeling session')
 
-        # Extract trace IDs for evaluation
-        trace_ids = [trace.info.trace_id for trace in traces]
+            # Extract trace IDs for evaluation
+            trace_ids = [trace.info.trace_id for trace in traces]
 
-        # Step 1: Run evaluation on current judge version (v_i)
-        logger.debug(f'Running evaluation on judge {judge_id} v{current_judge.version}')
-        self.evaluate_judge(judge_id, TraceRequest(trace_ids=trace_ids))
-
-        # Invalidate trace cache after evaluation to get fresh judge feedback
-        logger.debug(f'Invalidating {len(trace_ids)} traces from cache after evaluation')
-        cache_service.invalidate_traces(trace_ids)
-
-        # Get fresh traces with updated judge feedback for optimization
-        fresh_traces = cache_service.get_traces(trace_ids)
-        logger.debug(f'Retrieved {len(fresh_traces)} fresh traces for optimization')
-
-        # Step 2: Get alignment model if configured
-        alignment_model = None
-        if current_judge.alignment_model_config and current_judge.alignment_model_config.model_type == "serving_endpoint":
-            endpoint_name = current_judge.alignment_model_config.serving_endpoint.endpoint_name
-            alignment_model = f"databricks:/{endpoint_name}"
-            logger.info(f'Using custom alignment model: {alignment_model}')
-        else:
-            # Use default alignment model (AgentEvalLM via get_chat_completions_result)
-            logger.info('Using default alignment model (AgentEvalLM via get_chat_completions_result)')
+            logger.debug(f'Running evaluation on judge {judge_id} v{current_judge.version}')
+            self.evaluate_judge(judge_id, TraceRequest(trace_ids=trace_ids))
+
+            # Invalidate trace cache after evaluation to get fresh judge feedback
+            logger.debug(f'Invalidating {len(trace_ids)} traces from cache after evaluation')
+            cache_service.invalidate_traces(trace_ids)
 
-        # Step 3: Run alignment on the judge using MLflow's native capability
-        logger.info(f'Starting alignment for judge {judge_id}')
-        judge_instance = judge_service._judges[judge_id]
-        alignment_success = judge_instance.optimize(fresh_traces, alignment_model=alignment_model)
+            checkpoint.complete_phase(
+                PHASE_EVALUATE_CURRENT, base_version=current_judge.version, trace_ids=trace_ids
+            )
+
+        base_version = checkpoint.outputs(PHASE_EVALUATE_CURRENT)['base_version']
+        trace_ids = checkpoint.outputs(PHASE_EVALUATE_CURRENT)['trace_ids']
+
+        # A version created before an interruption but not yet checkpointed must not be
+        # created (or optimized) a second time
+        version_created = checkpoint.is_completed(PHASE_CREATE_VERSION)
+        if current_judge.version > base_version and not version_created:
+            logger.info(
+                f'Judge {judge_id} already advanced to v{current_judge.version}, '
+                'skipping optimization'
+            )
+            if not checkpoint.is_completed(PHASE_OPTIMIZE):
+                checkpoint.complete_phase(PHASE_OPTIMIZE, aligned_instructions=None)
+            checkpoint.complete_phase(PHASE_CREATE_VERSION, new_version=current_judge.version)
+
+        # Step 2: Run alignment on the judge using MLflow's native capability
+        if not checkpoint.is_completed(PHASE_OPTIMIZE):
+            checkpoint.start_phase(PHASE_OPTIMIZE)
+
+            # Get fresh traces with updated judge feedback for optimization
+            fresh_traces = cache_service.get_traces(trace_ids)
+            logger.debug(f'Retrieved {len(fresh_traces)} fresh traces for optimization')
+
+            # Get alignment model if configured
+            alignment_model = None
+            if (
+                current_judge.alignment_model_config
+                and current_judge.alignment_model_config.model_type == 'serving_endpoint'
+            ):
+                endpoint_name = current_judge.alignment_model_config.serving_endpoint.endpoint_name
+                alignment_model = f'databricks:/{endpoint_name}'
+                logger.info(f'Using custom alignment model: {alignment_model}')
+            else:
+                # Use default alignment model (AgentEvalLM via get_chat_completions_result)
+                logger.info(
+                    'Using default alignment model (AgentEvalLM via get_chat_completions_result)'
+                )
 
-        # Check if alignment failed and fail early
-        if not alignment_success:
-            logger.error(f'Alignment failed for judge {judge_id}')
-            raise RuntimeError('Judge alignment failed. Please check the app logs for details.')
+            logger.info(f'Starting alignment for judge {judge_id}')
+            # A resumed job may run before the judge has been loaded into memory
+            judge_instance = judge_service._get_or_recreate_judge(judge_id)
+            if not judge_instance:
+                raise ValueError(f'Judge {judge_id} not found')
+            alignment_success = judge_instance.optimize(
+                fresh_traces, alignment_model=alignment_model
+            )
+
+            # Check if alignment failed and fail early
+            if not alignment_success:
+                logger.error(f'Alignment failed for judge {judge_id}')
+                raise RuntimeError('Judge alignment failed. Please check the app logs for details.')
+
+            # The judge instance now has the aligned MLflow judge with updated instructions
+            checkpoint.complete_phase(
+                PHASE_OPTIMIZE,
+                aligned_instructions=judge_instance.scorer_func.instructions,
+                optimizer_stats=judge_instance.alignment_stats,
+            )
 
         # Step 3: Create new judge version (v_i+1) with aligned instructions
-        # The judge instance now has the aligned MLflow judge with updated instructions
-        aligned_instructions = judge_instance.scorer_func.instructions
+        if not checkpoint.is_completed(PHASE_CREATE_VERSION):
+            checkpoint.start_phase(PHASE_CREATE_VERSION)
+            aligned_instructions = checkpoint.outputs(PHASE_OPTIMIZE)['aligned_instructions']
+
+            logger.info(f'Creating new version for judge {judge_id} with aligned instructions')
+            new_judge = judge_service.create_new_version(judge_id, aligned_instructions)
+
+            checkpoint.complete_phase(PHASE_CREATE_VERSION, new_version=new_judge.version)
 
-        logger.info(f'Creating new version for judge {judge_id} with aligned instructions')
-        new_judge = judge_service.create_new_version(judge_id, aligned_instructions)
+        new_version = checkpoint.outputs(PHASE_CREATE_VERSION)['new_version']
 
         # Step 4: Run evaluation on new judge version (v_i+1)
-        logger.info(f'Running evaluation on new judge version {new_judge.version}')
-        new_eval_result = self.evaluate_judge(new_judge.id, TraceRequest(trace_ids=trace_ids))
+        if not checkpoint.is_completed(PHASE_EVALUATE_NEW):
+            checkpoint.start_phase(PHASE_EVALUATE_NEW)
 
-        # Invalidate trace cache after second evaluation to get fresh judge feedback
-        logger.debug(f'Invalidating trace cache for {len(trace_ids)} traces after new version evaluation')
-        cache_service.invalidate_traces(trace_ids)
+            logger.info(f'Running evaluation on new judge version {new_version}')
+            self.evaluate_judge(judge_id, TraceRequest(trace_ids=trace_ids))
 
-        # Step 5: Use labeling service count for aligned samples count
+            # Invalidate trace cache after second evaluation to get fresh judge feedback
+            logger.debug(
+                f'Invalidating trace cache for {len(trace_ids)} traces after new version evaluation'
+            )
+            cache_service.invalidate_traces(trace_ids)
+
+            checkpoint.complete_phase(PHASE_EVALUATE_NEW)
+
+        # Step 5: Tag the existing labeling run with the aligned samples count
+        checkpoint.start_phase(PHASE_FINALIZE)
         from server.services.labeling_service import labeling_service
 
         labeling_progress = labeling_service.get_labeling_progress(judge_id)
         aligned_samples_count = labeling_progress.labeled_examples
 
-        logger.info(f'Found {aligned_samples_count} traces with valid human feedback out of {len(traces)} total traces')
+        logger.info(
+            f'Found {aligned_samples_count} traces with valid human feedback '
+            f'out of {len(trace_ids)} total traces'
+        )
 
-        # Step 6: Tag the existing labeling run with alignment info
         client = MlflowClient()
         client.set_tag(current_judge.labeling_run_id, ALIGNED_SAMPLES_COUNT, str(aligned_samples_count))
+        labeling_progress_monitor.invalidate(judge_id)
         logger.info(f'Tagged labeling run {current_judge.labeling_run_id} with aligned samples count: {aligned_samples_count}')
+        checkpoint.complete_phase(PHASE_FINALIZE)
 
         return AlignmentResponse(
-            judge_id=new_judge.id,
+            judge_id=judge_id,
             success=True,
-            message=f'Successfully aligned judge from version {current_judge.version} to {new_judge.version} using {aligned_samples_count} aligned samples',
-            new_version=new_judge.version,
+            message=(
+                f'Successfully aligned judge from version {base_version} to {new_version} '
+                f'using {aligned_samples_count} aligned samples'
+            ),
+            new_version=new_version,
             improvement_metrics=None,
         )
 
@@ -456,34 +683,11 @@ class AlignmentService(BaseService):
         Returns:
             ConfusionMatrix object with calculated metrics
         """
-        if len(human_labels) != len(judge_results):
-            raise ValueError('Human labels and judge results must have the same length')
-
-        true_positive = 0  # Judge Pass & Human Pass
-        false_negative = 0  # Judge Fail & Human Pass
-        false_positive = 0  # Judge Pass & Human Fail
-        true_negative = 0  # Judge Fail & Human Fail
-
-        for human, judge in zip(human_labels, judge_results):
-            # Normalize to pass/fail
-            human_pass = str(human).lower() == 'pass'
-            judge_pass = str(judge).lower() == 'pass'
-
-            if human_pass and judge_pass:
-                true_positive += 1
-            elif human_pass and not judge_pass:
-                false_negative += 1
-            elif not human_pass and judge_pass:
-                false_positive += 1
-            elif not human_pass and not judge_pass:
-                true_negative += 1
-
-        return ConfusionMatrix(
-            true_positive=true_positive,
-            false_negative=false_negative,
-            false_positive=false_positive,
-            true_negative=true_negative,
+        labels, (human_codes, judge_codes) = encode_labels(
+            [human_labels, judge_results], ['Pass', 'Fail']
         )
+        matrix = confusion_matrix(human_codes, judge_codes, len(labels))
+        return binary_confusion_matrix(matrix, positive_label_code(labels))
 
 
 # Global service instance
@@ -7,6 +7,8 @@ import mlflow
 from dotenv import load_dotenv
 from mlflow.tracking import MlflowClient
 
+from server.utils.metrics import InstrumentedClient
+
 logger = logging.getLogger(__name__)
 
 # Module-level shared client
@@ -22,9 +24,9 @@ def get_shared_mlflow_client():
         load_dotenv('.env.local')
         _validate_auth()
             
-        # Setup MLflow once
+        # Setup MLflow once; every client call is timed for the /metrics endpoint
         mlflow.set_tracking_uri('databricks')
-        _shared_mlflow_client = MlflowClient()
+        _shared_mlflow_client = InstrumentedClient(MlflowClient(), 'mlflow_client')
         
     return _shared_mlflow_client
 
@@ -2,26 +2,95 @@
 
 import hashlib
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
 import mlflow
-from cachetools import TTLCache
+from cachetools import LRUCache, TTLCache
+
+from server.utils.metrics import record_cache, track_call
+from server.utils.parsing_utils import get_assessment_index
+from server.utils.trace_summary import TraceSummary
+
+from .evaluation_run_index import evaluation_run_index, index_key
+from .persistent_cache import PersistentCache, create_persistent_cache
 
 logger = logging.getLogger(__name__)
 
+# Full traces (with spans) kept in memory, for scoring and optimization; sized to hold
+# the largest evaluation or alignment batch so a run never evicts its own traces
+TRACE_CACHE_SIZE = int(os.getenv('TRACE_CACHE_SIZE', '1000'))
+# Trace summaries (no spans) kept in memory, for examples and comparisons
+TRACE_SUMMARY_CACHE_SIZE = int(os.getenv('TRACE_SUMMARY_CACHE_SIZE', '10000'))
+# Upper bound on concurrent MLflow trace fetches for a single batch
+TRACE_FETCH_MAX_WORKERS = int(os.getenv('TRACE_FETCH_MAX_WORKERS', '16'))
+# How long a computed alignment comparison is reused
+COMPARISON_CACHE_TTL_SECONDS = int(os.getenv('COMPARISON_CACHE_TTL_SECONDS', '600'))
+# Safety net for scorers changed outside this app; registrations and deletes made
+# here update the cache directly
+SCORER_CACHE_TTL_SECONDS = int(os.getenv('SCORER_CACHE_TTL_SECONDS', '3600'))
+
 
 class CacheService:
-    """Service for caching MLflow traces and evaluation results."""
+    """Service for caching MLflow traces and evaluation results.
+
+    Lookups go through the in-memory TTL caches first, then the optional on-disk
+    persistent tier (which survives restarts), and only then MLflow.
+
+    The service is shared by request handlers and background threads. cachetools
+    caches are not thread-safe (even reads update their LRU and expiry order), so
+    every access to the in-memory caches holds _cache_lock; MLflow calls do not.
+    """
 
-    def __init__(self):
-        # Cache for MLflow trace objects (trace_id -> trace)
+    def __init__(self, persistent_cache: Optional[PersistentCache] = None):
+        # Cache for full MLflow trace objects (trace_id -> trace)
         # TTL of 30 minutes for traces
-        self.trace_cache: TTLCache = TTLCache(maxsize=1000, ttl=1800)
+        self.trace_cache: TTLCache = TTLCache(maxsize=TRACE_CACHE_SIZE, ttl=1800)
+
+        # Span-free summaries of every trace loaded (trace_id -> TraceSummary). Far
+        # smaller than full traces, so many more fit in memory
+        self.summary_cache: TTLCache = TTLCache(maxsize=TRACE_SUMMARY_CACHE_SIZE, ttl=1800)
 
         # Cache for evaluation run IDs (cache_key -> mlflow_run_id)
         # TTL of 1 hour for evaluations
         self.evaluation_cache: TTLCache = TTLCache(maxsize=500, ttl=3600)
 
+        # Per-trace judge results ('judge_id:version:trace_id' -> feedback). A judge version
+        # never changes, so entries stay valid until the judge is deleted
+        self.assessment_cache: LRUCache = LRUCache(maxsize=20000)
+
+        # Alignment comparison results ('judge_id:v_prev:v_new:dataset_version:labels_version'
+        # -> result), dropped whenever traces or the judge's evaluations are invalidated
+        self.comparison_cache: TTLCache = TTLCache(maxsize=100, ttl=COMPARISON_CACHE_TTL_SECONDS)
+
+        # Registered scorers ((experiment_id, scorer_name) -> scorer), filled on registration
+        # and from scorer listings, and dropped when a judge is deleted
+        self.scorer_cache: TTLCache = TTLCache(maxsize=1000, ttl=SCORER_CACHE_TTL_SECONDS)
+
+        # Guards every read, write and scan of the in-memory caches above
+        self._cache_lock = threading.RLock()
+
+        # Optional on-disk tier, warmed lazily as entries are fetched
+        self.persistent_cache = persistent_cache
+
+        # Hit/miss counts per cache ('trace', 'evaluation', ...), see get_cache_stats
+        self._lookup_counts: Dict[str, Dict[str, int]] = {}
+        self._lookup_lock = threading.Lock()
+
+    def _record_lookup(self, cache: str, hits: int = 0, misses: int = 0) -> None:
+        """Count lookups for one cache, locally and in the exported metrics."""
+        with self._lookup_lock:
+            counts = self._lookup_counts.setdefault(cache, {'hits': 0, 'misses': 0})
+            counts['hits'] += hits
+            counts['misses'] += misses
+        record_cache(cache, hits=hits, misses=misses)
+
+    def _lookup_stats(self, cache: str) -> Dict[str, int]:
+        with self._lookup_lock:
+            return dict(self._lookup_counts.get(cache, {'hits': 0, 'misses': 0}))
+
     def compute_dataset_version(self, trace_ids: List[str]) -> str:
         """Compute dataset version from trace IDs.
 
@@ -41,6 +110,49 @@ class CacheService:
         # Return first 8 characters of hex digest
         return hash_obj.hexdigest()[:8]
 
+    def _fetch_trace(self, trace_id: str) -> Optional[Any]:
+        """Fetch a single trace from MLflow without touching the cache.
+
+        Args:
+            trace_id: MLflow trace ID
+
+        Returns:
+            MLflow trace object or None if not found
+        """
+        try:
+            with track_call('mlflow.get_trace'):
+                return mlflow.get_trace(trace_id)
+        except Exception as e:
+            logger.warning(f'Failed to fetch trace {trace_id}: {e}')
+            return None
+
+    def _cache_trace(
+        self, trace_id: str, trace: Any, keep_full: bool = True
+    ) -> Optional[TraceSummary]:
+        """Store a trace's summary, and the full trace unless keep_full is False.
+
+        Assessments are indexed once on the way in.
+
+        Returns:
+            The trace summary, or None if the trace could not be summarized
+        """
+        summary = None
+        try:
+            summary = TraceSummary.from_trace(trace)
+            get_assessment_index(summary)
+            with self._cache_lock:
+                self.summary_cache[trace_id] = summary
+        except Exception as e:
+            logger.debug(f'Could not summarize trace {trace_id}: {e}')
+        if keep_full:
+            try:
+                get_assessment_index(trace)
+            except Exception as e:
+                logger.debug(f'Could not index assessments for trace {trace_id}: {e}')
+            with self._cache_lock:
+                self.trace_cache[trace_id] = trace
+        return summary
+
     def get_trace(self, trace_id: str) -> Optional[Any]:
         """Get trace from cache or fetch from MLflow.
 
@@ -51,42 +163,184 @@ class CacheService:
             MLflow trace object or None if not found
         """
         # Check cache first
-        if trace_id in self.trace_cache:
+        with self._cache_lock:
+            trace = self.trace_cache.get(trace_id)
+        if trace is not None:
             logger.debug(f'Cache hit for trace {trace_id}')
-            return self.trace_cache[trace_id]
+            self._record_lookup('trace', hits=1)
+            return trace
+        self._record_lookup('trace', misses=1)
 
-        try:
-            # Fetch from MLflow
-            logger.debug(f'Cache miss for trace {trace_id}, fetching from MLflow')
-            trace = mlflow.get_trace(trace_id)
+        # Check persistent tier
+        if self.persistent_cache:
+            trace = self.persistent_cache.get_traces([trace_id]).get(trace_id)
+            self._record_lookup(
+                'persistent_trace', hits=int(trace is not None), misses=int(trace is None)
+            )
+            if trace is not None:
+                logger.debug(f'Persistent cache hit for trace {trace_id}')
+                self._cache_trace(trace_id, trace)
+                return trace
+
+        # Fetch from MLflow
+        logger.debug(f'Cache miss for trace {trace_id}, fetching from MLflow')
+        trace = self._fetch_trace(trace_id)
+        if trace is None:
+            return None
 
-            # Store in cache
-            self.trace_cache[trace_id] = trace
-            logger.debug(f'Cached trace {trace_id}')
+        # Store in cache
+        self._cache_trace(trace_id, trace)
+        if self.persistent_cache:
+            self.persistent_cache.put_traces([trace])
+        logger.debug(f'Cached trace {trace_id}')
 
-            return trace
-        except Exception as e:
-            logger.warning(f'Failed to fetch trace {trace_id}: {e}')
+        return trace
+
+    def refresh_trace(self, trace_id: str) -> Optional[Any]:
+        """Re-fetch a trace from MLflow and replace any cached copy.
+
+        Used when a trace changed upstream (e.g. an SME labeled it), so the cached
+        copy lacks its latest assessments.
+
+        Args:
+            trace_id: MLflow trace ID
+
+        Returns:
+            MLflow trace object or None if it could not be fetched
+        """
+        trace = self._fetch_trace(trace_id)
+        if trace is None:
             return None
 
+        self._cache_trace(trace_id, trace)
+        if self.persistent_cache:
+            self.persistent_cache.put_traces([trace])
+        logger.debug(f'Refreshed trace {trace_id}')
+        return trace
+
+    def is_trace_cached(self, trace_id: str) -> bool:
+        """Whether a trace is in the in-memory tier (without counting a lookup)."""
+        with self._cache_lock:
+            return trace_id in self.trace_cache
+
     def get_traces(self, trace_ids: List[str]) -> List['mlflow.entities.Trace']:
-        """Get multiple traces from cache or fetch from MLflow.
+        """Get multiple traces from cache, fetching all misses from MLflow concurrently.
+
+        Cache misses are collected up front and fetched through a bounded worker pool,
+        then written to the cache in a single pass from the calling thread.
 
         Args:
             trace_ids: List of MLflow trace IDs
 
         Returns:
-            List of MLflow trace objects (excludes any that couldn't be fetched)
+            List of MLflow trace objects in request order (excludes any that couldn't be fetched)
         """
+        found: Dict[str, Any] = {}
+        missing: List[str] = []
+        with self._cache_lock:
+            for trace_id in dict.fromkeys(trace_ids):
+                trace = self.trace_cache.get(trace_id)
+                if trace is not None:
+                    found[trace_id] = trace
+                else:
+                    missing.append(trace_id)
+        self._record_lookup('trace', hits=len(found), misses=len(missing))
+
+        found.update(self._load_traces(missing))
+
         traces = []
         for trace_id in trace_ids:
-            trace = self.get_trace(trace_id)
+            trace = found.get(trace_id)
             if trace:
                 traces.append(trace)
             else:
                 logger.warning(f'Could not fetch trace {trace_id} from cache')
         return traces
 
+    def _load_traces(self, trace_ids: List[str], keep_full: bool = True) -> Dict[str, Any]:
+        """Load traces missing from memory from the persistent tier, then MLflow concurrently.
+
+        Loaded traces are written to the memory tier (full traces only if keep_full)
+        in a single pass from the calling thread.
+
+        Returns:
+            Dictionary of trace_id -> full trace for every trace that could be loaded
+        """
+        loaded: Dict[str, Any] = {}
+        missing = trace_ids
+
+        if missing and self.persistent_cache:
+            persisted = self.persistent_cache.get_traces(missing)
+            for trace_id, trace in persisted.items():
+                self._cache_trace(trace_id, trace, keep_full=keep_full)
+                loaded[trace_id] = trace
+            self._record_lookup(
+                'persistent_trace', hits=len(persisted), misses=len(missing) - len(persisted)
+            )
+            missing = [trace_id for trace_id in missing if trace_id not in persisted]
+
+        if missing:
+            logger.debug(f'Fetching {len(missing)} traces from MLflow')
+            max_workers = max(1, min(TRACE_FETCH_MAX_WORKERS, len(missing)))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                fetched = list(executor.map(self._fetch_trace, missing))
+
+            new_traces = []
+            for trace_id, trace in zip(missing, fetched):
+                if trace is not None:
+                    self._cache_trace(trace_id, trace, keep_full=keep_full)
+                    loaded[trace_id] = trace
+                    new_traces.append(trace)
+
+            if self.persistent_cache and new_traces:
+                self.persistent_cache.put_traces(new_traces)
+
+        return loaded
+
+    def get_trace_summaries(self, trace_ids: List[str]) -> List[TraceSummary]:
+        """Get span-free summaries of multiple traces.
+
+        Summaries are served from memory when any form of the trace is cached. Misses
+        are loaded like get_traces, but only their summaries are kept in memory, so
+        reading many traces this way doesn't evict the full traces scoring needs.
+
+        Args:
+            trace_ids: List of MLflow trace IDs
+
+        Returns:
+            List of trace summaries in request order (excludes any that couldn't be loaded)
+        """
+        found: Dict[str, TraceSummary] = {}
+        missing: List[str] = []
+        for trace_id in dict.fromkeys(trace_ids):
+            with self._cache_lock:
+                summary = self.summary_cache.get(trace_id)
+                trace = self.trace_cache.get(trace_id) if summary is None else None
+            if summary is None:
+                if trace is not None:
+                    summary = self._cache_trace(trace_id, trace)
+            if summary is not None:
+                found[trace_id] = summary
+            else:
+                missing.append(trace_id)
+        self._record_lookup('trace_summary', hits=len(found), misses=len(missing))
+
+        loaded = self._load_traces(missing, keep_full=False)
+        with self._cache_lock:
+            for trace_id in loaded:
+                summary = self.summary_cache.get(trace_id)
+                if summary is not None:
+                    found[trace_id] = summary
+
+        summaries = []
+        for trace_id in trace_ids:
+            summary = found.get(trace_id)
+            if summary is not None:
+                summaries.append(summary)
+            else:
+                logger.warning(f'Could not load trace {trace_id} summary')
+        return summaries
+
     def get_evaluation_run_id(
         self, judge_id: str, judge_version: int, trace_ids: List[str], experiment_id: Optional[str] = None
     ) -> Optional[str]:
@@ -104,10 +358,24 @@ class CacheService:
         dataset_version = self.compute_dataset_version(trace_ids)
         cache_key = f'{judge_id}:{judge_version}:{dataset_version}'
 
-        if cache_key in self.evaluation_cache:
-            run_id = self.evaluation_cache[cache_key]
+        with self._cache_lock:
+            run_id = self.evaluation_cache.get(cache_key)
+        if run_id is not None:
             logger.debug(f'Cache hit for evaluation {cache_key}')
+            self._record_lookup('evaluation', hits=1)
             return run_id
+        self._record_lookup('evaluation', misses=1)
+
+        if self.persistent_cache:
+            run_id = self.persistent_cache.get_evaluation_run_id(cache_key)
+            self._record_lookup(
+                'persistent_evaluation', hits=int(bool(run_id)), misses=int(not run_id)
+            )
+            if run_id:
+                logger.debug(f'Persistent cache hit for evaluation {cache_key}')
+                with self._cache_lock:
+                    self.evaluation_cache[cache_key] = run_id
+                return run_id
 
         logger.debug(f'Cache miss for evaluation {cache_key}')
 
@@ -122,47 +390,42 @@ class CacheService:
         return None
 
     def find_evaluation_run(self, judge_id: str, judge_version: int, experiment_id: str, dataset_version: str) -> Optional[str]:
-        """Find existing evaluation run in MLflow by searching for runs with matching tags."""
-        from server.utils.naming_utils import sanitize_judge_name
+        """Find an existing evaluation run in MLflow.
 
+        Reads the judge's evaluation run index (a single experiment read). On a miss
+        (evaluations that predate the index, entries trimmed from it or index writes
+        that failed) it falls back to a single tag search, and a run found that way is
+        added to the index.
+        """
+        cache_key = f'{judge_id}:{judge_version}:{dataset_version}'
         try:
-            # Method 1: Search for runs with judge tags
-            runs = mlflow.search_runs(
-                experiment_ids=[experiment_id],
-                filter_string=f"tags.judge_id = '{judge_id}' and tags.judge_version = '{judge_version}' and tags.dataset_version = '{dataset_version}'",
-                output_format='list'
-            )
+            index = evaluation_run_index.get(experiment_id, judge_id) or {}
+            run_id = index.get(index_key(judge_version, dataset_version))
+            if run_id:
+                self._store_evaluation_run_id(cache_key, run_id)
+                return run_id
+
+            with track_call('mlflow.search_runs'):
+                runs = mlflow.search_runs(
+                    experiment_ids=[experiment_id],
+                    filter_string=(
+                        f"tags.judge_id = '{judge_id}' "
+                        f"and tags.judge_version = '{judge_version}' "
+                        f"and tags.dataset_version = '{dataset_version}'"
+                    ),
+                    output_format='list',
+                    max_results=1,
+                )
 
             if runs:
                 run_id = runs[0].info.run_id
                 # Cache the found run
-                self.evaluation_cache[f'{judge_id}:{judge_version}:{dataset_version}'] = run_id
+                self._store_evaluation_run_id(cache_key, run_id)
+                evaluation_run_index.record(
+                    experiment_id, judge_id, judge_version, dataset_version, run_id
+                )
                 return run_id
 
-            # Method 2: Fallback - search by run name pattern if tag search fails
-            # Get judge metadata to find judge name
-            from server.services.judge_service import judge_service
-            judge = judge_service.get_judge(judge_id)
-            if not judge:
-                return None
-
-            sanitized_name = sanitize_judge_name(judge.name)
-            run_name_pattern = f'evaluation_{sanitized_name}_v{judge_version}_{dataset_version}'
-
-            # Search for runs by name pattern
-            all_runs = mlflow.search_runs(
-                experiment_ids=[experiment_id],
-                output_format='list',
-                max_results=100  # Limit to avoid performance issues
-            )
-
-            for run in all_runs:
-                if run.info.run_name and run.info.run_name == run_name_pattern:
-                    run_id = run.info.run_id
-                    # Cache the found run
-                    self.evaluation_cache[f'{judge_id}:{judge_version}:{dataset_version}'] = run_id
-                    return run_id
-
             return None
 
         except Exception as e:
@@ -170,7 +433,12 @@ class CacheService:
             return None
 
     def cache_evaluation_run_id(
-        self, judge_id: str, judge_version: int, trace_ids: List[str], run_id: str
+        self,
+        judge_id: str,
+        judge_version: int,
+        trace_ids: List[str],
+        run_id: str,
+        experiment_id: Optional[str] = None,
     ) -> None:
         """Cache evaluation run ID for judge and dataset.
 
@@ -179,22 +447,156 @@ class CacheService:
             judge_version: Judge version
             trace_ids: List of trace IDs in dataset
             run_id: MLflow run ID to cache
+            experiment_id: MLflow experiment ID; when given, the run is also added to
+                the judge's evaluation run index
         """
         dataset_version = self.compute_dataset_version(trace_ids)
         cache_key = f'{judge_id}:{judge_version}:{dataset_version}'
 
-        self.evaluation_cache[cache_key] = run_id
+        self._store_evaluation_run_id(cache_key, run_id)
+        if experiment_id:
+            evaluation_run_index.record(
+                experiment_id, judge_id, judge_version, dataset_version, run_id
+            )
         logger.debug(f'Cached evaluation {cache_key} (dataset with {len(trace_ids)} traces)')
 
+    def _store_evaluation_run_id(self, cache_key: str, run_id: str) -> None:
+        """Write an evaluation run ID to all cache tiers."""
+        with self._cache_lock:
+            self.evaluation_cache[cache_key] = run_id
+        if self.persistent_cache:
+            self.persistent_cache.put_evaluation_run_id(cache_key, run_id)
+
+    def get_trace_assessments(
+        self, judge_id: str, judge_version: int, trace_ids: List[str]
+    ) -> Dict[str, Any]:
+        """Get cached per-trace judge results for a judge version.
+
+        Args:
+            judge_id: Judge identifier
+            judge_version: Judge version
+            trace_ids: Trace IDs to look up
+
+        Returns:
+            Dictionary of trace_id -> feedback for traces with a cached result
+        """
+        results = {}
+        with self._cache_lock:
+            for trace_id in trace_ids:
+                feedback = self.assessment_cache.get(f'{judge_id}:{judge_version}:{trace_id}')
+                if feedback is not None:
+                    results[trace_id] = feedback
+        self._record_lookup('assessment', hits=len(results), misses=len(trace_ids) - len(results))
+        logger.debug(
+            f'Assessment cache: {len(results)}/{len(trace_ids)} hits '
+            f'for {judge_id} v{judge_version}'
+        )
+        return results
+
+    def cache_trace_assessments(
+        self, judge_id: str, judge_version: int, feedback_by_trace: Dict[str, Any]
+    ) -> None:
+        """Cache per-trace judge results for a judge version.
+
+        Results that errored are skipped so those traces are scored again next time.
+
+        Args:
+            judge_id: Judge identifier
+            judge_version: Judge version
+            feedback_by_trace: Dictionary of trace_id -> feedback
+        """
+        with self._cache_lock:
+            for trace_id, feedback in feedback_by_trace.items():
+                if feedback is None or getattr(feedback, 'error', None) is not None:
+                    continue
+                self.assessment_cache[f'{judge_id}:{judge_version}:{trace_id}'] = feedback
+
+    def get_alignment_comparison(self, comparison_key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached alignment comparison.
+
+        Args:
+            comparison_key: Key from alignment_comparison_key
+
+        Returns:
+            Cached comparison result or None
+        """
+        with self._cache_lock:
+            result = self.comparison_cache.get(comparison_key)
+        self._record_lookup('comparison', hits=int(result is not None), misses=int(result is None))
+        return result
+
+    def cache_alignment_comparison(self, comparison_key: str, result: Dict[str, Any]) -> None:
+        """Cache an alignment comparison result.
+
+        Args:
+            comparison_key: Key from alignment_comparison_key
+            result: Comparison result (metrics and per-trace comparisons)
+        """
+        with self._cache_lock:
+            self.comparison_cache[comparison_key] = result
+
+    def get_scorer(self, experiment_id: str, scorer_name: str) -> Optional[Any]:
+        """Get a cached registered scorer.
+
+        Args:
+            experiment_id: Experiment the scorer is registered in
+            scorer_name: Registered scorer name
+
+        Returns:
+            Scorer or None if not cached
+        """
+        with self._cache_lock:
+            scorer = self.scorer_cache.get((experiment_id, scorer_name))
+        self._record_lookup('scorer', hits=int(scorer is not None), misses=int(scorer is None))
+        return scorer
+
+    def cache_scorers(self, experiment_id: str, scorers: List[Any]) -> None:
+        """Cache registered scorers by their names.
+
+        Args:
+            experiment_id: Experiment the scorers are registered in
+            scorers: Registered scorers (e.g. from register or list_scorers)
+        """
+        with self._cache_lock:
+            for scorer in scorers:
+                if scorer is not None:
+                    self.scorer_cache[(experiment_id, scorer.name)] = scorer
+
+    def invalidate_scorers(self, experiment_id: str, scorer_names: List[str]) -> None:
+        """Drop cached scorers, e.g. after they are deleted.
+
+        Args:
+            experiment_id: Experiment the scorers are registered in
+            scorer_names: Registered scorer names
+        """
+        with self._cache_lock:
+            for scorer_name in scorer_names:
+                self.scorer_cache.pop((experiment_id, scorer_name), None)
+
+    def alignment_comparison_key(
+        self,
+        judge_id: str,
+        previous_version: int,
+        new_version: int,
+        dataset_version: str,
+        labels_version: str,
+    ) -> str:
+        """Build the comparison cache key for two judge versions over a labeled dataset."""
+        return f'{judge_id}:{previous_version}:{new_version}:{dataset_version}:{labels_version}'
+
     def invalidate_trace(self, trace_id: str) -> None:
         """Invalidate cached trace.
 
         Args:
             trace_id: Trace ID to invalidate
         """
-        if trace_id in self.trace_cache:
-            del self.trace_cache[trace_id]
-            logger.debug(f'Invalidated trace cache for {trace_id}')
+        with self._cache_lock:
+            self.summary_cache.pop(trace_id, None)
+            if self.trace_cache.pop(trace_id, None) is not None:
+                logger.debug(f'Invalidated trace cache for {trace_id}')
+            self.comparison_cache.clear()
+        if self.persistent_cache:
+            self.persistent_cache.delete_traces([trace_id])
 
     def invalidate_traces(self, trace_ids: List[str]) -> None:
         """Invalidate multiple cached traces.
@@ -203,10 +605,15 @@ class CacheService:
             trace_ids: List of trace IDs to invalidate
         """
         invalidated_count = 0
-        for trace_id in trace_ids:
-            if trace_id in self.trace_cache:
-                del self.trace_cache[trace_id]
-                invalidated_count += 1
+        with self._cache_lock:
+            for trace_id in trace_ids:
+                self.summary_cache.pop(trace_id, None)
+                if self.trace_cache.pop(trace_id, None) is not None:
+                    invalidated_count += 1
+            # Comparisons read judge results from the traces
+            self.comparison_cache.clear()
+        if self.persistent_cache:
+            self.persistent_cache.delete_traces(trace_ids)
 
         logger.debug(f'Invalidated {invalidated_count} traces from cache')
 
@@ -216,13 +623,32 @@ class CacheService:
         Args:
             judge_id: Judge ID to invalidate evaluations for
         """
-        keys_to_remove = [
-            key for key in self.evaluation_cache.keys() if key.startswith(f'{judge_id}:')
-        ]
-
-        for key in keys_to_remove:
-            del self.evaluation_cache[key]
-            logger.debug(f'Invalidated evaluation cache for {key}')
+        prefix = f'{judge_id}:'
+        with self._cache_lock:
+            keys_to_remove = [key for key in self.evaluation_cache.keys() if key.startswith(prefix)]
+
+            for key in keys_to_remove:
+                self.evaluation_cache.pop(key, None)
+                logger.debug(f'Invalidated evaluation cache for {key}')
+
+            for cache in (self.assessment_cache, self.comparison_cache):
+                for key in [key for key in cache.keys() if key.startswith(prefix)]:
+                    cache.pop(key, None)
+
+        if self.persistent_cache:
+            self.persistent_cache.delete_evaluations_with_prefix(f'{judge_id}:')
+
+    def clear(self) -> None:
+        """Clear all cache tiers."""
+        with self._cache_lock:
+            self.trace_cache.clear()
+            self.summary_cache.clear()
+            self.evaluation_cache.clear()
+            self.assessment_cache.clear()
+            self.comparison_cache.clear()
+            self.scorer_cache.clear()
+        if self.persistent_cache:
+            self.persistent_cache.clear()
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics for monitoring.
@@ -230,23 +656,48 @@ class CacheService:
         Returns:
             Dictionary with cache statistics
         """
-        return {
-            'trace_cache': {
-                'size': len(self.trace_cache),
-                'maxsize': self.trace_cache.maxsize,
-                'ttl': self.trace_cache.ttl,
-                'hits': getattr(self.trace_cache, 'hits', 0),
-                'misses': getattr(self.trace_cache, 'misses', 0),
-            },
-            'evaluation_cache': {
-                'size': len(self.evaluation_cache),
-                'maxsize': self.evaluation_cache.maxsize,
-                'ttl': self.evaluation_cache.ttl,
-                'hits': getattr(self.evaluation_cache, 'hits', 0),
-                'misses': getattr(self.evaluation_cache, 'misses', 0),
-            },
-        }
+        with self._cache_lock:
+            stats = {
+                'trace_cache': {
+                    'size': len(self.trace_cache),
+                    'maxsize': self.trace_cache.maxsize,
+                    'ttl': self.trace_cache.ttl,
+                    **self._lookup_stats('trace'),
+                },
+                'trace_summary_cache': {
+                    'size': len(self.summary_cache),
+                    'maxsize': self.summary_cache.maxsize,
+                    'ttl': self.summary_cache.ttl,
+                    **self._lookup_stats('trace_summary'),
+                },
+                'evaluation_cache': {
+                    'size': len(self.evaluation_cache),
+                    'maxsize': self.evaluation_cache.maxsize,
+                    'ttl': self.evaluation_cache.ttl,
+                    **self._lookup_stats('evaluation'),
+                },
+                'assessment_cache': {
+                    'size': len(self.assessment_cache),
+                    'maxsize': self.assessment_cache.maxsize,
+                    **self._lookup_stats('assessment'),
+                },
+                'comparison_cache': {
+                    'size': len(self.comparison_cache),
+                    'maxsize': self.comparison_cache.maxsize,
+                    'ttl': self.comparison_cache.ttl,
+                    **self._lookup_stats('comparison'),
+                },
+                'scorer_cache': {
+                    'size': len(self.scorer_cache),
+                    'maxsize': self.scorer_cache.maxsize,
+                    'ttl': self.scorer_cache.ttl,
+                    **self._lookup_stats('scorer'),
+                },
+            }
+        if self.persistent_cache:
+            stats['persistent_cache'] = self.persistent_cache.get_stats()
+        return stats
 
 
 # Global cache service instance
-cache_service = CacheService()
+cache_service = CacheService(persistent_cache=create_persistent_cache(trace_ttl=1800))
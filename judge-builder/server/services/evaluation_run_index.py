@@ -0,0 +1,134 @@
+"""Per-judge index of evaluation runs stored in experiment tags."""
+
+import json
+import logging
+import os
+import threading
+from typing import Dict, Optional
+
+from .base_service import BaseService
+
+logger = logging.getLogger(__name__)
+
+EVALUATION_RUNS_TAG_PREFIX = 'evaluation_runs.'
+
+# Entries kept per judge; the oldest are dropped first to stay within the tag size limit
+EVALUATION_INDEX_MAX_ENTRIES = int(os.getenv('EVALUATION_INDEX_MAX_ENTRIES', '64'))
+# Re-read/merge attempts when another writer changes the tag concurrently
+EVALUATION_INDEX_MAX_WRITE_ATTEMPTS = 5
+
+
+def evaluation_runs_tag(judge_id: str) -> str:
+    """Experiment tag holding a judge's evaluation run index."""
+    return f'{EVALUATION_RUNS_TAG_PREFIX}{judge_id}'
+
+
+def index_key(judge_version: int, dataset_version: str) -> str:
+    """Key of an evaluation run in a judge's index."""
+    return f'{judge_version}:{dataset_version}'
+
+
+class EvaluationRunIndex(BaseService):
+    """Maps (judge version, dataset version) to evaluation run IDs.
+
+    Each judge's index is a single JSON experiment tag, so a lookup is one experiment
+    read instead of run searches. The index is a cache, not the source of truth:
+    entries can be trimmed or fail to be written, so callers fall back to a run search
+    on a miss. Writes are read-modify-write with read-back verification, like the
+    judge metadata tag.
+    """
+
+    def __init__(self, max_entries: int = EVALUATION_INDEX_MAX_ENTRIES):
+        super().__init__()
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # Serializes writes per judge within this process
+        self._judge_locks: Dict[str, threading.Lock] = {}
+
+    def get(self, experiment_id: str, judge_id: str) -> Optional[Dict[str, str]]:
+        """Read a judge's index.
+
+        Args:
+            experiment_id: Experiment holding the judge
+            judge_id: Judge identifier
+
+        Returns:
+            Mapping of ``'<judge_version>:<dataset_version>'`` to run ID, or None if the
+            judge has no index yet
+        """
+        experiment = self.client.get_experiment(experiment_id)
+        if not experiment or not experiment.tags:
+            return None
+        value = experiment.tags.get(evaluation_runs_tag(judge_id))
+        if value is None:
+            return None
+        return json.loads(value)
+
+    def record(
+        self,
+        experiment_id: str,
+        judge_id: str,
+        judge_version: int,
+        dataset_version: str,
+        run_id: str,
+    ) -> bool:
+        """Add an evaluation run to a judge's index.
+
+        Args:
+            experiment_id: Experiment holding the judge
+            judge_id: Judge identifier
+            judge_version: Evaluated judge version
+            dataset_version: Dataset version of the evaluated traces
+            run_id: MLflow run ID of the evaluation
+
+        Returns:
+            True if the run is in the stored index
+        """
+        key = index_key(judge_version, dataset_version)
+        with self._lock:
+            judge_lock = self._judge_locks.setdefault(judge_id, threading.Lock())
+
+        with judge_lock:
+            try:
+                for attempt in range(EVALUATION_INDEX_MAX_WRITE_ATTEMPTS):
+                    entries = self.get(experiment_id, judge_id) or {}
+                    if entries.get(key) == run_id:
+                        return True
+
+                    # Re-insert so the newest entries are kept when trimming
+                    entries.pop(key, None)
+                    entries[key] = run_id
+                    while len(entries) > self.max_entries:
+                        entries.pop(next(iter(entries)))
+
+                    self.client.set_experiment_tag(
+                        experiment_id, evaluation_runs_tag(judge_id), json.dumps(entries)
+                    )
+
+                    # Verify that a concurrent writer didn't replace the tag without our entry
+                    if (self.get(experiment_id, judge_id) or {}).get(key) == run_id:
+                        logger.debug(
+                            f'Indexed evaluation run {run_id} for judge {judge_id} ({key})'
+                        )
+                        return True
+
+                    logger.info(
+                        f'Evaluation index for judge {judge_id} changed concurrently, '
+                        f'retrying (attempt {attempt + 1})'
+                    )
+            except Exception as e:
+                logger.warning(f'Failed to index evaluation run {run_id} for judge {judge_id}: {e}')
+                return False
+
+        logger.warning(f'Gave up indexing evaluation run {run_id} for judge {judge_id}')
+        return False
+
+    def delete(self, experiment_id: str, judge_id: str) -> None:
+        """Remove a judge's index (e.g. when the judge is deleted)."""
+        if self.get(experiment_id, judge_id) is None:
+            return
+        self.client.delete_experiment_tag(experiment_id, evaluation_runs_tag(judge_id))
+
+
+# Global index instance
+evaluation_run_index = EvaluationRunIndex()
@@ -1,10 +1,11 @@
 """Experiment service for MLflow integration."""
 
 import logging
-from typing import List, Optional
+import os
+from typing import List, Optional, Tuple
 
 import mlflow
-from mlflow.entities import Experiment, ViewType
+from mlflow.entities import Experiment, Trace, ViewType
 
 from server.models import TraceExample
 from server.utils.parsing_utils import extract_text_from_data
@@ -13,6 +14,9 @@ from .base_service import BaseService
 
 logger = logging.getLogger(__name__)
 
+# Traces per MLflow search request when paging through an experiment
+TRACE_PAGE_SIZE = int(os.getenv('TRACE_PAGE_SIZE', '100'))
+
 
 class ExperimentService(BaseService):
     """Experiment and trace operations."""
@@ -32,28 +36,84 @@ class ExperimentService(BaseService):
         """Get experiment by ID."""
         return self.client.get_experiment(experiment_id)
 
-    def get_experiment_traces(self, experiment_id: str, run_id: Optional[str] = None, max_results: int = 1000):
-        """Get traces from MLflow experiment."""
-        search_params = {'experiment_ids': [experiment_id], 'max_results': max_results}
-        if run_id:
-            search_params['run_id'] = run_id
+    def search_traces_page(
+        self,
+        experiment_id: str,
+        run_id: Optional[str] = None,
+        page_size: int = TRACE_PAGE_SIZE,
+        page_token: Optional[str] = None,
+    ) -> Tuple[List[Trace], Optional[str]]:
+        """Get one page of traces from an MLflow experiment.
+
+        Args:
+            experiment_id: Experiment to search
+            run_id: Only return traces linked to this run (optional)
+            page_size: Maximum number of traces to return
+            page_token: Token from the previous page, or None for the first page
 
-        traces_df = mlflow.search_traces(**search_params)
+        Returns:
+            Tuple of (traces, next page token or None if this is the last page)
+        """
+        page = self.client.search_traces(
+            experiment_ids=[experiment_id],
+            run_id=run_id,
+            max_results=page_size,
+            page_token=page_token,
+        )
+        return list(page), page.token or None
+
+    def get_experiment_traces_page(
+        self,
+        experiment_id: str,
+        run_id: Optional[str] = None,
+        page_size: int = TRACE_PAGE_SIZE,
+        page_token: Optional[str] = None,
+    ) -> Tuple[List[TraceExample], Optional[str]]:
+        """Get one page of trace examples from an MLflow experiment."""
+        traces, next_page_token = self.search_traces_page(
+            experiment_id, run_id, page_size, page_token
+        )
+        return traces_to_examples(traces), next_page_token
 
+    def get_experiment_traces(
+        self, experiment_id: str, run_id: Optional[str] = None, max_results: int = 1000
+    ):
+        """Get traces from MLflow experiment."""
         trace_examples = []
-        for _, row in traces_df.iterrows():
-            trace_examples.append(
-                TraceExample(
-                    trace_id=row['trace_id'],
-                    request=extract_text_from_data(row['request'], 'request'),
-                    response=extract_text_from_data(row['response'], 'response'),
-                    assessments=row.get('assessments', [])
-                )
+        page_token = None
+        while len(trace_examples) < max_results:
+            page, page_token = self.get_experiment_traces_page(
+                experiment_id,
+                run_id,
+                page_size=min(TRACE_PAGE_SIZE, max_results - len(trace_examples)),
+                page_token=page_token,
             )
+            trace_examples.extend(page)
+            if not page_token:
+                break
 
         logger.debug(f'Retrieved {len(trace_examples)} traces from experiment {experiment_id}')
         return trace_examples
 
 
+def traces_to_examples(traces: List[Trace]) -> List[TraceExample]:
+    """Convert traces to examples, extracting each field for the whole page at once."""
+    trace_ids = [trace.info.trace_id for trace in traces]
+    requests = [extract_text_from_data(trace.data.request, 'request') for trace in traces]
+    responses = [extract_text_from_data(trace.data.response, 'response') for trace in traces]
+    assessments = [
+        [assessment.to_dictionary() for assessment in trace.info.assessments or []]
+        for trace in traces
+    ]
+    return [
+        TraceExample(
+            trace_id=trace_id, request=request, response=response, assessments=trace_assessments
+        )
+        for trace_id, request, response, trace_assessments in zip(
+            trace_ids, requests, responses, assessments
+        )
+    ]
+
+
 # Global service instance
 experiment_service = ExperimentService()
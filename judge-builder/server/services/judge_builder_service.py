@@ -11,6 +11,8 @@ from server.models import (
     JudgeCreateRequest,
     JudgeResponse,
 )
+from server.utils.concurrency import experiment_scope
+from server.utils.metrics import track_call
 from server.utils.naming_utils import (
     create_dataset_table_name,
     create_scorer_name,
@@ -18,7 +20,10 @@ from server.utils.naming_utils import (
 )
 
 from .base_service import BaseService
+from .cache_service import cache_service
+from .evaluation_run_index import evaluation_run_index
 from .experiment_service import experiment_service
+from .judge_metadata_store import judge_metadata_store
 from .judge_service import judge_service
 from .labeling_service import labeling_service
 
@@ -55,7 +60,8 @@ class JudgeBuilderService(BaseService):
 
             # 1. Validate experiment exists
             try:
-                experiment = mlflow.get_experiment(request.experiment_id)
+                with track_call('mlflow.get_experiment'):
+                    experiment = mlflow.get_experiment(request.experiment_id)
                 if not experiment:
                     raise ValueError(f'Experiment {request.experiment_id} not found')
                 logger.debug(f'Validated experiment: {experiment.name} ({request.experiment_id})')
@@ -73,7 +79,8 @@ class JudgeBuilderService(BaseService):
                 raise ValueError(f'Judge {judge_response.id} not found after creation')
 
             try:
-                judge.register_scorer()
+                scorer = judge.register_scorer()
+                cache_service.cache_scorers(judge_response.experiment_id, [scorer])
                 logger.debug(f'Successfully registered scorer for judge {judge_response.name}')
             except Exception as e:
                 logger.error(f'CRITICAL: Failed to register scorer for judge {judge_response.name}: {e}')
@@ -199,7 +206,9 @@ class JudgeBuilderService(BaseService):
             # 2. Delete MLflow run for labeling session and the labeling session itself
             try:
                 # Get the labeling session first to extract run_id
-                session = self.labeling_service._get_labeling_session(judge_id)
+                session = self.labeling_service._get_labeling_session(
+                    judge_id, judge_response.experiment_id, judge_response.labeling_run_id
+                )
                 if session:
                     # Delete the underlying MLflow run
                     try:
@@ -226,7 +235,15 @@ class JudgeBuilderService(BaseService):
                 from mlflow.genai.scorers import delete_scorer
 
                 scorer_name = create_scorer_name(judge_response.name, judge_response.version)
-                delete_scorer(name=scorer_name)
+                cache_service.invalidate_scorers(
+                    judge_response.experiment_id,
+                    [
+                        create_scorer_name(judge_response.name, version)
+                        for version in range(1, judge_response.version + 1)
+                    ],
+                )
+                with track_call('scorers.delete_scorer'):
+                    delete_scorer(name=scorer_name, experiment_id=judge_response.experiment_id)
                 logger.debug(
                     f'Successfully deleted MLflow scorer {scorer_name} for judge {judge_id}'
                 )
@@ -241,7 +258,11 @@ class JudgeBuilderService(BaseService):
                 import mlflow.genai.label_schemas as schemas
 
                 schema_name = sanitize_judge_name(judge_response.name)
-                schemas.delete_label_schema(schema_name)
+                # Label schema deletion has no experiment parameter
+                with experiment_scope(judge_response.experiment_id):
+                    mlflow.set_experiment(experiment_id=judge_response.experiment_id)
+                    with track_call('labeling.delete_label_schema'):
+                        schemas.delete_label_schema(schema_name)
                 logger.debug(f'Successfully deleted label schema {schema_name} for judge {judge_id}')
             except Exception as e:
                 warning_msg = f'Failed to delete label schema: {e}'
@@ -249,7 +270,17 @@ class JudgeBuilderService(BaseService):
                 if not _is_not_found_error(str(e)):
                     deletion_warnings.append(warning_msg)
 
-            # 5. Delete the judge from JudgeService
+            # 5. Delete the judge's evaluation run index
+            try:
+                evaluation_run_index.delete(judge_response.experiment_id, judge_id)
+                logger.debug(f'Deleted evaluation run index for judge {judge_id}')
+            except Exception as e:
+                warning_msg = f'Failed to delete evaluation run index: {e}'
+                logger.warning(warning_msg)
+                if not _is_not_found_error(str(e)):
+                    deletion_warnings.append(warning_msg)
+
+            # 6. Delete the judge from JudgeService
             try:
                 self.judge_service.delete_judge(judge_id)
                 logger.debug(f'Deleted judge from service: {judge_id}')
@@ -276,9 +307,6 @@ class JudgeBuilderService(BaseService):
     def _store_judge_metadata_in_experiment(self, judge_response: JudgeResponse):
         """Store judge metadata as experiment tags."""
         try:
-            # Set experiment context
-            mlflow.set_experiment(experiment_id=judge_response.experiment_id)
-
             # Generate dataset name for backward compatibility
             create_dataset_table_name(judge_response.name, judge_response.id)
 
@@ -289,24 +317,19 @@ class JudgeBuilderService(BaseService):
                 'instruction': judge_response.instruction,
                 'version': judge_response.version,
             }
-
-            # Get existing judges metadata from experiment tags
-            experiment = mlflow.get_experiment(judge_response.experiment_id)
-            existing_judges = {}
-            if experiment and experiment.tags and 'judges' in experiment.tags:
-                try:
-                    existing_judges = json.loads(experiment.tags['judges'])
-                except Exception as parse_error:
-                    logger.warning(f'Failed to parse existing judges metadata: {parse_error}')
-
-            # Add this judge to the metadata
-            existing_judges[judge_response.id] = judge_metadata
-
-            # Store updated judges metadata
-            mlflow.set_experiment_tag('judges', json.dumps(existing_judges))
+            if judge_response.schema_info:
+                judge_metadata['schema_info'] = judge_response.schema_info.model_dump()
+
+            # Add this judge to the experiment's judges metadata
+            if not judge_metadata_store.put(
+                judge_response.experiment_id, judge_response.id, judge_metadata
+            ):
+                raise RuntimeError(
+                    f'Failed to write judges metadata for experiment {judge_response.experiment_id}'
+                )
 
             # Set judge_builder tag to indicate this experiment contains judge builders
-            mlflow.set_experiment_tag('judge_builder', 'true')
+            self.client.set_experiment_tag(judge_response.experiment_id, 'judge_builder', 'true')
 
             logger.info(
                 f'Stored metadata for judge {judge_response.id} in experiment {judge_response.experiment_id}'
@@ -319,41 +342,13 @@ class JudgeBuilderService(BaseService):
     def _remove_judge_from_experiment_metadata(self, judge_id: str, experiment_id: str):
         """Remove judge from experiment metadata tags."""
         try:
-            mlflow.set_experiment(experiment_id=experiment_id)
-
-            # Get existing judges metadata
-            experiment = mlflow.get_experiment(experiment_id)
-            if not experiment or not experiment.tags or 'judges' not in experiment.tags:
-                logger.warning(f'No judges metadata found in experiment {experiment_id}')
-                return
-
-            try:
-                existing_judges = json.loads(experiment.tags['judges'])
-            except Exception as parse_error:
-                logger.warning(f'Failed to parse existing judges metadata: {parse_error}')
-                return
-
-            # Remove this judge from metadata
-            if judge_id in existing_judges:
-                del existing_judges[judge_id]
-
-                # Update experiment tags
-                if existing_judges:
-                    mlflow.set_experiment_tag('judges', json.dumps(existing_judges))
-                else:
-                    # Remove both tags entirely if no judges remain
-                    try:
-                        mlflow.delete_experiment_tag('judges')
-                        mlflow.delete_experiment_tag('judge_builder')
-                    except Exception:
-                        # delete_experiment_tag might not be available, just log and continue
-                        logger.warning(
-                            'Could not delete empty judges/judge_builder tags from experiment'
-                        )
-
+            # Removing the last judge also removes the judges/judge_builder tags
+            if judge_metadata_store.remove(experiment_id, judge_id):
                 logger.info(f'Removed judge {judge_id} from experiment {experiment_id} metadata')
             else:
-                logger.warning(f'Judge {judge_id} not found in experiment {experiment_id} metadata')
+                logger.warning(
+                    f'Could not remove judge {judge_id} from experiment {experiment_id} metadata'
+                )
 
         except Exception as e:
             logger.error(f'Failed to remove judge from experiment metadata: {e}')
@@ -0,0 +1,207 @@
+"""Coalescing writer for judge metadata stored in experiment tags."""
+
+import json
+import logging
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from .base_service import BaseService
+
+logger = logging.getLogger(__name__)
+
+JUDGES_TAG = 'judges'
+JUDGE_BUILDER_TAG = 'judge_builder'
+
+# Write-behind delay: updates arriving within this window share one tag write
+METADATA_FLUSH_DELAY_SECONDS = float(os.getenv('JUDGE_METADATA_FLUSH_DELAY_SECONDS', '0.5'))
+# Re-read/merge attempts when another writer changes the tag concurrently
+METADATA_MAX_WRITE_ATTEMPTS = 5
+# Delay before retrying a flush that failed (the updates stay queued)
+METADATA_RETRY_DELAY_SECONDS = 5.0
+
+# Pending operation kinds
+_MERGE = 'merge'
+_PUT = 'put'
+_REMOVE = 'remove'
+
+
+def _apply(
+    judges_metadata: Dict[str, dict], ops: List[Tuple[str, str, Optional[dict]]]
+) -> Dict[str, dict]:
+    """Apply pending operations to a copy of the judges metadata.
+
+    Every operation is idempotent, so the same list can be re-applied on top of a
+    fresher copy of the tag after a conflicting write.
+    """
+    result = {judge_id: dict(metadata) for judge_id, metadata in judges_metadata.items()}
+    for judge_id, kind, payload in ops:
+        if kind == _PUT:
+            result[judge_id] = dict(payload)
+        elif kind == _REMOVE:
+            result.pop(judge_id, None)
+        elif judge_id in result:
+            result[judge_id].update(payload)
+    return result
+
+
+class JudgeMetadataStore(BaseService):
+    """Batches updates to the ``judges`` experiment tag.
+
+    Each experiment stores the metadata of all its judges in a single JSON tag, so an
+    update means read-modify-write of the whole tag. Updates are queued per experiment
+    and written together, either after a short write-behind delay or immediately when
+    flushed. MLflow has no conditional tag write, so concurrency is optimistic: after
+    writing, the tag is read back and, if another writer replaced it without our
+    changes, the pending operations are merged onto the fresh value and written again.
+    """
+
+    def __init__(self, flush_delay_seconds: float = METADATA_FLUSH_DELAY_SECONDS):
+        super().__init__()
+        self.flush_delay_seconds = flush_delay_seconds
+        self._lock = threading.Lock()
+        self._pending: Dict[str, List[Tuple[str, str, Optional[dict]]]] = {}
+        self._timers: Dict[str, threading.Timer] = {}
+        # Serializes writes per experiment within this process
+        self._experiment_locks: Dict[str, threading.Lock] = {}
+        self.stats = {'updates': 0, 'writes': 0, 'conflicts': 0}
+
+    # Queueing
+    def update(self, experiment_id: str, judge_id: str, updates: dict, flush: bool = False) -> bool:
+        """Merge fields into a judge's metadata.
+
+        Args:
+            experiment_id: Experiment holding the judge
+            judge_id: Judge to update (ignored if not present in the tag)
+            updates: Fields to set
+            flush: Write now instead of after the write-behind delay
+
+        Returns:
+            True if the update was queued, or written when flushing
+        """
+        return self._enqueue(experiment_id, (judge_id, _MERGE, dict(updates)), flush)
+
+    def put(self, experiment_id: str, judge_id: str, metadata: dict, flush: bool = True) -> bool:
+        """Add or replace a judge's metadata entry."""
+        return self._enqueue(experiment_id, (judge_id, _PUT, dict(metadata)), flush)
+
+    def remove(self, experiment_id: str, judge_id: str, flush: bool = True) -> bool:
+        """Remove a judge's metadata entry."""
+        return self._enqueue(experiment_id, (judge_id, _REMOVE, None), flush)
+
+    def _enqueue(
+        self, experiment_id: str, op: Tuple[str, str, Optional[dict]], flush: bool
+    ) -> bool:
+        with self._lock:
+            self._pending.setdefault(experiment_id, []).append(op)
+            self.stats['updates'] += 1
+            if not flush:
+                self._schedule(experiment_id, self.flush_delay_seconds)
+        if flush:
+            return self.flush(experiment_id)
+        return True
+
+    def _schedule(self, experiment_id: str, delay: float) -> None:
+        """Start a write-behind timer for an experiment (caller holds the lock)."""
+        if experiment_id in self._timers:
+            return
+        timer = threading.Timer(delay, self._flush_scheduled, (experiment_id,))
+        timer.daemon = True
+        self._timers[experiment_id] = timer
+        timer.start()
+
+    def pending_count(self) -> int:
+        """Number of operations not yet written."""
+        with self._lock:
+            return sum(len(ops) for ops in self._pending.values())
+
+    # Flushing
+    def _flush_scheduled(self, experiment_id: str) -> None:
+        self.flush(experiment_id)
+
+    def flush(self, experiment_id: Optional[str] = None) -> bool:
+        """Write pending updates now.
+
+        Args:
+            experiment_id: Experiment to flush, or None to flush every experiment
+
+        Returns:
+            True if every flushed write succeeded
+        """
+        if experiment_id is None:
+            with self._lock:
+                experiment_ids = list(self._pending)
+            return all([self.flush(pending_id) for pending_id in experiment_ids])
+
+        with self._lock:
+            experiment_lock = self._experiment_locks.setdefault(experiment_id, threading.Lock())
+
+        with experiment_lock:
+            with self._lock:
+                ops = self._pending.pop(experiment_id, [])
+                timer = self._timers.pop(experiment_id, None)
+            if timer:
+                timer.cancel()
+            if not ops:
+                return True
+
+            try:
+                self._write(experiment_id, ops)
+                return True
+            except Exception as e:
+                logger.error(f'Failed to update judge metadata for experiment {experiment_id}: {e}')
+                # Keep the updates, ahead of any queued since, and retry later
+                with self._lock:
+                    self._pending[experiment_id] = ops + self._pending.get(experiment_id, [])
+                    self._schedule(experiment_id, METADATA_RETRY_DELAY_SECONDS)
+                return False
+
+    def _read(self, experiment_id: str) -> Dict[str, dict]:
+        experiment = self.client.get_experiment(experiment_id)
+        if not experiment or not experiment.tags or JUDGES_TAG not in experiment.tags:
+            return {}
+        return json.loads(experiment.tags[JUDGES_TAG])
+
+    def _write(self, experiment_id: str, ops: List[Tuple[str, str, Optional[dict]]]) -> None:
+        """Write operations with read-back verification, re-merging on conflict."""
+        current = self._read(experiment_id)
+        for judge_id, kind, _ in ops:
+            if kind == _MERGE and judge_id not in current:
+                logger.warning(f'Judge {judge_id} not found in experiment metadata')
+
+        for attempt in range(METADATA_MAX_WRITE_ATTEMPTS):
+            desired = _apply(current, ops)
+            if desired == current:
+                # Our operations are already reflected in the stored tag
+                return
+
+            if desired:
+                self.client.set_experiment_tag(experiment_id, JUDGES_TAG, json.dumps(desired))
+            elif current:
+                # Remove both tags entirely if no judges remain
+                self.client.delete_experiment_tag(experiment_id, JUDGES_TAG)
+                self.client.delete_experiment_tag(experiment_id, JUDGE_BUILDER_TAG)
+            self.stats['writes'] += 1
+
+            # Verify that a concurrent writer didn't replace the tag without our changes
+            current = self._read(experiment_id)
+            if _apply(current, ops) == current:
+                logger.debug(
+                    f'Wrote {len(ops)} judge metadata updates to experiment {experiment_id}'
+                )
+                return
+
+            self.stats['conflicts'] += 1
+            logger.info(
+                f'Judge metadata for experiment {experiment_id} changed concurrently, '
+                f'merging and retrying (attempt {attempt + 1})'
+            )
+
+        raise RuntimeError(
+            f'Judge metadata for experiment {experiment_id} kept changing concurrently; '
+            f'gave up after {METADATA_MAX_WRITE_ATTEMPTS} attempts'
+        )
+
+
+# Global store instance
+judge_metadata_store = JudgeMetadataStore()
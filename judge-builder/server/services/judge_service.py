@@ -2,9 +2,13 @@
 
 import json
 import logging
-from typing import Dict, List, Optional
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
-import mlflow
+from mlflow.entities import ViewType
 
 from server.judges.instruction_judge import InstructionJudge
 from server.models import (
@@ -12,15 +16,23 @@ from server.models import (
     JudgeResponse,
     SchemaInfo,
 )
+from server.utils.concurrency import run_blocking
+from server.utils.metrics import STARTUP_EXPERIMENTS, STARTUP_JUDGES, STARTUP_LOAD_SECONDS
 from server.utils.schema_analysis import (
     extract_categorical_options_from_instruction,
     is_binary_categorical_options,
 )
 
 from .base_service import BaseService
+from .cache_service import cache_service
 
 logger = logging.getLogger(__name__)
 
+# Page size for discovering judge_builder experiments (all pages are read)
+EXPERIMENT_SEARCH_PAGE_SIZE = 100
+# Judges instantiated concurrently on startup
+JUDGE_LOAD_MAX_WORKERS = int(os.getenv('JUDGE_LOAD_MAX_WORKERS', '16'))
+
 
 class JudgeService(BaseService):
     """Core judge management and versioning."""
@@ -33,45 +45,111 @@ class JudgeService(BaseService):
         self._versions: Dict[str, Dict[int, InstructionJudge]] = {}
         # Cache for judge_builder experiments to avoid repeated searches
         self._judge_experiments_cache = None
-
-    def _judge_to_response(self, judge: InstructionJudge) -> JudgeResponse:
-        """Convert a CustomPromptJudge to JudgeResponse."""
-        # Perform schema analysis once and cache it
+        # Index of judge_id -> (experiment_id, metadata), built from the cached experiments
+        self._judge_index: Optional[Dict[str, Tuple[str, dict]]] = None
+        # Guards registration of recreated judges, which may happen concurrently
+        self._lock = threading.Lock()
+        # Timing of the last startup load, for monitoring
+        self.startup_stats: Dict[str, Any] = {}
+        # Built responses keyed by (judge_id, version); cleared when a judge's fields change
+        self._responses: Dict[Tuple[str, int], JudgeResponse] = {}
+
+    def _analyze_schema(self, judge: InstructionJudge) -> Optional[SchemaInfo]:
+        """Run schema analysis on a judge's instructions (makes an LLM call).
+
+        Returns None if the analysis fails, so a guessed schema is never stored; the
+        judge's schema stays unset and is analyzed again on the next read.
+        """
         try:
             options = extract_categorical_options_from_instruction(judge.user_instructions)
-            schema_info = SchemaInfo(
-                is_binary=is_binary_categorical_options(options),
-                options=options
-            )
         except Exception as e:
             logger.warning(f'Schema analysis failed for judge {judge.id}: {e}')
-            # Default to binary categorical for backward compatibility
-            schema_info = SchemaInfo(
-                is_binary=True,
-                options=['Pass', 'Fail']
-            )
-        
-        return JudgeResponse(
-            id=judge.id,
-            name=judge.name,
-            instruction=judge.user_instructions,  # Use user instructions for display
-            experiment_id=judge.experiment_id,
-            version=judge.version,
-            labeling_run_id=judge.labeling_run_id,
-            schema_info=schema_info,
-            alignment_model_config=getattr(judge, 'alignment_model_config', None),
+            return None
+        return SchemaInfo(
+            is_binary=is_binary_categorical_options(options),
+            options=options
         )
 
+    def _get_schema_info(self, judge: InstructionJudge) -> Optional[SchemaInfo]:
+        """Get the judge's schema info, analyzing its instructions only if not yet known."""
+        schema_info = getattr(judge, 'schema_info', None)
+        if schema_info is None:
+            schema_info = self._analyze_schema(judge)
+            judge.schema_info = schema_info
+        return schema_info
+
+    def _judge_to_response(self, judge: InstructionJudge) -> JudgeResponse:
+        """Convert a CustomPromptJudge to JudgeResponse."""
+        key = (judge.id, judge.version)
+        response = self._responses.get(key)
+        if response is None:
+            response = JudgeResponse(
+                id=judge.id,
+                name=judge.name,
+                instruction=judge.user_instructions,  # Use user instructions for display
+                experiment_id=judge.experiment_id,
+                version=judge.version,
+                labeling_run_id=judge.labeling_run_id,
+                schema_info=self._get_schema_info(judge),
+                alignment_model_config=getattr(judge, 'alignment_model_config', None),
+            )
+            # Without a schema the analysis failed; don't cache so the next read retries
+            if response.schema_info is not None:
+                self._responses[key] = response
+        # Callers may modify the response, so hand out copies
+        return response.model_copy()
+
+    def _invalidate_responses(self, judge_id: str) -> None:
+        """Drop cached responses for a judge after its fields change."""
+        for key in [key for key in self._responses if key[0] == judge_id]:
+            del self._responses[key]
+
     def _get_judge_experiments(self, force_refresh: bool = False):
         """Get judge_builder experiments with caching."""
         if self._judge_experiments_cache is None or force_refresh:
-            self._judge_experiments_cache = mlflow.search_experiments(
-                view_type=mlflow.entities.ViewType.ACTIVE_ONLY,
-                filter_string="tags.judge_builder = 'true'",
-                max_results=100,
-            )
+            experiments = []
+            page_token = None
+            while True:
+                page = self.client.search_experiments(
+                    view_type=ViewType.ACTIVE_ONLY,
+                    filter_string="tags.judge_builder = 'true'",
+                    max_results=EXPERIMENT_SEARCH_PAGE_SIZE,
+                    page_token=page_token,
+                )
+                experiments.extend(page)
+                page_token = page.token
+                if not page_token:
+                    break
+            self._judge_experiments_cache = experiments
+            self._judge_index = None
         return self._judge_experiments_cache
 
+    def _get_judge_index(self) -> Dict[str, Tuple[str, dict]]:
+        """Get the judge_id -> (experiment_id, metadata) index, building it in one pass."""
+        experiments = self._get_judge_experiments()
+        if self._judge_index is None:
+            index = {}
+            for experiment in experiments:
+                if not experiment.tags or 'judges' not in experiment.tags:
+                    continue
+                try:
+                    judges_metadata = json.loads(experiment.tags['judges'])
+                except (TypeError, ValueError) as e:
+                    logger.warning(
+                        'Failed to parse judges metadata from experiment '
+                        f'{experiment.experiment_id}: {e}'
+                    )
+                    continue
+                for judge_id, metadata in judges_metadata.items():
+                    index[judge_id] = (experiment.experiment_id, metadata)
+            self._judge_index = index
+        return self._judge_index
+
+    def _invalidate_judge_experiments(self) -> None:
+        """Force the next lookup to search experiments again."""
+        self._judge_experiments_cache = None
+        self._judge_index = None
+
     # Core CRUD operations
     def create_judge(self, request: JudgeCreateRequest) -> JudgeResponse:
         """Create a new judge."""
@@ -106,9 +184,10 @@ class JudgeService(BaseService):
             )
 
         # Invalidate experiment cache since we created a new judge
-        self._judge_experiments_cache = None
+        self._invalidate_judge_experiments()
 
         logger.info(f"Created judge {judge.id} with name '{judge.name}'")
+        # Building the response analyzes the schema once; it is persisted with the judge metadata
         return self._judge_to_response(judge)
 
     def get_judge(self, judge_id: str) -> Optional[JudgeResponse]:
@@ -142,6 +221,7 @@ class JudgeService(BaseService):
             del self._judges[judge_id]
             if judge_id in self._versions:
                 del self._versions[judge_id]
+            self._invalidate_responses(judge_id)
 
             return True
 
@@ -162,6 +242,7 @@ class JudgeService(BaseService):
 
         # Update the alignment model config
         judge.alignment_model_config = config
+        self._invalidate_responses(judge_id)
 
         # Persist to metadata
         if config:
@@ -199,21 +280,26 @@ class JudgeService(BaseService):
         new_judge.id = judge_id  # Keep same ID
         new_judge.version = new_version
         new_judge.labeling_run_id = current_judge.labeling_run_id  # Carry over labeling run ID
+        # User instructions are unchanged, so the schema carries over without re-analysis
+        new_judge.schema_info = self._get_schema_info(current_judge)
 
         # Update storage
         self._judges[judge_id] = new_judge
         self._versions[judge_id][new_version] = new_judge
 
-        # Update experiment metadata with new version and optimized instructions
-        self._update_judge_version_in_metadata(judge_id, new_version, new_judge.experiment_id, aligned_instruction)
-
-        # Also update labeling_run_id in metadata if it exists
+        # Update experiment metadata with new version, optimized instructions and
+        # labeling_run_id in a single write
+        updates = {'version': new_version}
+        if aligned_instruction:
+            updates['optimized_instructions'] = aligned_instruction
         if current_judge.labeling_run_id:
-            self._update_judge_metadata(judge_id, new_judge.experiment_id, {'labeling_run_id': current_judge.labeling_run_id})
+            updates['labeling_run_id'] = current_judge.labeling_run_id
+        self._update_judge_metadata(judge_id, new_judge.experiment_id, updates, flush=True)
 
         # Register scorer for the new version
         try:
-            new_judge.register_scorer()
+            scorer = new_judge.register_scorer()
+            cache_service.cache_scorers(new_judge.experiment_id, [scorer])
         except Exception as e:
             logger.error(f'Failed to register scorer for judge {judge_id} version {new_version}: {e}')
 
@@ -227,94 +313,95 @@ class JudgeService(BaseService):
         if judge:
             return judge
 
-        # Use cached experiments
-        experiments = self._get_judge_experiments()
+        entry = self._get_judge_index().get(judge_id)
+        if not entry:
+            return None
 
-        for experiment in experiments:
-            if experiment.tags and 'judges' in experiment.tags:
-                judges_metadata = json.loads(experiment.tags['judges'])
-                if judge_id not in judges_metadata:
-                    continue
+        experiment_id, metadata = entry
+        judge = self._recreate_judge(judge_id, experiment_id, metadata)
 
-                metadata = judges_metadata[judge_id]
+        # Persist the schema for judges stored without one
+        if not metadata.get('schema_info') and judge.schema_info is not None:
+            self._update_judge_metadata(
+                judge_id, experiment_id, {'schema_info': judge.schema_info.model_dump()}
+            )
+        return judge
 
-                # Recreate judge from metadata
-                judge = InstructionJudge(
-                    name=metadata['name'],
-                    user_instructions=metadata['instruction'],  # Keep original for display
-                    experiment_id=experiment.experiment_id,
-                )
+    def _recreate_judge(
+        self, judge_id: str, experiment_id: str, metadata: dict
+    ) -> InstructionJudge:
+        """Recreate a judge from its experiment metadata and register it in memory."""
+        judge = InstructionJudge(
+            name=metadata['name'],
+            user_instructions=metadata['instruction'],  # Keep original for display
+            experiment_id=experiment_id,
+        )
 
-                # Override auto-generated values with stored ones
-                judge.id = judge_id
-                judge.version = metadata.get('version', 1)
+        # Override auto-generated values with stored ones
+        judge.id = judge_id
+        judge.version = metadata.get('version', 1)
 
-                # Set labeling_run_id if available in metadata
-                if 'labeling_run_id' in metadata and metadata['labeling_run_id']:
-                    judge.labeling_run_id = metadata['labeling_run_id']
+        # Set labeling_run_id if available in metadata
+        if 'labeling_run_id' in metadata and metadata['labeling_run_id']:
+            judge.labeling_run_id = metadata['labeling_run_id']
 
-                # Restore alignment_model_config if available in metadata
-                if 'alignment_model_config' in metadata and metadata['alignment_model_config']:
-                    from server.models import AlignmentModelConfig
-                    judge.alignment_model_config = AlignmentModelConfig(**metadata['alignment_model_config'])
+        # Restore alignment_model_config if available in metadata
+        if 'alignment_model_config' in metadata and metadata['alignment_model_config']:
+            from server.models import AlignmentModelConfig
+            judge.alignment_model_config = AlignmentModelConfig(
+                **metadata['alignment_model_config']
+            )
 
-                # For InstructionJudge, we don't need to manually handle optimized instructions
-                # The MLflow judge handles this internally
-                # TODO: We may need to recreate the judge with optimized instructions if needed
+        # Restore schema_info, analyzing it for judges stored without one
+        if metadata.get('schema_info'):
+            judge.schema_info = SchemaInfo(**metadata['schema_info'])
+        else:
+            judge.schema_info = self._analyze_schema(judge)
 
-                # Cache the recreated judge
-                self._judges[judge_id] = judge
+        # For InstructionJudge, we don't need to manually handle optimized instructions
+        # The MLflow judge handles this internally
+        # TODO: We may need to recreate the judge with optimized instructions if needed
 
-                # Initialize version history
-                if judge_id not in self._versions:
-                    self._versions[judge_id] = {}
-                self._versions[judge_id][judge.version] = judge
+        with self._lock:
+            # Another thread may have recreated the judge first
+            existing = self._judges.get(judge_id)
+            if existing:
+                return existing
 
-                logger.debug(
-                    f'Recreated judge {judge_id} from experiment {experiment.experiment_id}'
-                )
-                return judge
+            # Cache the recreated judge
+            self._judges[judge_id] = judge
 
-        return None
+            # Initialize version history
+            if judge_id not in self._versions:
+                self._versions[judge_id] = {}
+            self._versions[judge_id][judge.version] = judge
 
-    def _update_judge_metadata(self, judge_id: str, experiment_id: str, updates: dict):
+        logger.debug(f'Recreated judge {judge_id} from experiment {experiment_id}')
+        return judge
+
+    def _update_judge_metadata(
+        self, judge_id: str, experiment_id: str, updates: dict, flush: bool = False
+    ):
         """Helper method to update judge metadata in experiment tags."""
-        try:
-            import json
-
-            # Get current experiment
-            experiment = mlflow.get_experiment(experiment_id)
-            if not experiment or not experiment.tags:
-                logger.warning(f'No experiment found or no tags for experiment {experiment_id}')
-                return False
-
-            # Get current judges metadata
-            judges_metadata = {}
-            if 'judges' in experiment.tags:
-                judges_metadata = json.loads(experiment.tags['judges'])
-
-            # Update the judge metadata
-            if judge_id in judges_metadata:
-                judges_metadata[judge_id].update(updates)
-
-                # Update experiment tags
-                mlflow.set_experiment_tag('judges', json.dumps(judges_metadata))
-                logger.debug(f'Updated metadata for judge {judge_id}: {updates}')
-                return True
-            else:
-                logger.warning(f'Judge {judge_id} not found in experiment metadata')
-                return False
+        return self._update_judges_metadata(experiment_id, {judge_id: updates}, flush=flush)
 
-        except Exception as e:
-            logger.error(f'Failed to update judge metadata: {e}')
-            return False
+    def _update_judges_metadata(
+        self, experiment_id: str, updates_by_judge: Dict[str, dict], flush: bool = False
+    ) -> bool:
+        """Queue metadata updates for judges in one experiment.
 
-    def _update_judge_version_in_metadata(self, judge_id: str, new_version: int, experiment_id: str, optimized_instructions: str = None):
-        """Update the judge version and optimized instructions in experiment metadata."""
-        updates = {'version': new_version}
-        if optimized_instructions:
-            updates['optimized_instructions'] = optimized_instructions
-        self._update_judge_metadata(judge_id, experiment_id, updates)
+        Updates are coalesced by the metadata store into a single tag write, made
+        after a short delay unless flush is set.
+        """
+        from server.services.judge_metadata_store import judge_metadata_store
+
+        for judge_id, updates in updates_by_judge.items():
+            judge_metadata_store.update(experiment_id, judge_id, updates)
+            logger.debug(f'Queued metadata update for judge {judge_id}: {updates}')
+
+        if flush:
+            return judge_metadata_store.flush(experiment_id)
+        return True
 
     def update_judge_labeling_run_id(self, judge_id: str, labeling_run_id: str):
         """Update the labeling run ID for a judge."""
@@ -324,6 +411,7 @@ class JudgeService(BaseService):
             for version, version_judge in self._versions.get(judge_id, {}).items():
                 if hasattr(version_judge, 'labeling_run_id'):
                     version_judge.labeling_run_id = labeling_run_id
+            self._invalidate_responses(judge_id)
 
             # Update experiment metadata with labeling_run_id
             self._update_judge_metadata(judge_id, judge.experiment_id, {'labeling_run_id': labeling_run_id})
@@ -336,23 +424,70 @@ class JudgeService(BaseService):
         """Load all judges from experiments into cache on application startup."""
         logger.info('Loading all judges into cache on startup...')
         try:
-            # Load experiments (this will populate the cache)
-            experiments = self._get_judge_experiments()
-
-            judge_count = 0
-            for experiment in experiments:
-                if experiment.tags and 'judges' in experiment.tags:
-                    judges_metadata = json.loads(experiment.tags['judges'])
-                    for judge_id in judges_metadata.keys():
-                        # Use existing method to load/recreate each judge
-                        judge = self._get_or_recreate_judge(judge_id)
-                        if judge:
-                            judge_count += 1
-
-            logger.info(f'Successfully loaded {judge_count} judges into cache')
+            await run_blocking(self.load_all_judges)
         except Exception as e:
             logger.error(f'Failed to load judges on startup: {e}')
 
+    def load_all_judges(self) -> int:
+        """Recreate every judge found in experiment metadata, instantiating them concurrently.
+
+        Returns:
+            Number of judges loaded
+        """
+        start = time.perf_counter()
+
+        # One pass over the experiments builds the index (this also populates the cache)
+        index = self._get_judge_index()
+        pending = [
+            (judge_id, experiment_id, metadata)
+            for judge_id, (experiment_id, metadata) in index.items()
+            if judge_id not in self._judges
+        ]
+
+        def load(entry):
+            judge_id, experiment_id, metadata = entry
+            try:
+                return self._recreate_judge(judge_id, experiment_id, metadata)
+            except Exception as e:
+                logger.warning(f'Failed to load judge {judge_id}: {e}')
+                return None
+
+        judges = []
+        if pending:
+            max_workers = min(JUDGE_LOAD_MAX_WORKERS, len(pending))
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix='judge-loader'
+            ) as executor:
+                judges = list(executor.map(load, pending))
+
+        # Backfill schemas for judges stored without one, one tag write per experiment
+        backfills: Dict[str, Dict[str, dict]] = {}
+        for (judge_id, experiment_id, metadata), judge in zip(pending, judges):
+            if judge and judge.schema_info is not None and not metadata.get('schema_info'):
+                backfills.setdefault(experiment_id, {})[judge_id] = {
+                    'schema_info': judge.schema_info.model_dump()
+                }
+        for experiment_id, updates in backfills.items():
+            self._update_judges_metadata(experiment_id, updates)
+
+        judge_count = sum(1 for judge in judges if judge)
+        duration = time.perf_counter() - start
+        self.startup_stats = {
+            'judges_loaded': judge_count,
+            'judges_failed': len(pending) - judge_count,
+            'experiments': len(self._get_judge_experiments()),
+            'duration_seconds': round(duration, 3),
+        }
+        STARTUP_JUDGES.set(self.startup_stats['judges_loaded'], result='loaded')
+        STARTUP_JUDGES.set(self.startup_stats['judges_failed'], result='failed')
+        STARTUP_EXPERIMENTS.set(self.startup_stats['experiments'])
+        STARTUP_LOAD_SECONDS.set(duration)
+        logger.info(
+            f'Successfully loaded {judge_count} judges from {self.startup_stats["experiments"]} '
+            f'experiments in {duration:.2f}s'
+        )
+        return judge_count
+
 
 # Global service instance
 judge_service = JudgeService()
@@ -0,0 +1,246 @@
+"""Shared, versioned labeling progress per judge with push updates."""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional, Set
+
+from server.models import LabelingProgress
+from server.utils.metrics import LABELING_PROGRESS_REFRESHES
+
+logger = logging.getLogger(__name__)
+
+LABELING_PROGRESS_MONITOR_ENABLED = (
+    os.getenv('LABELING_PROGRESS_MONITOR_ENABLED', 'true').lower() == 'true'
+)
+# Seconds a judge's progress is reused before MLflow is read again
+LABELING_PROGRESS_INTERVAL_SECONDS = float(os.getenv('LABELING_PROGRESS_INTERVAL_SECONDS', '10'))
+# Seconds without readers after which a judge's progress is dropped
+LABELING_PROGRESS_IDLE_SECONDS = float(os.getenv('LABELING_PROGRESS_IDLE_SECONDS', '300'))
+
+
+class ProgressSubscription:
+    """One stream's view of a judge's progress, holding only the latest update.
+
+    Updates are published from the poller thread and picked up on the event loop
+    the subscription was created on; a slow reader skips straight to the newest
+    progress instead of queueing every change.
+    """
+
+    def __init__(self, judge_id: str, loop: asyncio.AbstractEventLoop):
+        self.judge_id = judge_id
+        self._loop = loop
+        self._event = asyncio.Event()
+        self._latest: Optional[LabelingProgress] = None
+
+    def publish(self, progress: LabelingProgress) -> None:
+        """Hand an update to the reader (safe to call from any thread)."""
+        self._latest = progress
+        self._loop.call_soon_threadsafe(self._event.set)
+
+    async def next(self, timeout: Optional[float] = None) -> Optional[LabelingProgress]:
+        """Wait for the next update, returning None if none arrives within the timeout."""
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        self._event.clear()
+        return self._latest
+
+
+class _JudgeProgress:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.progress: Optional[LabelingProgress] = None
+        self.refreshed_at = 0.0
+        self.accessed_at = 0.0
+        self.stale = False
+        self.subscribers: Set[ProgressSubscription] = set()
+
+
+class LabelingProgressMonitor:
+    """Keeps one labeling progress aggregate per judge, shared by all readers.
+
+    Reads within the refresh interval are served from the aggregate, so any number
+    of open pages polling or subscribing to a judge cost one MLflow read per interval.
+    A background thread refreshes judges with subscribers and pushes an update to
+    them only when the progress changes; each change gets a new version number.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float = LABELING_PROGRESS_INTERVAL_SECONDS,
+        idle_seconds: float = LABELING_PROGRESS_IDLE_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.interval_seconds = interval_seconds
+        self.idle_seconds = idle_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._judges: Dict[str, _JudgeProgress] = {}
+        # Versions are wall-clock milliseconds, so they keep increasing across restarts
+        self._last_version = 0
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _entry(self, judge_id: str) -> _JudgeProgress:
+        with self._lock:
+            entry = self._judges.get(judge_id)
+            if entry is None:
+                entry = self._judges[judge_id] = _JudgeProgress()
+            entry.accessed_at = self._clock()
+            return entry
+
+    def _next_version(self) -> int:
+        with self._lock:
+            self._last_version = max(self._last_version + 1, int(time.time() * 1000))
+            return self._last_version
+
+    def get(self, judge_id: str) -> LabelingProgress:
+        """Get a judge's progress, reading MLflow only if the aggregate is out of date."""
+        entry = self._entry(judge_id)
+        with entry.lock:
+            if (
+                entry.progress is None
+                or entry.stale
+                or self._clock() - entry.refreshed_at >= self.interval_seconds
+            ):
+                self._refresh(judge_id, entry)
+            return entry.progress
+
+    def _refresh(self, judge_id: str, entry: _JudgeProgress) -> bool:
+        """Re-read a judge's progress (caller holds the entry lock).
+
+        Returns:
+            True if the progress changed and subscribers were notified
+        """
+        from server.services.labeling_service import labeling_service
+
+        entry.refreshed_at = self._clock()
+        entry.stale = False
+        try:
+            progress = labeling_service.load_labeling_progress(judge_id)
+        except Exception as e:
+            LABELING_PROGRESS_REFRESHES.inc(result='failed')
+            logger.warning(f'Failed to refresh labeling progress for judge {judge_id}: {e}')
+            if entry.progress is not None:
+                # Keep serving the last known progress rather than flapping to zero
+                return False
+            progress = labeling_service._empty_progress()
+
+        previous = entry.progress
+        if previous is not None and progress.model_dump(exclude={'version'}) == previous.model_dump(
+            exclude={'version'}
+        ):
+            LABELING_PROGRESS_REFRESHES.inc(result='unchanged')
+            return False
+
+        entry.progress = progress.model_copy(update={'version': self._next_version()})
+        LABELING_PROGRESS_REFRESHES.inc(result='changed')
+        with self._lock:
+            subscribers = list(entry.subscribers)
+        for subscription in subscribers:
+            subscription.publish(entry.progress)
+        return True
+
+    def invalidate(self, judge_id: str) -> None:
+        """Mark a judge's progress out of date after its session or alignment changed."""
+        with self._lock:
+            entry = self._judges.get(judge_id)
+            if entry is None:
+                return
+            entry.stale = True
+            has_subscribers = bool(entry.subscribers)
+        if has_subscribers:
+            self._wake.set()
+
+    def subscribe(self, judge_id: str) -> ProgressSubscription:
+        """Register for a judge's progress updates on the running event loop."""
+        subscription = ProgressSubscription(judge_id, asyncio.get_running_loop())
+        entry = self._entry(judge_id)
+        with self._lock:
+            entry.subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: ProgressSubscription) -> None:
+        """Stop sending updates to a subscription."""
+        with self._lock:
+            entry = self._judges.get(subscription.judge_id)
+            if entry is not None:
+                entry.subscribers.discard(subscription)
+                entry.accessed_at = self._clock()
+
+    def subscriber_count(self, judge_id: Optional[str] = None) -> int:
+        """Number of open subscriptions, for one judge or overall."""
+        with self._lock:
+            entries = [self._judges.get(judge_id)] if judge_id else list(self._judges.values())
+            return sum(len(entry.subscribers) for entry in entries if entry)
+
+    def poll_once(self) -> int:
+        """Refresh the judges that have subscribers and are due, and drop idle judges.
+
+        Returns:
+            Number of judges whose progress changed
+        """
+        now = self._clock()
+        with self._lock:
+            for judge_id in [
+                judge_id
+                for judge_id, entry in self._judges.items()
+                if not entry.subscribers and now - entry.accessed_at >= self.idle_seconds
+            ]:
+                del self._judges[judge_id]
+            due = [
+                (judge_id, entry)
+                for judge_id, entry in self._judges.items()
+                if entry.subscribers
+                and (entry.stale or now - entry.refreshed_at >= self.interval_seconds)
+            ]
+
+        changed = 0
+        for judge_id, entry in due:
+            if self._stop.is_set():
+                break
+            with entry.lock:
+                # A reader may have refreshed it while we waited for the lock
+                if entry.stale or self._clock() - entry.refreshed_at >= self.interval_seconds:
+                    changed += self._refresh(judge_id, entry)
+        return changed
+
+    def start(self) -> None:
+        """Start refreshing in a daemon thread (no-op if already running)."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='labeling-progress', daemon=True)
+        self._thread.start()
+        logger.info(f'Started labeling progress monitor (every {self.interval_seconds:.0f}s)')
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop refreshing and wait for the current poll to finish."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.poll_once()
+            except Exception as e:
+                logger.warning(f'Labeling progress poll failed: {e}')
+            # Wake early when a judge with subscribers is invalidated
+            self._wake.wait(
+                min(self.interval_seconds, 1.0)
+                if self.subscriber_count()
+                else self.interval_seconds
+            )
+            self._wake.clear()
+
+
+# Global monitor instance
+labeling_progress_monitor = LabelingProgressMonitor()
@@ -1,32 +1,68 @@
 """Labeling service for managing examples and labeling sessions."""
 
 import logging
+import os
+import threading
+import time
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Callable, List, Optional, Set, Tuple
 
 import mlflow
 import mlflow.genai.label_schemas as schemas
 import mlflow.genai.labeling as labeling
+from cachetools import TTLCache
+from mlflow.genai.labeling import stores as labeling_stores
 
 from server.models import (
+    AddExamplesProgress,
     CreateLabelingSessionRequest,
     CreateLabelingSessionResponse,
     LabelingProgress,
     TraceExample,
     TraceRequest,
 )
+from server.utils.concurrency import experiment_scope
 from server.utils.constants import ALIGNED_SAMPLES_COUNT
+from server.utils.metrics import track_call
 from server.utils.naming_utils import create_session_name, get_short_id, sanitize_judge_name
-from server.utils.schema_analysis import extract_categorical_options_from_instruction  # For fallback only
+from server.utils.schema_analysis import (  # For fallback only
+    DEFAULT_CATEGORICAL_OPTIONS,
+    extract_categorical_options_from_instruction,
+)
 
 from .base_service import BaseService
+from .labeling_progress_monitor import labeling_progress_monitor
 
 logger = logging.getLogger(__name__)
 
+# How long a judge -> labeling session lookup is reused before checking MLflow again
+LABELING_SESSION_CACHE_TTL_SECONDS = int(os.getenv('LABELING_SESSION_CACHE_TTL_SECONDS', '300'))
+
+# Traces added to a labeling session per call, and retries per chunk
+EXAMPLES_INSERT_CHUNK_SIZE = int(os.getenv('EXAMPLES_INSERT_CHUNK_SIZE', '100'))
+EXAMPLES_INSERT_MAX_RETRIES = int(os.getenv('EXAMPLES_INSERT_MAX_RETRIES', '3'))
+EXAMPLES_INSERT_BACKOFF_SECONDS = 1.0
+
+# Cached marker for judges known to have no labeling session
+_NO_SESSION = object()
+
+
+def _is_completed(item) -> bool:
+    """Whether a labeling session item has been labeled."""
+    return bool(getattr(item, 'state', None)) and str(item.state) == 'COMPLETED'
+
 
 class LabelingService(BaseService):
     """Service for MLflow labeling session operations."""
 
+    def __init__(self):
+        super().__init__()
+        # judge_id -> labeling session (or _NO_SESSION), invalidated on create/delete
+        self._session_cache: TTLCache = TTLCache(
+            maxsize=1000, ttl=LABELING_SESSION_CACHE_TTL_SECONDS
+        )
+        self._session_cache_lock = threading.Lock()
+
     def create_labeling_session(
         self,
         judge_id: str,
@@ -39,8 +75,6 @@ class LabelingService(BaseService):
         if not judge_response:
             raise ValueError(f'Judge with ID {judge_id} not found')
 
-        mlflow.set_experiment(experiment_id=judge_response.experiment_id)
-
         instruction_text = f"""Please review the conversation and evaluate whether it satisfies the judge's instruction as follows:
         {judge_response.instruction}"""
 
@@ -56,25 +90,33 @@ class LabelingService(BaseService):
                 logger.debug(f'Generated schema for judge {judge_response.name}: {len(options)} options')
             except Exception as e:
                 logger.warning(f'Schema analysis failed for judge {judge_response.name}: {e}, using pass/fail fallback')
-                schema_input = schemas.InputCategorical(options=['Pass', 'Fail'])
+                schema_input = schemas.InputCategorical(options=list(DEFAULT_CATEGORICAL_OPTIONS))
 
         schema_name = sanitize_judge_name(judge_response.name)
-        schemas.create_label_schema(
-            name=schema_name,
-            type='feedback',
-            title=f'Judge Example Labeling: {judge_response.name}',
-            instruction=instruction_text,
-            input=schema_input,
-            enable_comment=True,
-            overwrite=True,
-        )
+        with track_call('labeling.create_label_schema'):
+            schemas.create_label_schema(
+                name=schema_name,
+                type='feedback',
+                title=f'Judge Example Labeling: {judge_response.name}',
+                instruction=instruction_text,
+                input=schema_input,
+                enable_comment=True,
+                overwrite=True,
+                experiment_id=judge_response.experiment_id,
+            )
 
         session_name = create_session_name(judge_response.name, judge_id)
-        session = labeling.create_labeling_session(
-            name=session_name,
-            assigned_users=request.sme_emails,
-            label_schemas=[schema_name],
-        )
+        # Session creation has no experiment parameter and reads the active experiment
+        with experiment_scope(judge_response.experiment_id):
+            mlflow.set_experiment(experiment_id=judge_response.experiment_id)
+            with track_call('labeling.create_labeling_session'):
+                session = labeling.create_labeling_session(
+                    name=session_name,
+                    assigned_users=request.sme_emails,
+                    label_schemas=[schema_name],
+                )
+        self._cache_session(judge_id, session)
+        labeling_progress_monitor.invalidate(judge_id)
 
         # Update the judge with the labeling run ID
         judge_service.update_judge_labeling_run_id(judge_id, session.mlflow_run_id)
@@ -96,44 +138,115 @@ class LabelingService(BaseService):
         if not judge_response:
             raise ValueError(f'Judge with ID {judge_id} not found')
 
-        experiment_id = judge_response.experiment_id
-        mlflow.set_experiment(experiment_id=experiment_id)
-        session = self._get_labeling_session(judge_id)
+        session = self._get_labeling_session(
+            judge_id, judge_response.experiment_id, judge_response.labeling_run_id
+        )
         if not session:
             raise ValueError('No labeling session found for this judge')
 
         return session
 
-    def _get_labeling_session(self, judge_id: str) -> Optional[labeling.LabelingSession]:
-        """Helper method to get the single labeling session for a judge."""
-        all_sessions = labeling.get_labeling_sessions()
+    def _list_labeling_sessions(self, experiment_id: str) -> List[labeling.LabelingSession]:
+        """List an experiment's labeling sessions.
+
+        ``labeling.get_labeling_sessions()`` (and ``get_labeling_session(run_id)``, which
+        lists and filters) read MLflow's process-global active experiment. The labeling
+        store takes the experiment explicitly, so lookups need no experiment scope.
+        """
+        with track_call('labeling.get_labeling_sessions'):
+            return labeling_stores._get_labeling_store().get_labeling_sessions(
+                experiment_id=experiment_id
+            )
+
+    def _get_labeling_session(
+        self, judge_id: str, experiment_id: str, labeling_run_id: Optional[str] = None
+    ) -> Optional[labeling.LabelingSession]:
+        """Helper method to get the single labeling session for a judge.
+
+        Lookups are cached per judge. On a miss, the experiment's sessions are listed
+        once; the session with the judge's labeling run ID is preferred, otherwise the
+        session named after the judge is used.
+
+        Args:
+            judge_id: Judge ID
+            experiment_id: Experiment the judge (and its labeling session) belongs to
+            labeling_run_id: MLflow run ID of the judge's labeling session, if known
+        """
+        with self._session_cache_lock:
+            cached = self._session_cache.get(judge_id)
+        if cached is not None:
+            return None if cached is _NO_SESSION else cached
 
         # Look for sessions matching this judge (using short ID)
         short_id = get_short_id(judge_id)
+        candidates = [
+            candidate
+            for candidate in self._list_labeling_sessions(experiment_id)
+            if short_id in candidate.name
+        ]
+        # Prefer the judge's recorded session run over any other session named after it
+        by_run = [c for c in candidates if c.mlflow_run_id == labeling_run_id]
+        session = (by_run or candidates or [None])[0]
+
+        self._cache_session(judge_id, session)
+        return session
 
-        for session in all_sessions:
-            session_name = session.name
-            # Check if session belongs to this judge (ends with short ID)
-            if short_id in session_name:
-                return session
-
-        return None
+    def _cache_session(self, judge_id: str, session: Optional[labeling.LabelingSession]) -> None:
+        with self._session_cache_lock:
+            self._session_cache[judge_id] = session if session is not None else _NO_SESSION
 
+    def invalidate_labeling_session(self, judge_id: str) -> None:
+        """Drop the cached labeling session lookup for a judge."""
+        with self._session_cache_lock:
+            self._session_cache.pop(judge_id, None)
 
     def delete_labeling_session(self, judge_id: str) -> bool:
         """Delete the labeling session for a judge."""
+        from server.services.judge_service import judge_service
+
+        judge_response = judge_service.get_judge(judge_id)
+        if not judge_response:
+            logger.warning(f'Judge {judge_id} not found')
+            return False
+
         # Get the session for this judge
-        session = self._get_labeling_session(judge_id)
+        session = self._get_labeling_session(
+            judge_id, judge_response.experiment_id, judge_response.labeling_run_id
+        )
         if not session:
             logger.warning(f'No labeling session found for judge {judge_id}')
             return False
 
-        labeling.delete_labeling_session(session)
+        try:
+            with track_call('labeling.delete_labeling_session'):
+                labeling.delete_labeling_session(session)
+        finally:
+            self.invalidate_labeling_session(judge_id)
+            labeling_progress_monitor.invalidate(judge_id)
         logger.info(f'Deleted labeling session for judge {judge_id}')
         return True
 
-    def add_examples(self, judge_id: str, request: TraceRequest) -> list:
-        """Add examples (traces) to the existing labeling session for a judge."""
+    def add_examples(
+        self,
+        judge_id: str,
+        request: TraceRequest,
+        on_progress: Optional[Callable[[AddExamplesProgress], None]] = None,
+    ) -> list:
+        """Add examples (traces) to the existing labeling session for a judge.
+
+        Traces already in the session are skipped, the rest are fetched concurrently
+        through the shared trace cache and added to the session in chunks, each
+        retried with backoff on failure.
+
+        Args:
+            judge_id: Judge ID
+            request: Trace IDs to add
+            on_progress: Called with the import progress after each stage and chunk
+
+        Returns:
+            List of TraceExample objects for the traces that were added
+        """
+        from server.services.cache_service import cache_service
         from server.services.judge_service import judge_service
 
         judge_response = judge_service.get_judge(judge_id)
@@ -144,20 +257,127 @@ class LabelingService(BaseService):
         if not experiment_id:
             raise ValueError('No experiment ID found for judge')
 
-        mlflow.set_experiment(experiment_id=experiment_id)
-
         # Get the single labeling session for this judge
-        session = self._get_labeling_session(judge_id)
+        session = self._get_labeling_session(
+            judge_id, experiment_id, judge_response.labeling_run_id
+        )
         if not session:
             raise ValueError('No labeling session found for this judge')
 
-        # Get existing trace IDs in the session
+        progress = AddExamplesProgress(stage='fetching', requested=len(request.trace_ids))
+
+        def report():
+            if on_progress:
+                on_progress(progress.model_copy())
+
+        # Skip traces already in the session (and duplicates within the request)
+        existing_trace_ids = self._get_session_trace_ids(session)
+        new_trace_ids = [
+            trace_id
+            for trace_id in dict.fromkeys(request.trace_ids)
+            if trace_id not in existing_trace_ids
+        ]
+        progress.skipped = len(request.trace_ids) - len(new_trace_ids)
+        if progress.skipped > 0:
+            logger.info(f'Skipped {progress.skipped} duplicate trace(s)')
+        report()
+
+        # Fetch real traces concurrently, reusing any already cached
+        target_traces = cache_service.get_traces(new_trace_ids) if new_trace_ids else []
+        progress.fetched = len(target_traces)
+        progress.fetch_failed = len(new_trace_ids) - len(target_traces)
+        if progress.fetch_failed:
+            logger.warning(
+                f'Failed to fetch {progress.fetch_failed} of {len(new_trace_ids)} trace(s)'
+            )
+
+        if not target_traces:
+            if progress.skipped > 0:
+                progress.stage = 'completed'
+                progress.traces = []
+                report()
+                return []
+            raise ValueError('No valid traces found')
+
+        # Add traces to the session
+        from mlflow import environment_variables as mlflow_env_vars
+
+        mlflow_env_vars.MLFLOW_ENABLE_ASYNC_TRACE_LOGGING.set(False)
+
+        progress.stage = 'inserting'
+        report()
+
+        added_traces = []
+        for i in range(0, len(target_traces), EXAMPLES_INSERT_CHUNK_SIZE):
+            chunk = target_traces[i : i + EXAMPLES_INSERT_CHUNK_SIZE]
+            if self._add_traces_with_retry(session, chunk):
+                added_traces.extend(chunk)
+                progress.added += len(chunk)
+            else:
+                progress.insert_failed += len(chunk)
+            report()
+
+        if not added_traces:
+            raise RuntimeError(f'Failed to add traces to labeling session {session.mlflow_run_id}')
+        labeling_progress_monitor.invalidate(judge_id)
+
+        logger.info(
+            f'Added {len(added_traces)} new trace(s) to session {session.mlflow_run_id}'
+            + (f' ({progress.insert_failed} failed)' if progress.insert_failed else '')
+        )
+
+        # Convert traces to TraceExample objects using the from_traces class method
+        examples = TraceExample.from_traces(added_traces)
+        progress.stage = 'completed'
+        progress.traces = examples
+        report()
+        return examples
+
+    def _list_session_items(self, session) -> List[Any]:
+        """List the items of a labeling session with the managed evals client."""
+        from databricks.rag_eval.clients.managedevals import managed_evals_client
+
+        client = managed_evals_client.ManagedEvalsClient()
+        with track_call('labeling.list_items_in_labeling_session'):
+            return client.list_items_in_labeling_session(session)
+
+    def get_completed_trace_ids(self, judge_id: str) -> Optional[Set[str]]:
+        """Get IDs of the traces whose labeling session items are completed.
+
+        Args:
+            judge_id: Judge ID
+
+        Returns:
+            Completed trace IDs, or None if the judge has no labeling session
+        """
+        from server.services.judge_service import judge_service
+
+        judge_response = judge_service.get_judge(judge_id)
+        if not judge_response:
+            return None
+
+        # No experiment scope: this runs on the trace warmer's thread, and the session is
+        # looked up by explicit experiment ID
+        session = self._get_labeling_session(
+            judge_id, judge_response.experiment_id, judge_response.labeling_run_id
+        )
+        if not session:
+            return None
+        items = self._list_session_items(session)
+
+        return {
+            item.source.trace_id
+            for item in items
+            if _is_completed(item)
+            and getattr(item, 'source', None)
+            and getattr(item.source, 'trace_id', None)
+        }
+
+    def _get_session_trace_ids(self, session) -> Set[str]:
+        """Get IDs of the traces already in a labeling session (empty if they can't be listed)."""
         existing_trace_ids = set()
         try:
-            from databricks.rag_eval.clients.managedevals import managed_evals_client
-
-            client = managed_evals_client.ManagedEvalsClient()
-            items = client.list_items_in_labeling_session(session)
+            items = self._list_session_items(session)
 
             # Extract trace IDs from items (trace_id is nested in item.source.trace_id)
             for item in items:
@@ -170,128 +390,158 @@ class LabelingService(BaseService):
         except Exception as e:
             logger.warning(f'Failed to get existing traces from session: {e}')
             # Continue without filtering if we can't get existing traces
+        return existing_trace_ids
 
-        # Get real traces from MLflow, filtering out duplicates
-        target_traces = []
-        skipped_count = 0
-        for trace_id in request.trace_ids:
-            # Skip if trace already exists in session
-            if trace_id in existing_trace_ids:
-                skipped_count += 1
-                continue
+    def _add_traces_with_retry(self, session, traces: List[Any]) -> bool:
+        """Add one chunk of traces to a session, retrying with exponential backoff.
 
+        Before a retry, traces the failed attempt managed to add are dropped from the
+        chunk so they aren't added twice.
+        """
+        for attempt in range(EXAMPLES_INSERT_MAX_RETRIES + 1):
             try:
-                # Fetch the actual trace from MLflow
-                trace = mlflow.get_trace(trace_id)
-                if trace:
-                    target_traces.append(trace)
+                with track_call('labeling.add_traces'):
+                    session.add_traces(traces)
+                return True
             except Exception as e:
-                logger.warning(f'Failed to fetch trace {trace_id}: {e}')
-                continue
-
-        if skipped_count > 0:
-            logger.info(f'Skipped {skipped_count} duplicate trace(s)')
-
-        if not target_traces:
-            if skipped_count > 0:
-                return []
-            raise ValueError('No valid traces found')
-
-        # Add traces to the session
-        from mlflow import environment_variables as mlflow_env_vars
-
-        mlflow_env_vars.MLFLOW_ENABLE_ASYNC_TRACE_LOGGING.set(False)
-
-        session.add_traces(target_traces)
-        logger.info(f'Added {len(target_traces)} new trace(s) to session {session.mlflow_run_id}')
-
-        # Convert traces to TraceExample objects using the from_traces class method
-        return TraceExample.from_traces(target_traces)
+                if attempt == EXAMPLES_INSERT_MAX_RETRIES:
+                    logger.error(
+                        f'Failed to add {len(traces)} trace(s) to session {session.mlflow_run_id} '
+                        f'after {attempt + 1} attempts: {e}'
+                    )
+                    return False
+                delay = EXAMPLES_INSERT_BACKOFF_SECONDS * (2**attempt)
+                logger.warning(f'Adding traces to session failed ({e}), retrying in {delay:.1f}s')
+                time.sleep(delay)
+
+                existing_trace_ids = self._get_session_trace_ids(session)
+                traces = [
+                    trace for trace in traces if trace.info.trace_id not in existing_trace_ids
+                ]
+                if not traces:
+                    return True
+        return False
 
     def get_examples(self, judge_id: str, include_judge_results: bool = False) -> list:
         """Get examples for a judge by searching traces in experiment and labeling session."""
-        # Get judge to extract experiment_id
+        examples = []
+        page_token = None
+        while True:
+            page, page_token = self.get_examples_page(
+                judge_id, include_judge_results=include_judge_results, page_token=page_token
+            )
+            examples.extend(page)
+            if not page_token:
+                return examples
+
+    def get_examples_page(
+        self,
+        judge_id: str,
+        include_judge_results: bool = False,
+        page_size: Optional[int] = None,
+        page_token: Optional[str] = None,
+    ) -> Tuple[list, Optional[str]]:
+        """Get one page of examples for a judge.
+
+        Args:
+            judge_id: Judge ID
+            include_judge_results: Attach the current judge version's assessment to each example
+            page_size: Maximum number of examples (defaults to the experiment service page size)
+            page_token: Token from the previous page, or None for the first page
+
+        Returns:
+            Tuple of (examples, next page token or None if this is the last page)
+        """
+        from server.services.experiment_service import (
+            TRACE_PAGE_SIZE,
+            experiment_service,
+            traces_to_examples,
+        )
         from server.services.judge_service import judge_service
 
         judge_response = judge_service.get_judge(judge_id)
         if not judge_response:
             raise ValueError(f'Judge with ID {judge_id} not found')
 
-        mlflow.set_experiment(experiment_id=judge_response.experiment_id)
-
         # Get the labeling session for this judge
-        session = self._get_labeling_session(judge_id)
+        session = self._get_labeling_session(
+            judge_id, judge_response.experiment_id, judge_response.labeling_run_id
+        )
         if not session:
-            return []
+            return [], None
 
-        from server.services.experiment_service import experiment_service
-
-        traces = experiment_service.get_experiment_traces(
-            judge_response.experiment_id, session.mlflow_run_id
+        traces, next_page_token = experiment_service.search_traces_page(
+            judge_response.experiment_id,
+            session.mlflow_run_id,
+            page_size=page_size or TRACE_PAGE_SIZE,
+            page_token=page_token,
         )
+        examples = traces_to_examples(traces)
 
         # If include_judge_results is True, populate judge_assessment for each trace
         if include_judge_results:
-            from server.services.cache_service import cache_service
             from server.utils.parsing_utils import get_scorer_feedback_from_trace
 
-            for trace_example in traces:
+            # The searched traces already carry their assessments
+            for trace_example, trace in zip(examples, traces):
                 try:
-                    # Get the full trace from cache to access assessments
-                    full_trace = cache_service.get_trace(trace_example.trace_id)
-                    if full_trace:
-                        # Get judge assessment for current judge version
-                        judge_assessment = get_scorer_feedback_from_trace(
-                            judge_response.name, judge_response.version, full_trace
-                        )
-                        trace_example.judge_assessment = judge_assessment
+                    trace_example.judge_assessment = get_scorer_feedback_from_trace(
+                        judge_response.name, judge_response.version, trace
+                    )
                 except Exception as e:
                     logger.warning(f'Failed to get judge assessment for trace {trace_example.trace_id}: {e}')
                     trace_example.judge_assessment = None
 
-        return traces
+        return examples, next_page_token
 
     def get_labeling_progress(self, judge_id: str) -> LabelingProgress:
         """Get labeling progress for a judge."""
-        from server.services.judge_service import judge_service
-
         try:
-            # Get judge and validate
-            judge_response = judge_service.get_judge(judge_id)
-            if not judge_response:
-                logger.warning(f'Judge {judge_id} not found')
-                return self._empty_progress()
+            return self.load_labeling_progress(judge_id)
+        except Exception as e:
+            logger.error(f'Failed to get labeling progress for judge {judge_id}: {e}')
+            return self._empty_progress()
 
-            mlflow.set_experiment(experiment_id=judge_response.experiment_id)
+    def load_labeling_progress(self, judge_id: str) -> LabelingProgress:
+        """Get labeling progress for a judge, raising if MLflow can't be read.
 
-            # Get the labeling session
-            session = self._get_labeling_session(judge_id)
-            if not session:
-                logger.info(f'No labeling session found for judge {judge_id}')
-                return self._empty_progress()
+        A judge that doesn't exist or has no labeling session has empty progress.
+        """
+        from server.services.judge_service import judge_service
 
-            # Get both total and labeled counts in single call
-            total_examples, labeled_examples = self._get_session_counts(
-                session, judge_response.experiment_id
-            )
+        # Get judge and validate
+        judge_response = judge_service.get_judge(judge_id)
+        if not judge_response:
+            logger.warning(f'Judge {judge_id} not found')
+            return self._empty_progress()
 
-            # Get used_for_alignment from judge's labeling run ID
-            used_for_alignment = self._get_used_for_alignment_from_judge(judge_response)
+        # Get the labeling session by explicit experiment ID; this runs under the progress
+        # monitor's per-judge lock, so it must not wait on the experiment gate
+        session = self._get_labeling_session(
+            judge_id, judge_response.experiment_id, judge_response.labeling_run_id
+        )
+        if not session:
+            logger.info(f'No labeling session found for judge {judge_id}')
+            return self._empty_progress()
 
-            # Get assigned SMEs from the labeling session
-            assigned_smes = getattr(session, 'assigned_users', [])
+        # Get both total and labeled counts in single call
+        items = self._list_session_items(session)
+        total_examples = len(items)
+        labeled_examples = sum(1 for item in items if _is_completed(item))
 
-            return LabelingProgress(
-                total_examples=total_examples,
-                labeled_examples=labeled_examples,
-                used_for_alignment=used_for_alignment,
-                labeling_session_url=getattr(session, 'url', None),
-                assigned_smes=assigned_smes,
-            )
+        # Get used_for_alignment from judge's labeling run ID
+        used_for_alignment = self._get_used_for_alignment_from_judge(judge_response)
 
-        except Exception as e:
-            logger.error(f'Failed to get labeling progress for judge {judge_id}: {e}')
-            return self._empty_progress()
+        # Get assigned SMEs from the labeling session
+        assigned_smes = getattr(session, 'assigned_users', [])
+
+        return LabelingProgress(
+            total_examples=total_examples,
+            labeled_examples=labeled_examples,
+            used_for_alignment=used_for_alignment,
+            labeling_session_url=getattr(session, 'url', None),
+            assigned_smes=assigned_smes,
+        )
 
     def _empty_progress(self) -> LabelingProgress:
         """Return empty progress for error cases."""
@@ -303,32 +553,6 @@ class LabelingService(BaseService):
             assigned_smes=[],
         )
 
-    def _get_session_counts(self, session, experiment_id: str) -> tuple[int, int]:
-        """Get both total and labeled counts for a labeling session.
-
-        Returns:
-            tuple[int, int]: (total_examples, labeled_examples)
-        """
-        try:
-            # Use managed evals client to get all items in the session
-            from databricks.rag_eval.clients.managedevals import managed_evals_client
-
-            client = managed_evals_client.ManagedEvalsClient()
-            items = client.list_items_in_labeling_session(session)
-
-            total_examples = len(items)
-            labeled_examples = sum(
-                1
-                for item in items
-                if hasattr(item, 'state') and item.state and str(item.state) == 'COMPLETED'
-            )
-
-            return total_examples, labeled_examples
-
-        except Exception as e:
-            logger.warning(f'Failed to get session counts: {e}')
-            return 0, 0
-
     def _get_used_for_alignment_from_judge(self, judge_response) -> int:
         """Get used_for_alignment count from judge's labeling run MLflow tags."""
         try:
@@ -336,7 +560,8 @@ class LabelingService(BaseService):
                 return 0
 
             import mlflow
-            run = mlflow.get_run(judge_response.labeling_run_id)
+            with track_call('mlflow.get_run'):
+                run = mlflow.get_run(judge_response.labeling_run_id)
             if run and run.data.tags:
                 aligned_count = run.data.tags.get(ALIGNED_SAMPLES_COUNT)
                 if aligned_count:
@@ -0,0 +1,309 @@
+"""SQLite-backed persistent cache tier for traces and evaluation run IDs."""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from mlflow.entities import Trace
+
+logger = logging.getLogger(__name__)
+
+# Default bounds for the on-disk cache (overridable via environment)
+DEFAULT_MAX_TRACE_BYTES = 256 * 1024 * 1024
+DEFAULT_MAX_EVALUATIONS = 5000
+
+# SQLite limits the number of bound parameters per statement
+_SQLITE_BATCH_SIZE = 500
+
+
+def _chunks(items: List[str], size: int = _SQLITE_BATCH_SIZE):
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+class PersistentCache:
+    """Size-bounded on-disk LRU store that sits under the in-memory TTL caches.
+
+    Traces are stored as serialized JSON alongside a SHA-256 content hash, which is
+    verified on read. Evaluation run IDs are stored by their
+    ``judge_id:version:dataset_version`` cache key. Entries are evicted least recently
+    used first once the configured bounds are exceeded.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_trace_bytes: int = DEFAULT_MAX_TRACE_BYTES,
+        max_evaluations: int = DEFAULT_MAX_EVALUATIONS,
+        trace_ttl: Optional[float] = None,
+    ):
+        """Open (or create) the cache database.
+
+        Args:
+            path: SQLite database file path
+            max_trace_bytes: Upper bound on total serialized trace payload size
+            max_evaluations: Upper bound on number of evaluation run mappings
+            trace_ttl: Seconds a stored trace stays valid (None for no expiry)
+        """
+        self.path = path
+        self.max_trace_bytes = max_trace_bytes
+        self.max_evaluations = max_evaluations
+        self.trace_ttl = trace_ttl
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._init_schema()
+
+    def _init_schema(self) -> None:
+        with self._lock:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS traces (
+                    trace_id TEXT PRIMARY KEY,
+                    content_hash TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    stored_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS evaluations (
+                    cache_key TEXT PRIMARY KEY,
+                    run_id TEXT NOT NULL,
+                    last_access REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                'CREATE INDEX IF NOT EXISTS idx_traces_last_access ON traces(last_access)'
+            )
+            self._conn.execute(
+                'CREATE INDEX IF NOT EXISTS idx_evaluations_last_access ON evaluations(last_access)'
+            )
+
+    # Traces
+    def get_traces(self, trace_ids: List[str]) -> Dict[str, Trace]:
+        """Load traces from disk.
+
+        Args:
+            trace_ids: Trace IDs to look up
+
+        Returns:
+            Dictionary of trace_id -> trace for every valid stored entry
+        """
+        if not trace_ids:
+            return {}
+
+        now = time.time()
+        min_stored_at = now - self.trace_ttl if self.trace_ttl is not None else 0
+        rows = []
+        with self._lock:
+            for chunk in _chunks(list(trace_ids)):
+                placeholders = ','.join('?' * len(chunk))
+                rows.extend(
+                    self._conn.execute(
+                        f'SELECT trace_id, content_hash, payload FROM traces '
+                        f'WHERE trace_id IN ({placeholders}) AND stored_at >= ?',
+                        (*chunk, min_stored_at),
+                    ).fetchall()
+                )
+
+        traces = {}
+        for trace_id, content_hash, payload in rows:
+            if hashlib.sha256(payload.encode()).hexdigest() != content_hash:
+                logger.warning(f'Persistent cache entry for trace {trace_id} is corrupt, dropping')
+                self.delete_traces([trace_id])
+                continue
+            try:
+                traces[trace_id] = Trace.from_json(payload)
+            except Exception as e:
+                logger.warning(f'Failed to deserialize cached trace {trace_id}: {e}')
+                self.delete_traces([trace_id])
+
+        if traces:
+            self._touch('traces', 'trace_id', list(traces), now)
+        return traces
+
+    def put_traces(self, traces: List[Any]) -> None:
+        """Store traces on disk in a single transaction and evict if over budget.
+
+        Args:
+            traces: MLflow trace objects to persist
+        """
+        now = time.time()
+        rows = []
+        for trace in traces:
+            try:
+                payload = trace.to_json()
+                if not isinstance(payload, str):
+                    continue
+            except Exception as e:
+                logger.debug(f'Skipping persistent cache write for trace: {e}')
+                continue
+            content_hash = hashlib.sha256(payload.encode()).hexdigest()
+            rows.append((trace.info.trace_id, content_hash, payload, len(payload), now, now))
+
+        if not rows:
+            return
+
+        with self._lock:
+            self._conn.execute('BEGIN')
+            try:
+                self._conn.executemany(
+                    'INSERT OR REPLACE INTO traces '
+                    '(trace_id, content_hash, payload, size, stored_at, last_access) '
+                    'VALUES (?, ?, ?, ?, ?, ?)',
+                    rows,
+                )
+                self._evict_traces()
+                self._conn.execute('COMMIT')
+            except sqlite3.Error as e:
+                self._conn.execute('ROLLBACK')
+                logger.warning(f'Failed to write traces to persistent cache: {e}')
+
+    def delete_traces(self, trace_ids: List[str]) -> None:
+        """Remove traces from disk.
+
+        Args:
+            trace_ids: Trace IDs to remove
+        """
+        with self._lock:
+            for chunk in _chunks(list(trace_ids)):
+                placeholders = ','.join('?' * len(chunk))
+                self._conn.execute(f'DELETE FROM traces WHERE trace_id IN ({placeholders})', chunk)
+
+    def _evict_traces(self) -> None:
+        """Evict least recently used traces until under the byte budget (lock held)."""
+        total = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM traces').fetchone()[0]
+        excess = total - self.max_trace_bytes
+        if excess <= 0:
+            return
+
+        to_delete = []
+        for trace_id, size in self._conn.execute(
+            'SELECT trace_id, size FROM traces ORDER BY last_access ASC'
+        ):
+            to_delete.append(trace_id)
+            excess -= size
+            if excess <= 0:
+                break
+
+        for chunk in _chunks(to_delete):
+            placeholders = ','.join('?' * len(chunk))
+            self._conn.execute(f'DELETE FROM traces WHERE trace_id IN ({placeholders})', chunk)
+        logger.debug(f'Evicted {len(to_delete)} traces from persistent cache')
+
+    # Evaluation run IDs
+    def get_evaluation_run_id(self, cache_key: str) -> Optional[str]:
+        """Look up an evaluation run ID by ``judge_id:version:dataset_version`` key."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT run_id FROM evaluations WHERE cache_key = ?', (cache_key,)
+            ).fetchone()
+        if not row:
+            return None
+        self._touch('evaluations', 'cache_key', [cache_key], time.time())
+        return row[0]
+
+    def put_evaluation_run_id(self, cache_key: str, run_id: str) -> None:
+        """Store an evaluation run ID and evict if over the entry budget."""
+        with self._lock:
+            self._conn.execute('BEGIN')
+            try:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO evaluations (cache_key, run_id, last_access) '
+                    'VALUES (?, ?, ?)',
+                    (cache_key, run_id, time.time()),
+                )
+                self._conn.execute(
+                    'DELETE FROM evaluations WHERE cache_key IN ('
+                    'SELECT cache_key FROM evaluations ORDER BY last_access DESC '
+                    'LIMIT -1 OFFSET ?)',
+                    (self.max_evaluations,),
+                )
+                self._conn.execute('COMMIT')
+            except sqlite3.Error as e:
+                self._conn.execute('ROLLBACK')
+                logger.warning(f'Failed to write evaluation run to persistent cache: {e}')
+
+    def delete_evaluations_with_prefix(self, prefix: str) -> None:
+        """Remove all evaluation mappings whose cache key starts with prefix."""
+        escaped = prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM evaluations WHERE cache_key LIKE ? ESCAPE '\\'", (f'{escaped}%',)
+            )
+
+    # Maintenance
+    def _touch(self, table: str, key_column: str, keys: List[str], now: float) -> None:
+        with self._lock:
+            for chunk in _chunks(keys):
+                placeholders = ','.join('?' * len(chunk))
+                self._conn.execute(
+                    f'UPDATE {table} SET last_access = ? WHERE {key_column} IN ({placeholders})',
+                    (now, *chunk),
+                )
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._conn.execute('DELETE FROM traces')
+            self._conn.execute('DELETE FROM evaluations')
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get persistent cache statistics for monitoring."""
+        with self._lock:
+            trace_count, trace_bytes = self._conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM traces'
+            ).fetchone()
+            evaluation_count = self._conn.execute('SELECT COUNT(*) FROM evaluations').fetchone()[0]
+        return {
+            'path': self.path,
+            'trace_count': trace_count,
+            'trace_bytes': trace_bytes,
+            'max_trace_bytes': self.max_trace_bytes,
+            'evaluation_count': evaluation_count,
+            'max_evaluations': self.max_evaluations,
+        }
+
+
+def create_persistent_cache(trace_ttl: Optional[float] = None) -> Optional[PersistentCache]:
+    """Create the process-wide persistent cache from environment configuration.
+
+    The on-disk tier is opt-in: set ``PERSISTENT_CACHE_PATH`` to a file on storage
+    that outlives the process. Each process using the cache should get its own path.
+
+    Returns:
+        PersistentCache instance, or None if not configured or the database can't be opened
+    """
+    path = os.getenv('PERSISTENT_CACHE_PATH')
+    if not path:
+        return None
+
+    try:
+        return PersistentCache(
+            path,
+            max_trace_bytes=int(
+                os.getenv('PERSISTENT_CACHE_MAX_TRACE_BYTES', DEFAULT_MAX_TRACE_BYTES)
+            ),
+            max_evaluations=int(
+                os.getenv('PERSISTENT_CACHE_MAX_EVALUATIONS', DEFAULT_MAX_EVALUATIONS)
+            ),
+            trace_ttl=trace_ttl,
+        )
+    except Exception as e:
+        logger.warning(f'Persistent cache disabled, failed to open {path}: {e}')
+        return None
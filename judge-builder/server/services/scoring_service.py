@@ -0,0 +1,332 @@
+"""Parallel, rate-limit-aware scoring of traces with a judge scorer."""
+
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import mlflow
+from mlflow.entities import AssessmentError, AssessmentSource, Feedback, Metric, RunTag
+from mlflow.genai.evaluation.entities import EvalResult
+from mlflow.genai.evaluation.utils import standardize_scorer_value
+from mlflow.genai.scorers.aggregation import compute_aggregated_metrics
+
+from server.models import ScoringStats
+from server.utils.metrics import track_call
+
+from .base_service import BaseService
+
+logger = logging.getLogger(__name__)
+
+# Concurrent judge calls per scoring run (overridable via environment)
+SCORING_MAX_WORKERS = int(os.getenv('SCORING_MAX_WORKERS', '8'))
+# Retries per trace when the serving endpoint rate limits us
+SCORING_MAX_RETRIES = int(os.getenv('SCORING_MAX_RETRIES', '5'))
+SCORING_BACKOFF_BASE_SECONDS = float(os.getenv('SCORING_BACKOFF_BASE_SECONDS', '1.0'))
+SCORING_BACKOFF_MAX_SECONDS = 60.0
+
+# Assessment metadata keys MLflow judges use to report token usage
+JUDGE_INPUT_TOKENS_KEY = 'mlflow.assessment.judgeInputTokens'
+JUDGE_OUTPUT_TOKENS_KEY = 'mlflow.assessment.judgeOutputTokens'
+SOURCE_RUN_ID_KEY = 'mlflow.assessment.sourceRunId'
+# Run tag mlflow.genai.evaluate sets (mlflow_tags only defines these from newer releases)
+MLFLOW_RUN_TYPE_KEY = 'mlflow.runType'
+MLFLOW_RUN_TYPE_GENAI_EVALUATE = 'genai_evaluate'
+
+# MlflowClient.link_traces_to_run accepts at most this many trace IDs per call
+_LINK_BATCH_SIZE = 100
+
+_RATE_LIMIT_MARKERS = (
+    '429',
+    'rate limit',
+    'rate_limit',
+    'ratelimit',
+    'request_limit_exceeded',
+    'too many requests',
+)
+
+
+def is_rate_limit_error(message: Optional[str]) -> bool:
+    """Check whether an error message indicates the serving endpoint throttled the call."""
+    if not message:
+        return False
+    lowered = message.lower()
+    return any(marker in lowered for marker in _RATE_LIMIT_MARKERS)
+
+
+class _SharedBackoff:
+    """Backoff shared by every worker in a scoring run.
+
+    When one call is rate limited, all workers pause until the backoff expires
+    instead of each hammering the endpoint with its own retries.
+    """
+
+    def __init__(self, base_seconds: float, max_seconds: float):
+        self.base_seconds = base_seconds
+        self.max_seconds = max_seconds
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+
+    def wait(self) -> None:
+        while True:
+            with self._lock:
+                delay = self._resume_at - time.monotonic()
+            if delay <= 0:
+                return
+            time.sleep(delay)
+
+    def trip(self, attempt: int) -> float:
+        """Extend the shared pause using exponential backoff with jitter."""
+        delay = min(self.max_seconds, self.base_seconds * (2**attempt))
+        delay *= 0.5 + random.random() / 2
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + delay)
+        return delay
+
+
+def _root_span_id(trace) -> Optional[str]:
+    for span in getattr(trace.data, 'spans', None) or []:
+        if span.parent_id is None:
+            return span.span_id
+    return None
+
+
+def _token_count(feedback: Feedback, key: str) -> int:
+    try:
+        return int((feedback.metadata or {}).get(key, 0))
+    except (TypeError, ValueError):
+        return 0
+
+
+class ScoringService(BaseService):
+    """Scores traces with a judge on a bounded worker pool and logs the results."""
+
+    def score_traces(
+        self,
+        scorer: Any,
+        traces: List[Any],
+        run_id: Optional[str] = None,
+        reused_results: Optional[Dict[str, Feedback]] = None,
+    ) -> Tuple[Dict[str, List[Feedback]], ScoringStats]:
+        """Score traces concurrently and log the assessments back to MLflow.
+
+        With a run, the run also gets what ``mlflow.genai.evaluate`` logged: the
+        per-scorer aggregate metrics (over scored and reused results) and the GenAI
+        evaluation run type, alongside the scoring statistics.
+
+        Args:
+            scorer: Registered judge scorer
+            traces: MLflow traces to score
+            run_id: Evaluation run to attach assessments and metrics to (optional)
+            reused_results: trace_id -> feedback for traces already scored by this judge
+                version in an earlier run; they are linked to the run without being
+                scored again
+
+        Returns:
+            Tuple of (trace_id -> feedback list, scoring statistics)
+        """
+        reused_results = reused_results or {}
+        reused_trace_ids = list(reused_results)
+        backoff = _SharedBackoff(SCORING_BACKOFF_BASE_SECONDS, SCORING_BACKOFF_MAX_SECONDS)
+        start = time.perf_counter()
+
+        outcomes = []
+        if traces:
+            max_workers = min(SCORING_MAX_WORKERS, len(traces))
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix='judge-scorer'
+            ) as executor:
+                outcomes = list(
+                    executor.map(lambda trace: self._score_trace(scorer, trace, backoff), traces)
+                )
+
+        duration = time.perf_counter() - start
+
+        feedback_by_trace: Dict[str, List[Feedback]] = {}
+        failed = retries = input_tokens = output_tokens = 0
+        for trace, (feedbacks, trace_retries) in zip(traces, outcomes):
+            feedback_by_trace[trace.info.trace_id] = feedbacks
+            retries += trace_retries
+            if any(feedback.error is not None for feedback in feedbacks):
+                failed += 1
+            for feedback in feedbacks:
+                input_tokens += _token_count(feedback, JUDGE_INPUT_TOKENS_KEY)
+                output_tokens += _token_count(feedback, JUDGE_OUTPUT_TOKENS_KEY)
+
+        stats = ScoringStats(
+            traces_scored=len(traces) - failed,
+            traces_failed=failed,
+            traces_reused=len(reused_trace_ids),
+            duration_seconds=duration,
+            traces_per_second=len(traces) / duration if duration > 0 else 0.0,
+            rate_limit_retries=retries,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+        )
+        logger.info(
+            f'Scored {len(traces)} traces with {scorer.name} in {duration:.1f}s '
+            f'({stats.traces_per_second:.2f} traces/sec, {failed} failed, '
+            f'{len(reused_trace_ids)} reused, {retries} rate-limit retries, '
+            f'{input_tokens} input / {output_tokens} output tokens)'
+        )
+
+        self.log_assessments(traces, feedback_by_trace, run_id)
+        if run_id:
+            self.link_traces_to_run(reused_trace_ids, run_id)
+            aggregates = self._aggregate_metrics(
+                scorer, [*feedback_by_trace.values(), *([f] for f in reused_results.values())]
+            )
+            self._log_stats(run_id, stats, aggregates)
+
+        return feedback_by_trace, stats
+
+    def _score_trace(
+        self, scorer: Any, trace: Any, backoff: _SharedBackoff
+    ) -> Tuple[List[Feedback], int]:
+        """Score one trace, retrying with shared backoff when rate limited."""
+        retries = 0
+        for attempt in range(SCORING_MAX_RETRIES + 1):
+            backoff.wait()
+            try:
+                with track_call('judge.score'):
+                    value = scorer(
+                        inputs=trace.data.request, outputs=trace.data.response, trace=trace
+                    )
+                feedbacks = standardize_scorer_value(scorer.name, value)
+                error_message = next(
+                    (f.error.error_message for f in feedbacks if f.error is not None), None
+                )
+            except Exception as e:
+                feedbacks = None
+                error_message = str(e)
+
+            if (
+                error_message
+                and is_rate_limit_error(error_message)
+                and attempt < SCORING_MAX_RETRIES
+            ):
+                delay = backoff.trip(attempt)
+                retries += 1
+                logger.debug(
+                    f'Rate limited scoring trace {trace.info.trace_id}, backing off {delay:.1f}s'
+                )
+                continue
+
+            if feedbacks is None:
+                logger.warning(f'Scoring trace {trace.info.trace_id} failed: {error_message}')
+                feedbacks = [
+                    Feedback(
+                        name=scorer.name,
+                        source=AssessmentSource(source_type='LLM_JUDGE', source_id=scorer.name),
+                        error=AssessmentError(
+                            error_code='SCORER_ERROR', error_message=error_message
+                        ),
+                    )
+                ]
+            return feedbacks, retries
+
+        return feedbacks, retries
+
+    def log_assessments(
+        self,
+        traces: List[Any],
+        feedback_by_trace: Dict[str, List[Feedback]],
+        run_id: Optional[str] = None,
+    ) -> None:
+        """Log scored assessments to their traces and link the traces to the run.
+
+        MLflow has no batch assessment endpoint, so assessments are written on the
+        worker pool once scoring has finished; trace links are sent in batches.
+
+        Args:
+            traces: Traces that were scored
+            feedback_by_trace: Dictionary of trace_id -> feedback to log
+            run_id: Evaluation run the assessments belong to (optional)
+        """
+        pending = []
+        for trace in traces:
+            span_id = _root_span_id(trace)
+            for feedback in feedback_by_trace.get(trace.info.trace_id, []):
+                feedback.trace_id = trace.info.trace_id
+                if span_id:
+                    feedback.span_id = span_id
+                if run_id:
+                    feedback.metadata = {**(feedback.metadata or {}), SOURCE_RUN_ID_KEY: run_id}
+                pending.append(feedback)
+
+        def log_one(feedback: Feedback) -> bool:
+            try:
+                with track_call('mlflow.log_assessment'):
+                    mlflow.log_assessment(trace_id=feedback.trace_id, assessment=feedback)
+                return True
+            except Exception as e:
+                logger.warning(f'Failed to log assessment for trace {feedback.trace_id}: {e}')
+                return False
+
+        if pending:
+            max_workers = max(1, min(SCORING_MAX_WORKERS, len(pending)))
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix='assessment-log'
+            ) as executor:
+                logged = sum(executor.map(log_one, pending))
+            logger.debug(f'Logged {logged}/{len(pending)} assessments')
+
+        if run_id:
+            self.link_traces_to_run([trace.info.trace_id for trace in traces], run_id)
+
+    def link_traces_to_run(self, trace_ids: List[str], run_id: str) -> None:
+        """Link traces to an evaluation run in batches.
+
+        Args:
+            trace_ids: Trace IDs to link
+            run_id: Evaluation run ID
+        """
+        for i in range(0, len(trace_ids), _LINK_BATCH_SIZE):
+            try:
+                self.client.link_traces_to_run(trace_ids[i : i + _LINK_BATCH_SIZE], run_id)
+            except Exception as e:
+                logger.warning(f'Failed to link traces to run {run_id}: {e}')
+
+    def _aggregate_metrics(
+        self, scorer: Any, feedbacks_per_trace: List[List[Feedback]]
+    ) -> Dict[str, float]:
+        """Aggregate per-scorer results the way ``mlflow.genai.evaluate`` does.
+
+        Produces ``<assessment name>/<aggregation>`` (``mean`` unless the scorer sets
+        ``aggregations``). Values MLflow can't cast to a number, such as categorical
+        options other than yes/no, are left out, as they are by evaluate.
+        """
+        eval_results = [
+            EvalResult(eval_item=None, assessments=feedbacks) for feedbacks in feedbacks_per_trace
+        ]
+        try:
+            return compute_aggregated_metrics(eval_results, scorers=[scorer])
+        except Exception as e:
+            logger.warning(f'Failed to aggregate results for scorer {scorer.name}: {e}')
+            return {}
+
+    def _log_stats(
+        self, run_id: str, stats: ScoringStats, aggregates: Optional[Dict[str, float]] = None
+    ) -> None:
+        """Record aggregate results, scoring throughput and token usage in one batch."""
+        timestamp = int(time.time() * 1000)
+        metrics = [
+            Metric(name, float(value), timestamp, 0) for name, value in (aggregates or {}).items()
+        ]
+        metrics += [
+            Metric(f'scoring/{name}', float(value), timestamp, 0)
+            for name, value in stats.model_dump().items()
+        ]
+        # Lets the MLflow UI show the run as a GenAI evaluation, as evaluate() did
+        tags = [RunTag(MLFLOW_RUN_TYPE_KEY, MLFLOW_RUN_TYPE_GENAI_EVALUATE)]
+        try:
+            self.client.log_batch(run_id, metrics=metrics, tags=tags)
+        except Exception as e:
+            logger.warning(f'Failed to log scoring metrics to run {run_id}: {e}')
+
+
+# Global service instance
+scoring_service = ScoringService()
@@ -0,0 +1,186 @@
+"""Background prefetching of newly labeled traces into the trace cache."""
+
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional, Set
+
+from server.utils.metrics import TRACE_WARMER_TRACES
+
+logger = logging.getLogger(__name__)
+
+TRACE_WARMER_ENABLED = os.getenv('TRACE_WARMER_ENABLED', 'true').lower() == 'true'
+# Seconds between polls of the judges' labeling sessions
+TRACE_WARMER_INTERVAL_SECONDS = float(os.getenv('TRACE_WARMER_INTERVAL_SECONDS', '30'))
+# MLflow calls (session listings and trace fetches) the warmer may make per minute
+TRACE_WARMER_CALLS_PER_MINUTE = int(os.getenv('TRACE_WARMER_CALLS_PER_MINUTE', '60'))
+
+
+class CallBudget:
+    """Token bucket allowing ``calls_per_minute`` calls, with bursts up to that size."""
+
+    def __init__(self, calls_per_minute: int, clock: Callable[[], float] = time.monotonic):
+        self.capacity = float(max(calls_per_minute, 0))
+        self.rate = self.capacity / 60.0
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        """Take one call from the budget if available."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+
+class TraceWarmer:
+    """Keeps traces labeled by SMEs warm in the CacheService.
+
+    Each poll lists the labeling session items of every loaded judge and diffs the
+    completed ones against the previous poll. Newly completed traces are re-fetched,
+    replacing cached copies that predate their labels, so the next alignment or
+    comparison starts from a warm cache. On a judge's first poll, completed traces
+    not already in memory are fetched. Work beyond the call budget stays queued for
+    the next poll, and the next poll resumes listing at the first judge it skipped.
+    """
+
+    def __init__(
+        self,
+        calls_per_minute: int = TRACE_WARMER_CALLS_PER_MINUTE,
+        interval_seconds: float = TRACE_WARMER_INTERVAL_SECONDS,
+    ):
+        self.interval_seconds = interval_seconds
+        self.budget = CallBudget(calls_per_minute)
+        self._lock = threading.Lock()
+        # judge_id -> completed trace IDs seen in the last poll
+        self._completed: Dict[str, Set[str]] = {}
+        # Trace IDs waiting to be fetched, in arrival order
+        self._pending: Dict[str, None] = {}
+        # Judge ID the next poll starts listing from ('' for the first judge)
+        self._resume_from = ''
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.stats = {'polls': 0, 'sessions_listed': 0, 'traces_refreshed': 0, 'traces_failed': 0}
+
+    def start(self) -> None:
+        """Start polling in a daemon thread (no-op if already running)."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='trace-warmer', daemon=True)
+        self._thread.start()
+        logger.info(
+            f'Started trace warmer (every {self.interval_seconds:.0f}s, '
+            f'{self.budget.capacity:.0f} calls/min)'
+        )
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop polling and wait for the current poll to finish."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.poll_once()
+            except Exception as e:
+                logger.warning(f'Trace warmer poll failed: {e}')
+            self._stop.wait(self.interval_seconds)
+
+    def poll_once(self) -> int:
+        """Collect newly completed traces and fetch as many as the budget allows.
+
+        Returns:
+            Number of traces refreshed into the cache
+        """
+        from server.services.judge_service import judge_service
+
+        with self._lock:
+            self.stats['polls'] += 1
+            judges = sorted(
+                (judge for judge in judge_service.list_judges() if judge.labeling_run_id),
+                key=lambda judge: judge.id,
+            )
+            for judge_id in set(self._completed) - {judge.id for judge in judges}:
+                del self._completed[judge_id]
+
+            # Start where the last poll ran out of budget, so later judges aren't starved
+            start = next((i for i, judge in enumerate(judges) if judge.id >= self._resume_from), 0)
+            self._resume_from = ''
+            for judge in judges[start:] + judges[:start]:
+                if self._stop.is_set() or not self.budget.try_acquire():
+                    self._resume_from = judge.id
+                    break
+                self._collect(judge.id)
+
+            return self._drain()
+
+    def _collect(self, judge_id: str) -> None:
+        """Queue a judge's newly completed traces (caller holds the lock)."""
+        from server.services.cache_service import cache_service
+        from server.services.labeling_service import labeling_service
+
+        try:
+            completed = labeling_service.get_completed_trace_ids(judge_id)
+        except Exception as e:
+            logger.debug(f'Trace warmer could not list labeling session for judge {judge_id}: {e}')
+            return
+        self.stats['sessions_listed'] += 1
+        if completed is None:
+            self._completed.pop(judge_id, None)
+            return
+
+        previous = self._completed.get(judge_id)
+        if previous is None:
+            new_trace_ids = [
+                trace_id for trace_id in completed if not cache_service.is_trace_cached(trace_id)
+            ]
+        else:
+            new_trace_ids = completed - previous
+        self._completed[judge_id] = completed
+
+        for trace_id in new_trace_ids:
+            self._pending[trace_id] = None
+        if new_trace_ids:
+            logger.debug(
+                f'Trace warmer queued {len(new_trace_ids)} labeled traces for judge {judge_id}'
+            )
+
+    def _drain(self) -> int:
+        """Fetch queued traces within the call budget (caller holds the lock)."""
+        from server.services.cache_service import cache_service
+
+        refreshed = 0
+        while self._pending and not self._stop.is_set() and self.budget.try_acquire():
+            trace_id = next(iter(self._pending))
+            del self._pending[trace_id]
+            if cache_service.refresh_trace(trace_id) is not None:
+                refreshed += 1
+                self.stats['traces_refreshed'] += 1
+                TRACE_WARMER_TRACES.inc(result='refreshed')
+            else:
+                self.stats['traces_failed'] += 1
+                TRACE_WARMER_TRACES.inc(result='failed')
+
+        if self._pending:
+            logger.debug(
+                f'Trace warmer deferred {len(self._pending)} traces to the next poll (call budget)'
+            )
+        return refreshed
+
+    def pending_count(self) -> int:
+        """Number of traces waiting for budget."""
+        return len(self._pending)
+
+
+# Global warmer instance
+trace_warmer = TraceWarmer()
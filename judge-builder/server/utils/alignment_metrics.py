@@ -0,0 +1,124 @@
+"""Vectorized agreement metrics between human labels and judge results."""
+
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from server.models import CategoricalMetrics, ClassMetrics, ConfusionMatrix
+
+# Label treated as the positive class of binary schemas
+POSITIVE_LABEL = 'pass'
+
+
+def _normalize(label) -> str:
+    return str(label).strip().lower()
+
+
+def encode_labels(
+    label_lists: Sequence[Sequence], options: Sequence[str]
+) -> Tuple[List[str], List[np.ndarray]]:
+    """Encode label lists into shared integer category codes.
+
+    Labels are compared case-insensitively. Schema options get the first codes in
+    option order; labels outside the schema get their own codes after them, so two
+    equal out-of-schema labels still count as agreeing.
+
+    Args:
+        label_lists: Label lists to encode (e.g. human labels and judge results)
+        options: Schema options from the judge's SchemaInfo
+
+    Returns:
+        Tuple of (labels in code order, one code array per input list)
+    """
+    vocabulary = {}
+    labels = []
+    for option in options:
+        key = _normalize(option)
+        if key not in vocabulary:
+            vocabulary[key] = len(labels)
+            labels.append(str(option))
+
+    normalized = [
+        np.array([_normalize(label) for label in values], dtype=object) for values in label_lists
+    ]
+    lengths = [len(values) for values in normalized]
+    combined = np.concatenate(normalized) if normalized else np.array([], dtype=object)
+
+    # Map each distinct label to its code once, then broadcast via the inverse index
+    unique, inverse = np.unique(combined.astype(str), return_inverse=True)
+    for key in unique:
+        if key not in vocabulary:
+            vocabulary[key] = len(labels)
+            labels.append(key)
+    lookup = np.array([vocabulary[key] for key in unique], dtype=np.intp)
+    codes = lookup[inverse.reshape(-1)]
+
+    return labels, np.split(codes, np.cumsum(lengths)[:-1])
+
+
+def confusion_matrix(
+    human_codes: np.ndarray, judge_codes: np.ndarray, num_labels: int
+) -> np.ndarray:
+    """Count label pairs into a matrix indexed [human label][judge label]."""
+    if len(human_codes) != len(judge_codes):
+        raise ValueError('Human labels and judge results must have the same length')
+    counts = np.bincount(human_codes * num_labels + judge_codes, minlength=num_labels * num_labels)
+    return counts.reshape(num_labels, num_labels)
+
+
+def cohens_kappa(matrix: np.ndarray) -> float:
+    """Cohen's kappa for a confusion matrix.
+
+    Returns 1.0 when both raters agree perfectly on a single label (chance agreement
+    is 1), and 0.0 for an empty matrix.
+    """
+    total = matrix.sum()
+    if total == 0:
+        return 0.0
+    observed = np.trace(matrix) / total
+    expected = float(matrix.sum(axis=1) @ matrix.sum(axis=0)) / (total * total)
+    if expected == 1.0:
+        return 1.0 if observed == 1.0 else 0.0
+    return float((observed - expected) / (1.0 - expected))
+
+
+def categorical_metrics(matrix: np.ndarray, labels: List[str]) -> CategoricalMetrics:
+    """Agreement, Cohen's kappa and per-label precision/recall from a confusion matrix."""
+    correct = np.diag(matrix)
+    support = matrix.sum(axis=1)
+    predicted = matrix.sum(axis=0)
+    precision = np.divide(correct, predicted, out=np.zeros(len(labels)), where=predicted > 0)
+    recall = np.divide(correct, support, out=np.zeros(len(labels)), where=support > 0)
+
+    return CategoricalMetrics(
+        labels=labels,
+        confusion_matrix=matrix.tolist(),
+        agreement_count=int(correct.sum()),
+        cohens_kappa=cohens_kappa(matrix),
+        per_class=[
+            ClassMetrics(label=label, precision=float(p), recall=float(r), support=int(s))
+            for label, p, r, s in zip(labels, precision, recall, support)
+        ],
+    )
+
+
+def binary_confusion_matrix(matrix: np.ndarray, positive_code: int) -> ConfusionMatrix:
+    """Collapse a multi-class matrix into positive vs. everything else."""
+    total = int(matrix.sum())
+    true_positive = int(matrix[positive_code, positive_code])
+    false_negative = int(matrix[positive_code].sum()) - true_positive
+    false_positive = int(matrix[:, positive_code].sum()) - true_positive
+    return ConfusionMatrix(
+        true_positive=true_positive,
+        false_negative=false_negative,
+        false_positive=false_positive,
+        true_negative=total - true_positive - false_negative - false_positive,
+    )
+
+
+def positive_label_code(labels: List[str]) -> int:
+    """Code of the positive class: 'Pass' if present, otherwise the first option."""
+    for code, label in enumerate(labels):
+        if _normalize(label) == POSITIVE_LABEL:
+            return code
+    return 0
@@ -0,0 +1,180 @@
+"""Helpers for running blocking MLflow work off the asyncio event loop."""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Size of the shared pool that runs blocking service calls for API routes
+MLFLOW_THREAD_POOL_SIZE = int(os.getenv('MLFLOW_THREAD_POOL_SIZE', '32'))
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Get the process-wide executor for blocking MLflow work."""
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=MLFLOW_THREAD_POOL_SIZE, thread_name_prefix='mlflow-worker'
+                )
+    return _executor
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking function in the shared executor without stalling the event loop.
+
+    Context variables are copied into the worker so request-scoped state is preserved.
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, func, *args, **kwargs)
+    return await loop.run_in_executor(get_executor(), call)
+
+
+class ConcurrencyLimiter:
+    """Caps how many calls of one kind may run in the executor at the same time.
+
+    Calls beyond the limit wait on the event loop (not in a worker thread), so a burst
+    of expensive requests can't exhaust the shared pool for cheap ones.
+    """
+
+    def __init__(self, name: str, limit: int):
+        self.name = name
+        self.limit = limit
+        self._semaphore = asyncio.Semaphore(limit)
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking function in the executor once a slot is available."""
+        if self._semaphore.locked():
+            logger.debug(f'Concurrency limit reached for {self.name} ({self.limit}), waiting')
+        async with self._semaphore:
+            return await run_blocking(func, *args, **kwargs)
+
+
+_limiters: Dict[str, ConcurrencyLimiter] = {}
+
+
+def route_limiter(name: str, default_limit: int) -> ConcurrencyLimiter:
+    """Get the named limiter, sized by ROUTE_CONCURRENCY_<NAME> if set.
+
+    Args:
+        name: Limiter name (e.g. 'evaluate')
+        default_limit: Limit used when no environment override exists
+
+    Returns:
+        Shared ConcurrencyLimiter for the name
+    """
+    if name not in _limiters:
+        env_var = f'ROUTE_CONCURRENCY_{name.upper().replace("-", "_")}'
+        _limiters[name] = ConcurrencyLimiter(name, int(os.getenv(env_var, default_limit)))
+    return _limiters[name]
+
+
+class _ExperimentGate:
+    """Serializes work that depends on MLflow's process-global active experiment.
+
+    Any number of threads may hold the gate for the same experiment; a thread that
+    needs a different experiment waits until they finish. New arrivals also wait
+    while another experiment is queued, so one busy experiment can't starve others.
+    Hold it only around the calls that read the active experiment, not around work
+    that can pass the experiment ID explicitly.
+
+    Re-entrant for a thread that already holds the gate. A nested scope for another
+    experiment steps out of the outer one while it runs, then re-enters it and
+    restores the outer experiment as the active one.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._active: Optional[str] = None
+        self._holders = 0
+        self._waiting: Dict[str, int] = {}
+        self._local = threading.local()
+
+    def _must_wait(self, experiment_id: str) -> bool:
+        if not self._holders:
+            return False
+        if self._active != experiment_id:
+            return True
+        return any(count for key, count in self._waiting.items() if key != experiment_id)
+
+    def _acquire(self, experiment_id: str) -> None:
+        with self._cond:
+            self._waiting[experiment_id] = self._waiting.get(experiment_id, 0) + 1
+            try:
+                while self._must_wait(experiment_id):
+                    self._cond.wait()
+            finally:
+                self._waiting[experiment_id] -= 1
+                if not self._waiting[experiment_id]:
+                    del self._waiting[experiment_id]
+            self._active = experiment_id
+            self._holders += 1
+
+    def _release(self) -> None:
+        with self._cond:
+            self._holders -= 1
+            # Waiters for the same experiment may be held back only by queued ones
+            self._cond.notify_all()
+
+    @contextmanager
+    def scope(self, experiment_id: str) -> Iterator[None]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        if stack and stack[-1] == experiment_id:
+            stack.append(experiment_id)
+            try:
+                yield
+            finally:
+                stack.pop()
+            return
+
+        outer = stack[-1] if stack else None
+        if outer is not None:
+            # Waiting for another experiment while holding this one could deadlock
+            self._release()
+        self._acquire(experiment_id)
+        stack.append(experiment_id)
+        try:
+            yield
+        finally:
+            stack.pop()
+            self._release()
+            if outer is not None:
+                self._acquire(outer)
+                import mlflow
+
+                mlflow.set_experiment(experiment_id=outer)
+
+
+_experiment_gate = _ExperimentGate()
+
+
+def experiment_scope(experiment_id: str):
+    """Guard code that sets and then relies on MLflow's active experiment.
+
+    Use it only for calls that have no explicit experiment parameter (labeling
+    session creation, label schema deletion); pass ``experiment_id`` wherever the
+    API accepts one instead.
+
+    Example:
+        with experiment_scope(judge.experiment_id):
+            mlflow.set_experiment(experiment_id=judge.experiment_id)
+            labeling.create_labeling_session(...)
+    """
+    return _experiment_gate.scope(experiment_id)
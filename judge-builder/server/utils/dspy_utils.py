@@ -1,7 +1,15 @@
 import dspy
+import hashlib
+import json
 import logging
-from databricks.rag_eval import context, env_vars
+import os
+import threading
+from typing import Optional, Tuple
 
+from cachetools import LRUCache
+from databricks.rag_eval import env_vars
+
+from server.utils import rag_client
 from server.utils.constants import VERSION
 
 logger = logging.getLogger(__name__)
@@ -9,6 +17,59 @@ logger = logging.getLogger(__name__)
 # Default alignment model configuration
 DEFAULT_ALIGNMENT_MODEL = "gpt-oss-120b"
 
+# Bounded cache of successful optimizer LM responses, shared across alignments
+LM_RESPONSE_CACHE_SIZE = int(os.getenv('ALIGNMENT_LM_CACHE_SIZE', '2048'))
+
+_lm_response_cache: LRUCache = LRUCache(maxsize=LM_RESPONSE_CACHE_SIZE)
+_lm_response_cache_lock = threading.Lock()
+
+
+def lm_cache_key(
+    model: str,
+    temperature: float,
+    system_prompt: Optional[str],
+    user_prompt: Optional[str],
+    rollout_id: Optional[int] = None,
+) -> str:
+    """Content-addressed cache key for one LM request.
+
+    DSPy gives each sampled rollout its own ``rollout_id`` so that repeated prompts
+    at a non-zero temperature still produce distinct samples; it is part of the key.
+    """
+    payload = json.dumps([model, temperature, system_prompt, user_prompt, rollout_id])
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def clear_lm_response_cache() -> None:
+    """Drop all cached LM responses."""
+    with _lm_response_cache_lock:
+        _lm_response_cache.clear()
+
+
+class LMCallStats:
+    """Thread-safe counters for the LM calls made during one alignment."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.lm_calls = 0
+        self.cache_hits = 0
+        self.errors = 0
+
+    def record(self, cache_hit: bool = False, error: bool = False) -> None:
+        """Count one LM call, or a cache hit or error."""
+        with self._lock:
+            if cache_hit:
+                self.cache_hits += 1
+            else:
+                self.lm_calls += 1
+            if error:
+                self.errors += 1
+
+    def as_dict(self) -> dict:
+        """Snapshot of the counters."""
+        with self._lock:
+            return {'lm_calls': self.lm_calls, 'cache_hits': self.cache_hits, 'errors': self.errors}
+
 
 class AttrDict(dict):
     """A dict that allows attribute-style access (like OpenAI's objects)."""
@@ -36,11 +97,33 @@ def to_attrdict(obj):
         return obj
 
 
+def _extract_prompts(prompt=None, messages=None) -> Tuple[Optional[str], Optional[str]]:
+    """Get the (user prompt, system prompt) from DSPy's call arguments."""
+    user_prompt = None
+    system_prompt = None
+
+    if messages:
+        # Extract user and system prompts from messages
+        for message in messages:
+            if message.get('role') == 'user':
+                user_prompt = message.get('content', '')
+            elif message.get('role') == 'system':
+                system_prompt = message.get('content', '')
+
+    # If no user prompt found in messages, use the prompt parameter
+    if not user_prompt and prompt:
+        user_prompt = prompt
+
+    return user_prompt, system_prompt
+
+
 class AgentEvalLM(dspy.BaseLM):
-    def __init__(self, model: str, temperature: float = 1.0):
+    def __init__(self, model: str, temperature: float = 1.0, stats: Optional[LMCallStats] = None):
         super().__init__('databricks/databricks-llama-4-maverick')
         self.model = model
         self.temperature = temperature
+        # Shared by reference with the copies DSPy makes for each rollout
+        self.stats = stats or LMCallStats()
         env_vars.RAG_EVAL_EVAL_SESSION_CLIENT_NAME.set(f'judge-builder-v{VERSION}')
 
     def dump_state(self):
@@ -50,35 +133,35 @@ class AgentEvalLM(dspy.BaseLM):
         pass
 
     def forward(self, prompt=None, messages=None, **kwargs):
-        return self._forward_impl(prompt=prompt, messages=messages, **kwargs)
-
-    @context.eval_context
-    def _forward_impl(self, prompt=None, messages=None, **kwargs):
+        user_prompt, system_prompt = _extract_prompts(prompt, messages)
+        if not self.cache:
+            return self._forward_impl(user_prompt, system_prompt)
+
+        # Optimizers re-ask identical prompts across iterations; serve those from the cache
+        rollout_id = kwargs.get('rollout_id', self.kwargs.get('rollout_id'))
+        cache_key = lm_cache_key(
+            self.model, self.temperature, system_prompt, user_prompt, rollout_id
+        )
+        with _lm_response_cache_lock:
+            cached = _lm_response_cache.get(cache_key)
+        if cached is not None:
+            self.stats.record(cache_hit=True)
+            return to_attrdict(cached)
+
+        return self._forward_impl(user_prompt, system_prompt, cache_key=cache_key)
+
+    def _forward_impl(
+        self,
+        user_prompt: Optional[str],
+        system_prompt: Optional[str],
+        cache_key: Optional[str] = None,
+    ):
         """Forward pass for the language model.
         Subclasses must implement this method, and the response should be identical to
         [OpenAI response format](https://platform.openai.com/docs/api-reference/responses/object).
         """
-        # Get the managed_rag_client from the context
-        managed_rag_client = context.get_context().build_managed_rag_client()
-
-        # Convert messages to the format expected by managed_rag_client
-        user_prompt = None
-        system_prompt = None
-
-        if messages:
-            # Extract user and system prompts from messages
-            for message in messages:
-                if message.get('role') == 'user':
-                    user_prompt = message.get('content', '')
-                elif message.get('role') == 'system':
-                    system_prompt = message.get('content', '')
-
-        # If no user prompt found in messages, use the prompt parameter
-        if not user_prompt and prompt:
-            user_prompt = prompt
-
-        # Call the managed_rag_client
-        response = managed_rag_client.get_chat_completions_result(
+        # Call the managed RAG service through the shared pooled client
+        response = rag_client.get_chat_completions_result(
             user_prompt=user_prompt, system_prompt=system_prompt, model=self.model, temperature=self.temperature
         )
 
@@ -101,6 +184,10 @@ class AgentEvalLM(dspy.BaseLM):
                 ],
                 'response_format': 'json_object',
             }
+            self.stats.record()
+            if cache_key is not None:
+                with _lm_response_cache_lock:
+                    _lm_response_cache[cache_key] = result_dict
         else:
             result_dict = {
                 'object': 'response',
@@ -112,6 +199,7 @@ class AgentEvalLM(dspy.BaseLM):
                 },
                 'response_format': 'json_object',
             }
+            self.stats.record(error=True)
 
         # Convert to attrdict-like format (simple dict access)
         return to_attrdict(result_dict)
@@ -0,0 +1,344 @@
+"""In-process performance metrics exposed in the Prometheus text format."""
+
+import functools
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Seconds; MLflow calls range from cache-speed lookups to multi-minute evaluations
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+# Items (for collections) or bytes (for strings)
+SIZE_BUCKETS = (1, 10, 100, 1000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric(ABC):
+    kind = ''
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> LabelValues:
+        return tuple(str(labels.get(name, '')) for name in self.label_names)
+
+    def render(self) -> List[str]:
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.kind}']
+        lines.extend(self._render_samples())
+        return lines
+
+    @abstractmethod
+    def _render_samples(self) -> List[str]:
+        """Sample lines for every label set, without the HELP and TYPE header."""
+
+
+class Counter(_Metric):
+    """Monotonically increasing count per label set."""
+
+    kind = 'counter'
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        super().__init__(name, documentation, label_names)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        """Add to the count for a label set."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: Any) -> float:
+        """Current count for a label set (0 if never incremented)."""
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def _render_samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [
+            f'{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}'
+            for key, value in values
+        ]
+
+
+class Gauge(_Metric):
+    """Latest value per label set."""
+
+    kind = 'gauge'
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        super().__init__(name, documentation, label_names)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: Any) -> None:
+        """Replace the value for a label set."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, **labels: Any) -> float:
+        """Current value for a label set (0 if never set)."""
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def _render_samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [
+            f'{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}'
+            for key, value in values
+        ]
+
+
+class Histogram(_Metric):
+    """Observations bucketed per label set, with running count and sum."""
+
+    kind = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [per-bucket counts (+Inf last), count, sum]
+        self._series: Dict[LabelValues, list] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """Record one observation for a label set."""
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0, 0.0]
+            series[0][index] += 1
+            series[1] += 1
+            series[2] += value
+
+    def count(self, **labels: Any) -> int:
+        """Number of observations for a label set."""
+        with self._lock:
+            series = self._series.get(self._key(labels))
+            return series[1] if series else 0
+
+    def _render_samples(self) -> List[str]:
+        with self._lock:
+            snapshot = sorted((key, (list(s[0]), s[1], s[2])) for key, s in self._series.items())
+        lines = []
+        for key, (bucket_counts, count, total) in snapshot:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), bucket_counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f'{self.name}_bucket{_format_labels(self.label_names, key, le)} {cumulative}'
+                )
+            labels = _format_labels(self.label_names, key)
+            lines.append(f'{self.name}_count{labels} {count}')
+            lines.append(f'{self.name}_sum{labels} {_format_value(total)}')
+        return lines
+
+
+class MetricsRegistry:
+    """Holds the process's metrics and renders them for scraping."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Counter:
+        """Get or register a counter."""
+        return self._register(Counter(name, documentation, label_names))
+
+    def gauge(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Gauge:
+        """Get or register a gauge."""
+        return self._register(Gauge(name, documentation, label_names))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Get or register a histogram."""
+        return self._register(Histogram(name, documentation, label_names, buckets))
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+registry = MetricsRegistry()
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+MLFLOW_CALL_SECONDS = registry.histogram(
+    'judge_builder_mlflow_call_duration_seconds',
+    'Latency of MLflow and Databricks calls by operation.',
+    ['operation'],
+)
+MLFLOW_CALL_ERRORS = registry.counter(
+    'judge_builder_mlflow_call_errors_total',
+    'MLflow and Databricks calls that raised, by operation.',
+    ['operation'],
+)
+MLFLOW_REQUEST_BYTES = registry.histogram(
+    'judge_builder_mlflow_request_bytes',
+    'Size of string arguments sent with MLflow calls (e.g. tag values), by operation.',
+    ['operation'],
+    SIZE_BUCKETS,
+)
+MLFLOW_RESULT_SIZE = registry.histogram(
+    'judge_builder_mlflow_result_size',
+    'Items returned by list-valued MLflow calls, or bytes for string results, by operation.',
+    ['operation'],
+    SIZE_BUCKETS,
+)
+CACHE_REQUESTS = registry.counter(
+    'judge_builder_cache_requests_total',
+    'Cache lookups by cache and result (hit or miss).',
+    ['cache', 'result'],
+)
+TRACE_WARMER_TRACES = registry.counter(
+    'judge_builder_trace_warmer_traces_total',
+    'Traces handled by the labeling trace warmer, by result (refreshed or failed).',
+    ['result'],
+)
+LABELING_PROGRESS_REFRESHES = registry.counter(
+    'judge_builder_labeling_progress_refreshes_total',
+    'Labeling progress reads from MLflow, by result (changed, unchanged or failed).',
+    ['result'],
+)
+STARTUP_JUDGES = registry.gauge(
+    'judge_builder_startup_judges',
+    'Judges found by the last startup load, by result (loaded or failed).',
+    ['result'],
+)
+STARTUP_EXPERIMENTS = registry.gauge(
+    'judge_builder_startup_experiments',
+    'Judge builder experiments found by the last startup load.',
+)
+STARTUP_LOAD_SECONDS = registry.gauge(
+    'judge_builder_startup_load_duration_seconds',
+    'Duration of the last startup judge load.',
+)
+HTTP_REQUEST_SECONDS = registry.histogram(
+    'judge_builder_http_request_duration_seconds',
+    'API request latency by method, route template and status code.',
+    ['method', 'route', 'status'],
+)
+
+
+def payload_size(value: Any) -> Optional[int]:
+    """Size of a call argument or result: bytes for strings, length for collections."""
+    if isinstance(value, str):
+        return len(value.encode('utf-8'))
+    if isinstance(value, bytes):
+        return len(value)
+    if isinstance(value, (list, tuple, dict, set)):
+        return len(value)
+    return None
+
+
+@contextmanager
+def track_call(operation: str) -> Iterator[None]:
+    """Record latency (and failures) of one MLflow or Databricks call.
+
+    Example:
+        with track_call('mlflow.get_trace'):
+            trace = mlflow.get_trace(trace_id)
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        MLFLOW_CALL_ERRORS.inc(operation=operation)
+        raise
+    finally:
+        MLFLOW_CALL_SECONDS.observe(time.perf_counter() - start, operation=operation)
+
+
+def record_cache(cache: str, hits: int = 0, misses: int = 0) -> None:
+    """Count cache hits and misses for one cache."""
+    if hits:
+        CACHE_REQUESTS.inc(hits, cache=cache, result='hit')
+    if misses:
+        CACHE_REQUESTS.inc(misses, cache=cache, result='miss')
+
+
+class InstrumentedClient:
+    """Proxy that records latency and payload sizes for every method of a client.
+
+    Attribute access is forwarded unchanged; callables are wrapped so each call is
+    timed under ``<prefix>.<method>``.
+    """
+
+    def __init__(self, client: Any, prefix: str):
+        self._client = client
+        self._prefix = prefix
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if not callable(attr) or name.startswith('_'):
+            return attr
+
+        operation = f'{self._prefix}.{name}'
+
+        @functools.wraps(attr)
+        def call(*args, **kwargs):
+            request_bytes = sum(
+                len(value.encode('utf-8'))
+                for value in (*args, *kwargs.values())
+                if isinstance(value, str)
+            )
+            if request_bytes:
+                MLFLOW_REQUEST_BYTES.observe(request_bytes, operation=operation)
+            with track_call(operation):
+                result = attr(*args, **kwargs)
+            size = payload_size(result)
+            if size is not None:
+                MLFLOW_RESULT_SIZE.observe(size, operation=operation)
+            return result
+
+        return call
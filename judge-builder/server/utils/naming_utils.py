@@ -1,6 +1,7 @@
 """Utilities for consistent naming and ID management across the application."""
 
 import re
+from functools import lru_cache
 
 
 def get_short_id(full_id: str, length: int = 8) -> str:
@@ -50,6 +51,7 @@ def create_dataset_table_name(judge_name: str, judge_id: str) -> str:
     return f'judge_{safe_name}_{short_id}_examples'
 
 
+@lru_cache(maxsize=1024)
 def sanitize_judge_name(judge_name: str) -> str:
     """Sanitize a judge name for use in identifiers, file names, and other contexts.
 
@@ -93,6 +95,7 @@ def sanitize_judge_name(judge_name: str) -> str:
     return sanitized
 
 
+@lru_cache(maxsize=4096)
 def create_scorer_name(judge_name: str, version: int) -> str:
     """Create a consistent scorer name for MLflow registration.
 
@@ -1,7 +1,7 @@
 """Parsing utilities for extracting data from various formats."""
 
 import json
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from mlflow.entities import Feedback, Trace
 
@@ -88,6 +88,57 @@ def extract_response_from_trace(trace) -> str:
     return extract_text_from_data(response_data, 'response')
 
 
+# Attribute holding a trace's assessment index (not a dataclass field, so it is
+# ignored by equality and not serialized)
+_ASSESSMENT_INDEX_ATTR = '_judge_builder_assessment_index'
+
+HUMAN_SOURCE = 'HUMAN'
+LLM_JUDGE_SOURCE = 'LLM_JUDGE'
+
+
+def build_assessment_index(trace: Trace) -> Dict[Tuple[str, str], Any]:
+    """Index a trace's assessments by (assessment name, source type).
+
+    The first assessment for each key wins, matching a front-to-back scan.
+
+    Args:
+        trace: Trace object with assessments
+
+    Returns:
+        Dictionary of (name, source type) -> assessment
+    """
+    index = {}
+    for assessment in trace.info.assessments or []:
+        index.setdefault((assessment.name, assessment.source.source_type), assessment)
+    return index
+
+
+def get_assessment_index(trace: Trace) -> Dict[Tuple[str, str], Any]:
+    """Get the assessment index for a trace, building and attaching it on first use.
+
+    The index is rebuilt if the trace's assessment list has been replaced or grown
+    since it was built.
+
+    Args:
+        trace: Trace object with assessments
+
+    Returns:
+        Dictionary of (name, source type) -> assessment
+    """
+    assessments = trace.info.assessments or []
+    try:
+        cached = vars(trace).get(_ASSESSMENT_INDEX_ATTR)
+    except TypeError:
+        # Slotted objects such as TraceSummary have no __dict__
+        cached = getattr(trace, _ASSESSMENT_INDEX_ATTR, None)
+    if cached is not None and cached[0] is assessments and cached[1] == len(assessments):
+        return cached[2]
+
+    index = build_assessment_index(trace)
+    setattr(trace, _ASSESSMENT_INDEX_ATTR, (assessments, len(assessments), index))
+    return index
+
+
 def get_human_feedback_from_trace(judge_name: str, trace: Trace) -> Optional[Feedback]:
     """Extract human feedback from a trace's assessments.
 
@@ -103,12 +154,7 @@ def get_human_feedback_from_trace(judge_name: str, trace: Trace) -> Optional[Fee
 
     # Normalize judge name for comparison
     normalized_judge_name = sanitize_judge_name(judge_name)
-
-    for assessment in trace.info.assessments:
-        if assessment.name == normalized_judge_name and assessment.source.source_type == 'HUMAN':
-            return assessment
-
-    return None
+    return get_assessment_index(trace).get((normalized_judge_name, HUMAN_SOURCE))
 
 
 def get_scorer_feedback_from_trace(judge_name: str, judge_version: int, trace: Trace) -> Optional[Feedback]:
@@ -127,13 +173,7 @@ def get_scorer_feedback_from_trace(judge_name: str, judge_version: int, trace: T
 
     # Create the expected scorer name
     scorer_name = create_scorer_name(judge_name, judge_version)
-
-    for assessment in trace.info.assessments:
-        if (assessment.name == scorer_name and
-            assessment.source.source_type == 'LLM_JUDGE'):
-            return assessment
-
-    return None
+    return get_assessment_index(trace).get((scorer_name, LLM_JUDGE_SOURCE))
 
 
 def assessment_has_error(assessment) -> bool:
@@ -0,0 +1,122 @@
+"""Process-wide managed RAG client with pooled keep-alive connections."""
+
+import logging
+import os
+import threading
+from typing import Optional
+
+from databricks.rag_eval import context, env_vars
+from requests import adapters
+
+from server.utils.constants import VERSION
+from server.utils.metrics import track_call
+
+logger = logging.getLogger(__name__)
+
+# Concurrent chat completion requests allowed across the process (also the pool size)
+MANAGED_RAG_MAX_CONCURRENCY = int(os.getenv('MANAGED_RAG_MAX_CONCURRENCY', '16'))
+
+_client = None
+_client_lock = threading.Lock()
+_request_slots = threading.BoundedSemaphore(MANAGED_RAG_MAX_CONCURRENCY)
+
+
+class _PooledAdapter(adapters.HTTPAdapter):
+    """HTTP adapter backed by a shared connection pool.
+
+    The managed RAG client opens a new session per request and closes it afterwards;
+    mounting this adapter keeps the underlying connections alive between requests
+    while still honoring each request's retry configuration.
+    """
+
+    def __init__(self, poolmanager, max_retries=None):
+        self._shared_poolmanager = poolmanager
+        super().__init__(
+            max_retries=max_retries if max_retries is not None else adapters.DEFAULT_RETRIES
+        )
+
+    def init_poolmanager(self, *args, **kwargs):
+        self.poolmanager = self._shared_poolmanager
+
+    def close(self):
+        # The shared pool outlives the per-request session
+        pass
+
+
+def _build_client():
+    """Build a managed RAG client whose request sessions share one connection pool."""
+    from databricks.rag_eval.clients.managedrag import managed_rag_client
+    from urllib3 import PoolManager
+
+    poolmanager = PoolManager(num_pools=4, maxsize=MANAGED_RAG_MAX_CONCURRENCY, block=True)
+
+    class PooledManagedRagClient(managed_rag_client.ManagedRagClient):
+        @classmethod
+        def _get_request_session(cls, retry_config=None):
+            session = super()._get_request_session(retry_config)
+            adapter = _PooledAdapter(poolmanager, max_retries=retry_config)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            return session
+
+    return PooledManagedRagClient()
+
+
+def get_managed_rag_client():
+    """Get the shared managed RAG client, building it on first use.
+
+    Building the client resolves the Databricks config and auth, so it is done once
+    per process instead of once per LLM call.
+    """
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = _build_client()
+                logger.info(
+                    'Created pooled managed RAG client '
+                    f'(max concurrency {MANAGED_RAG_MAX_CONCURRENCY})'
+                )
+    return _client
+
+
+def reset_managed_rag_client() -> None:
+    """Drop the shared client so the next call builds a new one (e.g. after an auth change)."""
+    global _client
+
+    with _client_lock:
+        _client = None
+
+
+@context.eval_context
+def get_chat_completions_result(
+    user_prompt: Optional[str],
+    system_prompt: Optional[str],
+    model: Optional[str] = None,
+    temperature: Optional[float] = None,
+):
+    """Call the managed chat completions API through the shared client.
+
+    At most MANAGED_RAG_MAX_CONCURRENCY requests run at once; further callers wait.
+
+    Args:
+        user_prompt: User prompt
+        system_prompt: Optional system prompt
+        model: Optional model name (service default if omitted)
+        temperature: Optional sampling temperature
+
+    Returns:
+        GetChatCompletionsResponse with output or error_message
+    """
+    env_vars.RAG_EVAL_EVAL_SESSION_CLIENT_NAME.set(f'judge-builder-v{VERSION}')
+
+    kwargs = {'user_prompt': user_prompt, 'system_prompt': system_prompt}
+    if model:
+        kwargs['model'] = model
+    if temperature is not None:
+        kwargs['temperature'] = temperature
+
+    client = get_managed_rag_client()
+    with _request_slots, track_call('managed_rag.chat_completions'):
+        return client.get_chat_completions_result(**kwargs)
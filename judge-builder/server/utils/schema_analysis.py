@@ -5,11 +5,13 @@ import logging
 from functools import lru_cache
 from typing import List
 
-from databricks.rag_eval import context, env_vars
-from server.utils.constants import VERSION
+from server.utils import rag_client
 
 logger = logging.getLogger(__name__)
 
+# Options to fall back to when analysis fails (never stored as a judge's schema)
+DEFAULT_CATEGORICAL_OPTIONS = ['Pass', 'Fail']
+
 SCHEMA_ANALYSIS_SYSTEM_PROMPT = """You are an expert at analyzing judge instructions to extract the possible categorical outputs.
 
 Your task is to analyze the given judge instruction and determine what categorical options the judge should return.
@@ -35,56 +37,56 @@ Return only valid JSON."""
 
 
 @lru_cache(maxsize=128)
-@context.eval_context
 def _extract_categorical_options_from_instruction(instruction: str) -> List[str]:
-    env_vars.RAG_EVAL_EVAL_SESSION_CLIENT_NAME.set(f'judge-builder-v{VERSION}')
-    managed_rag_client = context.get_context().build_managed_rag_client()
-    
     user_prompt = f"""Analyze this judge instruction and extract the categorical options. Provide your analysis as JSON. Do not use any markdown. 
     <instruction>{instruction}</instruction>"""
 
-    response = managed_rag_client.get_chat_completions_result(
+    response = rag_client.get_chat_completions_result(
         user_prompt=user_prompt, 
         system_prompt=SCHEMA_ANALYSIS_SYSTEM_PROMPT
     )
-    
+
+    # Failures raise rather than return a default, so lru_cache doesn't keep them
     if not response.output:
-        logger.warning("No output from LLM, falling back to pass/fail")
-        return ["Pass", "Fail"]
-        
+        raise ValueError('No output from LLM')
+
     # Parse LLM response
     try:
         analysis = json.loads(response.output.strip())
-        options = analysis.get("options", ["Pass", "Fail"])
-        
-        # Validate options
-        if not isinstance(options, list) or len(options) < 2:
-            logger.warning(f"Invalid options: {options}, using pass/fail")
-            return ["Pass", "Fail"]
-            
-        logger.info(f"LLM extracted options: {options}")
-        return options
-        
     except json.JSONDecodeError as e:
-        logger.warning(f"Failed to parse LLM JSON response: {e}")
-        return ["Pass", "Fail"]
+        raise ValueError(f'Failed to parse LLM JSON response: {e}') from e
+
+    options = analysis.get('options') if isinstance(analysis, dict) else None
+
+    # Validate options
+    if not isinstance(options, list) or len(options) < 2:
+        raise ValueError(f'Invalid options: {options}')
+
+    logger.info(f'LLM extracted options: {options}')
+    return options
 
 
 def extract_categorical_options_from_instruction(instruction: str) -> List[str]:
     """Extract categorical options from judge instruction using LLM analysis.
     
+    Successful results are cached per instruction; failures are not, so the next
+    call retries the analysis.
+
     Args:
         instruction: The judge instruction text to analyze
         
     Returns:
         List of categorical options (e.g., ["Pass", "Fail"] or ["Poor", "Fair", "Good", "Excellent"])
-        Falls back to ["Pass", "Fail"] if analysis fails.
+
+    Raises:
+        ValueError: If the LLM response has no usable options (errors from the LLM
+            call itself propagate unchanged)
     """
     try:
         return _extract_categorical_options_from_instruction(instruction)
     except Exception as e:
-        logger.error(f"LLM analysis failed: {e}")
-        return ["Pass", "Fail"]
+        logger.error(f'LLM analysis failed: {e}')
+        raise
 
 
 def is_binary_categorical_options(options: List[str]) -> bool:
@@ -0,0 +1,56 @@
+"""Compact trace summaries for callers that don't need span data."""
+
+from typing import Any, List, Optional
+
+
+class TraceSummary:
+    """A trace without its spans: ID, root request/response and assessments.
+
+    Summaries expose the attributes the parsing helpers read from a full MLflow
+    trace (``info.trace_id``, ``info.assessments``, ``data.request`` and
+    ``data.response``), so they can be passed to those helpers as-is. Anything that
+    needs spans (scoring, optimization) should load the full trace instead.
+    """
+
+    __slots__ = (
+        'trace_id',
+        'request',
+        'response',
+        'assessments',
+        '_judge_builder_assessment_index',
+    )
+
+    def __init__(
+        self,
+        trace_id: str,
+        request: Optional[str] = None,
+        response: Optional[str] = None,
+        assessments: Optional[List[Any]] = None,
+    ):
+        self.trace_id = trace_id
+        self.request = request
+        self.response = response
+        self.assessments = assessments or []
+
+    @classmethod
+    def from_trace(cls, trace: Any) -> 'TraceSummary':
+        """Summarize an MLflow trace, keeping its root span's inputs and outputs."""
+        return cls(
+            trace_id=trace.info.trace_id,
+            request=trace.data.request,
+            response=trace.data.response,
+            assessments=list(trace.info.assessments or []),
+        )
+
+    @property
+    def info(self) -> 'TraceSummary':
+        """Stand-in for ``Trace.info``: the summary itself."""
+        return self
+
+    @property
+    def data(self) -> 'TraceSummary':
+        """Stand-in for ``Trace.data``: the summary itself."""
+        return self
+
+    def __repr__(self) -> str:
+        return f'TraceSummary(trace_id={self.trace_id!r}, assessments={len(self.assessments)})'
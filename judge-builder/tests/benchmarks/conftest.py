@@ -0,0 +1,134 @@
+"""Fixtures for the service benchmarks.
+
+The benchmarks drive the real services against ``FakeMlflow``. Dataset sizes and
+the injected latency are read from the environment so the same suite covers quick
+local runs and larger scaling runs:
+
+    BENCHMARK_SIZES            Comma-separated trace counts (default: 100)
+    BENCHMARK_JUDGES           Judges seeded for the list benchmark (default: 50)
+    BENCHMARK_MLFLOW_LATENCY_MS  Delay added to every MLflow call (default: 0)
+    BENCHMARK_LLM_LATENCY_MS     Delay added to every judge call (default: 0)
+"""
+
+import json
+import os
+import uuid
+from typing import List, Optional
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from mlflow.entities import AssessmentSource, Feedback  # noqa: E402
+
+from server.utils.naming_utils import (  # noqa: E402
+    create_scorer_name,
+    create_session_name,
+    sanitize_judge_name,
+)
+from tests.fakes.fake_mlflow import FakeMlflow, FakeScorer  # noqa: E402
+
+BENCHMARK_SIZES = [
+    int(size) for size in os.getenv('BENCHMARK_SIZES', '100').split(',') if size.strip()
+]
+BENCHMARK_JUDGES = int(os.getenv('BENCHMARK_JUDGES', '50'))
+BENCHMARK_MLFLOW_LATENCY_MS = float(os.getenv('BENCHMARK_MLFLOW_LATENCY_MS', '0'))
+BENCHMARK_LLM_LATENCY_MS = float(os.getenv('BENCHMARK_LLM_LATENCY_MS', '0'))
+
+JUDGE_INSTRUCTION = 'Does the {{ outputs }} answer the {{ inputs }}? Answer Pass or Fail.'
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize benchmarks that take a size over BENCHMARK_SIZES."""
+    if 'size' in metafunc.fixturenames:
+        metafunc.parametrize('size', BENCHMARK_SIZES)
+
+
+def reset_services() -> None:
+    """Drop everything the service singletons have cached between benchmark rounds."""
+    from server.services.cache_service import cache_service
+    from server.services.judge_service import judge_service
+    from server.services.labeling_service import labeling_service
+
+    with judge_service._lock:
+        judge_service._judges.clear()
+        judge_service._versions.clear()
+        judge_service._responses.clear()
+    judge_service._invalidate_judge_experiments()
+    cache_service.clear()
+    labeling_service._session_cache.clear()
+
+
+@pytest.fixture
+def fake_mlflow():
+    """A FakeMlflow installed in place of MLflow, with the service caches reset."""
+    from server.services.cache_service import cache_service
+
+    fake = FakeMlflow(
+        latency_seconds=BENCHMARK_MLFLOW_LATENCY_MS / 1000,
+        llm_latency_seconds=BENCHMARK_LLM_LATENCY_MS / 1000,
+    )
+    reset_services()
+    with fake.install(), patch.object(cache_service, 'persistent_cache', None):
+        yield fake
+    reset_services()
+
+
+def seed_judge(
+    fake: FakeMlflow,
+    experiment_id: str,
+    name: str,
+    version: int = 1,
+    labeling_run_id: Optional[str] = None,
+) -> str:
+    """Store a judge in its experiment's metadata tag and register its scorers."""
+    judge_id = str(uuid.uuid4())
+    tags = fake._experiment_state(experiment_id)['tags']
+    judges = json.loads(tags.get('judges', '{}'))
+    judges[judge_id] = {
+        'name': name,
+        'instruction': JUDGE_INSTRUCTION,
+        'version': version,
+        'schema_info': {'is_binary': True, 'options': ['Pass', 'Fail']},
+        'labeling_run_id': labeling_run_id,
+    }
+    tags['judges'] = json.dumps(judges)
+    tags['judge_builder'] = 'true'
+    for judge_version in range(1, version + 1):
+        fake.register_scorer(
+            experiment_id, FakeScorer(fake, create_scorer_name(name, judge_version))
+        )
+    return judge_id
+
+
+def seed_labeled_judge(fake: FakeMlflow, size: int, version: int = 1, name: str = 'Answer quality'):
+    """Seed a judge whose labeling session holds ``size`` traces labeled by SMEs.
+
+    Returns:
+        Tuple of (judge_id, experiment_id, trace IDs)
+    """
+    experiment_id = fake.create_experiment(f'benchmark-{uuid.uuid4().hex[:8]}')
+    trace_ids: List[str] = []
+    for i in range(size):
+        trace = fake.create_trace(experiment_id, f'Question {i}?', f'Answer {i}.')
+        trace_ids.append(trace.info.trace_id)
+        fake.add_assessment(
+            trace.info.trace_id,
+            Feedback(
+                name=sanitize_judge_name(name),
+                value='Pass' if i % 3 else 'Fail',
+                source=AssessmentSource(source_type='HUMAN', source_id='sme@example.com'),
+            ),
+        )
+
+    # The session name carries the judge's short ID, so the judge ID is fixed first
+    judge_id = seed_judge(fake, experiment_id, name, version=version)
+    session = fake.add_labeling_session(
+        experiment_id, create_session_name(name, judge_id), trace_ids, completed_trace_ids=trace_ids
+    )
+    tags = fake._experiment_state(experiment_id)['tags']
+    judges = json.loads(tags['judges'])
+    judges[judge_id]['labeling_run_id'] = session.mlflow_run_id
+    tags['judges'] = json.dumps(judges)
+    return judge_id, experiment_id, trace_ids
@@ -0,0 +1,137 @@
+"""Benchmarks of the judge-builder services against an in-process MLflow.
+
+Each round starts from cold service caches, so timings and call counts reflect a
+request served right after startup. Call counts are recorded in the benchmark's
+``extra_info`` and the key ones are asserted, so a change that adds MLflow round
+trips to a hot path fails here even when the latency is not injected.
+"""
+
+from server.models import TraceRequest
+from server.utils.naming_utils import create_scorer_name
+from tests.benchmarks.conftest import (
+    BENCHMARK_JUDGES,
+    reset_services,
+    seed_judge,
+    seed_labeled_judge,
+)
+
+ROUNDS = 3
+
+
+def _record_calls(benchmark, fake) -> None:
+    benchmark.extra_info['mlflow_calls'] = dict(fake.calls)
+
+
+def test_list_judges(benchmark, fake_mlflow):
+    """Benchmark loading and listing judges spread over several experiments."""
+    from server.services.judge_service import judge_service
+
+    experiment_ids = [fake_mlflow.create_experiment(f'judges-{i}') for i in range(5)]
+    for i in range(BENCHMARK_JUDGES):
+        seed_judge(fake_mlflow, experiment_ids[i % len(experiment_ids)], f'Judge {i}')
+
+    def setup():
+        reset_services()
+        fake_mlflow.reset_calls()
+
+    def run():
+        judge_service.load_all_judges()
+        return judge_service.list_judges()
+
+    judges = benchmark.pedantic(run, setup=setup, rounds=ROUNDS)
+    _record_calls(benchmark, fake_mlflow)
+
+    assert len(judges) == BENCHMARK_JUDGES
+    # One experiment search serves every judge
+    assert fake_mlflow.calls['client.search_experiments'] == 1
+
+
+def test_get_examples(benchmark, fake_mlflow, size):
+    """Benchmark listing a judge's labeled examples with its results."""
+    from server.services.labeling_service import labeling_service
+
+    judge_id, _, trace_ids = seed_labeled_judge(fake_mlflow, size)
+
+    def setup():
+        reset_services()
+        fake_mlflow.reset_calls()
+
+    examples = benchmark.pedantic(
+        labeling_service.get_examples,
+        args=(judge_id,),
+        kwargs={'include_judge_results': True},
+        setup=setup,
+        rounds=ROUNDS,
+    )
+    _record_calls(benchmark, fake_mlflow)
+
+    assert [example.trace_id for example in examples] == trace_ids
+    # Searched traces carry their assessments; no per-trace fetches
+    assert fake_mlflow.calls['mlflow.get_trace'] == 0
+
+
+def test_evaluate_judge(benchmark, fake_mlflow, size):
+    """Benchmark a first evaluation of a judge over its labeled traces."""
+    from server.services.alignment_service import alignment_service
+
+    def setup():
+        reset_services()
+        judge_id, _, trace_ids = seed_labeled_judge(fake_mlflow, size)
+        fake_mlflow.reset_calls()
+        return (judge_id, TraceRequest(trace_ids=trace_ids)), {}
+
+    result = benchmark.pedantic(alignment_service.evaluate_judge, setup=setup, rounds=ROUNDS)
+    _record_calls(benchmark, fake_mlflow)
+
+    assert result.mlflow_run_id
+    assert result.total_traces == size
+    assert result.scoring_stats.traces_scored == size
+    assert fake_mlflow.calls['llm.judge'] == size
+    assert fake_mlflow.calls['mlflow.log_assessment'] == size
+    # A judge without an index falls back to one tag search for its earlier runs
+    assert fake_mlflow.calls['mlflow.search_runs'] <= 1
+
+
+def test_alignment_comparison(benchmark, fake_mlflow, size):
+    """Benchmark comparing an aligned judge with its previous version."""
+    from server.services.alignment_service import alignment_service
+    from server.services.cache_service import cache_service
+    from server.services.evaluation_run_index import evaluation_run_index
+
+    judge_id, experiment_id, trace_ids = seed_labeled_judge(fake_mlflow, size, version=2)
+    name = 'Answer quality'
+    dataset_version = cache_service.compute_dataset_version(trace_ids)
+    for version in (1, 2):
+        scorer = next(
+            s
+            for s in fake_mlflow.list_scorers(experiment_id)
+            if s.name == create_scorer_name(name, version)
+        )
+        run_id = fake_mlflow.create_run(
+            experiment_id,
+            f'evaluation_v{version}',
+            tags={
+                'judge_id': judge_id,
+                'judge_version': version,
+                'dataset_version': dataset_version,
+            },
+        )
+        for trace_id in trace_ids:
+            fake_mlflow.add_assessment(trace_id, scorer(trace=fake_mlflow._traces[trace_id]))
+        evaluation_run_index.record(experiment_id, judge_id, version, dataset_version, run_id)
+
+    def setup():
+        reset_services()
+        fake_mlflow.reset_calls()
+
+    result = benchmark.pedantic(
+        alignment_service.get_alignment_comparison, args=(judge_id,), setup=setup, rounds=ROUNDS
+    )
+    _record_calls(benchmark, fake_mlflow)
+
+    assert result['metrics'].total_samples == size
+    assert len(result['comparisons']) == size
+    # Indexed evaluation runs are found without searching runs or re-scoring
+    assert fake_mlflow.calls['mlflow.search_runs'] == 0
+    assert fake_mlflow.calls['llm.judge'] == 0
+
@@ -0,0 +1,9 @@
+"""Shared test configuration."""
+
+import os
+import tempfile
+
+# Keep test runs off any on-disk state configured in the developer's environment;
+# services are built at import time, so this must run before they are imported.
+os.environ.pop('PERSISTENT_CACHE_PATH', None)
+os.environ['ALIGNMENT_JOBS_DB_PATH'] = os.path.join(tempfile.mkdtemp(), 'alignment_jobs.db')
@@ -0,0 +1,673 @@
+"""In-process stand-in for the MLflow APIs used by the judge-builder services.
+
+``FakeMlflow`` keeps experiments, runs, traces, assessments, labeling sessions and
+registered scorers in memory and serves the subset of the MLflow tracking, tracing,
+labeling and scorer APIs the services call. Every API call is counted per operation
+and can be slowed down with injected latency, so service behavior (call counts,
+wall time, scaling) can be measured without a Databricks workspace.
+
+Example:
+    fake = FakeMlflow(latency_seconds=0.005)
+    experiment_id = fake.create_experiment('exp')
+    trace = fake.create_trace(experiment_id, 'What is MLflow?', 'A platform.')
+    with fake.install():
+        cache_service.get_trace(trace.info.trace_id)
+    assert fake.calls['mlflow.get_trace'] == 1
+"""
+
+import dataclasses
+import hashlib
+import json
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from unittest.mock import patch
+
+from mlflow.entities import (
+    AssessmentSource,
+    Experiment,
+    ExperimentTag,
+    Feedback,
+    Span,
+    Trace,
+    TraceData,
+    TraceInfo,
+    TraceLocation,
+    TraceState,
+)
+from mlflow.exceptions import MlflowException
+from mlflow.store.entities.paged_list import PagedList
+from mlflow.tracing.constant import SpanAttributeKey
+from mlflow.tracing.utils import build_otel_context
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import ReadableSpan
+
+COMPLETED = 'COMPLETED'
+PENDING = 'PENDING'
+
+_TAG_FILTER = re.compile(r"tags\.(?P<key>[\w.]+)\s*=\s*'(?P<value>[^']*)'")
+
+
+def _new_id() -> str:
+    return uuid.uuid4().hex
+
+
+def _matches_tag_filter(tags: Dict[str, str], filter_string: Optional[str]) -> bool:
+    """Evaluate a conjunction of ``tags.<key> = '<value>'`` clauses."""
+    if not filter_string:
+        return True
+    clauses = [
+        clause.strip() for clause in re.split(r'\s+and\s+', filter_string, flags=re.IGNORECASE)
+    ]
+    for clause in clauses:
+        match = _TAG_FILTER.fullmatch(clause)
+        if not match:
+            raise NotImplementedError(
+                f'FakeMlflow only supports tag equality filters, got: {clause}'
+            )
+        if tags.get(match['key']) != match['value']:
+            return False
+    return True
+
+
+def _paginate(items: List[Any], max_results: Optional[int], page_token: Optional[str]) -> PagedList:
+    start = int(page_token) if page_token else 0
+    end = start + max_results if max_results else len(items)
+    return PagedList(items[start:end], str(end) if end < len(items) else None)
+
+
+def _build_trace(trace_id: str, experiment_id: str, request: Any, response: Any) -> Trace:
+    """Build a real MLflow trace with a single root span carrying the request and response."""
+    now = time.time_ns()
+    otel_span = ReadableSpan(
+        name='root',
+        context=build_otel_context(uuid.UUID(hex=trace_id[-32:]).int, 1),
+        parent=None,
+        start_time=now,
+        end_time=now + 1_000_000,
+        attributes={
+            SpanAttributeKey.REQUEST_ID: json.dumps(trace_id),
+            SpanAttributeKey.INPUTS: json.dumps(request),
+            SpanAttributeKey.OUTPUTS: json.dumps(response),
+            SpanAttributeKey.SPAN_TYPE: json.dumps('CHAIN'),
+        },
+        resource=Resource.get_empty(),
+    )
+    info = TraceInfo(
+        trace_id=trace_id,
+        trace_location=TraceLocation.from_experiment_id(experiment_id),
+        request_time=now // 1_000_000,
+        state=TraceState.OK,
+        request_preview=json.dumps(request)[:1000],
+        response_preview=json.dumps(response)[:1000],
+    )
+    return Trace(info=info, data=TraceData(spans=[Span(otel_span)]))
+
+
+def _copy_trace(trace: Trace) -> Trace:
+    """Copy a trace the way a fetch would: later assessments don't show up in the copy."""
+    info = dataclasses.replace(trace.info, assessments=list(trace.info.assessments))
+    return Trace(info=info, data=trace.data)
+
+
+class _Run:
+    def __init__(self, fake: 'FakeMlflow', experiment_id: str, run_name: Optional[str]):
+        self.info = SimpleNamespace(
+            run_id=_new_id(), run_name=run_name, experiment_id=experiment_id
+        )
+        self.data = SimpleNamespace(tags={}, metrics={})
+        self._fake = fake
+
+    def __enter__(self) -> '_Run':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._fake._end_run(self)
+
+
+class FakeLabelingSession:
+    """Labeling session whose items track which traces SMEs have labeled."""
+
+    def __init__(
+        self, fake: 'FakeMlflow', experiment_id: str, name: str, assigned_users: List[str]
+    ):
+        self._fake = fake
+        self.name = name
+        self.experiment_id = experiment_id
+        self.assigned_users = list(assigned_users or [])
+        self.mlflow_run_id = fake._create_run(experiment_id, name).info.run_id
+        self.url = f'https://fake-mlflow/labeling/{self.mlflow_run_id}'
+        self.items: List[SimpleNamespace] = []
+
+    def add_traces(self, traces: Iterable[Any]) -> 'FakeLabelingSession':
+        """Add traces to the session as pending items."""
+        self._fake._call('labeling.add_traces')
+        trace_ids = [trace.info.trace_id for trace in traces]
+        with self._fake._lock:
+            self.items.extend(
+                SimpleNamespace(state=PENDING, source=SimpleNamespace(trace_id=t))
+                for t in trace_ids
+            )
+        self._fake._link(trace_ids, self.mlflow_run_id)
+        return self
+
+
+class FakeScorer:
+    """Registered judge scorer that answers after the injected LLM latency."""
+
+    def __init__(self, fake: 'FakeMlflow', name: str, options: Tuple[str, ...] = ('Pass', 'Fail')):
+        self._fake = fake
+        self.name = name
+        self.options = options
+
+    def __call__(
+        self, inputs: Any = None, outputs: Any = None, trace: Optional[Trace] = None
+    ) -> Feedback:
+        """Return a deterministic pseudo-random feedback for the trace."""
+        self._fake._call('llm.judge', self._fake.llm_latency_seconds)
+        subject = trace.info.trace_id if trace else json.dumps([inputs, outputs], default=str)
+        key = f'{self.name}:{subject}'
+        value = self.options[int(hashlib.sha256(key.encode()).hexdigest(), 16) % len(self.options)]
+        return Feedback(
+            name=self.name,
+            value=value,
+            rationale='Decided by the fake judge.',
+            source=AssessmentSource(source_type='LLM_JUDGE', source_id=self.name),
+        )
+
+
+class FakeJudge(FakeScorer):
+    """Stand-in for the judge returned by ``mlflow.genai.judges.make_judge``."""
+
+    def __init__(self, fake: 'FakeMlflow', name: str, instructions: str, **kwargs: Any):
+        super().__init__(fake, name)
+        self.instructions = instructions
+
+    def register(
+        self, name: Optional[str] = None, experiment_id: Optional[str] = None
+    ) -> FakeScorer:
+        """Register the judge as a scorer in an experiment."""
+        self._fake._call('scorers.register')
+        scorer = FakeScorer(self._fake, name or self.name, self.options)
+        self._fake.register_scorer(experiment_id or self._fake.active_experiment_id, scorer)
+        return scorer
+
+
+class _FakeClient:
+    """The ``MlflowClient`` methods used by the services."""
+
+    def __init__(self, fake: 'FakeMlflow'):
+        self._fake = fake
+
+    def get_experiment(self, experiment_id: str) -> Experiment:
+        self._fake._call('client.get_experiment')
+        return self._fake._experiment(experiment_id)
+
+    def search_experiments(
+        self,
+        view_type: Any = None,
+        max_results: Optional[int] = None,
+        filter_string: Optional[str] = None,
+        order_by: Optional[List[str]] = None,
+        page_token: Optional[str] = None,
+    ) -> PagedList:
+        self._fake._call('client.search_experiments')
+        return _paginate(self._fake._search_experiments(filter_string), max_results, page_token)
+
+    def set_experiment_tag(self, experiment_id: str, key: str, value: Any) -> None:
+        self._fake._call('client.set_experiment_tag')
+        self._fake._set_experiment_tag(experiment_id, key, value)
+
+    def delete_experiment_tag(self, experiment_id: str, key: str) -> None:
+        self._fake._call('client.delete_experiment_tag')
+        with self._fake._lock:
+            tags = self._fake._experiment_state(experiment_id)['tags']
+            if key not in tags:
+                raise MlflowException(f'No tag with name: {key} in experiment {experiment_id}')
+            del tags[key]
+
+    def search_traces(
+        self,
+        experiment_ids: List[str],
+        run_id: Optional[str] = None,
+        max_results: Optional[int] = None,
+        page_token: Optional[str] = None,
+        **kwargs: Any,
+    ) -> PagedList:
+        self._fake._call('client.search_traces')
+        return _paginate(self._fake._search_traces(experiment_ids, run_id), max_results, page_token)
+
+    def link_traces_to_run(self, trace_ids: List[str], run_id: str) -> None:
+        self._fake._call('client.link_traces_to_run')
+        self._fake._link(trace_ids, run_id)
+
+    def log_batch(self, run_id: str, metrics: Iterable[Any] = (), **kwargs: Any) -> None:
+        self._fake._call('client.log_batch')
+        run = self._fake._get_run(run_id)
+        for metric in metrics:
+            run.data.metrics[metric.key] = metric.value
+
+    def get_run(self, run_id: str) -> _Run:
+        self._fake._call('client.get_run')
+        return self._fake._get_run(run_id)
+
+
+class _FakeManagedEvalsClient:
+    """The ``ManagedEvalsClient`` methods used by the services."""
+
+    def __init__(self, fake: 'FakeMlflow'):
+        self._fake = fake
+
+    def list_items_in_labeling_session(self, session: FakeLabelingSession) -> List[SimpleNamespace]:
+        self._fake._call('managed_evals.list_items_in_labeling_session')
+        with self._fake._lock:
+            return [SimpleNamespace(state=item.state, source=item.source) for item in session.items]
+
+
+class FakeMlflow:
+    """In-memory MLflow backend with per-call counting and injected latency.
+
+    Args:
+        latency_seconds: Delay added to every MLflow call
+        latencies: Per-operation delays overriding ``latency_seconds`` (keys as in ``calls``)
+        llm_latency_seconds: Delay of each judge (LLM) call
+    """
+
+    def __init__(
+        self,
+        latency_seconds: float = 0.0,
+        latencies: Optional[Dict[str, float]] = None,
+        llm_latency_seconds: float = 0.0,
+    ):
+        self.latency_seconds = latency_seconds
+        self.latencies = dict(latencies or {})
+        self.llm_latency_seconds = llm_latency_seconds
+        self.calls: Counter = Counter()
+        self.client = _FakeClient(self)
+        self.managed_evals_client = _FakeManagedEvalsClient(self)
+        self.active_experiment_id: Optional[str] = None
+
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        self._experiments: Dict[str, dict] = {}
+        self._runs: Dict[str, _Run] = {}
+        self._traces: Dict[str, Trace] = {}
+        # run_id -> linked trace IDs, in link order
+        self._run_traces: Dict[str, Dict[str, None]] = {}
+        self._sessions: Dict[str, FakeLabelingSession] = {}
+        self._scorers: Dict[Tuple[str, str], FakeScorer] = {}
+        self._label_schemas: Dict[str, dict] = {}
+
+    # Call accounting
+    def _call(self, operation: str, latency: Optional[float] = None) -> None:
+        with self._lock:
+            self.calls[operation] += 1
+        delay = self.latencies.get(operation, self.latency_seconds if latency is None else latency)
+        if delay:
+            time.sleep(delay)
+
+    def reset_calls(self) -> None:
+        """Forget the call counts (e.g. after seeding or warm-up)."""
+        with self._lock:
+            self.calls.clear()
+
+    def total_calls(self, exclude: Iterable[str] = ('llm.judge',)) -> int:
+        """Number of MLflow calls made, excluding LLM calls by default."""
+        excluded = set(exclude)
+        with self._lock:
+            return sum(
+                count for operation, count in self.calls.items() if operation not in excluded
+            )
+
+    # Seeding (no latency, not counted)
+    def create_experiment(self, name: str, tags: Optional[Dict[str, str]] = None) -> str:
+        """Create an experiment and return its ID."""
+        experiment_id = str(len(self._experiments) + 1000)
+        with self._lock:
+            self._experiments[experiment_id] = {'name': name, 'tags': dict(tags or {})}
+        return experiment_id
+
+    def create_trace(self, experiment_id: str, request: Any, response: Any) -> Trace:
+        """Create a trace with a root span holding the request and response."""
+        trace_id = f'tr-{_new_id()}'
+        trace = _build_trace(trace_id, experiment_id, {'request': request}, {'response': response})
+        with self._lock:
+            self._traces[trace_id] = trace
+        return trace
+
+    def add_assessment(self, trace_id: str, assessment: Feedback) -> Feedback:
+        """Attach an assessment to a stored trace."""
+        assessment.trace_id = trace_id
+        assessment.assessment_id = assessment.assessment_id or f'a-{_new_id()}'
+        with self._lock:
+            trace = self._traces[trace_id]
+            trace.info.assessments = [*trace.info.assessments, assessment]
+        return assessment
+
+    def add_labeling_session(
+        self,
+        experiment_id: str,
+        name: str,
+        trace_ids: List[str],
+        completed_trace_ids: Iterable[str] = (),
+        assigned_users: Optional[List[str]] = None,
+    ) -> FakeLabelingSession:
+        """Create a labeling session holding traces, some of them already labeled."""
+        session = FakeLabelingSession(self, experiment_id, name, assigned_users or [])
+        completed = set(completed_trace_ids)
+        with self._lock:
+            session.items = [
+                SimpleNamespace(
+                    state=COMPLETED if trace_id in completed else PENDING,
+                    source=SimpleNamespace(trace_id=trace_id),
+                )
+                for trace_id in trace_ids
+            ]
+            self._sessions[session.mlflow_run_id] = session
+        self._link(trace_ids, session.mlflow_run_id)
+        return session
+
+    def create_run(
+        self, experiment_id: str, run_name: str, tags: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Create a finished run and return its ID."""
+        run = self._create_run(experiment_id, run_name)
+        run.data.tags.update({key: str(value) for key, value in (tags or {}).items()})
+        return run.info.run_id
+
+    def register_scorer(self, experiment_id: str, scorer: FakeScorer) -> None:
+        """Store a scorer as registered in an experiment."""
+        with self._lock:
+            self._scorers[(experiment_id, scorer.name)] = scorer
+
+    # Internal state helpers
+    def _experiment_state(self, experiment_id: str) -> dict:
+        state = self._experiments.get(str(experiment_id))
+        if state is None:
+            raise MlflowException(
+                f'Experiment with id={experiment_id} does not exist (RESOURCE_DOES_NOT_EXIST)'
+            )
+        return state
+
+    def _experiment(self, experiment_id: str) -> Experiment:
+        with self._lock:
+            state = self._experiment_state(experiment_id)
+            tags = [ExperimentTag(key, value) for key, value in state['tags'].items()]
+        return Experiment(
+            str(experiment_id), state['name'], f'fake:/{experiment_id}', 'active', tags
+        )
+
+    def _search_experiments(self, filter_string: Optional[str]) -> List[Experiment]:
+        with self._lock:
+            experiment_ids = [
+                experiment_id
+                for experiment_id, state in self._experiments.items()
+                if _matches_tag_filter(state['tags'], filter_string)
+            ]
+        return [self._experiment(experiment_id) for experiment_id in experiment_ids]
+
+    def _set_experiment_tag(self, experiment_id: str, key: str, value: Any) -> None:
+        with self._lock:
+            self._experiment_state(experiment_id)['tags'][key] = str(value)
+
+    def _create_run(self, experiment_id: str, run_name: Optional[str]) -> _Run:
+        run = _Run(self, experiment_id, run_name)
+        with self._lock:
+            self._runs[run.info.run_id] = run
+        return run
+
+    def _get_run(self, run_id: str) -> _Run:
+        with self._lock:
+            run = self._runs.get(run_id)
+        if run is None:
+            raise MlflowException(f'Run {run_id} not found (RESOURCE_DOES_NOT_EXIST)')
+        return run
+
+    def _active_runs(self) -> List[_Run]:
+        if not hasattr(self._local, 'runs'):
+            self._local.runs = []
+        return self._local.runs
+
+    def _end_run(self, run: _Run) -> None:
+        runs = self._active_runs()
+        if run in runs:
+            runs.remove(run)
+
+    def _link(self, trace_ids: Iterable[str], run_id: str) -> None:
+        with self._lock:
+            linked = self._run_traces.setdefault(run_id, {})
+            for trace_id in trace_ids:
+                linked[trace_id] = None
+
+    def _search_traces(self, experiment_ids: List[str], run_id: Optional[str]) -> List[Trace]:
+        experiment_ids = {str(experiment_id) for experiment_id in experiment_ids}
+        with self._lock:
+            if run_id:
+                candidates = [
+                    self._traces[t] for t in self._run_traces.get(run_id, {}) if t in self._traces
+                ]
+            else:
+                candidates = list(self._traces.values())
+            return [
+                _copy_trace(trace)
+                for trace in candidates
+                if trace.info.trace_location.mlflow_experiment.experiment_id in experiment_ids
+            ]
+
+    # mlflow module functions
+    def get_trace(self, trace_id: str, **kwargs: Any) -> Optional[Trace]:
+        """Fake of mlflow.get_trace; returns a copy of the stored trace."""
+        self._call('mlflow.get_trace')
+        with self._lock:
+            trace = self._traces.get(trace_id)
+            return _copy_trace(trace) if trace else None
+
+    def log_assessment(self, trace_id: str, assessment: Feedback) -> Feedback:
+        """Fake of mlflow.log_assessment."""
+        self._call('mlflow.log_assessment')
+        return self.add_assessment(trace_id, assessment)
+
+    def set_experiment(
+        self, experiment_name: Optional[str] = None, experiment_id: Optional[str] = None
+    ) -> Experiment:
+        """Fake of mlflow.set_experiment."""
+        self._call('mlflow.set_experiment')
+        experiment = self._experiment(experiment_id)
+        self.active_experiment_id = str(experiment_id)
+        return experiment
+
+    def get_experiment(self, experiment_id: str) -> Experiment:
+        """Fake of MlflowClient.get_experiment."""
+        self._call('mlflow.get_experiment')
+        return self._experiment(experiment_id)
+
+    def search_experiments(
+        self, filter_string: Optional[str] = None, max_results: Optional[int] = None, **kwargs: Any
+    ):
+        """Fake of mlflow.search_experiments."""
+        self._call('mlflow.search_experiments')
+        return self._search_experiments(filter_string)[:max_results]
+
+    def set_experiment_tag(self, key: str, value: Any) -> None:
+        """Fake of mlflow.set_experiment_tag on the active experiment."""
+        self._call('mlflow.set_experiment_tag')
+        self._set_experiment_tag(self.active_experiment_id, key, value)
+
+    def start_run(
+        self, run_name: Optional[str] = None, experiment_id: Optional[str] = None, **kwargs: Any
+    ) -> _Run:
+        """Fake of mlflow.start_run."""
+        self._call('mlflow.start_run')
+        run = self._create_run(str(experiment_id or self.active_experiment_id), run_name)
+        self._active_runs().append(run)
+        return run
+
+    def set_tag(self, key: str, value: Any) -> None:
+        """Fake of mlflow.set_tag on the active run."""
+        self._call('mlflow.set_tag')
+        self._active_runs()[-1].data.tags[key] = str(value)
+
+    def get_run(self, run_id: str) -> _Run:
+        """Fake of mlflow.get_run."""
+        self._call('mlflow.get_run')
+        return self._get_run(run_id)
+
+    def delete_run(self, run_id: str) -> None:
+        """Fake of MlflowClient.delete_run."""
+        self._call('mlflow.delete_run')
+        with self._lock:
+            self._runs.pop(run_id, None)
+            self._run_traces.pop(run_id, None)
+
+    def search_runs(
+        self,
+        experiment_ids: List[str],
+        filter_string: Optional[str] = None,
+        max_results: Optional[int] = None,
+        output_format: str = 'pandas',
+        **kwargs: Any,
+    ) -> List[_Run]:
+        """Fake of mlflow.search_runs, matching tag equality filters."""
+        self._call('mlflow.search_runs')
+        if output_format != 'list':
+            raise NotImplementedError('FakeMlflow.search_runs only supports output_format="list"')
+        experiment_ids = {str(experiment_id) for experiment_id in experiment_ids}
+        with self._lock:
+            runs = [
+                run
+                for run in self._runs.values()
+                if run.info.experiment_id in experiment_ids
+                and _matches_tag_filter(run.data.tags, filter_string)
+            ]
+        return runs[:max_results] if max_results else runs
+
+    # mlflow.genai.labeling / label_schemas
+    def get_labeling_session(self, run_id: str) -> FakeLabelingSession:
+        """Fake of mlflow.genai.get_labeling_session."""
+        self._call('labeling.get_labeling_session')
+        with self._lock:
+            session = self._sessions.get(run_id)
+        if session is None:
+            raise MlflowException(f'Labeling session {run_id} not found')
+        return session
+
+    def get_labeling_sessions(
+        self, experiment_id: Optional[str] = None
+    ) -> List[FakeLabelingSession]:
+        """Fake of the labeling store get_labeling_sessions."""
+        self._call('labeling.get_labeling_sessions')
+        experiment_id = str(experiment_id or self.active_experiment_id)
+        with self._lock:
+            return [s for s in self._sessions.values() if s.experiment_id == experiment_id]
+
+    def create_labeling_session(
+        self,
+        name: str,
+        assigned_users: Optional[List[str]] = None,
+        label_schemas: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> FakeLabelingSession:
+        """Fake of mlflow.genai.create_labeling_session."""
+        self._call('labeling.create_labeling_session')
+        session = FakeLabelingSession(self, self.active_experiment_id, name, assigned_users or [])
+        with self._lock:
+            self._sessions[session.mlflow_run_id] = session
+        return session
+
+    def delete_labeling_session(self, session: FakeLabelingSession) -> None:
+        """Fake of mlflow.genai.delete_labeling_session."""
+        self._call('labeling.delete_labeling_session')
+        with self._lock:
+            self._sessions.pop(session.mlflow_run_id, None)
+
+    def create_label_schema(self, name: str, **kwargs: Any) -> SimpleNamespace:
+        """Fake of label_schemas.create_label_schema."""
+        self._call('labeling.create_label_schema')
+        with self._lock:
+            self._label_schemas[name] = kwargs
+        return SimpleNamespace(name=name, **kwargs)
+
+    def delete_label_schema(self, name: str) -> None:
+        """Fake of label_schemas.delete_label_schema."""
+        self._call('labeling.delete_label_schema')
+        with self._lock:
+            self._label_schemas.pop(name, None)
+
+    # mlflow.genai.scorers / judges
+    def list_scorers(self, experiment_id: Optional[str] = None) -> List[FakeScorer]:
+        """Fake of mlflow.genai.scorers.list_scorers."""
+        self._call('scorers.list_scorers')
+        experiment_id = str(experiment_id or self.active_experiment_id)
+        with self._lock:
+            return [
+                scorer
+                for (scorer_experiment, _), scorer in self._scorers.items()
+                if scorer_experiment == experiment_id
+            ]
+
+    def delete_scorer(self, name: str, experiment_id: Optional[str] = None, **kwargs: Any) -> None:
+        """Fake of mlflow.genai.scorers.delete_scorer."""
+        self._call('scorers.delete_scorer')
+        experiment_id = str(experiment_id or self.active_experiment_id)
+        with self._lock:
+            if self._scorers.pop((experiment_id, name), None) is None:
+                raise MlflowException(f'No registered scorer named {name}')
+
+    def make_judge(self, name: str, instructions: str, **kwargs: Any) -> FakeJudge:
+        """Fake of mlflow.genai.judges.make_judge."""
+        return FakeJudge(self, name, instructions, **kwargs)
+
+    @contextmanager
+    def install(self) -> Iterator['FakeMlflow']:
+        """Route the services' MLflow calls to this fake for the duration of the block."""
+        import mlflow
+        import mlflow.genai.label_schemas as label_schemas
+        import mlflow.genai.labeling as labeling
+        from databricks.rag_eval.clients.managedevals import managed_evals_client
+        from mlflow.genai import scorers
+        from mlflow.genai.labeling import stores as labeling_stores
+
+        from server.services.base_service import get_shared_mlflow_client
+
+        targets = [
+            (mlflow, 'get_trace', self.get_trace),
+            (mlflow, 'log_assessment', self.log_assessment),
+            (mlflow, 'set_experiment', self.set_experiment),
+            (mlflow, 'get_experiment', self.get_experiment),
+            (mlflow, 'search_experiments', self.search_experiments),
+            (mlflow, 'set_experiment_tag', self.set_experiment_tag),
+            (mlflow, 'start_run', self.start_run),
+            (mlflow, 'set_tag', self.set_tag),
+            (mlflow, 'get_run', self.get_run),
+            (mlflow, 'delete_run', self.delete_run),
+            (mlflow, 'search_runs', self.search_runs),
+            (labeling, 'get_labeling_session', self.get_labeling_session),
+            (labeling, 'get_labeling_sessions', self.get_labeling_sessions),
+            (labeling, 'create_labeling_session', self.create_labeling_session),
+            (labeling, 'delete_labeling_session', self.delete_labeling_session),
+            # Explicit-experiment session listing goes through the labeling store
+            (labeling_stores, '_get_labeling_store', lambda *args, **kwargs: self),
+            (label_schemas, 'create_label_schema', self.create_label_schema),
+            (label_schemas, 'delete_label_schema', self.delete_label_schema),
+            (scorers, 'list_scorers', self.list_scorers),
+            (scorers, 'delete_scorer', self.delete_scorer),
+            (
+                managed_evals_client,
+                'ManagedEvalsClient',
+                lambda *args, **kwargs: self.managed_evals_client,
+            ),
+            # The shared client wraps MlflowClient; swap the wrapped client so metrics still apply
+            (get_shared_mlflow_client(), '_client', self.client),
+        ]
+        with ExitStack() as stack:
+            for target, attribute, replacement in targets:
+                stack.enter_context(patch.object(target, attribute, replacement))
+            stack.enter_context(
+                patch('server.judges.instruction_judge.make_judge', self.make_judge)
+            )
+            yield self
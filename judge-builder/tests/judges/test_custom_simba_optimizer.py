@@ -0,0 +1,24 @@
+"""Unit tests for the custom SIMBA alignment optimizer."""
+
+from unittest.mock import Mock, patch
+
+from server.judges.custom_simba_optimizer import CustomSIMBAAlignmentOptimizer
+
+
+class TestCustomSIMBAAlignmentOptimizer:
+    """Test cases for CustomSIMBAAlignmentOptimizer."""
+
+    @patch('server.judges.custom_simba_optimizer.trace_to_dspy_example')
+    def test_traces_to_examples_keeps_order_and_drops_unlabeled(self, mock_to_example):
+        """Test parallel conversion preserves trace order and skips traces without feedback."""
+        traces = [Mock(name=f'trace-{i}') for i in range(20)]
+        mock_to_example.side_effect = lambda trace, judge: (
+            None if traces.index(trace) % 2 else traces.index(trace)
+        )
+
+        examples = CustomSIMBAAlignmentOptimizer(model='test-model')._traces_to_examples(
+            Mock(), traces
+        )
+
+        assert examples == list(range(0, 20, 2))
+        assert mock_to_example.call_count == 20
@@ -0,0 +1,227 @@
+"""Unit tests for the durable alignment job queue."""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from server.models import AlignmentJob, AlignmentResponse
+from server.services.alignment_job_service import MAX_JOB_ATTEMPTS, AlignmentJobService
+from server.services.alignment_service import PHASE_EVALUATE_CURRENT, PHASE_OPTIMIZE
+
+
+def make_response(judge_id: str = 'judge-123') -> AlignmentResponse:
+    """Build a successful alignment response."""
+    return AlignmentResponse(judge_id=judge_id, success=True, message='ok', new_version=2)
+
+
+def wait_for(service: AlignmentJobService):
+    """Wait until every submitted job has finished."""
+    service._executor.shutdown(wait=True)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Path for a job database in a temporary directory."""
+    return str(tmp_path / 'jobs.db')
+
+
+@pytest.fixture
+def mock_run_alignment():
+    """Patch alignment_service.run_alignment."""
+    with patch('server.services.alignment_service.alignment_service.run_alignment') as mock_run:
+        yield mock_run
+
+
+class TestAlignmentJobService:
+    """Test cases for AlignmentJobService."""
+
+    def test_job_completes_with_phase_timings(self, db_path, mock_run_alignment):
+        """Test that a submitted job runs and records its phases."""
+
+        def run(judge_id, checkpoint):
+            checkpoint.start_phase(PHASE_EVALUATE_CURRENT)
+            checkpoint.complete_phase(PHASE_EVALUATE_CURRENT, base_version=1, trace_ids=['t1'])
+            return make_response(judge_id)
+
+        mock_run_alignment.side_effect = run
+        service = AlignmentJobService(db_path)
+
+        job, created = service.submit('judge-123')
+        wait_for(service)
+
+        assert created
+        stored = service.get_job('judge-123')
+        assert stored.job_id == job.job_id
+        assert stored.status == 'completed'
+        assert stored.result.new_version == 2
+        assert [timing.phase for timing in stored.phases] == [PHASE_EVALUATE_CURRENT]
+        assert stored.phases[0].duration_seconds is not None
+        assert stored.checkpoint[PHASE_EVALUATE_CURRENT]['trace_ids'] == ['t1']
+
+    def test_duplicate_submit_is_rejected_while_active(self, db_path, mock_run_alignment):
+        """Test that only one active job is tracked per judge."""
+        release = threading.Event()
+        mock_run_alignment.side_effect = lambda judge_id, checkpoint: (
+            release.wait(timeout=5) and make_response(judge_id)
+        )
+        service = AlignmentJobService(db_path)
+
+        first, created = service.submit('judge-123')
+        second, created_again = service.submit('judge-123')
+        release.set()
+        wait_for(service)
+
+        assert created
+        assert not created_again
+        assert second.job_id == first.job_id
+
+    def test_concurrency_is_bounded(self, db_path, mock_run_alignment):
+        """Test that no more than max_concurrent alignments run at once."""
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def run(judge_id, checkpoint):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return make_response(judge_id)
+
+        mock_run_alignment.side_effect = run
+        service = AlignmentJobService(db_path, max_concurrent=2)
+
+        for i in range(5):
+            service.submit(f'judge-{i}')
+        wait_for(service)
+
+        assert peak == 2
+        assert service.get_stats() == {'completed': 5}
+
+    @pytest.mark.parametrize(
+        'error,error_type',
+        [
+            (ValueError('missing'), 'not_found'),
+            (RuntimeError('optimize failed'), 'optimization_failure'),
+            (Exception('boom'), 'unknown'),
+        ],
+    )
+    def test_failures_are_classified(self, db_path, mock_run_alignment, error, error_type):
+        """Test that failures are stored with the error type the API maps to HTTP codes."""
+        mock_run_alignment.side_effect = error
+        service = AlignmentJobService(db_path)
+
+        service.submit('judge-123')
+        wait_for(service)
+
+        job = service.get_job('judge-123')
+        assert job.status == 'failed'
+        assert job.error_type == error_type
+        assert job.error_message == str(error)
+
+    def test_clear_job_only_removes_finished_jobs(self, db_path, mock_run_alignment):
+        """Test that clearing a finished job allows a new submission."""
+        mock_run_alignment.side_effect = lambda judge_id, checkpoint: make_response(judge_id)
+        service = AlignmentJobService(db_path)
+
+        service.submit('judge-123')
+        wait_for(service)
+        service.clear_job('judge-123')
+
+        assert service.get_job('judge-123') is None
+
+    def test_interrupted_job_resumes_from_checkpoint(self, db_path, mock_run_alignment):
+        """Test that a job left running by a previous process resumes after its last phase."""
+        now = time.time()
+        previous = AlignmentJobService(db_path)
+        previous._save(
+            AlignmentJob(
+                job_id='job-1',
+                judge_id='judge-123',
+                status='running',
+                phase=PHASE_OPTIMIZE,
+                checkpoint={PHASE_EVALUATE_CURRENT: {'base_version': 1, 'trace_ids': ['t1']}},
+                attempts=1,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+
+        resumed_checkpoints = []
+
+        def run(judge_id, checkpoint):
+            resumed_checkpoints.append(dict(checkpoint.completed))
+            return make_response(judge_id)
+
+        mock_run_alignment.side_effect = run
+        service = AlignmentJobService(db_path)
+
+        assert service.resume_interrupted_jobs() == 1
+        wait_for(service)
+
+        assert resumed_checkpoints == [
+            {PHASE_EVALUATE_CURRENT: {'base_version': 1, 'trace_ids': ['t1']}}
+        ]
+        job = service.get_job('judge-123')
+        assert job.status == 'completed'
+        assert job.attempts == 2
+
+    def test_repeatedly_interrupted_job_is_failed(self, db_path, mock_run_alignment):
+        """Test that a job interrupted too many times is not resumed again."""
+        now = time.time()
+        service = AlignmentJobService(db_path)
+        service._save(
+            AlignmentJob(
+                job_id='job-1',
+                judge_id='judge-123',
+                status='running',
+                attempts=MAX_JOB_ATTEMPTS,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+
+        assert service.resume_interrupted_jobs() == 0
+        assert service.get_job('judge-123').status == 'failed'
+        mock_run_alignment.assert_not_called()
+
+
+class TestAlignmentCheckpointResume:
+    """Test cases for resuming run_alignment from a checkpoint."""
+
+    def test_completed_phases_are_skipped(self):
+        """Test that a resumed run doesn't repeat evaluation or version creation."""
+        from server.services.alignment_service import (
+            PHASE_CREATE_VERSION,
+            AlignmentCheckpoint,
+            AlignmentService,
+        )
+
+        judge = Mock(version=2, labeling_run_id='run-1', alignment_model_config=None)
+        checkpoint = AlignmentCheckpoint(
+            {
+                PHASE_EVALUATE_CURRENT: {'base_version': 1, 'trace_ids': ['t1']},
+                PHASE_OPTIMIZE: {'aligned_instructions': 'aligned'},
+                PHASE_CREATE_VERSION: {'new_version': 2},
+            }
+        )
+
+        with patch('server.services.judge_service.judge_service') as mock_judge_service, \
+             patch('server.services.labeling_service.labeling_service') as mock_labeling_service, \
+             patch('server.services.alignment_service.cache_service'), \
+             patch('server.services.alignment_service.MlflowClient'), \
+             patch.object(AlignmentService, 'evaluate_judge') as mock_evaluate:
+            mock_judge_service.get_judge.return_value = judge
+            mock_labeling_service.get_labeling_progress.return_value = Mock(labeled_examples=5)
+
+            result = AlignmentService().run_alignment('judge-123', checkpoint=checkpoint)
+
+        assert result.new_version == 2
+        assert mock_evaluate.call_count == 1
+        mock_judge_service.create_new_version.assert_not_called()
+        mock_judge_service._get_or_recreate_judge.assert_not_called()
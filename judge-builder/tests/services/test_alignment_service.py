@@ -12,10 +12,12 @@ from server.models import (
     TraceRequest,
 )
 from server.services.alignment_service import AlignmentService
+from server.services.cache_service import cache_service
 
 
 @pytest.fixture
 def alignment_service():
+    cache_service.scorer_cache.clear()
     return AlignmentService()
 
 
@@ -76,6 +78,50 @@ class TestAlignmentService:
 
             assert result is None
 
+    def test_get_judge_scorer_uses_cache(self, alignment_service, mock_judge):
+        """Test that a listed scorer is served from the cache on later lookups."""
+        mock_scorer = Mock()
+        mock_scorer.name = 'v2_instruction_judge_test_judge'
+        other_scorer = Mock()
+        other_scorer.name = 'v1_instruction_judge_other_judge'
+
+        with patch('server.services.alignment_service.scorers.list_scorers') as mock_list:
+            mock_list.return_value = [other_scorer, mock_scorer]
+
+            assert alignment_service._get_judge_scorer(mock_judge) == mock_scorer
+            assert alignment_service._get_judge_scorer(mock_judge) == mock_scorer
+
+            mock_list.assert_called_once()
+            assert (
+                cache_service.get_scorer('exp-123', 'v1_instruction_judge_other_judge')
+                == other_scorer
+            )
+
+    def test_get_judge_scorer_registered_skips_listing(self, alignment_service, mock_judge):
+        """Test that a scorer cached at registration needs no listing."""
+        mock_scorer = Mock()
+        mock_scorer.name = 'v2_instruction_judge_test_judge'
+        cache_service.cache_scorers('exp-123', [mock_scorer])
+
+        with patch('server.services.alignment_service.scorers.list_scorers') as mock_list:
+            assert alignment_service._get_judge_scorer(mock_judge) == mock_scorer
+            mock_list.assert_not_called()
+
+    def test_get_judge_scorer_after_invalidation(self, alignment_service, mock_judge):
+        """Test that invalidated scorers are listed again."""
+        mock_scorer = Mock()
+        mock_scorer.name = 'v2_instruction_judge_test_judge'
+        cache_service.cache_scorers('exp-123', [mock_scorer])
+        cache_service.invalidate_scorers(
+            'exp-123', ['v1_instruction_judge_test_judge', mock_scorer.name]
+        )
+
+        with patch('server.services.alignment_service.scorers.list_scorers') as mock_list:
+            mock_list.return_value = []
+
+            assert alignment_service._get_judge_scorer(mock_judge) is None
+            mock_list.assert_called_once()
+
     @patch('server.services.alignment_service.cache_service')
     def test_evaluate_judge_cached(self, mock_cache_service, alignment_service, mock_judge):
         """Test judge evaluation with cached result."""
@@ -90,18 +136,26 @@ class TestAlignmentService:
 
     @patch('server.services.alignment_service.mlflow')
     @patch('server.services.alignment_service.cache_service')
-    @patch('server.services.alignment_service.evaluate')
-    def test_evaluate_judge_new_evaluation(self, mock_evaluate, mock_cache_service, mock_mlflow,
-                                         alignment_service, mock_judge, mock_trace):
+    @patch('server.services.alignment_service.scoring_service')
+    def test_evaluate_judge_new_evaluation(
+        self,
+        mock_scoring_service,
+        mock_cache_service,
+        mock_mlflow,
+        alignment_service,
+        mock_judge,
+        mock_trace,
+    ):
         """Test judge evaluation with new evaluation run."""
         # Setup mocks
         mock_cache_service.get_evaluation_run_id.return_value = None
-        mock_cache_service.get_trace.return_value = mock_trace
+        mock_cache_service.get_traces.return_value = [mock_trace]
         mock_scorer = Mock()
         mock_scorer.name = 'v2_instruction_judge_test_judge'
         mock_run = Mock()
         mock_run.info.run_id = 'new-run-123'
         mock_mlflow.start_run.return_value.__enter__.return_value = mock_run
+        mock_scoring_service.score_traces.return_value = ({}, None)
 
         with patch.object(alignment_service, '_get_judge_scorer', return_value=mock_scorer), \
              patch('server.services.alignment_service.judge_service') as mock_judge_service:
@@ -112,7 +166,55 @@ class TestAlignmentService:
 
             assert result.judge_id == 'judge-123'
             assert result.mlflow_run_id == 'new-run-123'
-            mock_evaluate.assert_called_once()
+            mock_scoring_service.score_traces.assert_called_once_with(
+                mock_scorer, [mock_trace], 'new-run-123', reused_results={}
+            )
+
+    @patch('server.services.alignment_service.mlflow')
+    @patch('server.services.alignment_service.cache_service')
+    @patch('server.services.alignment_service.scoring_service')
+    def test_evaluate_judge_scores_only_new_traces(self, mock_scoring_service, mock_cache_service,
+                                                   mock_mlflow, alignment_service, mock_judge):
+        """Test that traces already scored by this judge version are reused, not re-scored."""
+        traces = []
+        for trace_id in ['trace-1', 'trace-2', 'trace-3']:
+            trace = Mock()
+            trace.info.trace_id = trace_id
+            trace.info.assessments = []
+            traces.append(trace)
+
+        mock_cache_service.get_evaluation_run_id.return_value = None
+        mock_cache_service.get_traces.return_value = traces
+        previous_results = {'trace-1': Mock(), 'trace-2': Mock()}
+        mock_cache_service.get_trace_assessments.return_value = previous_results
+        new_feedback = Mock()
+        mock_scoring_service.score_traces.return_value = ({'trace-3': [new_feedback]}, None)
+        mock_run = Mock()
+        mock_run.info.run_id = 'new-run-123'
+        mock_mlflow.start_run.return_value.__enter__.return_value = mock_run
+
+        with (
+            patch.object(
+                alignment_service, '_get_judge_scorer', return_value=Mock()
+            ) as mock_get_scorer,
+            patch('server.services.judge_service.judge_service') as mock_judge_service,
+        ):
+            mock_judge_service.get_judge.return_value = mock_judge
+
+            result = alignment_service.evaluate_judge(
+                'judge-123', TraceRequest(trace_ids=['trace-1', 'trace-2', 'trace-3'])
+            )
+
+        assert result.mlflow_run_id == 'new-run-123'
+        mock_scoring_service.score_traces.assert_called_once_with(
+            mock_get_scorer.return_value,
+            [traces[2]],
+            'new-run-123',
+            reused_results=previous_results,
+        )
+        mock_cache_service.cache_trace_assessments.assert_called_with(
+            'judge-123', 2, {'trace-3': new_feedback}
+        )
 
     def test_test_judge_success(self, alignment_service, mock_judge, mock_trace):
         """Test successful judge testing on single trace."""
@@ -159,7 +261,7 @@ class TestAlignmentService:
         # Setup mocks
         mock_judge.version = 2
         mock_cache_service.get_evaluation_run_id.return_value = 'run-123'
-        mock_cache_service.get_trace.return_value = mock_trace
+        mock_cache_service.get_traces.return_value = [mock_trace]
         mock_get_human.return_value = mock_assessment
         mock_get_scorer.return_value = mock_assessment
         mock_has_error.return_value = False
@@ -241,7 +343,7 @@ class TestAlignmentService:
     def test_run_alignment_success(self, mock_cache_service, alignment_service,
                                  mock_judge, mock_trace):
         """Test successful alignment run."""
-        mock_cache_service.get_trace.return_value = mock_trace
+        mock_cache_service.get_traces.return_value = [mock_trace]
         mock_example = Mock()
         mock_example.trace_id = 'trace-123'
 
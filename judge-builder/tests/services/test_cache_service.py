@@ -1,11 +1,21 @@
 """Unit tests for cache service."""
 
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
 import pytest
+from cachetools import LRUCache, TTLCache
+from mlflow.entities import AssessmentSource, Feedback
 
 from server.services.cache_service import CacheService
+from server.utils.parsing_utils import (
+    extract_request_from_trace,
+    extract_response_from_trace,
+    get_human_feedback_from_trace,
+)
+from server.utils.trace_summary import TraceSummary
+from tests.fakes.fake_mlflow import FakeMlflow
 
 
 @pytest.fixture
@@ -137,6 +147,18 @@ class TestCacheService:
         # Should also be cached now
         assert cache_service.trace_cache['trace-123'] == mock_trace
 
+    @patch('server.services.cache_service.mlflow.get_trace')
+    def test_refresh_trace_replaces_cached_copy(self, mock_mlflow_get, cache_service, mock_trace):
+        """Test that refreshing re-fetches a trace even when it is cached."""
+        stale = Mock()
+        cache_service.trace_cache['trace-123'] = stale
+        mock_mlflow_get.return_value = mock_trace
+
+        assert cache_service.refresh_trace('trace-123') == mock_trace
+        assert cache_service.trace_cache['trace-123'] == mock_trace
+        assert cache_service.is_trace_cached('trace-123')
+        assert not cache_service.is_trace_cached('trace-456')
+
     @patch('server.services.cache_service.mlflow.get_trace')
     def test_get_trace_mlflow_error(self, mock_mlflow_get, cache_service):
         """Test getting trace when MLflow raises exception."""
@@ -146,13 +168,46 @@ class TestCacheService:
 
         assert result is None
 
+    @patch('server.services.cache_service.evaluation_run_index')
+    @patch('server.services.cache_service.mlflow.search_runs')
+    def test_find_evaluation_run_from_index(self, mock_search_runs, mock_index, cache_service):
+        """Test that an indexed evaluation run is found without searching runs."""
+        mock_index.get.return_value = {'1:abc123': 'indexed-run-123'}
+
+        result = cache_service.find_evaluation_run('judge-123', 1, 'exp-123', 'abc123')
+
+        assert result == 'indexed-run-123'
+        mock_index.get.assert_called_once_with('exp-123', 'judge-123')
+        mock_search_runs.assert_not_called()
+        assert cache_service.evaluation_cache['judge-123:1:abc123'] == 'indexed-run-123'
+
+    @patch('server.services.cache_service.evaluation_run_index')
+    @patch('server.services.cache_service.mlflow.search_runs')
+    def test_find_evaluation_run_not_in_index(self, mock_search_runs, mock_index, cache_service):
+        """Test that a run missing from an existing index is searched for and backfilled."""
+        mock_index.get.return_value = {'1:other': 'indexed-run-123'}
+        mock_run = Mock()
+        mock_run.info.run_id = 'found-run-123'
+        mock_search_runs.return_value = [mock_run]
+
+        result = cache_service.find_evaluation_run('judge-123', 1, 'exp-123', 'abc123')
+
+        assert result == 'found-run-123'
+        mock_search_runs.assert_called_once()
+        assert mock_search_runs.call_args.kwargs['max_results'] == 1
+        mock_index.record.assert_called_once_with(
+            'exp-123', 'judge-123', 1, 'abc123', 'found-run-123'
+        )
+
+    @patch('server.services.cache_service.evaluation_run_index')
     @patch('server.services.cache_service.mlflow.search_runs')
-    def test_find_evaluation_run_found(self, mock_search_runs, cache_service):
+    def test_find_evaluation_run_found(self, mock_search_runs, mock_index, cache_service):
         """Test finding evaluation run in MLflow."""
         judge_id = 'judge-123'
         judge_version = 1
         experiment_id = 'exp-123'
         dataset_version = 'abc123'
+        mock_index.get.return_value = None
 
         # Mock MLflow response
         mock_run = Mock()
@@ -164,28 +219,48 @@ class TestCacheService:
         assert result == 'found-run-123'
         mock_search_runs.assert_called_once()
 
-        # Should also cache the result
+        # Should also cache the result and add it to the index
         cache_key = f'{judge_id}:{judge_version}:{dataset_version}'
         assert cache_service.evaluation_cache[cache_key] == 'found-run-123'
+        mock_index.record.assert_called_once_with(
+            experiment_id, judge_id, judge_version, dataset_version, 'found-run-123'
+        )
 
+    @patch('server.services.cache_service.evaluation_run_index')
     @patch('server.services.cache_service.mlflow.search_runs')
-    def test_find_evaluation_run_not_found(self, mock_search_runs, cache_service):
+    def test_find_evaluation_run_not_found(self, mock_search_runs, mock_index, cache_service):
         """Test finding evaluation run when not found in MLflow."""
+        mock_index.get.return_value = None
         mock_search_runs.return_value = []
 
         result = cache_service.find_evaluation_run('judge-123', 1, 'exp-123', 'abc123')
 
         assert result is None
+        mock_search_runs.assert_called_once()
 
+    @patch('server.services.cache_service.evaluation_run_index')
     @patch('server.services.cache_service.mlflow.search_runs')
-    def test_find_evaluation_run_mlflow_error(self, mock_search_runs, cache_service):
+    def test_find_evaluation_run_mlflow_error(self, mock_search_runs, mock_index, cache_service):
         """Test finding evaluation run when MLflow raises exception."""
+        mock_index.get.return_value = None
         mock_search_runs.side_effect = Exception('MLflow error')
 
         result = cache_service.find_evaluation_run('judge-123', 1, 'exp-123', 'abc123')
 
         assert result is None
 
+    @patch('server.services.cache_service.evaluation_run_index')
+    def test_cache_evaluation_run_id_records_index(self, mock_index, cache_service):
+        """Test that caching an evaluation with an experiment adds it to the index."""
+        trace_ids = ['trace-1', 'trace-2']
+        dataset_version = cache_service.compute_dataset_version(trace_ids)
+
+        cache_service.cache_evaluation_run_id('judge-123', 2, trace_ids, 'run-123', 'exp-123')
+
+        mock_index.record.assert_called_once_with(
+            'exp-123', 'judge-123', 2, dataset_version, 'run-123'
+        )
+
     def test_ttl_expiration(self, cache_service):
         """Test that cache entries expire after TTL."""
         import time
@@ -248,3 +323,205 @@ class TestCacheService:
 
         finally:
             cache_service.trace_cache_ttl = original_ttl
+
+    @patch('server.services.cache_service.mlflow.get_trace')
+    def test_get_traces_fetches_only_misses(self, mock_mlflow_get, cache_service):
+        """Test that get_traces serves hits from cache and fetches only misses."""
+        cached = Mock()
+        cache_service.trace_cache['trace-1'] = cached
+        mock_mlflow_get.side_effect = lambda trace_id: f'fetched-{trace_id}'
+
+        result = cache_service.get_traces(['trace-1', 'trace-2', 'trace-3'])
+
+        assert result == [cached, 'fetched-trace-2', 'fetched-trace-3']
+        assert sorted(c.args[0] for c in mock_mlflow_get.call_args_list) == ['trace-2', 'trace-3']
+        assert cache_service.trace_cache['trace-2'] == 'fetched-trace-2'
+        assert cache_service.trace_cache['trace-3'] == 'fetched-trace-3'
+
+    @patch('server.services.cache_service.mlflow.get_trace')
+    def test_get_traces_skips_failures(self, mock_mlflow_get, cache_service):
+        """Test that traces which fail to fetch are excluded and not cached."""
+
+        def fake_get_trace(trace_id):
+            if trace_id == 'bad':
+                raise Exception('MLflow error')
+            return f'fetched-{trace_id}'
+
+        mock_mlflow_get.side_effect = fake_get_trace
+
+        result = cache_service.get_traces(['good-1', 'bad', 'good-2'])
+
+        assert result == ['fetched-good-1', 'fetched-good-2']
+        assert 'bad' not in cache_service.trace_cache
+
+    @patch('server.services.cache_service.mlflow.get_trace')
+    def test_get_traces_dedupes_fetches(self, mock_mlflow_get, cache_service):
+        """Test that duplicate trace IDs are fetched once."""
+        mock_mlflow_get.side_effect = lambda trace_id: f'fetched-{trace_id}'
+
+        result = cache_service.get_traces(['trace-1', 'trace-1'])
+
+        assert result == ['fetched-trace-1', 'fetched-trace-1']
+        mock_mlflow_get.assert_called_once_with('trace-1')
+
+    def test_trace_assessments_keyed_by_judge_version_and_trace(self, cache_service):
+        """Test per-trace results are cached per judge version and errors are skipped."""
+        ok = Mock(error=None)
+        failed = Mock(error=Mock())
+
+        cache_service.cache_trace_assessments('judge-1', 1, {'trace-1': ok, 'trace-2': failed})
+
+        assert cache_service.get_trace_assessments('judge-1', 1, ['trace-1', 'trace-2']) == {
+            'trace-1': ok
+        }
+        assert cache_service.get_trace_assessments('judge-1', 2, ['trace-1']) == {}
+
+    def test_invalidate_judge_evaluations_drops_trace_assessments(self, cache_service):
+        """Test that invalidating a judge also forgets its per-trace results."""
+        cache_service.cache_trace_assessments('judge-1', 1, {'trace-1': Mock(error=None)})
+        cache_service.cache_trace_assessments('judge-10', 1, {'trace-1': Mock(error=None)})
+
+        cache_service.invalidate_judge_evaluations('judge-1')
+
+        assert cache_service.get_trace_assessments('judge-1', 1, ['trace-1']) == {}
+        assert 'trace-1' in cache_service.get_trace_assessments('judge-10', 1, ['trace-1'])
+
+    def test_alignment_comparison_cached_per_key(self, cache_service):
+        """Test comparison results are keyed by judge, versions, dataset and labels."""
+        key = cache_service.alignment_comparison_key('judge-1', 1, 2, 'data-v1', 'labels-v1')
+        cache_service.cache_alignment_comparison(key, {'metrics': {}})
+
+        assert cache_service.get_alignment_comparison(key) == {'metrics': {}}
+        relabeled = cache_service.alignment_comparison_key('judge-1', 1, 2, 'data-v1', 'labels-v2')
+        assert cache_service.get_alignment_comparison(relabeled) is None
+
+    def test_alignment_comparison_invalidation(self, cache_service):
+        """Test comparisons are dropped when their judge or traces are invalidated."""
+        key_1 = cache_service.alignment_comparison_key('judge-1', 1, 2, 'data', 'labels')
+        key_10 = cache_service.alignment_comparison_key('judge-10', 1, 2, 'data', 'labels')
+        cache_service.cache_alignment_comparison(key_1, {'judge': 1})
+        cache_service.cache_alignment_comparison(key_10, {'judge': 10})
+
+        cache_service.invalidate_judge_evaluations('judge-1')
+
+        assert cache_service.get_alignment_comparison(key_1) is None
+        assert cache_service.get_alignment_comparison(key_10) == {'judge': 10}
+
+        cache_service.invalidate_traces(['trace-1'])
+
+        assert cache_service.get_alignment_comparison(key_10) is None
+
+    def test_cache_stats_count_hits_and_misses(self, cache_service, mock_trace):
+        """Test that cache stats report real lookup counts."""
+        cache_service.trace_cache['trace-123'] = mock_trace
+
+        cache_service.get_traces(['trace-123'])
+        cache_service.get_trace_assessments('judge-1', 1, ['trace-1', 'trace-2'])
+        with patch.object(cache_service, '_fetch_trace', return_value=None):
+            cache_service.get_trace('missing')
+
+        stats = cache_service.get_cache_stats()
+        assert (stats['trace_cache']['hits'], stats['trace_cache']['misses']) == (1, 1)
+        assert (stats['assessment_cache']['hits'], stats['assessment_cache']['misses']) == (0, 2)
+
+    @patch('server.services.cache_service.mlflow.get_trace')
+    def test_get_trace_summaries_keeps_only_summaries(
+        self, mock_mlflow_get, cache_service, mock_trace
+    ):
+        """Test that summary misses are fetched without keeping the full trace in memory."""
+        mock_trace.info.assessments = []
+        mock_mlflow_get.return_value = mock_trace
+
+        result = cache_service.get_trace_summaries(['trace-123'])
+
+        assert len(result) == 1
+        assert isinstance(result[0], TraceSummary)
+        assert result[0].info.trace_id == 'trace-123'
+        assert result[0].data.request == {'request': 'test request'}
+        assert 'trace-123' in cache_service.summary_cache
+        assert 'trace-123' not in cache_service.trace_cache
+
+        # Served from memory from now on
+        cache_service.get_trace_summaries(['trace-123'])
+        mock_mlflow_get.assert_called_once_with('trace-123')
+
+    @patch('server.services.cache_service.mlflow.get_trace')
+    def test_get_trace_summaries_from_cached_full_trace(
+        self, mock_mlflow_get, cache_service, mock_trace
+    ):
+        """Test that a cached full trace is summarized instead of fetched."""
+        mock_trace.info.assessments = []
+        cache_service.trace_cache['trace-123'] = mock_trace
+
+        result = cache_service.get_trace_summaries(['trace-123', 'trace-123'])
+
+        assert [summary.trace_id for summary in result] == ['trace-123', 'trace-123']
+        mock_mlflow_get.assert_not_called()
+
+    @patch('server.services.cache_service.mlflow.get_trace')
+    def test_get_traces_also_caches_summary(self, mock_mlflow_get, cache_service, mock_trace):
+        """Test that loading a full trace stores its summary, and invalidation drops both."""
+        mock_trace.info.assessments = []
+        mock_mlflow_get.return_value = mock_trace
+
+        cache_service.get_traces(['trace-123'])
+        assert 'trace-123' in cache_service.summary_cache
+
+        cache_service.invalidate_traces(['trace-123'])
+        assert 'trace-123' not in cache_service.summary_cache
+        assert 'trace-123' not in cache_service.trace_cache
+
+    def test_concurrent_access(self, cache_service):
+        """Test that reads, writes and invalidation scans from many threads don't race."""
+        # Small caches so entries are evicted and expire while other threads scan them
+        cache_service.assessment_cache = LRUCache(maxsize=50)
+        cache_service.evaluation_cache = TTLCache(maxsize=50, ttl=0.001)
+        cache_service.comparison_cache = TTLCache(maxsize=20, ttl=0.001)
+        feedback = Mock(error=None)
+
+        def work(worker):
+            judge_id = f'judge-{worker % 4}'
+            for i in range(300):
+                trace_ids = [f'trace-{worker}-{i}-{n}' for n in range(5)]
+                cache_service.cache_trace_assessments(
+                    judge_id, 1, {trace_id: feedback for trace_id in trace_ids}
+                )
+                cache_service.get_trace_assessments(judge_id, 1, trace_ids)
+                cache_service.cache_evaluation_run_id(judge_id, 1, trace_ids, f'run-{i}')
+                cache_service.get_evaluation_run_id(judge_id, 1, trace_ids)
+                key = cache_service.alignment_comparison_key(judge_id, 1, 2, str(i), 'labels')
+                cache_service.cache_alignment_comparison(key, {'metrics': {}})
+                cache_service.get_alignment_comparison(key)
+                cache_service.invalidate_judge_evaluations(judge_id)
+                cache_service.invalidate_traces(trace_ids)
+                cache_service.get_cache_stats()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            # list() re-raises any exception from a worker
+            list(executor.map(work, range(16)))
+
+        assert len(cache_service.assessment_cache) <= 50
+
+    def test_trace_summary_matches_full_trace(self):
+        """Test that a summary reads the same as its trace through the parsing helpers."""
+        fake = FakeMlflow()
+        experiment_id = fake.create_experiment('exp')
+        trace = fake.create_trace(experiment_id, 'What is MLflow?', 'A platform.')
+        fake.add_assessment(
+            trace.info.trace_id,
+            Feedback(
+                name='quality',
+                value='Pass',
+                source=AssessmentSource(source_type='HUMAN', source_id='sme'),
+            ),
+        )
+
+        summary = TraceSummary.from_trace(trace)
+
+        assert (
+            extract_request_from_trace(summary)
+            == extract_request_from_trace(trace)
+            == 'What is MLflow?'
+        )
+        assert extract_response_from_trace(summary) == 'A platform.'
+        assert get_human_feedback_from_trace('quality', summary).value == 'Pass'
@@ -0,0 +1,118 @@
+"""Unit tests for the evaluation run index."""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from server.services.evaluation_run_index import EvaluationRunIndex, evaluation_runs_tag
+
+
+class FakeExperimentTags:
+    """In-memory stand-in for experiment tag reads and writes."""
+
+    def __init__(self, tags=None):
+        self.tags = dict(tags or {})
+        self.reads = 0
+        self.writes = 0
+        self.on_write = None
+
+    def get_experiment(self, experiment_id):
+        """Return an experiment with a copy of the tags."""
+        self.reads += 1
+        return Mock(experiment_id=experiment_id, tags=dict(self.tags))
+
+    def set_experiment_tag(self, experiment_id, key, value):
+        """Set a tag, counting the write."""
+        self.tags[key] = value
+        self.writes += 1
+        if self.on_write:
+            self.on_write(key)
+
+    def delete_experiment_tag(self, experiment_id, key):
+        """Delete a tag."""
+        del self.tags[key]
+
+
+@pytest.fixture
+def backend():
+    """Create an in-memory experiment tag backend."""
+    return FakeExperimentTags()
+
+
+@pytest.fixture
+def index(backend):
+    """Create an index on the fake backend."""
+    index = EvaluationRunIndex(max_entries=3)
+    index.client = backend
+    return index
+
+
+class TestEvaluationRunIndex:
+    """Test cases for EvaluationRunIndex."""
+
+    def test_get_without_index(self, index, backend):
+        """Test that a judge without an index reads as None."""
+        assert index.get('exp-1', 'judge-1') is None
+        assert backend.reads == 1
+
+    def test_record_and_get(self, index, backend):
+        """Test that recorded runs are read back with one experiment read."""
+        assert index.record('exp-1', 'judge-1', 1, 'abc', 'run-1')
+        assert index.record('exp-1', 'judge-1', 2, 'abc', 'run-2')
+
+        backend.reads = 0
+        assert index.get('exp-1', 'judge-1') == {'1:abc': 'run-1', '2:abc': 'run-2'}
+        assert backend.reads == 1
+        assert index.get('exp-1', 'judge-2') is None
+
+    def test_record_existing_entry_skips_write(self, index, backend):
+        """Test that re-recording the same run does not rewrite the tag."""
+        index.record('exp-1', 'judge-1', 1, 'abc', 'run-1')
+        writes = backend.writes
+
+        assert index.record('exp-1', 'judge-1', 1, 'abc', 'run-1')
+        assert backend.writes == writes
+
+    def test_oldest_entries_are_trimmed(self, index):
+        """Test that the index keeps the newest max_entries runs."""
+        for version in range(1, 5):
+            index.record('exp-1', 'judge-1', version, 'abc', f'run-{version}')
+
+        assert index.get('exp-1', 'judge-1') == {
+            '2:abc': 'run-2',
+            '3:abc': 'run-3',
+            '4:abc': 'run-4',
+        }
+
+    def test_concurrent_overwrite_is_retried(self, index, backend):
+        """Test that a writer replacing the tag without our entry triggers a retry."""
+        index.record('exp-1', 'judge-1', 1, 'abc', 'run-1')
+
+        def overwrite_once(key):
+            backend.on_write = None
+            backend.tags[key] = json.dumps({'1:abc': 'run-1', '1:def': 'run-other'})
+
+        backend.on_write = overwrite_once
+
+        assert index.record('exp-1', 'judge-1', 2, 'abc', 'run-2')
+        assert index.get('exp-1', 'judge-1') == {
+            '1:abc': 'run-1',
+            '1:def': 'run-other',
+            '2:abc': 'run-2',
+        }
+
+    def test_record_failure_returns_false(self, index, backend):
+        """Test that a failing write is reported without raising."""
+        backend.set_experiment_tag = Mock(side_effect=Exception('MLflow error'))
+
+        assert not index.record('exp-1', 'judge-1', 1, 'abc', 'run-1')
+
+    def test_delete(self, index, backend):
+        """Test that deleting removes the judge's tag and tolerates a missing index."""
+        index.record('exp-1', 'judge-1', 1, 'abc', 'run-1')
+
+        index.delete('exp-1', 'judge-1')
+        index.delete('exp-1', 'judge-1')
+
+        assert evaluation_runs_tag('judge-1') not in backend.tags
@@ -5,6 +5,7 @@ from unittest import TestCase
 from unittest.mock import Mock, patch
 
 from mlflow.entities import Experiment, ViewType
+from mlflow.store.entities.paged_list import PagedList
 
 from server.services.experiment_service import ExperimentService
 
@@ -115,50 +116,87 @@ class TestExperimentService(TestCase):
 
         self.assertIn('Experiment not found', str(context.exception))
 
-    @patch('server.services.experiment_service.mlflow')
-    def test_get_experiment_traces_basic(self, mock_mlflow):
+    def _mock_trace(
+        self, trace_id, request='{"request": "Question"}', response='{"response": "Answer"}'
+    ):
+        trace = Mock()
+        trace.info.trace_id = trace_id
+        trace.info.assessments = []
+        trace.data.request = request
+        trace.data.response = response
+        return trace
+
+    def test_get_experiment_traces_basic(self):
         """Test getting traces from an experiment."""
-        mock_traces = {
-            'trace': [
-                {'trace_id': 'trace1', 'request': 'Question 1'},
-                {'trace_id': 'trace2', 'request': 'Question 2'},
-            ]
-        }
-        mock_mlflow.search_traces.return_value = mock_traces
+        self.service.client = Mock()
+        self.service.client.search_traces.return_value = PagedList(
+            [self._mock_trace('trace1'), self._mock_trace('trace2', request='plain text')], None
+        )
 
         result = self.service.get_experiment_traces('exp123')
 
-        mock_mlflow.search_traces.assert_called_once_with(experiment_ids=['exp123'])
-
-        self.assertEqual(result, mock_traces)
+        self.assertEqual([example.trace_id for example in result], ['trace1', 'trace2'])
+        self.assertEqual(result[0].request, 'Question')
+        self.assertEqual(result[0].response, 'Answer')
+        self.assertEqual(result[1].request, 'plain text')
 
-    @patch('server.services.experiment_service.mlflow')
-    def test_get_experiment_traces_with_run_id(self, mock_mlflow):
+    def test_get_experiment_traces_with_run_id(self):
         """Test getting traces from an experiment filtered by run ID."""
-        mock_traces = {'trace': [{'trace_id': 'trace1', 'run_id': 'run123'}]}
-        mock_mlflow.search_traces.return_value = mock_traces
+        self.service.client = Mock()
+        self.service.client.search_traces.return_value = PagedList(
+            [self._mock_trace('trace1')], None
+        )
+
+        self.service.get_experiment_traces('exp123', run_id='run123')
 
-        result = self.service.get_experiment_traces('exp123', run_id='run123')
+        call_args = self.service.client.search_traces.call_args
+        self.assertEqual(call_args.kwargs['experiment_ids'], ['exp123'])
+        self.assertEqual(call_args.kwargs['run_id'], 'run123')
 
-        mock_mlflow.search_traces.assert_called_once_with(
-            experiment_ids=['exp123'], run_id='run123'
+    def test_get_experiment_traces_follows_page_tokens(self):
+        """Test that all pages are read, up to max_results."""
+        self.service.client = Mock()
+        self.service.client.search_traces.side_effect = [
+            PagedList([self._mock_trace('trace1'), self._mock_trace('trace2')], 'page-2'),
+            PagedList([self._mock_trace('trace3')], None),
+        ]
+
+        result = self.service.get_experiment_traces('exp123')
+
+        self.assertEqual(len(result), 3)
+        tokens = [c.kwargs['page_token'] for c in self.service.client.search_traces.call_args_list]
+        self.assertEqual(tokens, [None, 'page-2'])
+
+    def test_get_experiment_traces_page(self):
+        """Test getting a single page and its continuation token."""
+        self.service.client = Mock()
+        self.service.client.search_traces.return_value = PagedList(
+            [self._mock_trace('trace1')], 'next'
         )
 
-        self.assertEqual(result, mock_traces)
+        examples, next_page_token = self.service.get_experiment_traces_page(
+            'exp123', page_size=1, page_token='this'
+        )
 
-    @patch('server.services.experiment_service.mlflow')
-    def test_get_experiment_traces_empty_result(self, mock_mlflow):
+        self.assertEqual(len(examples), 1)
+        self.assertEqual(next_page_token, 'next')
+        call_args = self.service.client.search_traces.call_args
+        self.assertEqual(call_args.kwargs['max_results'], 1)
+        self.assertEqual(call_args.kwargs['page_token'], 'this')
+
+    def test_get_experiment_traces_empty_result(self):
         """Test getting traces when no traces exist."""
-        mock_mlflow.search_traces.return_value = {'trace': []}
+        self.service.client = Mock()
+        self.service.client.search_traces.return_value = PagedList([], None)
 
         result = self.service.get_experiment_traces('exp123')
 
-        self.assertEqual(result['trace'], [])
+        self.assertEqual(result, [])
 
-    @patch('server.services.experiment_service.mlflow')
-    def test_get_experiment_traces_mlflow_error(self, mock_mlflow):
+    def test_get_experiment_traces_mlflow_error(self):
         """Test get experiment traces when MLflow raises an error."""
-        mock_mlflow.search_traces.side_effect = Exception('MLflow connection error')
+        self.service.client = Mock()
+        self.service.client.search_traces.side_effect = Exception('MLflow connection error')
 
         with self.assertRaises(Exception) as context:
             self.service.get_experiment_traces('exp123')
@@ -218,28 +256,5 @@ class TestExperimentService(TestCase):
         self.assertIn('view_type', call_args.kwargs)
         self.assertEqual(call_args.kwargs['view_type'], ViewType.ACTIVE_ONLY)
 
-    @patch('server.services.experiment_service.mlflow')
-    def test_get_experiment_traces_parameter_construction(self, mock_mlflow):
-        """Test that get_experiment_traces constructs parameters correctly."""
-        mock_mlflow.search_traces.return_value = {'trace': []}
-
-        # Test without run_id
-        self.service.get_experiment_traces('exp123')
-
-        call_args = mock_mlflow.search_traces.call_args
-        expected_params = {'experiment_ids': ['exp123']}
-        self.assertEqual(call_args.kwargs, expected_params)
-
-        # Reset mock
-        mock_mlflow.search_traces.reset_mock()
-
-        # Test with run_id
-        self.service.get_experiment_traces('exp123', run_id='run456')
-
-        call_args = mock_mlflow.search_traces.call_args
-        expected_params = {'experiment_ids': ['exp123'], 'run_id': 'run456'}
-        self.assertEqual(call_args.kwargs, expected_params)
-
-
 if __name__ == '__main__':
     unittest.main()
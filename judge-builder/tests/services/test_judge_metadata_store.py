@@ -0,0 +1,138 @@
+"""Unit tests for the coalescing judge metadata store."""
+
+import json
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from server.services.judge_metadata_store import JudgeMetadataStore
+
+
+class FakeExperimentTags:
+    """In-memory stand-in for experiment tag reads and writes."""
+
+    def __init__(self, judges=None):
+        self.tags = {'judges': json.dumps(judges or {}), 'judge_builder': 'true'}
+        self.writes = 0
+        self.on_write = None
+
+    def get_experiment(self, experiment_id):
+        """Return an experiment with a copy of the tags."""
+        return Mock(experiment_id=experiment_id, tags=dict(self.tags))
+
+    def set_experiment_tag(self, experiment_id, key, value):
+        """Set a tag, counting the write."""
+        self.tags[key] = value
+        self.writes += 1
+        if self.on_write:
+            self.on_write()
+
+    def delete_experiment_tag(self, experiment_id, key):
+        """Delete a tag if present."""
+        self.tags.pop(key, None)
+
+    @property
+    def judges(self):
+        """Decoded judges tag."""
+        return json.loads(self.tags['judges'])
+
+
+@pytest.fixture
+def backend():
+    """Create an in-memory experiment tag backend holding two judges."""
+    return FakeExperimentTags(
+        {'judge-1': {'name': 'One', 'version': 1}, 'judge-2': {'name': 'Two'}}
+    )
+
+
+@pytest.fixture
+def store(backend):
+    """Create a store on the fake backend that only flushes when asked."""
+    store = JudgeMetadataStore(flush_delay_seconds=60)
+    store.client = backend
+    return store
+
+
+class TestJudgeMetadataStore:
+    """Test cases for JudgeMetadataStore."""
+
+    def test_updates_are_coalesced_into_one_write(self, store, backend):
+        """Test that queued updates for several judges share a single tag write."""
+        store.update('exp-1', 'judge-1', {'version': 2})
+        store.update('exp-1', 'judge-1', {'labeling_run_id': 'run-1'})
+        store.update('exp-1', 'judge-2', {'version': 5})
+
+        assert backend.writes == 0
+        assert store.pending_count() == 3
+        assert store.flush('exp-1')
+
+        assert backend.writes == 1
+        assert backend.judges['judge-1'] == {
+            'name': 'One',
+            'version': 2,
+            'labeling_run_id': 'run-1',
+        }
+        assert backend.judges['judge-2']['version'] == 5
+        assert store.pending_count() == 0
+
+    def test_write_behind_flushes_after_delay(self, backend):
+        """Test that queued updates are written without an explicit flush."""
+        store = JudgeMetadataStore(flush_delay_seconds=0.01)
+        store.client = backend
+        written = threading.Event()
+        backend.on_write = written.set
+
+        store.update('exp-1', 'judge-1', {'version': 3})
+
+        assert written.wait(timeout=5)
+        assert backend.judges['judge-1']['version'] == 3
+
+    def test_concurrent_overwrite_is_merged(self, store, backend):
+        """Test that a writer replacing the tag without our change triggers a re-merge."""
+        original_set = backend.set_experiment_tag
+
+        def racing_set(experiment_id, key, value):
+            original_set(experiment_id, key, value)
+            if backend.writes == 1:
+                # Another process writes its own update from a stale read
+                stale = {
+                    'judge-1': {'name': 'One', 'version': 1},
+                    'judge-2': {'name': 'Two', 'version': 9},
+                }
+                backend.tags['judges'] = json.dumps(stale)
+
+        backend.set_experiment_tag = racing_set
+
+        assert store.update('exp-1', 'judge-1', {'version': 2}, flush=True)
+
+        assert store.stats['conflicts'] == 1
+        assert backend.judges['judge-1']['version'] == 2
+        assert backend.judges['judge-2']['version'] == 9
+
+    def test_failed_flush_keeps_updates(self, store, backend):
+        """Test that updates are retained for a later flush when the write fails."""
+        backend.set_experiment_tag = Mock(side_effect=Exception('unavailable'))
+
+        assert not store.update('exp-1', 'judge-1', {'version': 2}, flush=True)
+        assert store.pending_count() == 1
+
+        del backend.set_experiment_tag
+        assert store.flush()
+        assert backend.judges['judge-1']['version'] == 2
+
+    def test_put_and_remove(self, store, backend):
+        """Test adding judges and removing the last one clears the tags."""
+        store.put('exp-1', 'judge-3', {'name': 'Three'})
+        assert backend.judges['judge-3'] == {'name': 'Three'}
+
+        for judge_id in ('judge-1', 'judge-2', 'judge-3'):
+            store.remove('exp-1', judge_id)
+
+        assert 'judges' not in backend.tags
+        assert 'judge_builder' not in backend.tags
+
+    def test_update_for_unknown_judge_is_skipped(self, store, backend):
+        """Test that updating a judge missing from the tag doesn't write."""
+        assert store.update('exp-1', 'missing', {'version': 2}, flush=True)
+        assert backend.writes == 0
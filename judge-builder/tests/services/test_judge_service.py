@@ -1,11 +1,16 @@
 """Unit tests for JudgeService."""
 
+import asyncio
+import json
 import unittest
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import Mock, patch
+
+from mlflow.store.entities.paged_list import PagedList
 
 from server.models import JudgeCreateRequest, JudgeResponse
 from server.services.judge_service import JudgeService
+from server.utils.metrics import STARTUP_EXPERIMENTS, STARTUP_JUDGES
 
 
 class TestJudgeService(TestCase):
@@ -339,6 +344,167 @@ class TestJudgeService(TestCase):
         self.service.delete_judge('nonexistent')
         mock_logger.warning.assert_called_with('Cannot delete judge nonexistent: not found')
 
+    @patch('server.services.judge_service.extract_categorical_options_from_instruction')
+    def test_schema_analyzed_once_per_judge(self, mock_extract):
+        """Test that listing judges reuses the schema instead of re-running analysis."""
+        mock_extract.return_value = ['Good', 'Bad']
+        request = JudgeCreateRequest(
+            name='Schema Judge', instruction='Is {{ outputs }} good or bad?', experiment_id='exp123'
+        )
+        response = self.service.create_judge(request)
+
+        for _ in range(3):
+            judges = self.service.list_judges()
+        self.service.get_judge(response.id)
+
+        mock_extract.assert_called_once()
+        self.assertEqual(judges[0].schema_info.options, ['Good', 'Bad'])
+
+    @patch('server.services.judge_service.extract_categorical_options_from_instruction')
+    def test_cached_response_refreshed_after_update(self, mock_extract):
+        """Test that cached responses are dropped when judge fields change."""
+        mock_extract.return_value = ['Pass', 'Fail']
+        request = JudgeCreateRequest(
+            name='Update Judge', instruction='Check {{ outputs }}', experiment_id='exp123'
+        )
+        response = self.service.create_judge(request)
+        self.service.get_judge(response.id)
+
+        with patch.object(self.service, '_update_judge_metadata'):
+            self.service.update_judge_labeling_run_id(response.id, 'run-456')
+
+        self.assertEqual(self.service.get_judge(response.id).labeling_run_id, 'run-456')
+
+    @patch('server.services.judge_service.extract_categorical_options_from_instruction')
+    def test_recreate_restores_persisted_schema(self, mock_extract):
+        """Test that a judge recreated from metadata uses its stored schema."""
+        experiment = Mock()
+        experiment.experiment_id = 'exp123'
+        experiment.tags = {
+            'judges': json.dumps({
+                'judge-1': {
+                    'name': 'Stored Judge',
+                    'instruction': 'Rate {{ outputs }}',
+                    'version': 2,
+                    'schema_info': {'is_binary': False, 'options': ['1', '2', '3']},
+                }
+            })
+        }
+
+        with patch.object(self.service, '_get_judge_experiments', return_value=[experiment]):
+            response = self.service.get_judge('judge-1')
+
+        mock_extract.assert_not_called()
+        self.assertEqual(response.version, 2)
+        self.assertEqual(response.schema_info.options, ['1', '2', '3'])
+        self.assertFalse(response.schema_info.is_binary)
+
+    @patch('server.services.judge_service.extract_categorical_options_from_instruction')
+    def test_failed_schema_analysis_retried_on_next_read(self, mock_extract):
+        """Test that a failed analysis leaves the schema unset and is not cached."""
+        mock_extract.side_effect = [Exception('LLM unavailable'), ['Good', 'Bad']]
+        request = JudgeCreateRequest(
+            name='Retry Judge', instruction='Is {{ outputs }} good or bad?', experiment_id='exp123'
+        )
+        response = self.service.create_judge(request)
+
+        self.assertIsNone(response.schema_info)
+        self.assertIsNone(self.service._judges[response.id].schema_info)
+
+        retried = self.service.get_judge(response.id)
+
+        self.assertEqual(mock_extract.call_count, 2)
+        self.assertEqual(retried.schema_info.options, ['Good', 'Bad'])
+
+    @patch('server.services.judge_service.extract_categorical_options_from_instruction')
+    def test_failed_schema_analysis_not_persisted(self, mock_extract):
+        """Test that a judge recreated without a schema doesn't store a fallback."""
+        mock_extract.side_effect = Exception('LLM unavailable')
+        experiment = self._judge_experiment('exp123', ['judge-1'])
+        metadata = json.loads(experiment.tags['judges'])
+        del metadata['judge-1']['schema_info']
+        experiment.tags = {'judges': json.dumps(metadata)}
+
+        with patch.object(self.service, '_get_judge_experiments', return_value=[experiment]), \
+             patch.object(self.service, '_update_judge_metadata') as mock_update:
+            response = self.service.get_judge('judge-1')
+
+        self.assertIsNone(response.schema_info)
+        mock_update.assert_not_called()
+
+
+    def _judge_experiment(self, experiment_id, judges):
+        experiment = Mock()
+        experiment.experiment_id = experiment_id
+        experiment.tags = {
+            'judges': json.dumps({
+                judge_id: {
+                    'name': f'Judge {judge_id}',
+                    'instruction': 'Rate {{ outputs }}',
+                    'schema_info': {'is_binary': True, 'options': ['Pass', 'Fail']},
+                }
+                for judge_id in judges
+            })
+        }
+        return experiment
+
+    def test_judge_experiments_paginated(self):
+        """Test that experiments past the first page are discovered."""
+        first_page = PagedList([self._judge_experiment('exp-1', ['judge-1'])], 'next-token')
+        second_page = PagedList([self._judge_experiment('exp-2', ['judge-2'])], None)
+        self.service.client = Mock()
+        self.service.client.search_experiments.side_effect = [first_page, second_page]
+
+        index = self.service._get_judge_index()
+
+        self.assertEqual(self.service.client.search_experiments.call_count, 2)
+        self.assertEqual(
+            self.service.client.search_experiments.call_args.kwargs['page_token'], 'next-token'
+        )
+        self.assertEqual(index['judge-2'][0], 'exp-2')
+
+    def test_load_all_judges_on_startup(self):
+        """Test that startup loads every judge from one experiment search."""
+        experiments = [
+            self._judge_experiment('exp-1', ['judge-1', 'judge-2']),
+            self._judge_experiment('exp-2', ['judge-3']),
+            Mock(experiment_id='exp-3', tags={'judges': 'not json'}),
+        ]
+
+        with patch.object(
+            self.service, '_get_judge_experiments', return_value=experiments
+        ) as mock_experiments:
+            asyncio.run(self.service.load_all_judges_on_startup())
+            self.assertEqual(self.service.get_judge('judge-3').name, 'Judge judge-3')
+
+        self.assertEqual(set(self.service._judges), {'judge-1', 'judge-2', 'judge-3'})
+        self.assertEqual(self.service.startup_stats['judges_loaded'], 3)
+        self.assertEqual(self.service.startup_stats['experiments'], 3)
+        self.assertIn('duration_seconds', self.service.startup_stats)
+        self.assertEqual(STARTUP_JUDGES.value(result='loaded'), 3)
+        self.assertEqual(STARTUP_EXPERIMENTS.value(), 3)
+        # The index is built once and reused for lookups
+        self.assertLessEqual(mock_experiments.call_count, 3)
+
+    @patch('server.services.judge_service.extract_categorical_options_from_instruction')
+    def test_startup_backfills_schema_once_per_experiment(self, mock_extract):
+        """Test that schemas missing from metadata are written back in one update per experiment."""
+        mock_extract.return_value = ['Pass', 'Fail']
+        experiment = self._judge_experiment('exp-1', ['judge-1', 'judge-2'])
+        metadata = json.loads(experiment.tags['judges'])
+        for judge_metadata in metadata.values():
+            del judge_metadata['schema_info']
+        experiment.tags = {'judges': json.dumps(metadata)}
+
+        with patch.object(self.service, '_get_judge_experiments', return_value=[experiment]), \
+             patch.object(self.service, '_update_judges_metadata') as mock_update:
+            self.assertEqual(self.service.load_all_judges(), 2)
+
+        mock_update.assert_called_once()
+        experiment_id, updates = mock_update.call_args.args
+        self.assertEqual(experiment_id, 'exp-1')
+        self.assertEqual(set(updates), {'judge-1', 'judge-2'})
+
 
 if __name__ == '__main__':
     unittest.main()
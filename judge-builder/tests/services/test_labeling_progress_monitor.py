@@ -0,0 +1,151 @@
+"""Unit tests for the labeling progress monitor."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from server.models import LabelingProgress
+from server.services.labeling_progress_monitor import LabelingProgressMonitor
+
+
+class FakeClock:
+    """Clock the tests advance by hand."""
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        """Current fake time."""
+        return self.now
+
+
+def _progress(labeled, total=10):
+    return LabelingProgress(
+        total_examples=total,
+        labeled_examples=labeled,
+        used_for_alignment=0,
+        labeling_session_url='https://databricks.com/labeling/123',
+        assigned_smes=[],
+    )
+
+
+@pytest.fixture
+def labeling_service():
+    """Patch labeling_service with a fixed progress result."""
+    with patch('server.services.labeling_service.labeling_service') as labeling_service:
+        labeling_service.load_labeling_progress.return_value = _progress(3)
+        labeling_service._empty_progress.return_value = _progress(0, total=0)
+        yield labeling_service
+
+
+@pytest.fixture
+def clock():
+    """Create a fake clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def monitor(clock):
+    """Create a monitor driven by the fake clock."""
+    return LabelingProgressMonitor(interval_seconds=10, idle_seconds=60, clock=clock)
+
+
+class TestLabelingProgressMonitor:
+    """Test cases for LabelingProgressMonitor."""
+
+    def test_reads_within_interval_share_one_load(self, monitor, labeling_service, clock):
+        """Test that repeated reads reuse the aggregate until the interval passes."""
+        first = monitor.get('judge-1')
+        for _ in range(5):
+            assert monitor.get('judge-1') == first
+        assert labeling_service.load_labeling_progress.call_count == 1
+
+        clock.now = 10.0
+        monitor.get('judge-1')
+        assert labeling_service.load_labeling_progress.call_count == 2
+
+    def test_version_changes_only_with_progress(self, monitor, labeling_service, clock):
+        """Test that the version stays the same until the counts change."""
+        version = monitor.get('judge-1').version
+        assert version > 0
+
+        clock.now = 10.0
+        assert monitor.get('judge-1').version == version
+
+        labeling_service.load_labeling_progress.return_value = _progress(4)
+        clock.now = 20.0
+        progress = monitor.get('judge-1')
+        assert progress.labeled_examples == 4
+        assert progress.version > version
+
+    def test_failed_refresh_keeps_last_progress(self, monitor, labeling_service, clock):
+        """Test that a failed read serves the last known progress instead of zeros."""
+        progress = monitor.get('judge-1')
+
+        labeling_service.load_labeling_progress.side_effect = Exception('MLflow error')
+        clock.now = 10.0
+
+        assert monitor.get('judge-1') == progress
+
+    def test_failed_first_read_is_empty(self, monitor, labeling_service):
+        """Test that a judge whose progress can't be read starts out empty."""
+        labeling_service.load_labeling_progress.side_effect = Exception('MLflow error')
+
+        assert monitor.get('judge-1').total_examples == 0
+
+    def test_invalidate_forces_refresh(self, monitor, labeling_service):
+        """Test that invalidating a judge makes the next read go to MLflow."""
+        monitor.get('judge-1')
+        monitor.invalidate('judge-1')
+        monitor.get('judge-1')
+
+        assert labeling_service.load_labeling_progress.call_count == 2
+
+    def test_subscribers_are_notified_only_on_change(self, monitor, labeling_service, clock):
+        """Test that a poll pushes to subscribers only when the progress changed."""
+
+        async def scenario():
+            subscription = monitor.subscribe('judge-1')
+            initial = monitor.get('judge-1')
+            assert (await subscription.next(timeout=1)) == initial
+
+            clock.now = 10.0
+            assert monitor.poll_once() == 0
+            assert await subscription.next(timeout=0.05) is None
+
+            labeling_service.load_labeling_progress.return_value = _progress(5)
+            clock.now = 20.0
+            assert monitor.poll_once() == 1
+            update = await subscription.next(timeout=1)
+            assert update.labeled_examples == 5
+            assert update.version > initial.version
+
+            monitor.unsubscribe(subscription)
+            assert monitor.subscriber_count('judge-1') == 0
+
+        asyncio.run(scenario())
+
+    def test_one_poll_serves_all_subscribers(self, monitor, labeling_service, clock):
+        """Test that many subscribers to a judge cost one read per poll."""
+
+        async def scenario():
+            subscriptions = [monitor.subscribe('judge-1') for _ in range(10)]
+            clock.now = 10.0
+            monitor.poll_once()
+            updates = await asyncio.gather(*(s.next(timeout=1) for s in subscriptions))
+            assert all(update.labeled_examples == 3 for update in updates)
+
+        asyncio.run(scenario())
+        assert labeling_service.load_labeling_progress.call_count == 1
+
+    def test_poll_skips_judges_without_subscribers(self, monitor, labeling_service, clock):
+        """Test that judges only read through GET are refreshed lazily and dropped when idle."""
+        monitor.get('judge-1')
+
+        clock.now = 30.0
+        monitor.poll_once()
+        assert labeling_service.load_labeling_progress.call_count == 1
+
+        clock.now = 100.0
+        monitor.poll_once()
+        assert monitor._judges == {}
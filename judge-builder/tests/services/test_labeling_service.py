@@ -123,9 +123,9 @@ class TestLabelingService(TestCase):
 
         result = self.service.get_labeling_session('judge123')
 
-        # Verify calls
-        mock_mlflow.set_experiment.assert_called_once_with(experiment_id='exp456')
-        mock_get_session.assert_called_once_with('judge123')
+        # Verify calls; the lookup names the experiment instead of setting it
+        mock_mlflow.set_experiment.assert_not_called()
+        mock_get_session.assert_called_once_with('judge123', 'exp456', None)
 
         self.assertEqual(result, mock_session)
 
@@ -154,8 +154,8 @@ class TestLabelingService(TestCase):
 
         self.assertIn('No labeling session found for this judge', str(context.exception))
 
-    @patch('server.services.labeling_service.labeling')
-    def test_get_labeling_session_helper_method(self, mock_labeling):
+    @patch.object(LabelingService, '_list_labeling_sessions')
+    def test_get_labeling_session_helper_method(self, mock_list_sessions):
         """Test the _get_labeling_session helper method."""
         # Mock labeling sessions
         mock_session1 = Mock()
@@ -164,30 +164,91 @@ class TestLabelingService(TestCase):
         mock_session2 = Mock()
         mock_session2.name = 'quality_judge_def45678_labeling'  # Match first 8 chars of judge ID
 
-        mock_labeling.get_labeling_sessions.return_value = [mock_session1, mock_session2]
+        mock_list_sessions.return_value = [mock_session1, mock_session2]
 
         # Test with judge ID that matches session2 (first 8 chars: "def45678")
-        result = self.service._get_labeling_session('def45678-1234-5678-abcd-123456789012')
+        result = self.service._get_labeling_session(
+            'def45678-1234-5678-abcd-123456789012', 'exp456'
+        )
 
         self.assertEqual(result, mock_session2)
+        mock_list_sessions.assert_called_once_with('exp456')
 
-    @patch('server.services.labeling_service.labeling')
-    def test_get_labeling_session_helper_no_match(self, mock_labeling):
+    @patch.object(LabelingService, '_list_labeling_sessions')
+    def test_get_labeling_session_helper_no_match(self, mock_list_sessions):
         """Test _get_labeling_session when no matching session is found."""
         mock_session = Mock()
         mock_session.name = 'unrelated_session_xyz789'
 
-        mock_labeling.get_labeling_sessions.return_value = [mock_session]
+        mock_list_sessions.return_value = [mock_session]
 
-        result = self.service._get_labeling_session('judge123')
+        result = self.service._get_labeling_session('judge123', 'exp456')
 
         self.assertIsNone(result)
 
+    @patch.object(LabelingService, '_list_labeling_sessions')
+    def test_get_labeling_session_helper_cached(self, mock_list_sessions):
+        """Test that repeated lookups reuse the cached session."""
+        mock_session = Mock()
+        mock_session.name = 'quality_judge_def45678_labeling'
+        mock_list_sessions.return_value = [mock_session]
+
+        for _ in range(3):
+            result = self.service._get_labeling_session(
+                'def45678-1234-5678-abcd-123456789012', 'exp456'
+            )
+
+        self.assertEqual(result, mock_session)
+        mock_list_sessions.assert_called_once()
+
+    @patch.object(LabelingService, '_list_labeling_sessions')
+    def test_get_labeling_session_helper_by_run_id(self, mock_list_sessions):
+        """Test that the session with the judge's labeling run ID is preferred."""
+        stale_session = Mock(mlflow_run_id='run-0')
+        stale_session.name = 'quality_judge_def45678_labeling'
+        mock_session = Mock(mlflow_run_id='run-1')
+        mock_session.name = 'quality_judge_def45678_labeling'
+        mock_list_sessions.return_value = [stale_session, mock_session]
+
+        result = self.service._get_labeling_session(
+            'def45678-1234-5678-abcd-123456789012', 'exp456', 'run-1'
+        )
+
+        self.assertEqual(result, mock_session)
+
+    @patch.object(LabelingService, '_list_labeling_sessions')
+    def test_get_labeling_session_helper_invalidated(self, mock_list_sessions):
+        """Test that a cached miss is dropped once the cache is invalidated."""
+        mock_session = Mock()
+        mock_session.name = 'quality_judge_def45678_labeling'
+        mock_list_sessions.side_effect = [[], [mock_session]]
+        judge_id = 'def45678-1234-5678-abcd-123456789012'
+
+        self.assertIsNone(self.service._get_labeling_session(judge_id, 'exp456'))
+        self.assertIsNone(self.service._get_labeling_session(judge_id, 'exp456'))
+        self.service.invalidate_labeling_session(judge_id)
+
+        self.assertEqual(self.service._get_labeling_session(judge_id, 'exp456'), mock_session)
+        self.assertEqual(mock_list_sessions.call_count, 2)
+
+    @patch('server.services.labeling_service.labeling_stores')
+    def test_list_labeling_sessions_uses_explicit_experiment(self, mock_stores):
+        """Test that sessions are listed for the given experiment, not the active one."""
+        mock_store = mock_stores._get_labeling_store.return_value
+        mock_store.get_labeling_sessions.return_value = []
+
+        self.assertEqual(self.service._list_labeling_sessions('exp456'), [])
+        mock_store.get_labeling_sessions.assert_called_once_with(experiment_id='exp456')
+
     @patch('server.services.labeling_service.logger')
+    @patch('server.services.judge_service.judge_service')
     @patch.object(LabelingService, '_get_labeling_session')
     @patch('server.services.labeling_service.labeling')
-    def test_delete_labeling_session_success(self, mock_labeling, mock_get_session, mock_logger):
+    def test_delete_labeling_session_success(
+        self, mock_labeling, mock_get_session, mock_judge_service, mock_logger
+    ):
         """Test successful labeling session deletion."""
+        mock_judge_service.get_judge.return_value = self.mock_judge_response
         mock_session = Mock()
         mock_session.mlflow_run_id = 'run123'
         mock_session.url = 'https://test.com/session'
@@ -197,12 +258,17 @@ class TestLabelingService(TestCase):
 
         self.assertTrue(result)
         mock_labeling.delete_labeling_session.assert_called_once_with(mock_session)
+        mock_get_session.assert_called_once_with('judge123', 'exp456', None)
         mock_logger.info.assert_called_once()
 
     @patch('server.services.labeling_service.logger')
+    @patch('server.services.judge_service.judge_service')
     @patch.object(LabelingService, '_get_labeling_session')
-    def test_delete_labeling_session_not_found(self, mock_get_session, mock_logger):
+    def test_delete_labeling_session_not_found(
+        self, mock_get_session, mock_judge_service, mock_logger
+    ):
         """Test deletion when no labeling session exists."""
+        mock_judge_service.get_judge.return_value = self.mock_judge_response
         mock_get_session.return_value = None
 
         result = self.service.delete_labeling_session('judge123')
@@ -234,19 +300,20 @@ class TestLabelingService(TestCase):
         mock_trace2.data.request = 'Explain ML'
         mock_trace2.data.response = 'ML is machine learning'
 
-        mock_mlflow.get_trace.side_effect = [mock_trace1, mock_trace2]
-
         request = TraceRequest(trace_ids=['trace1', 'trace2'])
 
         # Mock the environment variable setting
-        with patch('mlflow.environment_variables') as mock_env_vars:
+        with patch('mlflow.environment_variables') as mock_env_vars, \
+             patch('server.services.cache_service.cache_service.get_traces') as mock_get_traces:
             mock_env_vars.MLFLOW_ENABLE_ASYNC_TRACE_LOGGING.set = Mock()
+            mock_get_traces.return_value = [mock_trace1, mock_trace2]
 
             result = self.service.add_examples('judge123', request)
 
         # Verify MLflow calls
-        mock_mlflow.set_experiment.assert_called_once_with(experiment_id='exp456')
-        self.assertEqual(mock_mlflow.get_trace.call_count, 2)
+        mock_mlflow.set_experiment.assert_not_called()
+        mock_get_session.assert_called_once_with('judge123', 'exp456', None)
+        mock_get_traces.assert_called_once_with(['trace1', 'trace2'])
         mock_session.add_traces.assert_called_once()
 
         # Verify result
@@ -314,21 +381,19 @@ class TestLabelingService(TestCase):
         mock_get_session.return_value = mock_session
 
         # Mock trace fetching with one success and one failure
-        def mock_get_trace_side_effect(trace_id):
-            if trace_id == 'trace1':
-                mock_trace = Mock()
-                mock_trace.info.trace_id = 'trace1'
-                mock_trace.data.request = 'Test request'
-                mock_trace.data.response = 'Test response'
-                return mock_trace
-            else:
-                raise Exception('Trace not found')
-
-        mock_mlflow.get_trace.side_effect = mock_get_trace_side_effect
+        mock_trace = Mock()
+        mock_trace.info.trace_id = 'trace1'
+        mock_trace.data.request = 'Test request'
+        mock_trace.data.response = 'Test response'
 
         request = TraceRequest(trace_ids=['trace1', 'trace2'])
 
-        with patch('mlflow.environment_variables') as mock_env_vars:
+        with (
+            patch('mlflow.environment_variables') as mock_env_vars,
+            patch(
+                'server.services.cache_service.cache_service.get_traces', return_value=[mock_trace]
+            ),
+        ):
             mock_env_vars.MLFLOW_ENABLE_ASYNC_TRACE_LOGGING.set = Mock()
             result = self.service.add_examples('judge123', request)
 
@@ -344,16 +409,67 @@ class TestLabelingService(TestCase):
         mock_judge_service.get_judge.return_value = self.mock_judge_response
         mock_get_session.return_value = Mock()
 
-        # Mock all trace fetches to fail
-        mock_mlflow.get_trace.side_effect = Exception('All traces failed')
-
         request = TraceRequest(trace_ids=['trace1', 'trace2'])
 
-        with self.assertRaises(ValueError) as context:
+        # Mock all trace fetches to fail
+        with patch('server.services.cache_service.cache_service.get_traces', return_value=[]), \
+             self.assertRaises(ValueError) as context:
             self.service.add_examples('judge123', request)
 
         self.assertIn('No valid traces found', str(context.exception))
 
+    @patch('server.services.labeling_service.EXAMPLES_INSERT_BACKOFF_SECONDS', 0)
+    @patch('server.services.labeling_service.EXAMPLES_INSERT_CHUNK_SIZE', 2)
+    @patch.object(LabelingService, '_get_session_trace_ids')
+    @patch('server.services.labeling_service.mlflow')
+    @patch('server.services.judge_service.judge_service')
+    @patch.object(LabelingService, '_get_labeling_session')
+    def test_add_examples_in_chunks_with_retry(
+        self, mock_get_session, mock_judge_service, mock_mlflow, mock_existing
+    ):
+        """Test that examples are deduped, added in chunks, retried and reported."""
+        mock_judge_service.get_judge.return_value = self.mock_judge_response
+        mock_session = Mock()
+        mock_session.add_traces.side_effect = [
+            None,
+            Exception('503 Service Unavailable'),
+            None,
+            None,
+        ]
+        mock_get_session.return_value = mock_session
+        mock_existing.side_effect = [{'trace0'}, set()]
+
+        traces = []
+        for i in range(1, 6):
+            trace = Mock()
+            trace.info.trace_id = f'trace{i}'
+            traces.append(trace)
+
+        request = TraceRequest(trace_ids=[f'trace{i}' for i in range(6)])
+        updates = []
+
+        with (
+            patch('mlflow.environment_variables'),
+            patch(
+                'server.services.cache_service.cache_service.get_traces', return_value=traces
+            ) as mock_get_traces,
+            patch('server.models.TraceExample.from_traces', side_effect=lambda added: list(added)),
+        ):
+            result = self.service.add_examples('judge123', request, on_progress=updates.append)
+
+        mock_get_traces.assert_called_once_with([f'trace{i}' for i in range(1, 6)])
+        chunks = [
+            [t.info.trace_id for t in c.args[0]] for c in mock_session.add_traces.call_args_list
+        ]
+        self.assertEqual(
+            chunks, [['trace1', 'trace2'], ['trace3', 'trace4'], ['trace3', 'trace4'], ['trace5']]
+        )
+        self.assertEqual(len(result), 5)
+        self.assertEqual([u.stage for u in updates][0], 'fetching')
+        self.assertEqual(updates[-1].stage, 'completed')
+        self.assertEqual(updates[-1].skipped, 1)
+        self.assertEqual(updates[-1].added, 5)
+
     @patch('server.services.labeling_service.mlflow')
     @patch('server.services.judge_service.judge_service')
     @patch.object(LabelingService, '_get_labeling_session')
@@ -366,26 +482,29 @@ class TestLabelingService(TestCase):
         mock_session.url = 'https://test.com/session'
         mock_get_session.return_value = mock_session
 
-        # Mock search results
-        mock_search_result = {'trace': ['{"trace_id": "trace1"}', '{"trace_id": "trace2"}']}
-        mock_mlflow.search_traces.return_value = mock_search_result
+        # Mock two pages of search results
+        traces = []
+        for i in range(1, 4):
+            trace = Mock()
+            trace.info.trace_id = f'trace{i}'
+            trace.info.assessments = []
+            trace.data.request = '{"request": "Question"}'
+            trace.data.response = '{"response": "Answer"}'
+            traces.append(trace)
 
-        # Mock Trace.from_json
-        mock_trace1 = Mock()
-        mock_trace2 = Mock()
         with patch(
-            'server.services.labeling_service.mlflow.entities.Trace.from_json',
-            side_effect=[mock_trace1, mock_trace2],
-        ):
+            'server.services.experiment_service.experiment_service.search_traces_page'
+        ) as mock_search:
+            mock_search.side_effect = [(traces[:2], 'page-2'), (traces[2:], None)]
             result = self.service.get_examples('judge123')
 
         # Verify calls
-        mock_mlflow.set_experiment.assert_called_once_with(experiment_id='exp456')
-        mock_mlflow.search_traces.assert_called_once_with(
-            experiment_ids=['exp456'], filter_string='run_id = "run123"', max_results=1000
-        )
+        mock_mlflow.set_experiment.assert_not_called()
+        self.assertEqual(mock_search.call_args_list[0].args, ('exp456', 'run123'))
+        self.assertEqual(mock_search.call_args_list[1].kwargs['page_token'], 'page-2')
 
-        self.assertEqual(len(result), 2)
+        self.assertEqual([example.trace_id for example in result], ['trace1', 'trace2', 'trace3'])
+        self.assertEqual(result[0].request, 'Question')
 
     @patch('server.services.judge_service.judge_service')
     def test_get_examples_judge_not_found(self, mock_judge_service):
@@ -408,14 +527,14 @@ class TestLabelingService(TestCase):
         result = self.service.get_examples('judge123')
 
         self.assertEqual(result, [])
-        mock_mlflow.set_experiment.assert_called_once_with(experiment_id='exp456')
+        mock_get_session.assert_called_once_with('judge123', 'exp456', None)
 
     @patch('server.services.labeling_service.mlflow')
     @patch('server.services.judge_service.judge_service')
     @patch.object(LabelingService, '_get_labeling_session')
-    @patch.object(LabelingService, '_get_session_counts')
+    @patch.object(LabelingService, '_list_session_items')
     def test_get_labeling_progress_success(
-        self, mock_get_counts, mock_get_session, mock_judge_service, mock_mlflow
+        self, mock_list_items, mock_get_session, mock_judge_service, mock_mlflow
     ):
         """Test successful labeling progress retrieval."""
         mock_judge_service.get_judge.return_value = self.mock_judge_response
@@ -423,17 +542,20 @@ class TestLabelingService(TestCase):
         mock_session = Mock()
         mock_session.mlflow_run_id = 'run123'
         mock_session.url = 'https://databricks.com/labeling/123'
+        mock_session.assigned_users = []
         mock_get_session.return_value = mock_session
 
-        mock_get_counts.return_value = (10, 6)  # total_examples, labeled_examples
+        mock_list_items.return_value = [
+            Mock(state=state) for state in ['COMPLETED'] * 6 + ['IN_PROGRESS'] * 4
+        ]
 
         result = self.service.get_labeling_progress('judge123')
 
         # Verify calls
         mock_judge_service.get_judge.assert_called_once_with('judge123')
-        mock_mlflow.set_experiment.assert_called_once_with(experiment_id='exp456')
-        mock_get_session.assert_called_once_with('judge123')
-        mock_get_counts.assert_called_once_with(mock_session, 'exp456')
+        mock_mlflow.set_experiment.assert_not_called()
+        mock_get_session.assert_called_once_with('judge123', 'exp456', None)
+        mock_list_items.assert_called_once_with(mock_session)
 
         # Verify result
         self.assertIsInstance(result, LabelingProgress)
@@ -473,11 +595,16 @@ class TestLabelingService(TestCase):
         self.assertEqual(result.used_for_alignment, 0)
         self.assertIsNone(result.labeling_session_url)
 
-    def test_get_session_counts_success(self):
-        """Test _get_session_counts method."""
+    @patch('server.services.labeling_service.mlflow')
+    @patch('server.services.judge_service.judge_service')
+    def test_load_labeling_progress_counts_items(self, mock_judge_service, mock_mlflow):
+        """Test that progress counts all session items and the completed ones."""
+        mock_judge_service.get_judge.return_value = self.mock_judge_response
         with patch(
             'databricks.rag_eval.clients.managedevals.managed_evals_client.ManagedEvalsClient'
-        ) as mock_client_class:
+        ) as mock_client_class, patch.object(
+            self.service, '_get_labeling_session', return_value=Mock(url=None, assigned_users=[])
+        ) as mock_get_session:
             # Mock the client and items
             mock_client = Mock()
             mock_client_class.return_value = mock_client
@@ -499,27 +626,67 @@ class TestLabelingService(TestCase):
                 mock_item4,
             ]
 
-            mock_session = Mock()
-            total_examples, labeled_examples = self.service._get_session_counts(
-                mock_session, 'exp123'
-            )
+            result = self.service.load_labeling_progress('judge123')
 
             # Verify managed evals client call
-            mock_client.list_items_in_labeling_session.assert_called_once_with(mock_session)
+            mock_client.list_items_in_labeling_session.assert_called_once_with(mock_get_session.return_value)
 
             # Verify results: 4 total items, 2 completed items
-            self.assertEqual(total_examples, 4)
-            self.assertEqual(labeled_examples, 2)
+            self.assertEqual(result.total_examples, 4)
+            self.assertEqual(result.labeled_examples, 2)
 
-    def test_get_session_counts_error(self):
-        """Test _get_session_counts with managed evals client error."""
-        # This will fail to import databricks.rag_eval.clients.managedevals in test environment
-        mock_session = Mock()
-        total_examples, labeled_examples = self.service._get_session_counts(mock_session, 'exp123')
+    @patch('server.services.labeling_service.mlflow')
+    @patch('server.services.judge_service.judge_service')
+    def test_get_completed_trace_ids(self, mock_judge_service, mock_mlflow):
+        """Test that only completed items' trace IDs are returned."""
+        mock_judge_service.get_judge.return_value = self.mock_judge_response
+        items = []
+        for trace_id, state in (
+            ('trace-1', 'COMPLETED'),
+            ('trace-2', 'IN_PROGRESS'),
+            ('trace-3', 'COMPLETED'),
+        ):
+            item = Mock()
+            item.state = state
+            item.source.trace_id = trace_id
+            items.append(item)
+
+        with patch.object(self.service, '_get_labeling_session', return_value=Mock()), \
+             patch.object(self.service, '_list_session_items', return_value=items):
+            result = self.service.get_completed_trace_ids('judge123')
+
+        self.assertEqual(result, {'trace-1', 'trace-3'})
+        # Read from the warmer's thread without switching the active experiment
+        mock_mlflow.set_experiment.assert_not_called()
+
+    @patch('server.services.labeling_service.mlflow')
+    @patch('server.services.judge_service.judge_service')
+    def test_get_completed_trace_ids_no_session(self, mock_judge_service, mock_mlflow):
+        """Test that judges without a labeling session return None."""
+        mock_judge_service.get_judge.return_value = self.mock_judge_response
 
-        # Should return (0, 0) on error
-        self.assertEqual(total_examples, 0)
-        self.assertEqual(labeled_examples, 0)
+        with patch.object(self.service, '_get_labeling_session', return_value=None):
+            self.assertIsNone(self.service.get_completed_trace_ids('judge123'))
+
+    @patch('server.services.labeling_service.mlflow')
+    @patch('server.services.judge_service.judge_service')
+    def test_labeling_progress_item_listing_error(self, mock_judge_service, mock_mlflow):
+        """Test that a listing error raises from load but reads as empty progress from get."""
+        mock_judge_service.get_judge.return_value = self.mock_judge_response
+
+        with (
+            patch.object(self.service, '_get_labeling_session', return_value=Mock()),
+            patch.object(
+                self.service, '_list_session_items', side_effect=Exception('MLflow error')
+            ),
+        ):
+            with self.assertRaises(Exception):
+                self.service.load_labeling_progress('judge123')
+            result = self.service.get_labeling_progress('judge123')
+
+        # Should return empty progress on error
+        self.assertEqual(result.total_examples, 0)
+        self.assertEqual(result.labeled_examples, 0)
 
     @patch('server.services.labeling_service.extract_categorical_options_from_instruction')
     @patch('server.services.labeling_service.mlflow')
@@ -0,0 +1,131 @@
+"""Unit tests for the persistent cache tier."""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from server.services.cache_service import CacheService
+from server.services.persistent_cache import PersistentCache
+
+
+def make_trace(trace_id: str, body: str = 'payload'):
+    """Create a mock trace that serializes to JSON."""
+    trace = Mock()
+    trace.info.trace_id = trace_id
+    trace.to_json.return_value = json.dumps({'trace_id': trace_id, 'body': body})
+    return trace
+
+
+def fake_from_json(payload: str):
+    """Deserialize a mock trace payload back into a mock trace."""
+    data = json.loads(payload)
+    return make_trace(data['trace_id'], data['body'])
+
+
+@pytest.fixture
+def persistent_cache(tmp_path):
+    """Create a persistent cache backed by a temporary database."""
+    return PersistentCache(str(tmp_path / 'cache.db'))
+
+
+@pytest.fixture(autouse=True)
+def patch_trace_from_json():
+    """Patch Trace.from_json to decode the test traces."""
+    with patch('server.services.persistent_cache.Trace.from_json', side_effect=fake_from_json):
+        yield
+
+
+class TestPersistentCache:
+    """Test cases for PersistentCache."""
+
+    def test_trace_round_trip(self, persistent_cache):
+        """Test storing and loading traces."""
+        persistent_cache.put_traces([make_trace('trace-1'), make_trace('trace-2')])
+
+        result = persistent_cache.get_traces(['trace-1', 'trace-2', 'trace-3'])
+
+        assert set(result) == {'trace-1', 'trace-2'}
+        assert result['trace-1'].info.trace_id == 'trace-1'
+
+    def test_corrupt_trace_is_dropped(self, persistent_cache):
+        """Test that entries whose content hash doesn't match are discarded."""
+        persistent_cache.put_traces([make_trace('trace-1')])
+        persistent_cache._conn.execute(
+            "UPDATE traces SET payload = '{}' WHERE trace_id = 'trace-1'"
+        )
+
+        assert persistent_cache.get_traces(['trace-1']) == {}
+        assert persistent_cache.get_stats()['trace_count'] == 0
+
+    def test_expired_traces_are_misses(self, tmp_path):
+        """Test that traces older than the TTL are not returned."""
+        cache = PersistentCache(str(tmp_path / 'cache.db'), trace_ttl=60)
+        cache.put_traces([make_trace('trace-1')])
+        cache._conn.execute('UPDATE traces SET stored_at = stored_at - 120')
+
+        assert cache.get_traces(['trace-1']) == {}
+
+    def test_lru_eviction_by_size(self, tmp_path):
+        """Test that least recently used traces are evicted when over the byte budget."""
+        first = make_trace('trace-1')
+        entry_size = len(first.to_json())
+        cache = PersistentCache(str(tmp_path / 'cache.db'), max_trace_bytes=entry_size * 2)
+
+        cache.put_traces([first])
+        cache.put_traces([make_trace('trace-2')])
+        cache._conn.execute(
+            "UPDATE traces SET last_access = last_access - 10 WHERE trace_id = 'trace-2'"
+        )
+        cache.put_traces([make_trace('trace-3')])
+
+        assert set(cache.get_traces(['trace-1', 'trace-2', 'trace-3'])) == {'trace-1', 'trace-3'}
+
+    def test_evaluation_run_ids(self, persistent_cache):
+        """Test storing, bounding and invalidating evaluation run IDs."""
+        persistent_cache.put_evaluation_run_id('judge_1:1:abc', 'run-1')
+        persistent_cache.put_evaluation_run_id('judge_1:2:abc', 'run-2')
+        persistent_cache.put_evaluation_run_id('judge_10:1:abc', 'run-3')
+
+        assert persistent_cache.get_evaluation_run_id('judge_1:1:abc') == 'run-1'
+
+        persistent_cache.delete_evaluations_with_prefix('judge_1:')
+
+        assert persistent_cache.get_evaluation_run_id('judge_1:1:abc') is None
+        assert persistent_cache.get_evaluation_run_id('judge_1:2:abc') is None
+        assert persistent_cache.get_evaluation_run_id('judge_10:1:abc') == 'run-3'
+
+    def test_evaluation_entry_bound(self, tmp_path):
+        """Test that evaluation mappings are capped at max_evaluations."""
+        cache = PersistentCache(str(tmp_path / 'cache.db'), max_evaluations=2)
+        for i in range(3):
+            cache.put_evaluation_run_id(f'judge:{i}:abc', f'run-{i}')
+
+        assert cache.get_stats()['evaluation_count'] == 2
+
+    @patch('server.services.cache_service.mlflow.get_trace')
+    def test_cache_service_cold_start_uses_disk(self, mock_mlflow_get, tmp_path):
+        """Test that a fresh CacheService serves repeat traces without MLflow calls."""
+        path = str(tmp_path / 'cache.db')
+        mock_mlflow_get.side_effect = lambda trace_id: make_trace(trace_id)
+
+        warm = CacheService(persistent_cache=PersistentCache(path))
+        warm.get_traces(['trace-1', 'trace-2'])
+        warm.cache_evaluation_run_id('judge-1', 1, ['trace-1', 'trace-2'], 'run-1')
+        assert mock_mlflow_get.call_count == 2
+
+        cold = CacheService(persistent_cache=PersistentCache(path))
+        traces = cold.get_traces(['trace-1', 'trace-2'])
+
+        assert [trace.info.trace_id for trace in traces] == ['trace-1', 'trace-2']
+        assert mock_mlflow_get.call_count == 2
+        assert cold.get_evaluation_run_id('judge-1', 1, ['trace-1', 'trace-2']) == 'run-1'
+
+    def test_cache_service_invalidation_reaches_disk(self, persistent_cache):
+        """Test that invalidating traces also removes them from the persistent tier."""
+        service = CacheService(persistent_cache=persistent_cache)
+        persistent_cache.put_traces([make_trace('trace-1')])
+
+        service.invalidate_traces(['trace-1'])
+
+        assert persistent_cache.get_traces(['trace-1']) == {}
@@ -0,0 +1,180 @@
+"""Unit tests for the parallel scoring service."""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from mlflow.entities import AssessmentSource, Feedback
+
+from server.services.scoring_service import (
+    JUDGE_INPUT_TOKENS_KEY,
+    JUDGE_OUTPUT_TOKENS_KEY,
+    SOURCE_RUN_ID_KEY,
+    ScoringService,
+    is_rate_limit_error,
+)
+
+SCORER_NAME = 'v1_instruction_judge_test_judge'
+
+
+def make_trace(trace_id: str):
+    """Build a mock trace with no spans."""
+    trace = Mock()
+    trace.info.trace_id = trace_id
+    trace.data.spans = []
+    return trace
+
+
+def make_feedback(value: str = 'Pass', metadata=None) -> Feedback:
+    """Build judge feedback for the test scorer."""
+    return Feedback(
+        name=SCORER_NAME,
+        value=value,
+        source=AssessmentSource(source_type='LLM_JUDGE', source_id='judge'),
+        metadata=metadata,
+    )
+
+
+@pytest.fixture
+def scoring_service():
+    """Create a scoring service with a mock MLflow client."""
+    service = ScoringService()
+    service.client = Mock()
+    return service
+
+
+@pytest.fixture
+def mock_log_assessment():
+    """Patch mlflow.log_assessment."""
+    with patch('server.services.scoring_service.mlflow.log_assessment') as mock_log:
+        yield mock_log
+
+
+@pytest.fixture(autouse=True)
+def fast_backoff():
+    """Shorten the rate limit backoff."""
+    with patch('server.services.scoring_service.SCORING_BACKOFF_BASE_SECONDS', 0.01):
+        yield
+
+
+class TestScoringService:
+    """Test cases for ScoringService."""
+
+    def test_scores_traces_concurrently(self, scoring_service, mock_log_assessment):
+        """Test that judge calls overlap and every assessment is logged to the run."""
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def score(**kwargs):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return make_feedback()
+
+        scorer = Mock(side_effect=score)
+        scorer.name = SCORER_NAME
+        traces = [make_trace(f'trace-{i}') for i in range(6)]
+
+        results, stats = scoring_service.score_traces(scorer, traces, 'run-1')
+
+        assert peak > 1
+        assert set(results) == {f'trace-{i}' for i in range(6)}
+        assert stats.traces_scored == 6
+        assert stats.traces_per_second > 0
+        assert mock_log_assessment.call_count == 6
+        logged = mock_log_assessment.call_args.kwargs['assessment']
+        assert logged.metadata[SOURCE_RUN_ID_KEY] == 'run-1'
+        scoring_service.client.link_traces_to_run.assert_called_once_with(
+            [trace.info.trace_id for trace in traces], 'run-1'
+        )
+        scoring_service.client.log_batch.assert_called_once()
+
+    def test_retries_rate_limited_calls(self, scoring_service, mock_log_assessment):
+        """Test that 429 responses are retried after backing off."""
+        scorer = Mock(side_effect=[Exception('429 Too Many Requests'), make_feedback()])
+        scorer.name = SCORER_NAME
+
+        results, stats = scoring_service.score_traces(scorer, [make_trace('trace-1')])
+
+        assert scorer.call_count == 2
+        assert stats.rate_limit_retries == 1
+        assert stats.traces_failed == 0
+        assert results['trace-1'][0].value == 'Pass'
+
+    def test_other_errors_become_error_feedback(self, scoring_service, mock_log_assessment):
+        """Test that non-rate-limit failures aren't retried and are recorded as errors."""
+        scorer = Mock(side_effect=Exception('model unavailable'))
+        scorer.name = SCORER_NAME
+
+        results, stats = scoring_service.score_traces(scorer, [make_trace('trace-1')])
+
+        assert scorer.call_count == 1
+        assert stats.traces_failed == 1
+        feedback = results['trace-1'][0]
+        assert feedback.name == SCORER_NAME
+        assert feedback.error.error_message == 'model unavailable'
+
+    def test_reports_token_usage(self, scoring_service, mock_log_assessment):
+        """Test that token usage reported by the judge is summed per run."""
+        scorer = Mock(
+            return_value=make_feedback(
+                metadata={JUDGE_INPUT_TOKENS_KEY: '100', JUDGE_OUTPUT_TOKENS_KEY: '20'}
+            )
+        )
+        scorer.name = SCORER_NAME
+
+        _, stats = scoring_service.score_traces(
+            scorer, [make_trace('trace-1'), make_trace('trace-2')]
+        )
+
+        assert stats.input_tokens == 200
+        assert stats.output_tokens == 40
+
+    def test_reused_traces_are_linked_not_scored(self, scoring_service, mock_log_assessment):
+        """Test that traces with earlier results are linked to the run without judge calls."""
+        scorer = Mock(return_value=make_feedback())
+        scorer.name = SCORER_NAME
+
+        reused = {'trace-1': make_feedback(), 'trace-2': make_feedback()}
+        _, stats = scoring_service.score_traces(
+            scorer, [make_trace('trace-3')], 'run-1', reused_results=reused
+        )
+
+        assert scorer.call_count == 1
+        assert stats.traces_reused == 2
+        linked = [c.args[0] for c in scoring_service.client.link_traces_to_run.call_args_list]
+        assert linked == [['trace-3'], ['trace-1', 'trace-2']]
+
+    def test_logs_aggregate_metrics_like_evaluate(self, scoring_service, mock_log_assessment):
+        """Test that the run gets evaluate's per-scorer means over scored and reused results."""
+        scorer = Mock(side_effect=[make_feedback('yes'), make_feedback('no')])
+        scorer.name = SCORER_NAME
+        scorer.aggregations = None
+
+        scoring_service.score_traces(
+            scorer,
+            [make_trace('trace-1'), make_trace('trace-2')],
+            'run-1',
+            reused_results={'trace-3': make_feedback('yes'), 'trace-4': make_feedback('yes')},
+        )
+
+        kwargs = scoring_service.client.log_batch.call_args.kwargs
+        metrics = {metric.key: metric.value for metric in kwargs['metrics']}
+        assert metrics[f'{SCORER_NAME}/mean'] == 0.75
+        assert metrics['scoring/traces_scored'] == 2
+        tags = [(tag.key, tag.value) for tag in kwargs['tags']]
+        assert tags == [('mlflow.runType', 'genai_evaluate')]
+
+
+def test_is_rate_limit_error():
+    """Test rate limit detection from error messages."""
+    assert is_rate_limit_error('HTTP 429: REQUEST_LIMIT_EXCEEDED')
+    assert is_rate_limit_error('Rate limit exceeded for endpoint')
+    assert not is_rate_limit_error('Internal server error')
+    assert not is_rate_limit_error(None)
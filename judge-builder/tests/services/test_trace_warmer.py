@@ -0,0 +1,196 @@
+"""Unit tests for the labeling trace warmer."""
+
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from server.services.trace_warmer import CallBudget, TraceWarmer
+
+
+class FakeClock:
+    """Clock the tests advance by hand."""
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        """Current fake time."""
+        return self.now
+
+
+def _judge(judge_id, labeling_run_id='run-1'):
+    judge = Mock()
+    judge.id = judge_id
+    judge.labeling_run_id = labeling_run_id
+    return judge
+
+
+@pytest.fixture
+def services():
+    """Patch the services the warmer reads from."""
+    with patch('server.services.judge_service.judge_service') as judge_service, \
+         patch('server.services.labeling_service.labeling_service') as labeling_service, \
+         patch('server.services.cache_service.cache_service') as cache_service:
+        judge_service.list_judges.return_value = [_judge('judge-1')]
+        cache_service.is_trace_cached.return_value = False
+        cache_service.refresh_trace.side_effect = lambda trace_id: Mock(trace_id=trace_id)
+        yield judge_service, labeling_service, cache_service
+
+
+def _refreshed(cache_service):
+    return [call.args[0] for call in cache_service.refresh_trace.call_args_list]
+
+
+class TestCallBudget:
+    """Test cases for CallBudget."""
+
+    def test_budget_refills_over_time(self):
+        """Test that calls are limited to the per-minute budget and refill gradually."""
+        clock = FakeClock()
+        budget = CallBudget(calls_per_minute=2, clock=clock)
+
+        assert budget.try_acquire()
+        assert budget.try_acquire()
+        assert not budget.try_acquire()
+
+        clock.now = 30.0
+        assert budget.try_acquire()
+        assert not budget.try_acquire()
+
+    def test_zero_budget_disables_calls(self):
+        """Test that a zero budget allows no calls."""
+        assert not CallBudget(calls_per_minute=0).try_acquire()
+
+
+class TestTraceWarmer:
+    """Test cases for TraceWarmer."""
+
+    def test_first_poll_warms_uncached_completed_traces(self, services):
+        """Test that a judge's first poll fetches completed traces missing from memory."""
+        _, labeling_service, cache_service = services
+        labeling_service.get_completed_trace_ids.return_value = {'trace-1', 'trace-2'}
+        cache_service.is_trace_cached.side_effect = lambda trace_id: trace_id == 'trace-1'
+
+        warmer = TraceWarmer(calls_per_minute=100)
+
+        assert warmer.poll_once() == 1
+        assert _refreshed(cache_service) == ['trace-2']
+
+    def test_newly_completed_traces_are_refreshed(self, services):
+        """Test that traces completed since the last poll are re-fetched even if cached."""
+        _, labeling_service, cache_service = services
+        cache_service.is_trace_cached.return_value = True
+        labeling_service.get_completed_trace_ids.return_value = {'trace-1'}
+
+        warmer = TraceWarmer(calls_per_minute=100)
+        warmer.poll_once()
+        assert _refreshed(cache_service) == []
+
+        labeling_service.get_completed_trace_ids.return_value = {'trace-1', 'trace-2'}
+        assert warmer.poll_once() == 1
+        assert _refreshed(cache_service) == ['trace-2']
+
+        # No new completions: nothing is fetched again
+        assert warmer.poll_once() == 0
+
+    def test_work_beyond_budget_is_deferred(self, services):
+        """Test that traces over the call budget wait for a later poll."""
+        _, labeling_service, cache_service = services
+        labeling_service.get_completed_trace_ids.return_value = {'trace-1', 'trace-2', 'trace-3'}
+
+        warmer = TraceWarmer(calls_per_minute=3)
+        clock = FakeClock()
+        warmer.budget = CallBudget(3, clock=clock)
+
+        # One call lists the session, two fetch traces
+        assert warmer.poll_once() == 2
+        assert warmer.pending_count() == 1
+
+        clock.now = 40.0
+        assert warmer.poll_once() == 1
+        assert warmer.pending_count() == 0
+        assert sorted(_refreshed(cache_service)) == ['trace-1', 'trace-2', 'trace-3']
+
+    def test_polls_resume_at_first_judge_skipped(self, services):
+        """Test that judges past the call budget are listed first on the next poll."""
+        judge_service, labeling_service, _ = services
+        judge_service.list_judges.return_value = [_judge(f'judge-{i}') for i in range(1, 4)]
+        labeling_service.get_completed_trace_ids.return_value = set()
+
+        warmer = TraceWarmer(calls_per_minute=2)
+        clock = FakeClock()
+        warmer.budget = CallBudget(2, clock=clock)
+
+        def listed():
+            calls = labeling_service.get_completed_trace_ids.call_args_list
+            labeling_service.get_completed_trace_ids.reset_mock()
+            return [call.args[0] for call in calls]
+
+        warmer.poll_once()
+        assert listed() == ['judge-1', 'judge-2']
+
+        clock.now = 60.0
+        warmer.poll_once()
+        assert listed() == ['judge-3', 'judge-1']
+
+        clock.now = 120.0
+        warmer.poll_once()
+        assert listed() == ['judge-2', 'judge-3']
+
+    def test_judges_without_labeling_session_are_skipped(self, services):
+        """Test that judges without a labeling run are not listed."""
+        judge_service, labeling_service, _ = services
+        judge_service.list_judges.return_value = [_judge('judge-1', labeling_run_id=None)]
+
+        warmer = TraceWarmer(calls_per_minute=100)
+
+        assert warmer.poll_once() == 0
+        labeling_service.get_completed_trace_ids.assert_not_called()
+
+    def test_listing_failure_does_not_stop_other_judges(self, services):
+        """Test that a judge whose session can't be listed doesn't block the rest."""
+        judge_service, labeling_service, cache_service = services
+        judge_service.list_judges.return_value = [_judge('judge-1'), _judge('judge-2')]
+
+        def completed_trace_ids(judge_id):
+            if judge_id == 'judge-1':
+                raise Exception('MLflow error')
+            return {'trace-2'}
+
+        labeling_service.get_completed_trace_ids.side_effect = completed_trace_ids
+
+        warmer = TraceWarmer(calls_per_minute=100)
+
+        assert warmer.poll_once() == 1
+        assert _refreshed(cache_service) == ['trace-2']
+
+    def test_failed_fetch_is_counted(self, services):
+        """Test that traces that can't be fetched are counted as failed."""
+        _, labeling_service, cache_service = services
+        labeling_service.get_completed_trace_ids.return_value = {'trace-1'}
+        cache_service.refresh_trace.side_effect = None
+        cache_service.refresh_trace.return_value = None
+
+        warmer = TraceWarmer(calls_per_minute=100)
+
+        assert warmer.poll_once() == 0
+        assert warmer.stats['traces_failed'] == 1
+
+    def test_start_and_stop(self, services):
+        """Test that the background thread polls and stops cleanly."""
+        _, labeling_service, _ = services
+        polled = threading.Event()
+
+        def completed_trace_ids(judge_id):
+            polled.set()
+            return set()
+
+        labeling_service.get_completed_trace_ids.side_effect = completed_trace_ids
+
+        warmer = TraceWarmer(calls_per_minute=100, interval_seconds=60)
+        warmer.start()
+        assert polled.wait(timeout=5)
+        warmer.stop()
+
+        assert warmer.stats['polls'] == 1
+        assert warmer._thread is None
@@ -0,0 +1,92 @@
+"""Unit tests for alignment metrics."""
+
+import numpy as np
+import pytest
+
+from server.utils.alignment_metrics import (
+    binary_confusion_matrix,
+    categorical_metrics,
+    cohens_kappa,
+    confusion_matrix,
+    encode_labels,
+    positive_label_code,
+)
+
+
+class TestEncodeLabels:
+    """Test cases for encode_labels."""
+
+    def test_options_first_and_case_insensitive(self):
+        """Test schema options get the first codes and casing is ignored."""
+        labels, (human, judge) = encode_labels(
+            [['fail', 'PASS'], ['Pass', 'Fail']], ['Pass', 'Fail']
+        )
+
+        assert labels == ['Pass', 'Fail']
+        assert human.tolist() == [1, 0]
+        assert judge.tolist() == [0, 1]
+
+    def test_unknown_labels_get_own_codes(self):
+        """Test labels outside the schema are distinct from options and each other."""
+        labels, (human, judge) = encode_labels(
+            [['maybe', 'Pass'], ['Maybe', 'other']], ['Pass', 'Fail']
+        )
+
+        assert labels == ['Pass', 'Fail', 'maybe', 'other']
+        assert human.tolist() == [2, 0]
+        assert judge.tolist() == [2, 3]
+
+    def test_empty_lists(self):
+        """Test encoding empty label lists."""
+        labels, (human, judge) = encode_labels([[], []], ['Pass', 'Fail'])
+
+        assert labels == ['Pass', 'Fail']
+        assert len(human) == 0 and len(judge) == 0
+
+
+class TestMetrics:
+    """Test cases for confusion matrix based metrics."""
+
+    def test_multiclass_metrics(self):
+        """Test confusion matrix, agreement, kappa and per-class metrics for a 3-class schema."""
+        options = ['Poor', 'Fair', 'Good']
+        human_labels = ['poor', 'fair', 'good', 'good', 'fair', 'poor']
+        judge_labels = ['poor', 'good', 'good', 'good', 'fair', 'fair']
+        labels, (human, judge) = encode_labels([human_labels, judge_labels], options)
+
+        matrix = confusion_matrix(human, judge, len(labels))
+        metrics = categorical_metrics(matrix, labels)
+
+        assert metrics.confusion_matrix == [[1, 1, 0], [0, 1, 1], [0, 0, 2]]
+        assert metrics.agreement_count == 4
+        # observed 4/6, expected (2*1 + 2*2 + 2*3) / 36 = 1/3
+        assert metrics.cohens_kappa == pytest.approx(0.5)
+        good = metrics.per_class[2]
+        assert (good.label, good.precision, good.recall, good.support) == (
+            'Good',
+            pytest.approx(2 / 3),
+            1.0,
+            2,
+        )
+
+    def test_length_mismatch(self):
+        """Test mismatched label lists are rejected."""
+        with pytest.raises(ValueError):
+            confusion_matrix(np.array([0, 1]), np.array([0]), 2)
+
+    def test_kappa_edge_cases(self):
+        """Test kappa for empty and single-label matrices."""
+        assert cohens_kappa(np.zeros((2, 2), dtype=int)) == 0.0
+        assert cohens_kappa(np.array([[3, 0], [0, 0]])) == 1.0
+
+    def test_binary_collapse_uses_pass_as_positive(self):
+        """Test collapsing treats any non-pass label as negative."""
+        labels, (human, judge) = encode_labels(
+            [['pass', 'pass', 'fail', 'maybe'], ['pass', 'fail', 'pass', 'fail']], ['Fail', 'Pass']
+        )
+        matrix = confusion_matrix(human, judge, len(labels))
+
+        binary = binary_confusion_matrix(matrix, positive_label_code(labels))
+
+        assert (binary.true_positive, binary.false_negative) == (1, 1)
+        assert (binary.false_positive, binary.true_negative) == (1, 1)
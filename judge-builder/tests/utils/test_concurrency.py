@@ -0,0 +1,173 @@
+"""Tests for concurrency helpers."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from server.utils.concurrency import ConcurrencyLimiter, _ExperimentGate, run_blocking
+
+
+class TestRunBlocking:
+    """Test cases for run_blocking."""
+
+    def test_runs_in_worker_thread(self):
+        """Test that the function runs off the event loop thread."""
+
+        async def main():
+            return threading.get_ident(), await run_blocking(threading.get_ident)
+
+        loop_thread, worker_thread = asyncio.run(main())
+
+        assert loop_thread != worker_thread
+
+    def test_passes_arguments_and_propagates_errors(self):
+        """Test that args/kwargs are forwarded and exceptions re-raised."""
+
+        def divide(a, b=1):
+            return a / b
+
+        assert asyncio.run(run_blocking(divide, 6, b=3)) == 2
+
+        with pytest.raises(ZeroDivisionError):
+            asyncio.run(run_blocking(divide, 1, b=0))
+
+    def test_event_loop_not_blocked(self):
+        """Test that other coroutines progress while blocking work runs."""
+
+        async def main():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.01)
+
+            task = asyncio.create_task(ticker())
+            await run_blocking(time.sleep, 0.2)
+            task.cancel()
+            return ticks
+
+        assert asyncio.run(main()) >= 5
+
+
+class TestConcurrencyLimiter:
+    """Test cases for ConcurrencyLimiter."""
+
+    def test_caps_concurrent_calls(self):
+        """Test that no more than `limit` calls run at once."""
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def work():
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+
+        async def main():
+            limiter = ConcurrencyLimiter('test', 2)
+            await asyncio.gather(*(limiter.run(work) for _ in range(6)))
+
+        asyncio.run(main())
+
+        assert peak == 2
+
+
+class TestExperimentGate:
+    """Test cases for the experiment gate."""
+
+    def test_same_experiment_runs_concurrently(self):
+        """Test that holders of the same experiment don't block each other."""
+        gate = _ExperimentGate()
+        barrier = threading.Barrier(2, timeout=1)
+
+        def work():
+            with gate.scope('exp-1'):
+                barrier.wait()
+
+        threads = [threading.Thread(target=work) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert not barrier.broken
+
+    def test_different_experiments_are_serialized(self):
+        """Test that a different experiment waits for current holders to finish."""
+        gate = _ExperimentGate()
+        events = []
+        entered = threading.Event()
+
+        def first():
+            with gate.scope('exp-1'):
+                entered.set()
+                time.sleep(0.1)
+                events.append('exp-1 done')
+
+        def second():
+            entered.wait()
+            with gate.scope('exp-2'):
+                events.append('exp-2 start')
+
+        threads = [threading.Thread(target=first), threading.Thread(target=second)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert events == ['exp-1 done', 'exp-2 start']
+
+    def test_reentrant_for_same_experiment(self):
+        """Test nested scopes for the same experiment on one thread."""
+        gate = _ExperimentGate()
+
+        with gate.scope('exp-1'):
+            with gate.scope('exp-1'):
+                pass
+
+
+    def test_nested_scope_for_other_experiment(self):
+        """Test that a nested scope switches experiments and restores the outer one."""
+        gate = _ExperimentGate()
+
+        with patch('mlflow.set_experiment') as set_experiment:
+            with gate.scope('exp-1'):
+                with gate.scope('exp-2'):
+                    assert gate._active == 'exp-2'
+                assert gate._active == 'exp-1'
+
+        set_experiment.assert_called_once_with(experiment_id='exp-1')
+        assert gate._holders == 0
+
+    def test_nested_scope_waits_without_blocking_others(self):
+        """Test that a nested switch waits for other holders without deadlocking."""
+        gate = _ExperimentGate()
+        holding = threading.Event()
+        release = threading.Event()
+
+        def other_holder():
+            with gate.scope('exp-1'):
+                holding.set()
+                release.wait(1)
+
+        thread = threading.Thread(target=other_holder)
+        thread.start()
+        holding.wait(1)
+
+        with patch('mlflow.set_experiment'):
+            with gate.scope('exp-1'):
+                threading.Timer(0.05, release.set).start()
+                with gate.scope('exp-2'):
+                    assert gate._active == 'exp-2'
+        thread.join(1)
+
+        assert not thread.is_alive()
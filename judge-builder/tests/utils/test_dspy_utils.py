@@ -0,0 +1,63 @@
+"""Unit tests for the DSPy language model adapter."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from server.utils.dspy_utils import AgentEvalLM, LMCallStats, clear_lm_response_cache
+
+
+@pytest.fixture
+def chat_completions():
+    """Patch the chat completions call with a fixed response."""
+    response = Mock(output='{"result": "Pass"}', error_message=None)
+    with patch(
+        'server.utils.rag_client.get_chat_completions_result', return_value=response
+    ) as mock_call:
+        clear_lm_response_cache()
+        yield mock_call
+    clear_lm_response_cache()
+
+
+class TestAgentEvalLM:
+    """Test cases for AgentEvalLM response caching."""
+
+    def test_identical_prompts_are_served_from_cache(self, chat_completions):
+        """Test that a repeated prompt is sent to the model only once."""
+        stats = LMCallStats()
+        lm = AgentEvalLM(model='test-model', stats=stats)
+        messages = [
+            {'role': 'system', 'content': 'Be strict'},
+            {'role': 'user', 'content': 'Judge this'},
+        ]
+
+        first = lm.forward(messages=messages)
+        second = lm.forward(messages=messages)
+
+        assert chat_completions.call_count == 1
+        assert second.choices[0].message.content == first.choices[0].message.content
+        assert stats.as_dict() == {'lm_calls': 1, 'cache_hits': 1, 'errors': 0}
+
+    def test_cache_key_includes_prompt_temperature_and_rollout(self, chat_completions):
+        """Test that different prompts, temperatures and rollouts are not conflated."""
+        lm = AgentEvalLM(model='test-model')
+
+        lm.forward(prompt='one')
+        lm.forward(prompt='two')
+        AgentEvalLM(model='test-model', temperature=0.0).forward(prompt='one')
+        lm.copy(rollout_id=1).forward(prompt='one')
+        lm.copy(rollout_id=1).forward(prompt='one')
+
+        assert chat_completions.call_count == 4
+
+    def test_errors_are_not_cached(self, chat_completions):
+        """Test that failed responses are retried on the next call."""
+        chat_completions.return_value = Mock(output=None, error_message='overloaded')
+        lm = AgentEvalLM(model='test-model')
+
+        result = lm.forward(prompt='one')
+        lm.forward(prompt='one')
+
+        assert result.error == 'overloaded'
+        assert chat_completions.call_count == 2
+        assert lm.stats.errors == 2
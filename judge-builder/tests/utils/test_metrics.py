@@ -0,0 +1,96 @@
+"""Unit tests for the performance metrics registry."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from server.utils.metrics import (
+    MLFLOW_CALL_ERRORS,
+    MLFLOW_CALL_SECONDS,
+    InstrumentedClient,
+    MetricsRegistry,
+    track_call,
+)
+
+
+class TestMetricsRegistry:
+    """Test cases for counters, histograms and rendering."""
+
+    def test_counter_render(self):
+        """Test counters render one sample per label set."""
+        registry = MetricsRegistry()
+        counter = registry.counter('test_requests_total', 'Requests.', ['cache', 'result'])
+
+        counter.inc(cache='trace', result='hit')
+        counter.inc(2, cache='trace', result='hit')
+        counter.inc(cache='trace', result='miss')
+
+        text = registry.render()
+        assert '# TYPE test_requests_total counter' in text
+        assert 'test_requests_total{cache="trace",result="hit"} 3' in text
+        assert 'test_requests_total{cache="trace",result="miss"} 1' in text
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test histogram buckets, count and sum."""
+        registry = MetricsRegistry()
+        histogram = registry.histogram(
+            'test_seconds', 'Latency.', ['operation'], buckets=(0.1, 1.0)
+        )
+
+        for value in (0.05, 0.5, 0.5, 5.0):
+            histogram.observe(value, operation='get')
+
+        lines = registry.render().splitlines()
+        assert 'test_seconds_bucket{operation="get",le="0.1"} 1' in lines
+        assert 'test_seconds_bucket{operation="get",le="1.0"} 3' in lines
+        assert 'test_seconds_bucket{operation="get",le="+Inf"} 4' in lines
+        assert 'test_seconds_count{operation="get"} 4' in lines
+        assert 'test_seconds_sum{operation="get"} 6.05' in lines
+
+    def test_gauge_keeps_latest_value(self):
+        """Test gauges render the last value set per label set."""
+        registry = MetricsRegistry()
+        gauge = registry.gauge('test_judges', 'Judges.', ['result'])
+
+        gauge.set(3, result='loaded')
+        gauge.set(2, result='loaded')
+
+        text = registry.render()
+        assert '# TYPE test_judges gauge' in text
+        assert 'test_judges{result="loaded"} 2' in text
+        assert gauge.value(result='failed') == 0
+
+    def test_label_values_are_escaped(self):
+        """Test quotes and newlines in label values don't break the format."""
+        registry = MetricsRegistry()
+        registry.counter('test_total', 'Test.', ['route']).inc(route='a"b\nc')
+
+        assert 'test_total{route="a\\"b\\nc"} 1' in registry.render()
+
+
+class TestInstrumentation:
+    """Test cases for call tracking."""
+
+    def test_track_call_counts_errors(self):
+        """Test that failed calls are timed and counted as errors."""
+        before = MLFLOW_CALL_ERRORS.value(operation='test.failing')
+
+        with pytest.raises(ValueError):
+            with track_call('test.failing'):
+                raise ValueError('boom')
+
+        assert MLFLOW_CALL_ERRORS.value(operation='test.failing') == before + 1
+        assert MLFLOW_CALL_SECONDS.count(operation='test.failing') >= 1
+
+    def test_instrumented_client_forwards_calls(self):
+        """Test that client methods are timed and results returned unchanged."""
+        client = Mock()
+        client.search_traces.return_value = ['trace-1', 'trace-2']
+        client.tracking_uri = 'databricks'
+        instrumented = InstrumentedClient(client, 'test_client')
+        before = MLFLOW_CALL_SECONDS.count(operation='test_client.search_traces')
+
+        assert instrumented.search_traces(experiment_ids=['exp-1']) == ['trace-1', 'trace-2']
+        assert instrumented.tracking_uri == 'databricks'
+        client.search_traces.assert_called_once_with(experiment_ids=['exp-1'])
+        assert MLFLOW_CALL_SECONDS.count(operation='test_client.search_traces') == before + 1
@@ -204,8 +204,10 @@ from mlflow.entities import Assessment, AssessmentSource
 
 from server.utils.parsing_utils import (
     assessment_has_error,
+    build_assessment_index,
     extract_request_from_trace,
     extract_response_from_trace,
+    get_assessment_index,
     get_human_feedback_from_trace,
     get_scorer_feedback_from_trace,
 )
@@ -424,6 +426,48 @@ def test_assessment_has_error_with_error(mock_assessment):
     assert result is True
 
 
+def _make_assessment(name, source_type):
+    assessment = Mock()
+    assessment.name = name
+    assessment.source = Mock()
+    assessment.source.source_type = source_type
+    return assessment
+
+
+def test_assessment_index_first_match_wins(mock_trace_with_assessments):
+    """Test the index keeps the first assessment for each name and source."""
+    first = _make_assessment('test_judge', 'HUMAN')
+    second = _make_assessment('test_judge', 'HUMAN')
+    scorer = _make_assessment('test_judge', 'LLM_JUDGE')
+    mock_trace_with_assessments.info.assessments = [first, second, scorer]
+
+    index = get_assessment_index(mock_trace_with_assessments)
+
+    assert index[('test_judge', 'HUMAN')] is first
+    assert index[('test_judge', 'LLM_JUDGE')] is scorer
+
+
+@patch('server.utils.parsing_utils.build_assessment_index', wraps=build_assessment_index)
+def test_assessment_index_reused_until_assessments_change(mock_build, mock_trace_with_assessments):
+    """Test the index is built once per trace and rebuilt when assessments change."""
+    mock_trace_with_assessments.info.assessments = [_make_assessment('test_judge', 'HUMAN')]
+
+    get_assessment_index(mock_trace_with_assessments)
+    get_assessment_index(mock_trace_with_assessments)
+    assert mock_build.call_count == 1
+
+    added = _make_assessment('other_judge', 'HUMAN')
+    mock_trace_with_assessments.info.assessments.append(added)
+    assert get_assessment_index(mock_trace_with_assessments)[('other_judge', 'HUMAN')] is added
+
+    replacement = _make_assessment('test_judge', 'HUMAN')
+    mock_trace_with_assessments.info.assessments = [replacement]
+    assert get_assessment_index(mock_trace_with_assessments) == {
+        ('test_judge', 'HUMAN'): replacement
+    }
+    assert mock_build.call_count == 3
+
+
 @patch('server.utils.parsing_utils.sanitize_judge_name')
 def test_get_human_feedback_multiple_assessments(mock_sanitize, mock_trace_with_assessments):
     """Test get_human_feedback_from_trace with multiple assessments."""
@@ -0,0 +1,75 @@
+"""Unit tests for the pooled managed RAG client."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+from urllib3 import PoolManager
+
+from server.utils import rag_client
+from server.utils.rag_client import _PooledAdapter
+
+
+@pytest.fixture
+def server():
+    """Serve a local HTTP endpoint for the client tests."""
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        connections = set()
+
+        def do_POST(self):
+            Handler.connections.add(self.client_address)
+            self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            self.send_response(200)
+            self.send_header('Content-Length', '2')
+            self.end_headers()
+            self.wfile.write(b'{}')
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.handler = Handler
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+
+
+class TestRagClient:
+    """Test cases for the pooled managed RAG client."""
+
+    def test_pooled_adapter_reuses_connections_across_sessions(self, server):
+        """Test that closing a per-request session keeps the pooled connection alive."""
+        poolmanager = PoolManager(maxsize=2, block=True)
+        url = f'http://127.0.0.1:{server.server_port}/api/2.0/agents/chat-completions'
+
+        for _ in range(5):
+            with requests.Session() as session:
+                session.mount('http://', _PooledAdapter(poolmanager))
+                assert session.post(url, json={}).status_code == 200
+
+        assert len(server.handler.connections) == 1
+
+    def test_client_is_built_once(self):
+        """Test that every call shares one client and optional arguments are omitted."""
+        client = Mock()
+        rag_client.reset_managed_rag_client()
+        with patch('server.utils.rag_client._build_client', return_value=client) as mock_build, \
+             patch('server.utils.rag_client.context.context_is_active', return_value=True):
+            rag_client.get_chat_completions_result('one', None)
+            rag_client.get_chat_completions_result('two', 'system', model='m', temperature=0.0)
+        rag_client.reset_managed_rag_client()
+
+        mock_build.assert_called_once()
+        assert client.get_chat_completions_result.call_args_list[0].kwargs == {
+            'user_prompt': 'one',
+            'system_prompt': None,
+        }
+        assert client.get_chat_completions_result.call_args_list[1].kwargs == {
+            'user_prompt': 'two',
+            'system_prompt': 'system',
+            'model': 'm',
+            'temperature': 0.0,
+        }
@@ -4,6 +4,7 @@ import unittest
 from unittest.mock import Mock, patch
 
 from server.utils.schema_analysis import (
+    _extract_categorical_options_from_instruction,
     extract_categorical_options_from_instruction,
     is_binary_categorical_options,
 )
@@ -12,113 +13,111 @@ from server.utils.schema_analysis import (
 class TestSchemaAnalysis(unittest.TestCase):
     """Test cases for schema analysis functions."""
 
-    @patch('server.utils.schema_analysis.context')
-    def test_extract_categorical_options_success(self, mock_context):
+    def setUp(self):
+        """Clear the analysis cache between tests."""
+        _extract_categorical_options_from_instruction.cache_clear()
+
+    @patch('server.utils.rag_client.get_chat_completions_result')
+    def test_extract_categorical_options_success(self, mock_chat_completions):
         """Test successful extraction of categorical options."""
-        # Mock the managed_rag_client and response
-        mock_client = Mock()
-        mock_context.get_context.return_value.build_managed_rag_client.return_value = mock_client
-        
+        # Mock the chat completions response
         mock_response = Mock()
         mock_response.output = '{"options": ["Pass", "Fail"]}'
-        mock_client.get_chat_completions_result.return_value = mock_response
-        
+        mock_chat_completions.return_value = mock_response
+
         # Test the function
-        result = extract_categorical_options_from_instruction("Return pass if good, fail if bad")
-        
+        result = extract_categorical_options_from_instruction('Return pass if good, fail if bad')
+
         # Verify result
-        self.assertEqual(result, ["Pass", "Fail"])
-        mock_client.get_chat_completions_result.assert_called_once()
+        self.assertEqual(result, ['Pass', 'Fail'])
+        mock_chat_completions.assert_called_once()
 
-    @patch('server.utils.schema_analysis.context')
-    def test_extract_categorical_options_multi_option(self, mock_context):
+    @patch('server.utils.rag_client.get_chat_completions_result')
+    def test_extract_categorical_options_multi_option(self, mock_chat_completions):
         """Test extraction of multi-categorical options."""
-        mock_client = Mock()
-        mock_context.get_context.return_value.build_managed_rag_client.return_value = mock_client
-        
         mock_response = Mock()
         mock_response.output = '{"options": ["Poor", "Fair", "Good", "Excellent"]}'
-        mock_client.get_chat_completions_result.return_value = mock_response
-        
-        result = extract_categorical_options_from_instruction("Rate as poor, fair, good, or excellent")
-        
-        self.assertEqual(result, ["Poor", "Fair", "Good", "Excellent"])
-
-    @patch('server.utils.schema_analysis.context')
-    def test_extract_categorical_options_numeric_conversion(self, mock_context):
+        mock_chat_completions.return_value = mock_response
+
+        result = extract_categorical_options_from_instruction(
+            'Rate as poor, fair, good, or excellent'
+        )
+
+        self.assertEqual(result, ['Poor', 'Fair', 'Good', 'Excellent'])
+
+    @patch('server.utils.rag_client.get_chat_completions_result')
+    def test_extract_categorical_options_numeric_conversion(self, mock_chat_completions):
         """Test conversion of numeric ranges to categorical options."""
-        mock_client = Mock()
-        mock_context.get_context.return_value.build_managed_rag_client.return_value = mock_client
-        
         mock_response = Mock()
         mock_response.output = '{"options": ["1", "2", "3", "4", "5"]}'
-        mock_client.get_chat_completions_result.return_value = mock_response
-        
-        result = extract_categorical_options_from_instruction("Rate from 1 to 5")
-        
-        self.assertEqual(result, ["1", "2", "3", "4", "5"])
-
-    @patch('server.utils.schema_analysis.context')
-    def test_extract_categorical_options_fallback_on_error(self, mock_context):
-        """Test fallback to Pass/Fail when LLM call fails."""
-        mock_context.get_context.side_effect = Exception("Connection failed")
-        
-        result = extract_categorical_options_from_instruction("Some instruction")
-        
-        self.assertEqual(result, ["Pass", "Fail"])
-
-    @patch('server.utils.schema_analysis.context')
-    def test_extract_categorical_options_invalid_json(self, mock_context):
-        """Test fallback when LLM returns invalid JSON."""
-        mock_client = Mock()
-        mock_context.get_context.return_value.build_managed_rag_client.return_value = mock_client
-        
+        mock_chat_completions.return_value = mock_response
+
+        result = extract_categorical_options_from_instruction('Rate from 1 to 5')
+
+        self.assertEqual(result, ['1', '2', '3', '4', '5'])
+
+    @patch('server.utils.rag_client.get_chat_completions_result')
+    def test_extract_categorical_options_raises_on_error(self, mock_chat_completions):
+        """Test that an LLM call failure propagates instead of defaulting to Pass/Fail."""
+        mock_chat_completions.side_effect = Exception('Connection failed')
+
+        with self.assertRaisesRegex(Exception, 'Connection failed'):
+            extract_categorical_options_from_instruction('Some instruction')
+
+    @patch('server.utils.rag_client.get_chat_completions_result')
+    def test_extract_categorical_options_failure_not_cached(self, mock_chat_completions):
+        """Test that a failed analysis is retried on the next call."""
+        mock_response = Mock()
+        mock_response.output = '{"options": ["Poor", "Good"]}'
+        mock_chat_completions.side_effect = [Exception('Connection failed'), mock_response]
+
+        with self.assertRaises(Exception):
+            extract_categorical_options_from_instruction('Some instruction')
+        result = extract_categorical_options_from_instruction('Some instruction')
+
+        self.assertEqual(result, ['Poor', 'Good'])
+        self.assertEqual(mock_chat_completions.call_count, 2)
+
+    @patch('server.utils.rag_client.get_chat_completions_result')
+    def test_extract_categorical_options_invalid_json(self, mock_chat_completions):
+        """Test that an error is raised when LLM returns invalid JSON."""
         mock_response = Mock()
         mock_response.output = 'invalid json'
-        mock_client.get_chat_completions_result.return_value = mock_response
-        
-        result = extract_categorical_options_from_instruction("Some instruction")
-        
-        self.assertEqual(result, ["Pass", "Fail"])
-
-    @patch('server.utils.schema_analysis.context')
-    def test_extract_categorical_options_invalid_options(self, mock_context):
-        """Test fallback when LLM returns invalid options."""
-        mock_client = Mock()
-        mock_context.get_context.return_value.build_managed_rag_client.return_value = mock_client
-        
+        mock_chat_completions.return_value = mock_response
+
+        with self.assertRaisesRegex(ValueError, 'JSON'):
+            extract_categorical_options_from_instruction('Some instruction')
+
+    @patch('server.utils.rag_client.get_chat_completions_result')
+    def test_extract_categorical_options_invalid_options(self, mock_chat_completions):
+        """Test that an error is raised when LLM returns invalid options."""
         mock_response = Mock()
         mock_response.output = '{"options": ["OnlyOne"]}'  # Only one option
-        mock_client.get_chat_completions_result.return_value = mock_response
-        
-        result = extract_categorical_options_from_instruction("Some instruction")
-        
-        self.assertEqual(result, ["Pass", "Fail"])
-
-    @patch('server.utils.schema_analysis.context')
-    def test_extract_categorical_options_no_output(self, mock_context):
-        """Test fallback when LLM returns no output."""
-        mock_client = Mock()
-        mock_context.get_context.return_value.build_managed_rag_client.return_value = mock_client
-        
+        mock_chat_completions.return_value = mock_response
+
+        with self.assertRaisesRegex(ValueError, 'Invalid options'):
+            extract_categorical_options_from_instruction('Some instruction')
+
+    @patch('server.utils.rag_client.get_chat_completions_result')
+    def test_extract_categorical_options_no_output(self, mock_chat_completions):
+        """Test that an error is raised when LLM returns no output."""
         mock_response = Mock()
         mock_response.output = None
-        mock_client.get_chat_completions_result.return_value = mock_response
-        
-        result = extract_categorical_options_from_instruction("Some instruction")
-        
-        self.assertEqual(result, ["Pass", "Fail"])
+        mock_chat_completions.return_value = mock_response
+
+        with self.assertRaisesRegex(ValueError, 'No output'):
+            extract_categorical_options_from_instruction('Some instruction')
 
     def test_is_binary_categorical_options_binary(self):
         """Test binary detection with 2 options."""
-        self.assertTrue(is_binary_categorical_options(["Pass", "Fail"]))
-        self.assertTrue(is_binary_categorical_options(["Yes", "No"]))
+        self.assertTrue(is_binary_categorical_options(['Pass', 'Fail']))
+        self.assertTrue(is_binary_categorical_options(['Yes', 'No']))
 
     def test_is_binary_categorical_options_non_binary(self):
         """Test binary detection with non-binary options."""
-        self.assertFalse(is_binary_categorical_options(["Poor", "Fair", "Good", "Excellent"]))
-        self.assertFalse(is_binary_categorical_options(["1", "2", "3", "4", "5"]))
-        self.assertFalse(is_binary_categorical_options(["Single"]))  # Only one option
+        self.assertFalse(is_binary_categorical_options(['Poor', 'Fair', 'Good', 'Excellent']))
+        self.assertFalse(is_binary_categorical_options(['1', '2', '3', '4', '5']))
+        self.assertFalse(is_binary_categorical_options(['Single']))  # Only one option
         self.assertFalse(is_binary_categorical_options([]))  # Empty list
 
 
@@ -1,6 +1,11 @@
+import asyncio
 import sqlite3
 import threading
+import queue
 import json
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from fastapi import HTTPException
 from datetime import datetime
 import logging
@@ -8,205 +13,353 @@ from models import MessageResponse, ChatHistoryItem, ChatHistoryResponse
 
 logger = logging.getLogger(__name__)
 
+# Read connections shared by all request threads
+DB_POOL_SIZE = int(os.getenv("CHAT_DB_POOL_SIZE", "8"))
+# Seconds a reader waits for a free connection before giving up
+DB_POOL_TIMEOUT = float(os.getenv("CHAT_DB_POOL_TIMEOUT", "30"))
+# Most queued writes committed together in one transaction
+DB_WRITE_BATCH_SIZE = int(os.getenv("CHAT_DB_WRITE_BATCH_SIZE", "100"))
+
 class ChatDatabase:
-    def __init__(self, db_file='chat_history.db'):
+    """SQLite chat store with concurrent readers and a single batching writer.
+
+    The database runs in WAL mode, so reads never wait on writes: each read
+    borrows a connection from a bounded pool. All writes go through a queue
+    drained by one writer thread, which commits whatever has queued up in a
+    single transaction; each write runs in its own savepoint, so a failing
+    write is rolled back and reported without affecting the rest of its batch.
+
+    The public methods are coroutines. Reads run on a thread pool the size of
+    the connection pool and writes await the writer thread's futures, so no
+    disk I/O happens on the event loop.
+    """
+
+    def __init__(self, db_file='chat_history.db', pool_size: int = DB_POOL_SIZE,
+                 write_batch_size: int = DB_WRITE_BATCH_SIZE, pool_timeout: float = DB_POOL_TIMEOUT):
         self.db_file = db_file
-        self.db_lock = threading.Lock()
-        self.connection_pool = {}
+        self.pool_size = pool_size
+        self.write_batch_size = write_batch_size
+        self.pool_timeout = pool_timeout
         self.first_message_cache = {}
+        self._readers = queue.Queue(maxsize=pool_size)
+        self._reader_count = 0
+        self._pool_lock = threading.Lock()
+        self._write_queue = queue.Queue()
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._read_executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="chat-db-reader")
         self.init_db()
-    
-    def get_connection(self):
-        """Get a database connection from the pool or create a new one"""
-        thread_id = threading.get_ident()
-        if thread_id not in self.connection_pool:
-            conn = sqlite3.connect(self.db_file)
-            conn.row_factory = sqlite3.Row
-            self.connection_pool[thread_id] = conn
-        return self.connection_pool[thread_id]
-    
-    def close_connection(self):
-        """Close the database connection for the current thread"""
-        thread_id = threading.get_ident()
-        if thread_id in self.connection_pool:
-            self.connection_pool[thread_id].close()
-            del self.connection_pool[thread_id]
+        self._writer_conn = self._connect()
+        self._writer = threading.Thread(target=self._run_writer, name="chat-db-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection configured for WAL with transactions managed explicitly"""
+        conn = sqlite3.connect(self.db_file, check_same_thread=False, isolation_level=None, timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA synchronous = NORMAL')
+        conn.execute('PRAGMA foreign_keys = ON')
+        return conn
+
+    @contextmanager
+    def reader(self):
+        """Borrow a read connection from the pool, opening one if the pool isn't full yet"""
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            with self._pool_lock:
+                can_open = self._reader_count < self.pool_size
+                if can_open:
+                    self._reader_count += 1
+            if can_open:
+                try:
+                    conn = self._connect()
+                except sqlite3.Error:
+                    with self._pool_lock:
+                        self._reader_count -= 1
+                    raise
+            else:
+                try:
+                    conn = self._readers.get(timeout=self.pool_timeout)
+                except queue.Empty:
+                    raise sqlite3.OperationalError("Timed out waiting for a database connection")
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    def submit_write(self, write) -> Future:
+        """Queue a write for the writer thread.
+
+        `write` is called with a cursor inside the batch's transaction; the returned
+        future resolves to its result once the batch has been committed. Raises
+        sqlite3.ProgrammingError once the database has been closed.
+        """
+        future = Future()
+        # Queued under the lock so nothing lands behind close()'s stop marker
+        with self._close_lock:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Cannot write to a closed ChatDatabase")
+            self._write_queue.put((write, future))
+        return future
+
+    async def _write(self, write):
+        """Queue a write and wait for it to be committed without blocking the event loop"""
+        return await asyncio.wrap_future(self.submit_write(write))
+
+    async def _read(self, read, *args):
+        """Run a blocking read on the reader thread pool"""
+        return await asyncio.get_running_loop().run_in_executor(self._read_executor, read, *args)
+
+    def _run_writer(self):
+        stopping = False
+        while not stopping:
+            item = self._write_queue.get()
+            if item is None:
+                break
+            batch = [item]
+            # Everything that queued up during the previous commit goes into this one
+            while len(batch) < self.write_batch_size:
+                try:
+                    item = self._write_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            # The writer must outlive any failed batch, or every later write would hang
+            try:
+                self._commit_batch(batch)
+            except Exception as e:
+                logger.error(f"Error writing batch of {len(batch)} writes: {str(e)}")
+                self._fail_batch(batch, e)
+
+    @staticmethod
+    def _fail_batch(batch, error):
+        """Fail every write in the batch that hasn't been resolved yet"""
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    def _commit_batch(self, batch):
+        """Run a batch of writes in one transaction, isolating each in a savepoint"""
+        conn = self._writer_conn
+        cursor = None
+        outcomes = []
+        try:
+            cursor = conn.cursor()
+            cursor.execute('BEGIN IMMEDIATE')
+            for write, future in batch:
+                if not future.set_running_or_notify_cancel():
+                    continue
+                cursor.execute('SAVEPOINT write')
+                try:
+                    outcomes.append((future, write(cursor), None))
+                except Exception as e:
+                    cursor.execute('ROLLBACK TO write')
+                    outcomes.append((future, None, e))
+                cursor.execute('RELEASE write')
+            cursor.execute('COMMIT')
+        except Exception as e:
+            logger.error(f"Error committing batch of {len(batch)} writes: {str(e)}")
+            try:
+                if conn.in_transaction:
+                    conn.rollback()
+            except Exception as rollback_error:
+                logger.error(f"Error rolling back batch: {str(rollback_error)}")
+            self._fail_batch(batch, e)
+            return
+        finally:
+            if cursor is not None:
+                cursor.close()
+
+        for future, result, error in outcomes:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    def close(self):
+        """Commit queued writes, stop the writer thread and close all connections"""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._write_queue.put(None)
+        self._writer.join()
+        self._writer_conn.close()
+        self._read_executor.shutdown()
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
     
     def init_db(self):
         """Initialize the database with required tables and indexes"""
-        with self.db_lock:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        try:
+            # WAL is persistent, so every later connection to the file reads it
+            cursor.execute('PRAGMA journal_mode = WAL')
+            cursor.execute('BEGIN')
             
-            try:
-                # Enable foreign key constraints
-                cursor.execute('PRAGMA foreign_keys = ON')
-                
-                # Create sessions table with user information
-                cursor.execute('''
-                CREATE TABLE IF NOT EXISTS sessions (
-                    session_id TEXT PRIMARY KEY,
-                    user_id TEXT NOT NULL,
-                    user_email TEXT,
-                    first_query TEXT,
-                    timestamp TEXT NOT NULL,
-                    is_active INTEGER DEFAULT 1,
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
-                )
-                ''')
-                
-                # Create messages table
-                cursor.execute('''
-                CREATE TABLE IF NOT EXISTS messages (
-                    message_id TEXT PRIMARY KEY,
-                    session_id TEXT NOT NULL,
-                    user_id TEXT NOT NULL,
-                    content TEXT NOT NULL,
-                    role TEXT NOT NULL,
-                    model TEXT,
-                    timestamp TEXT NOT NULL,
-                    sources TEXT,
-                    metrics TEXT,
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (session_id) REFERENCES sessions(session_id) ON DELETE CASCADE
-                )
-                ''')
-                
-                # Create ratings table
-                cursor.execute('''
-                CREATE TABLE IF NOT EXISTS message_ratings (
-                    message_id TEXT NOT NULL,
-                    user_id TEXT NOT NULL,
-                    session_id TEXT NOT NULL,
-                    rating TEXT CHECK(rating IN ('up', 'down')),
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                    PRIMARY KEY (message_id, user_id),
-                    FOREIGN KEY (message_id) REFERENCES messages(message_id) ON DELETE CASCADE,
-                    FOREIGN KEY (session_id) REFERENCES sessions(session_id) ON DELETE CASCADE
-                )
-                ''')
-                
-                # Create indexes for better query performance
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_messages_session_id ON messages(session_id)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_messages_timestamp ON messages(timestamp)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_sessions_timestamp ON sessions(timestamp)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_sessions_user_id ON sessions(user_id)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_messages_user_id ON messages(user_id)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_ratings_message_id ON message_ratings(message_id)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_ratings_user_id ON message_ratings(user_id)')
-                
-                conn.commit()
-            except sqlite3.Error as e:
-                logger.error(f"Error initializing database: {str(e)}")
-                raise
-            finally:
-                cursor.close()
+            # Create sessions table with user information
+            cursor.execute('''
+            CREATE TABLE IF NOT EXISTS sessions (
+                session_id TEXT PRIMARY KEY,
+                user_id TEXT NOT NULL,
+                user_email TEXT,
+                first_query TEXT,
+                timestamp TEXT NOT NULL,
+                is_active INTEGER DEFAULT 1,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+            ''')
+            
+            # Create messages table
+            cursor.execute('''
+            CREATE TABLE IF NOT EXISTS messages (
+                message_id TEXT PRIMARY KEY,
+                session_id TEXT NOT NULL,
+                user_id TEXT NOT NULL,
+                content TEXT NOT NULL,
+                role TEXT NOT NULL,
+                model TEXT,
+                timestamp TEXT NOT NULL,
+                sources TEXT,
+                metrics TEXT,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (session_id) REFERENCES sessions(session_id) ON DELETE CASCADE
+            )
+            ''')
+            
+            # Create ratings table
+            cursor.execute('''
+            CREATE TABLE IF NOT EXISTS message_ratings (
+                message_id TEXT NOT NULL,
+                user_id TEXT NOT NULL,
+                session_id TEXT NOT NULL,
+                rating TEXT CHECK(rating IN ('up', 'down')),
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (message_id, user_id),
+                FOREIGN KEY (message_id) REFERENCES messages(message_id) ON DELETE CASCADE,
+                FOREIGN KEY (session_id) REFERENCES sessions(session_id) ON DELETE CASCADE
+            )
+            ''')
+            
+            # Create indexes for better query performance
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_messages_session_id ON messages(session_id)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_messages_timestamp ON messages(timestamp)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_sessions_timestamp ON sessions(timestamp)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_sessions_user_id ON sessions(user_id)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_messages_user_id ON messages(user_id)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_ratings_message_id ON message_ratings(message_id)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_ratings_user_id ON message_ratings(user_id)')
+            
+            conn.commit()
+        except sqlite3.Error as e:
+            if conn.in_transaction:
+                conn.rollback()
+            logger.error(f"Error initializing database: {str(e)}")
+            raise
+        finally:
+            cursor.close()
+            conn.close()
     
-    def save_message_to_session(self, session_id: str, user_id: str, message: MessageResponse, user_info: dict = None, is_first_message: bool = False):
+    async def save_message_to_session(self, session_id: str, user_id: str, message: MessageResponse, user_info: dict = None, is_first_message: bool = False):
         """Save a message to a chat session, creating the session if it doesn't exist"""
-        with self.db_lock:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            try:
-                conn.execute('BEGIN TRANSACTION')
-                
-                logger.info(f"Saving message: session_id={session_id}, user_id={user_id}, message_id={message.message_id}")
-                
-                # Check if session exists
-                cursor.execute('SELECT session_id FROM sessions WHERE session_id = ? and user_id = ?', (session_id, user_id))
-                if not cursor.fetchone():
-                    logger.info(f"Creating new session: session_id={session_id}, user_id={user_id}")
-                    # Create new session with user info
-                    cursor.execute('''
-                    INSERT INTO sessions (session_id, user_id, user_email, first_query, timestamp, is_active)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    ''', (
-                        session_id,
-                        user_id,  # Use the provided user_id directly
-                        user_info.get('email') if user_info else None,
-                        message.content if is_first_message else "",
-                        message.timestamp.isoformat(),
-                        1
-                    ))
-                
-                # Save message with user_id
+        logger.info(f"Saving message: session_id={session_id}, user_id={user_id}, message_id={message.message_id}")
+        
+        def write(cursor):
+            # Check if session exists
+            cursor.execute('SELECT session_id FROM sessions WHERE session_id = ? and user_id = ?', (session_id, user_id))
+            if not cursor.fetchone():
+                logger.info(f"Creating new session: session_id={session_id}, user_id={user_id}")
+                # Create new session with user info
                 cursor.execute('''
-                INSERT INTO messages (
-                    message_id, session_id, user_id, content, role, model, 
-                    timestamp, sources, metrics
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                INSERT INTO sessions (session_id, user_id, user_email, first_query, timestamp, is_active)
+                VALUES (?, ?, ?, ?, ?, ?)
                 ''', (
-                    message.message_id,
                     session_id,
                     user_id,  # Use the provided user_id directly
-                    message.content,
-                    message.role,
-                    message.model,
+                    user_info.get('email') if user_info else None,
+                    message.content if is_first_message else "",
                     message.timestamp.isoformat(),
-                    json.dumps(message.sources) if message.sources else None,
-                    json.dumps(message.metrics) if message.metrics else None
+                    1
                 ))
-                
-                # Update cache after saving message
-                self.first_message_cache[session_id] = False
-                
-                conn.commit()
-            except sqlite3.Error as e:
-                conn.rollback()
-                logger.error(f"Error saving message to session: {str(e)}")
-                raise
-            finally:
-                cursor.close()
+            
+            # Save message with user_id
+            cursor.execute('''
+            INSERT INTO messages (
+                message_id, session_id, user_id, content, role, model, 
+                timestamp, sources, metrics
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                message.message_id,
+                session_id,
+                user_id,  # Use the provided user_id directly
+                message.content,
+                message.role,
+                message.model,
+                message.timestamp.isoformat(),
+                json.dumps(message.sources) if message.sources else None,
+                json.dumps(message.metrics) if message.metrics else None
+            ))
+        
+        try:
+            await self._write(write)
+        except sqlite3.Error as e:
+            logger.error(f"Error saving message to session: {str(e)}")
+            raise
+        
+        # Update cache after saving message
+        self.first_message_cache[session_id] = False
     
-    def update_message(self, session_id: str, user_id: str, message: MessageResponse):
+    async def update_message(self, session_id: str, user_id: str, message: MessageResponse):
         """Update an existing message in the database"""
-        with self.db_lock:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        def write(cursor):
+            cursor.execute('''
+            UPDATE messages 
+            SET content = ?, 
+                role = ?, 
+                model = ?, 
+                timestamp = ?, 
+                sources = ?, 
+                metrics = ?
+            WHERE message_id = ? AND session_id = ? AND user_id = ?
+            ''', (
+                message.content,
+                message.role,
+                message.model,
+                message.timestamp.isoformat(),
+                json.dumps(message.sources) if message.sources else None,
+                json.dumps(message.metrics) if message.metrics else None,
+                message.message_id,
+                session_id,
+                user_id
+            ))
             
-            try:
-                conn.execute('BEGIN TRANSACTION')
-                
-                cursor.execute('''
-                UPDATE messages 
-                SET content = ?, 
-                    role = ?, 
-                    model = ?, 
-                    timestamp = ?, 
-                    sources = ?, 
-                    metrics = ?
-                WHERE message_id = ? AND session_id = ? AND user_id = ?
-                ''', (
-                    message.content,
-                    message.role,
-                    message.model,
-                    message.timestamp.isoformat(),
-                    json.dumps(message.sources) if message.sources else None,
-                    json.dumps(message.metrics) if message.metrics else None,
-                    message.message_id,
-                    session_id,
-                    user_id
-                ))
-                
-                if cursor.rowcount == 0:
-                    raise HTTPException(
-                        status_code=404,
-                        detail=f"Message {message.message_id} not found in session {session_id}"
-                    )
-                
-                conn.commit()
-            except sqlite3.Error as e:
-                conn.rollback()
-                logger.error(f"Error updating message: {str(e)}")
-                raise
-            finally:
-                cursor.close()
+            if cursor.rowcount == 0:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Message {message.message_id} not found in session {session_id}"
+                )
+        
+        try:
+            await self._write(write)
+        except sqlite3.Error as e:
+            logger.error(f"Error updating message: {str(e)}")
+            raise
     
-    def get_chat_history(self, user_id: str = None) -> ChatHistoryResponse:
+    async def get_chat_history(self, user_id: str = None) -> ChatHistoryResponse:
         """Retrieve chat sessions with their messages for a specific user"""
-        with self.db_lock:
-            conn = self.get_connection()
+        return await self._read(self._get_chat_history, user_id)
+
+    def _get_chat_history(self, user_id: str = None) -> ChatHistoryResponse:
+        with self.reader() as conn:
             cursor = conn.cursor()
             
             try:
@@ -265,10 +418,12 @@ class ChatDatabase:
             finally:
                 cursor.close()
     
-    def get_chat(self, session_id: str, user_id: str = None) -> ChatHistoryItem:
+    async def get_chat(self, session_id: str, user_id: str = None) -> ChatHistoryItem:
         """Retrieve a specific chat session"""
-        with self.db_lock:
-            conn = self.get_connection()
+        return await self._read(self._get_chat, session_id, user_id)
+
+    def _get_chat(self, session_id: str, user_id: str = None) -> ChatHistoryItem:
+        with self.reader() as conn:
             cursor = conn.cursor()
             
             try:
@@ -329,39 +484,32 @@ class ChatDatabase:
             finally:
                 cursor.close()
     
-    def clear_session(self, session_id: str, user_id: str):
+    async def clear_session(self, session_id: str, user_id: str):
         """Clear a session and its messages"""
-        with self.db_lock:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            try:
-                conn.execute('BEGIN TRANSACTION')
-                
-                # Delete messages
-                cursor.execute('DELETE FROM messages WHERE session_id = ? and user_id = ?', (session_id, user_id))
-                # Delete session
-                cursor.execute('DELETE FROM sessions WHERE session_id = ? and user_id = ?', (session_id, user_id))
-                # Clear cache
-                if session_id in self.first_message_cache:
-                    del self.first_message_cache[session_id]
-                
-                conn.commit()
-            except sqlite3.Error as e:
-                conn.rollback()
-                logger.error(f"Error clearing session: {str(e)}")
-                raise
-            finally:
-                cursor.close()
+        def write(cursor):
+            # Delete messages
+            cursor.execute('DELETE FROM messages WHERE session_id = ? and user_id = ?', (session_id, user_id))
+            # Delete session
+            cursor.execute('DELETE FROM sessions WHERE session_id = ? and user_id = ?', (session_id, user_id))
+        
+        try:
+            await self._write(write)
+        except sqlite3.Error as e:
+            logger.error(f"Error clearing session: {str(e)}")
+            raise
+        
+        # Clear cache
+        self.first_message_cache.pop(session_id, None)
     
-    def is_first_message(self, session_id: str, user_id: str) -> bool:
+    async def is_first_message(self, session_id: str, user_id: str) -> bool:
         """Check if this is the first message in a session"""
         # Check cache first
         if session_id in self.first_message_cache:
             return self.first_message_cache[session_id]
-            
-        with self.db_lock:
-            conn = self.get_connection()
+        return await self._read(self._is_first_message, session_id, user_id)
+
+    def _is_first_message(self, session_id: str, user_id: str) -> bool:
+        with self.reader() as conn:
             cursor = conn.cursor()
             
             try:
@@ -373,8 +521,10 @@ class ChatDatabase:
                 count = cursor.fetchone()[0]
                 is_first = count == 0
                 
-                # Update cache
-                self.first_message_cache[session_id] = is_first
+                # Only cache False: a save of this session may have set it after our
+                # read, and a stale True must not overwrite it
+                if not is_first:
+                    self.first_message_cache[session_id] = False
                 return is_first
             except sqlite3.Error as e:
                 logger.error(f"Error checking first message: {str(e)}")
@@ -382,55 +532,48 @@ class ChatDatabase:
             finally:
                 cursor.close()
 
-    def update_message_rating(self, message_id: str, user_id: str, rating: str | None) -> bool:
-        with self.db_lock:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+    async def update_message_rating(self, message_id: str, user_id: str, rating: str | None) -> bool:
+        def write(cursor):
+            # First verify the message exists and belongs to the user
+            cursor.execute('''
+            SELECT message_id, session_id FROM messages 
+            WHERE message_id = ? AND user_id = ?
+            ''', (message_id, user_id))
             
-            try:
-                conn.execute('BEGIN TRANSACTION')
-                
-                # First verify the message exists and belongs to the user
+            result = cursor.fetchone()
+            if not result:
+                logger.error(f"Message {message_id} not found for user {user_id}")
+                return False
+            
+            session_id = result['session_id']
+            
+            if rating is None:
+                # Remove the rating
                 cursor.execute('''
-                SELECT message_id, session_id FROM messages 
+                DELETE FROM message_ratings 
                 WHERE message_id = ? AND user_id = ?
                 ''', (message_id, user_id))
-                
-                result = cursor.fetchone()
-                if not result:
-                    logger.error(f"Message {message_id} not found for user {user_id}")
-                    conn.rollback()
-                    return False
-                
-                session_id = result['session_id']
-                
-                if rating is None:
-                    # Remove the rating
-                    cursor.execute('''
-                    DELETE FROM message_ratings 
-                    WHERE message_id = ? AND user_id = ?
-                    ''', (message_id, user_id))
-                else:
-                    # Insert or update the rating
-                    cursor.execute('''
-                    INSERT INTO message_ratings (message_id, user_id, session_id, rating)
-                    VALUES (?, ?, ?, ?)
-                    ON CONFLICT(message_id, user_id) DO UPDATE SET rating = excluded.rating
-                    ''', (message_id, user_id, session_id, rating))
-                
-                conn.commit()
-                return True
-            except sqlite3.Error as e:
-                conn.rollback()
-                logger.error(f"Error updating message rating: {str(e)}")
-                return False
-            finally:
-                cursor.close()
+            else:
+                # Insert or update the rating
+                cursor.execute('''
+                INSERT INTO message_ratings (message_id, user_id, session_id, rating)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(message_id, user_id) DO UPDATE SET rating = excluded.rating
+                ''', (message_id, user_id, session_id, rating))
+            return True
+        
+        try:
+            return await self._write(write)
+        except sqlite3.Error as e:
+            logger.error(f"Error updating message rating: {str(e)}")
+            return False
 
-    def get_message_rating(self, message_id: str, user_id: str) -> str | None:
+    async def get_message_rating(self, message_id: str, user_id: str) -> str | None:
         """Get the rating of a message"""
-        with self.db_lock:
-            conn = self.get_connection()
+        return await self._read(self._get_message_rating, message_id, user_id)
+
+    def _get_message_rating(self, message_id: str, user_id: str) -> str | None:
+        with self.reader() as conn:
             cursor = conn.cursor()
             
             try:
@@ -0,0 +1,116 @@
+"""Load test for ChatDatabase: concurrent chat sessions writing and reading history.
+
+Each simulated session is a task on one event loop, like a request in the app,
+and loops the way the chat endpoint does: check whether the message is the
+session's first, save the user's message, save an assistant placeholder, update
+it with the final answer, and periodically reload the chat. A ticker task on the
+same loop measures how late it wakes up, i.e. how long a streaming response
+would stall behind database work.
+
+    python chat_db_load_test.py --sessions 100 --duration 10
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime
+
+from chat_database import ChatDatabase
+from models import MessageResponse
+
+TICK_SECONDS = 0.005
+
+
+def make_message(role: str, content: str) -> MessageResponse:
+    return MessageResponse(
+        message_id=str(uuid.uuid4()),
+        content=content,
+        role=role,
+        model="load-test",
+        timestamp=datetime.now(),
+        sources=[{"url": "https://example.com/doc", "title": "doc"}] if role == "assistant" else None,
+    )
+
+
+async def run_session(chat_db: ChatDatabase, index: int, deadline: float, saves: list, read_latencies: list, errors: list):
+    session_id = str(uuid.uuid4())
+    user_id = f"user-{index}"
+    turn = 0
+    while time.perf_counter() < deadline:
+        try:
+            is_first = await chat_db.is_first_message(session_id, user_id)
+            start = time.perf_counter()
+            await chat_db.save_message_to_session(session_id, user_id, make_message("user", f"question {turn}"),
+                                                  user_info={"email": f"{user_id}@example.com"}, is_first_message=is_first)
+            answer = make_message("assistant", "")
+            await chat_db.save_message_to_session(session_id, user_id, answer)
+            answer.content = f"answer {turn} " * 50
+            await chat_db.update_message(session_id, user_id, answer)
+            saves.append(time.perf_counter() - start)
+            if turn % 5 == 4:
+                start = time.perf_counter()
+                await chat_db.get_chat(session_id, user_id)
+                read_latencies.append(time.perf_counter() - start)
+            turn += 1
+        except Exception as e:
+            errors.append(e)
+
+
+async def measure_loop_lag(deadline: float, lags: list):
+    """Sleep in short ticks and record how late each wake-up is"""
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        await asyncio.sleep(TICK_SECONDS)
+        lags.append(max(0.0, time.perf_counter() - start - TICK_SECONDS))
+
+
+def percentile(values: list, pct: float) -> float:
+    if not values:
+        return 0.0
+    return statistics.quantiles(values, n=100)[int(pct) - 1] if len(values) > 1 else values[0]
+
+
+async def run(args, db_file: str):
+    chat_db = ChatDatabase(db_file)
+    saves, read_latencies, errors, lags = [], [], [], []
+    deadline = time.perf_counter() + args.duration
+    start = time.perf_counter()
+    await asyncio.gather(
+        measure_loop_lag(deadline, lags),
+        *(run_session(chat_db, i, deadline, saves, read_latencies, errors) for i in range(args.sessions)),
+    )
+    elapsed = time.perf_counter() - start
+    await asyncio.to_thread(chat_db.close)
+
+    # Each turn saves two messages and updates one
+    messages = len(saves) * 2
+    print(f"sessions:          {args.sessions}")
+    print(f"duration:          {elapsed:.1f}s")
+    print(f"messages saved:    {messages} ({messages / elapsed:.0f}/s)")
+    print(f"turns:             {len(saves)} ({len(saves) / elapsed:.0f}/s)")
+    print(f"turn latency:      p50 {percentile(saves, 50) * 1000:.1f}ms, p99 {percentile(saves, 99) * 1000:.1f}ms")
+    print(f"chat reads:        {len(read_latencies)}, p50 {percentile(read_latencies, 50) * 1000:.1f}ms, "
+          f"p99 {percentile(read_latencies, 99) * 1000:.1f}ms")
+    print(f"event loop lag:    p50 {percentile(lags, 50) * 1000:.1f}ms, p99 {percentile(lags, 99) * 1000:.1f}ms, "
+          f"max {max(lags, default=0) * 1000:.1f}ms")
+    print(f"errors:            {len(errors)}")
+    if errors:
+        print(f"first error:       {errors[0]!r}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=100, help="Concurrent chat sessions")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run")
+    parser.add_argument("--db-file", help="Database file (defaults to a temporary file)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(run(args, args.db_file or os.path.join(tmp, "load_test.db")))
+
+
+if __name__ == "__main__":
+    main()
@@ -105,9 +105,9 @@ async def chat(
     try:
         user_id = user_info["user_id"]
         logger.info(f"Processing request for user_id: {user_id}")
-        is_first_message = chat_db.is_first_message(message.session_id, user_id)
+        is_first_message = await chat_db.is_first_message(message.session_id, user_id)
         logger.info(f"Is first message: {is_first_message}")
-        user_message = message_handler.create_message(
+        user_message = await message_handler.create_message(
             message_id=str(uuid.uuid4()),
             content=message.content,
             role="user",
@@ -237,7 +237,7 @@ async def chat(
             logger.warning("Rate limit error encountered")
             error_message = "The service is currently experiencing high demand. Please wait a moment and try again."
         
-        error_message = message_handler.create_error_message(
+        error_message = await message_handler.create_error_message(
             session_id=message.session_id,
             user_id=user_id,
             error_content="An error occurred while processing your request. " + str(e)
@@ -320,8 +320,8 @@ async def websocket_chat(
             message_request = MessageRequest(**data)
             logger.info(f"Processing WebSocket message for session_id: {message_request.session_id}")
             
-            is_first_message = chat_db.is_first_message(message_request.session_id, user_id)
-            user_message = message_handler.create_message(
+            is_first_message = await chat_db.is_first_message(message_request.session_id, user_id)
+            user_message = await message_handler.create_message(
                 message_id=str(uuid.uuid4()),
                 content=message_request.content,
                 role="user",
@@ -407,7 +407,7 @@ async def websocket_chat(
                                         # Save the accumulated assistant response to database
                                         if accumulated_content:
                                             try:
-                                                assistant_message = message_handler.create_message(
+                                                assistant_message = await message_handler.create_message(
                                                     message_id=assistant_message_id,
                                                     content=accumulated_content,
                                                     role="assistant",
@@ -445,7 +445,7 @@ async def websocket_chat(
 @api_app.get("/chats", response_model=ChatHistoryResponse)
 async def get_chat_history(user_info: dict = Depends(get_user_info),chat_db: ChatDatabase = Depends(get_chat_db)):
     user_id = user_info["user_id"]
-    return chat_db.get_chat_history(user_id)
+    return await chat_db.get_chat_history(user_id)
 
 # Add logout endpoint
 @api_app.get("/logout")
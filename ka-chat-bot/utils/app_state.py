@@ -40,7 +40,9 @@ class AppState:
 
     async def shutdown(self, app: FastAPI):
         """Shutdown tasks"""
-        pass
+        if self.chat_db:
+            # Commit any queued writes before the worker exits
+            await asyncio.to_thread(self.chat_db.close)
 
 # Create a global app state instance
 app_state = AppState() 
\ No newline at end of file
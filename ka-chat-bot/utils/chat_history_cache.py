@@ -36,6 +36,11 @@ class ChatHistoryCache:
             if len(self.cache[session_id].messages) > 20:
                 self.cache[session_id].messages = self.cache[session_id].messages[-20:]
 
+    def set_history(self, session_id: str, chat: ChatHistoryItem):
+        """Store a session's history loaded from the database"""
+        with self.lock:
+            self.cache[session_id] = chat
+
     def clear_session(self, session_id: str):
         """Clear a session from cache"""
         with self.lock:
@@ -46,11 +51,7 @@ class ChatHistoryCache:
         """Update a message in the cache while preserving order"""
         with self.lock:
             if session_id not in self.cache:
-                chat_data = self.chat_db.get_chat(session_id, message.user_id)
-                if chat_data:
-                    self.cache[session_id] = chat_data
-                else:
-                    raise ValueError("Session id {} not found in cache or DB during update_message.".format(session_id))
+                raise ValueError("Session id {} not found in cache during update_message.".format(session_id))
             messages = self.cache[session_id].messages
             for msg in messages:
                 if msg.message_id == message_id:
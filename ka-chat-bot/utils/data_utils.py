@@ -91,7 +91,7 @@ async def load_chat_history(session_id: str, user_id: str, is_first_message: boo
         chat_history = convert_messages_to_cache_format(chat_history.messages)
     # If cache is empty and not first message, load from database
     elif not chat_history and not is_first_message:
-        chat_data = chat_db.get_chat(session_id, user_id)
+        chat_data = await chat_db.get_chat(session_id, user_id)
         if chat_data and chat_data.messages:
             # Convert to cache format
             chat_history = convert_messages_to_cache_format(chat_data.messages)
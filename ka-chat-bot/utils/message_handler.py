@@ -12,7 +12,7 @@ class MessageHandler:
         self.chat_db = chat_db
         self.chat_history_cache = chat_history_cache
 
-    def create_message(self, message_id: str, content: str, role: str, session_id: str, user_id: str, 
+    async def create_message(self, message_id: str, content: str, role: str, session_id: str, user_id: str, 
                       user_info: Optional[dict] = None, sources: Optional[list] = None, 
                       metrics: Optional[dict] = None, is_first_message: bool = False) -> MessageResponse:
         """Create a new message and save it to both database and cache"""
@@ -28,7 +28,7 @@ class MessageHandler:
             created_at=datetime.now().isoformat()
         )
         # Save to database
-        self.chat_db.save_message_to_session(session_id, 
+        await self.chat_db.save_message_to_session(session_id, 
                                              user_id, 
                                              message, 
                                              user_info=user_info,
@@ -37,7 +37,7 @@ class MessageHandler:
         self.chat_history_cache.add_message(session_id, message)
         return message
 
-    def update_message(self, session_id: str, message_id: str, user_id: str, 
+    async def update_message(self, session_id: str, message_id: str, user_id: str, 
                       content: str, sources: Optional[list] = None, 
                       timestamp: Optional[datetime] = None,
                       metrics: Optional[dict] = None) -> MessageResponse:
@@ -55,16 +55,20 @@ class MessageHandler:
         )
         
         # Update in database
-        self.chat_db.update_message(session_id, user_id, message)
+        await self.chat_db.update_message(session_id, user_id, message)
+        
+        # Load the session into the cache if it isn't there yet
+        if self.chat_history_cache.get_history(session_id) is None:
+            self.chat_history_cache.set_history(session_id, await self.chat_db.get_chat(session_id, user_id))
         
         # Update in cache with all fields
         self.chat_history_cache.update_message(session_id, message_id, message)
         
         return message
 
-    def create_error_message(self, session_id: str, user_id: str, error_content: str) -> MessageResponse:
+    async def create_error_message(self, session_id: str, user_id: str, error_content: str) -> MessageResponse:
         """Create an error message and save it"""
-        return self.create_message(
+        return await self.create_message(
             message_id=str(uuid.uuid4()),
             content=error_content,
             role="assistant",
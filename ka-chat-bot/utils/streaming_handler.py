@@ -151,7 +151,7 @@ class StreamingHandler:
                         logger.warning(f"Failed to parse JSON: {json_str[:100]}... Error: {e}")
                         continue
             if update_flag:
-                updated_message = message_handler.update_message(
+                updated_message = await message_handler.update_message(
                                     session_id=session_id,
                                     message_id=message_id,
                                     user_id=user_id,
@@ -164,7 +164,7 @@ class StreamingHandler:
                                     }
                                 )
             else:
-                assistant_message = message_handler.create_message(
+                assistant_message = await message_handler.create_message(
                                     message_id=message_id,
                                     content=accumulated_content,
                                     role="assistant",
@@ -214,7 +214,7 @@ class StreamingHandler:
             response = await response_task
             response_data = await request_handler.handle_databricks_response(response, start_time)
             
-            assistant_message = message_handler.create_message(
+            assistant_message = await message_handler.create_message(
                 message_id=str(uuid.uuid4()),
                 content=response_data["content"],
                 role="assistant",
@@ -229,7 +229,7 @@ class StreamingHandler:
             yield "event: done\ndata: {}\n\n"
         except Exception as e:
             logger.error(f"Error in non-streami ng response: {str(e)}")
-            error_message = message_handler.create_error_message(
+            error_message = await message_handler.create_error_message(
                 session_id=session_id,
                 user_id=user_id,
                 error_content="Request timed out. " + str(e) + " Please try again later."
@@ -268,7 +268,7 @@ class StreamingHandler:
                 yield response_chunk
         except Exception as e:
             logger.error(f"Error in streaming regeneration: {str(e)}")
-            error_message = message_handler.create_error_message(
+            error_message = await message_handler.create_error_message(
                 session_id=session_id,
                 user_id=user_id,
                 error_content="Failed to regenerate response. " + str(e)
@@ -298,7 +298,7 @@ class StreamingHandler:
             response = await request_handler.enqueue_request(url, headers, request_data)
             response_data = await request_handler.handle_databricks_response(response, start_time)
             
-            update_message = message_handler.update_message(
+            update_message = await message_handler.update_message(
                 session_id=session_id,
                 message_id=message_id,
                 user_id=user_id,
@@ -312,7 +312,7 @@ class StreamingHandler:
             yield "event: done\ndata: {}\n\n"   
         except Exception as e:
             logger.error(f"Error in non-streaming regeneration: {str(e)}")
-            error_message = message_handler.update_message(
+            error_message = await message_handler.update_message(
                 session_id=session_id,
                 message_id=message_id,
                 user_id=user_id,